@@ -5,6 +5,7 @@ import sys
 import aviary
 from aviary.interface.methods_for_level1 import _exec_level1, _setup_level1_parser
 from aviary.utils.Fortran_to_Aviary import _exec_F2A, _setup_F2A_parser
+from aviary.utils.aero_table_conversion import _exec_aero_grid, _setup_aero_grid_parser
 from aviary.visualization.dashboard import _dashboard_setup_parser, _dashboard_cmd
 from aviary.interface.graphical_input import IntegratedPlottingApp
 
@@ -74,6 +75,9 @@ _command_map = {
                      "Allows users to draw a mission profile for use in Aviary."),
     'dashboard': (_dashboard_setup_parser, _dashboard_cmd,
                   "Run the Dashboard tool"),
+    'convert_aero_grid': (_setup_aero_grid_parser, _exec_aero_grid,
+                          "Converts Aviary aero tables into binary structured grids "
+                          "for the table-based aerodynamics"),
 }
 
 
@@ -4,17 +4,29 @@ This file contains functions needed to run Aviary using the Level 1 interface.
 import os
 import importlib.util
 import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 import openmdao.api as om
+from openmdao.utils.mpi import MPI
+
 from aviary.variable_info.enums import AnalysisScheme
 from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.problem_templates import ProblemTemplate, get_problem_template, \
+    problem_template_key
+from aviary.utils.csv_data_file import read_data_file, write_data_file
+from aviary.utils.named_values import NamedValues
+
+# problem built once by each process running a sweep, reused for all of its cases
+_sweep_problem = None
 
 
 def run_aviary(aircraft_filename, phase_info, mission_method, mass_method, optimizer=None,
                analysis_scheme=AnalysisScheme.COLLOCATION, objective_type=None,
                record_filename='dymos_solution.db', restart_filename=None, max_iter=50,
                run_driver=True, make_plots=True, phase_info_parameterization=None,
-               optimization_history_filename=None):
+               optimization_history_filename=None, reuse_setup=False, coloring_dir=None):
     """
     Run the Aviary optimization problem for a specified aircraft configuration and mission.
 
@@ -52,6 +64,14 @@ def run_aviary(aircraft_filename, phase_info, mission_method, mass_method, optim
     phase_info_parameterization : function, optional
         Additional information to parameterize the phase_info object based on
         desired cruise altitude and Mach.
+    reuse_setup : bool, optional
+        If True, the problem set up by an earlier call in this process is reused when
+        this call only changes the values of its inputs (see problem_templates).
+        The returned problem is then the same object returned by the earlier call.
+    coloring_dir : str, optional
+        Directory of the total coloring store. If given, the total coloring is loaded
+        from this directory when a problem with the same structure was run before,
+        instead of being computed.
 
     Returns
     -------
@@ -65,14 +85,62 @@ def run_aviary(aircraft_filename, phase_info, mission_method, mass_method, optim
     Users can modify or add methods to alter the Aviary problem's behavior.
 
     """
+    prob = _build_aviary_problem(
+        aircraft_filename, phase_info, mission_method, mass_method, optimizer=optimizer,
+        analysis_scheme=analysis_scheme, objective_type=objective_type,
+        max_iter=max_iter, phase_info_parameterization=phase_info_parameterization,
+        reuse_setup=reuse_setup, coloring_dir=coloring_dir)
+
+    prob.failed = prob.run_aviary_problem(
+        record_filename, restart_filename=restart_filename, run_driver=run_driver,
+        make_plots=make_plots,
+        optimization_history_filename=optimization_history_filename)
+
+    return prob
 
+
+def _build_aviary_problem(aircraft_filename, phase_info, mission_method, mass_method,
+                          optimizer=None, analysis_scheme=AnalysisScheme.COLLOCATION,
+                          objective_type=None, max_iter=50,
+                          phase_info_parameterization=None, reuse_setup=False,
+                          coloring_dir=None, **kwargs):
+    """
+    Build, set up, and initialize the AviaryProblem run by run_aviary.
+
+    If reuse_setup is True, a stored problem template is restored instead of building
+    a new problem when possible, and otherwise the new problem is stored as a template.
+    Additional keyword arguments are passed to AviaryProblem.
+    """
     # Build problem
-    prob = AviaryProblem(phase_info, mission_method, mass_method, analysis_scheme)
+    prob = AviaryProblem(phase_info, mission_method, mass_method, analysis_scheme,
+                         **kwargs)
 
     # Load aircraft and options data from user
     # Allow for user overrides here
     prob.load_inputs(aircraft_filename)
 
+    template = None
+
+    if reuse_setup:
+        # the parameterized phase_info is part of the template key
+        if phase_info_parameterization is not None:
+            prob.phase_info = phase_info_parameterization(prob.phase_info,
+                                                          prob.aviary_inputs)
+            phase_info_parameterization = None
+
+        key = problem_template_key(prob, optimizer=optimizer,
+                                   objective_type=objective_type, max_iter=max_iter,
+                                   coloring_dir=coloring_dir, **kwargs)
+        template = get_problem_template(key, prob)
+
+        if template is not None:
+            prob = template.restore(prob)
+            prob.set_initial_guesses()
+
+            return prob
+
+        template = ProblemTemplate(key, prob)
+
     # Have checks for clashing user inputs
     # Raise warnings or errors depending on how clashing the issues are
     prob.check_inputs()
@@ -86,7 +154,7 @@ def run_aviary(aircraft_filename, phase_info, mission_method, mass_method, optim
     # Link phases and variables
     prob.link_phases()
 
-    prob.add_driver(optimizer, max_iter=max_iter)
+    prob.add_driver(optimizer, max_iter=max_iter, coloring_dir=coloring_dir)
 
     prob.add_design_variables()
 
@@ -94,16 +162,218 @@ def run_aviary(aircraft_filename, phase_info, mission_method, mass_method, optim
     # Detail which variables the optimizer can control
     prob.add_objective(objective_type=objective_type)
 
-    prob.setup()
+    if template is None:
+        prob.setup()
+    else:
+        template.setup()
 
     prob.set_initial_guesses()
 
-    prob.failed = prob.run_aviary_problem(
-        record_filename, restart_filename=restart_filename, run_driver=run_driver, make_plots=make_plots, optimization_history_filename=optimization_history_filename)
-
     return prob
 
 
+def run_aviary_sweep(aircraft_filename, phase_info, mission_method, mass_method, cases,
+                     outputs, results_filename='sweep_results.csv', optimizer=None,
+                     analysis_scheme=AnalysisScheme.COLLOCATION, objective_type=None,
+                     max_iter=50, run_driver=True, phase_info_parameterization=None,
+                     num_procs=1, warm_start=False, coloring_dir=None):
+    """
+    Run the same Aviary problem for a table of cases, each overriding some inputs.
+
+    The problem is only built and set up once by each process, then reused for every
+    case that process runs by setting the overridden inputs with set_val. Later sweeps
+    of the same problem in the same process reuse its stored setup as well. Cases are
+    split between processes using MPI when running under MPI, or otherwise a pool of
+    num_procs processes.
+
+    Parameters
+    ----------
+    aircraft_filename : str
+        Filename from which to load the aircraft and options data.
+    phase_info : dict
+        Information about the phases of the mission.
+    mission_method : str
+        The method used for defining the mission; can be 'GASP', 'FLOPS', 'solved',
+        or 'simple'.
+    mass_method : str
+        The method used for calculating the mass; can be 'GASP' or 'FLOPS'.
+    cases : NamedValues or str
+        Table of input overrides, one row per case, or the name of a data file
+        containing the table (see read_data_file). Every column must be an input of the
+        problem that can be changed with set_val after setup - options can not be
+        swept.
+    outputs : dict
+        Scalar variables recorded for each case, with the units they are recorded in.
+    results_filename : str, optional
+        Name of the data file the results table is written to. If None, no file is
+        written.
+    optimizer : str, optional
+        The optimizer to use.
+    analysis_scheme : AnalysisScheme, optional
+        The analysis scheme to use, defaults to AnalysisScheme.COLLOCATION.
+    objective_type : str, optional
+        Type of the optimization objective.
+    max_iter : int, optional
+        Maximum number of iterations for the optimizer, defaults to 50.
+    run_driver : bool, optional
+        If True, the driver is run for each case, otherwise only the model is run.
+    phase_info_parameterization : function, optional
+        Additional information to parameterize the phase_info object based on
+        desired cruise altitude and Mach.
+    num_procs : int, optional
+        Number of processes used to run cases when not running under MPI. Defaults to 1,
+        which runs every case in the current process.
+    warm_start : bool, optional
+        If True, each case starts from the solution of the previous case run by the same
+        process. Otherwise, the initial guesses are reset before each case.
+    coloring_dir : str, optional
+        Directory of the total coloring store, shared by all processes (see
+        run_aviary).
+
+    Returns
+    -------
+    NamedValues
+        Results table, containing the inputs of each case, the requested outputs, and
+        a 'failed' column that is 1 for cases that failed and 0 otherwise.
+    """
+    if isinstance(cases, NamedValues):
+        cases = NamedValues(cases)
+    else:
+        cases = read_data_file(cases)
+
+    case_table = [(name, np.asarray(val).ravel(), units) for name, (val, units) in cases]
+    num_cases = len(case_table[0][1]) if case_table else 0
+
+    for name, val, units in case_table:
+        if len(val) != num_cases:
+            raise ValueError(f'Column "{name}" of the sweep cases has {len(val)} '
+                             f'values, but other columns have {num_cases}.')
+
+    case_list = [[(name, val[idx], units) for name, val, units in case_table]
+                 for idx in range(num_cases)]
+
+    build_args = {
+        'aircraft_filename': aircraft_filename,
+        'phase_info': phase_info,
+        'mission_method': mission_method,
+        'mass_method': mass_method,
+        'optimizer': optimizer,
+        'analysis_scheme': analysis_scheme,
+        'objective_type': objective_type,
+        'max_iter': max_iter,
+        'phase_info_parameterization': phase_info_parameterization,
+        'reuse_setup': True,
+        'coloring_dir': coloring_dir,
+        'reports': None,
+    }
+    case_args = (outputs, run_driver, warm_start)
+
+    if MPI and MPI.COMM_WORLD.size > 1:
+        comm = MPI.COMM_WORLD
+        _init_sweep_process(dict(build_args, comm=MPI.COMM_SELF))
+
+        # every rank runs every comm.size-th case
+        try:
+            local_results = [(idx, _run_sweep_case(case_list[idx], *case_args))
+                             for idx in range(comm.rank, num_cases, comm.size)]
+        finally:
+            _end_sweep_process()
+
+        results = [None] * num_cases
+        for rank_results in comm.allgather(local_results):
+            for idx, result in rank_results:
+                results[idx] = result
+
+    elif num_procs > 1 and num_cases > 1:
+        with ProcessPoolExecutor(max_workers=min(num_procs, num_cases),
+                                 initializer=_init_sweep_process,
+                                 initargs=(build_args,)) as executor:
+            results = list(executor.map(_run_sweep_case, case_list,
+                                        *[[arg] * num_cases for arg in case_args]))
+
+    else:
+        _init_sweep_process(build_args)
+        try:
+            results = [_run_sweep_case(case, *case_args) for case in case_list]
+        finally:
+            _end_sweep_process()
+
+    results_table = NamedValues()
+
+    for name, val, units in case_table:
+        results_table.set_val(name, val, units)
+
+    for idx, name in enumerate(outputs):
+        results_table.set_val(name, np.array([result[idx] for result in results]),
+                              outputs[name])
+
+    results_table.set_val('failed', np.array([result[-1] for result in results]),
+                          'unitless')
+
+    if results_filename is not None and (not MPI or MPI.COMM_WORLD.rank == 0):
+        write_data_file(results_filename, results_table)
+
+    return results_table
+
+
+def _init_sweep_process(build_args):
+    """
+    Build the problem reused by every sweep case run in this process.
+    """
+    global _sweep_problem
+
+    _sweep_problem = _build_aviary_problem(**build_args)
+    _sweep_problem.set_solver_print(level=0)
+
+
+def _end_sweep_process():
+    """
+    Release the problem built for the sweep run in this process.
+    """
+    global _sweep_problem
+
+    _sweep_problem = None
+
+
+def _run_sweep_case(case, outputs, run_driver, warm_start):
+    """
+    Run a single sweep case with the problem built for this process.
+
+    Any error raised while running the case is recorded as a failure of that case, so
+    the remaining cases are still run.
+
+    Returns
+    -------
+    list
+        Value of each output, followed by 1 if the case failed or 0 otherwise.
+    """
+    prob = _sweep_problem
+
+    try:
+        if not warm_start:
+            prob.set_initial_guesses()
+
+        for name, val, units in case:
+            prob.set_val(name, val, units=units)
+
+        if run_driver:
+            failed = prob.run_driver()
+        else:
+            prob.run_model()
+            failed = False
+
+    except Exception as error:
+        # analysis errors are expected for some cases, anything else is reported
+        if not isinstance(error, om.AnalysisError):
+            inputs = ', '.join(f'{name}={val} {units}' for name, val, units in case)
+            warnings.warn(f'Sweep case ({inputs}) failed with '
+                          f'{type(error).__name__}: {error}')
+        failed = True
+
+    return [float(np.asarray(prob.get_val(name, units=units)).ravel()[0])
+            for name, units in outputs.items()] + [int(bool(failed))]
+
+
 def run_level_1(
     input_deck,
     outdir='output',
@@ -1,4 +1,8 @@
 import csv
+import hashlib
+import os
+import pickle
+import uuid
 import warnings
 from packaging import version
 import inspect
@@ -11,10 +15,13 @@ import numpy as np
 import dymos as dm
 from dymos.utils.misc import _unspecified
 
+import openmdao
 import openmdao.api as om
+from openmdao.utils.coloring import Coloring
 from openmdao.utils.units import convert_units
 from openmdao.utils.units import valid_units
 
+from aviary import __version__ as aviary_version
 from aviary.constants import GRAV_ENGLISH_LBM, RHO_SEA_LEVEL_ENGLISH
 from aviary.mission.flops_based.phases.build_landing import Landing
 from aviary.mission.flops_based.phases.build_takeoff import Takeoff
@@ -46,6 +53,7 @@ from aviary.utils.preprocessors import preprocess_crewpayload
 from aviary.interface.utils.check_phase_info import check_phase_info
 from aviary.utils.aviary_values import AviaryValues
 
+from aviary.variable_info.core_promotes import core_mission_inputs
 from aviary.variable_info.functions import setup_trajectory_params, override_aviary_vars
 from aviary.variable_info.variables import Aircraft, Mission, Dynamic
 from aviary.variable_info.enums import AnalysisScheme, ProblemType, SpeedType, AlphaModes
@@ -95,6 +103,51 @@ def wrapped_convert_units(val_unit_tuple, new_units):
         return convert_units(value, units, new_units)
 
 
+def _phase_info_structure(info):
+    """
+    Return a copy of phase info in which objects such as subsystem builders and
+    engine models are replaced by their names, so that it has a stable representation.
+    """
+    if isinstance(info, dict):
+        return {key: _phase_info_structure(val) for key, val in info.items()}
+
+    if isinstance(info, AviaryValues):
+        return {key: _phase_info_structure(val) for key, val in info}
+
+    if isinstance(info, (list, tuple)):
+        return type(info)(_phase_info_structure(val) for val in info)
+
+    if info is None or isinstance(info, (str, bool, int, float, np.ndarray)):
+        return info
+
+    return getattr(info, 'name', type(info).__name__)
+
+
+class _RestartableRecorder(om.SqliteRecorder):
+    """
+    SqliteRecorder that starts a new recording when it is started again after it was
+    shut down, so that a problem can be run more than once.
+    """
+
+    def __init__(self, filepath, **kwargs):
+        super().__init__(filepath, **kwargs)
+
+        self._restart_args = (filepath, kwargs)
+        self._shut_down = False
+
+    def startup(self, recording_requester, comm=None):
+        if self._shut_down:
+            filepath, kwargs = self._restart_args
+            self.__init__(filepath, **kwargs)
+
+        super().startup(recording_requester, comm)
+
+    def shutdown(self):
+        super().shutdown()
+
+        self._shut_down = True
+
+
 class PreMissionGroup(om.Group):
     def configure(self):
         external_outputs = promote_aircraft_and_mission_vars(self)
@@ -137,6 +190,15 @@ class AviaryProblem(om.Problem):
 
         self.aviary_inputs = None
 
+        # whether the driver declares coloring, the directory of the total coloring
+        # store, and the path of the stored coloring for this problem
+        self.use_coloring = False
+        self.coloring_dir = None
+        self._coloring_path = None
+
+        # recorders added by run_aviary_problem, by their owner and file
+        self._recorders = {}
+
         phase_info = deepcopy(phase_info)
 
         for phase_name in phase_info:
@@ -343,12 +405,22 @@ class AviaryProblem(om.Problem):
                               subsystems['aerodynamics'],
                               subsystems['mass'],]
 
+        subsystem_options = self.pre_mission_info.get('subsystem_options', {})
+
+        # core subsystems with pre-mission options can add the inputs that these
+        # options need, before the mission is built from the inputs
+        for subsystem in default_subsystems:
+            if subsystem.name in subsystem_options:
+                self.aviary_inputs = subsystem.preprocess_inputs(
+                    self.aviary_inputs, **subsystem_options[subsystem.name])
+
         pre_mission.add_subsystem(
             'core_subsystems',
             CorePreMission(
                 aviary_options=self.aviary_inputs,
                 subsystems=default_subsystems,
                 process_overrides=False,
+                subsystem_options=subsystem_options,
             ),
             promotes_inputs=['*'],
             promotes_outputs=['*'])
@@ -372,7 +444,7 @@ class AviaryProblem(om.Problem):
         )
 
         # Build and add takeoff subsystem
-        takeoff = takeoff_options.build_phase(False)
+        takeoff = takeoff_options.build_phase(False, aviary_options=self.aviary_inputs)
         self.model.add_subsystem(
             'takeoff', takeoff, promotes_inputs=['aircraft:*', 'mission:*'],
             promotes_outputs=['mission:*'])
@@ -1026,8 +1098,18 @@ class AviaryProblem(om.Problem):
                     for parameter in parameter_dict:
                         external_parameters[phase_name][parameter] = parameter_dict[parameter]
 
+            variables_to_add = list(core_mission_inputs)
+
+            # the drag polar tables are only mission parameters when the core
+            # aerodynamics samples them in pre-mission
+            if self.core_subsystems['aerodynamics'].polar_grid is not None:
+                variables_to_add.extend([Aircraft.Design.ZERO_LIFT_DRAG_POLAR,
+                                         Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR])
+
             traj = setup_trajectory_params(
-                self.model, traj, self.aviary_inputs, phases, meta_data=self.meta_data, external_parameters=external_parameters)
+                self.model, traj, self.aviary_inputs, phases, meta_data=self.meta_data,
+                variables_to_add=variables_to_add,
+                external_parameters=external_parameters)
 
         elif self.mission_method == "solved":
             target_range = self.aviary_inputs.get_val(
@@ -1477,7 +1559,8 @@ class AviaryProblem(om.Problem):
 
             self.model.set_input_defaults(Mission.Takeoff.ASCENT_DURATION, val=30.0)
 
-    def add_driver(self, optimizer=None, use_coloring=None, max_iter=50, debug_print=False):
+    def add_driver(self, optimizer=None, use_coloring=None, max_iter=50,
+                   debug_print=False, coloring_dir=None):
         """
         Add an optimization driver to the Aviary problem.
 
@@ -1492,7 +1575,8 @@ class AviaryProblem(om.Problem):
             If "SLSQP", it will instantiate a ScipyOptimizeDriver, else it will instantiate a pyOptSparseDriver.
 
         use_coloring : bool, optional
-            If True (default), the driver will declare coloring, which can speed up derivative computations.
+            If True (default), the driver will declare coloring, which can speed up
+            derivative computations.
 
         max_iter : int, optional
             The maximum number of iterations allowed for the optimization process. Default is 50. This option is
@@ -1502,6 +1586,11 @@ class AviaryProblem(om.Problem):
             If True, default debug print options ['desvars','ln_cons','nl_cons','objs'] will be set. If a list is
             provided, it will be used as the debug print options.
 
+        coloring_dir : str or Path, optional
+            Directory of the total coloring store. If given, the total coloring of a
+            problem with the same structure is loaded from this directory instead of
+            being computed, and a newly computed coloring is saved in it.
+
         Returns
         -------
         None
@@ -1519,8 +1608,10 @@ class AviaryProblem(om.Problem):
             driver = self.driver = om.pyOptSparseDriver()
 
         driver.options["optimizer"] = optimizer
+        self.use_coloring = use_coloring
         if use_coloring:
             driver.declare_coloring()
+            self.coloring_dir = coloring_dir
 
         if driver.options["optimizer"] == "SNOPT":
             driver.opt_settings["Major iterations limit"] = max_iter
@@ -1810,6 +1901,136 @@ class AviaryProblem(om.Problem):
             warnings.simplefilter("ignore", om.PromotionWarning)
             super().setup(**kwargs)
 
+        self._coloring_path = None
+
+        if self.coloring_dir is not None:
+            self._coloring_path = self._coloring_store_path(kwargs.get('mode', 'auto'))
+
+        self._load_stored_coloring()
+
+    def run_driver(self, case_prefix=None, reset_iter_counts=True):
+        """
+        Run the driver, then save its total coloring in the coloring store, if used.
+        """
+        failed = super().run_driver(case_prefix=case_prefix,
+                                    reset_iter_counts=reset_iter_counts)
+
+        self._store_coloring()
+
+        return failed
+
+    def _coloring_store_path(self, mode):
+        """
+        Return the path of the total coloring for the structure of this set-up problem.
+
+        The coloring is stored under a hash of everything the sparsity of the total
+        jacobian depends on: the phase info, the variables of the model (which cover
+        the phases, their transcriptions and the subsystems) and their connections, the
+        design variables and responses, the derivative mode, the aircraft options, and
+        the versions of Aviary, OpenMDAO and dymos.
+        """
+        model = self.model
+        structure = hashlib.sha256()
+
+        def add(*items):
+            try:
+                structure.update(pickle.dumps(items, protocol=4))
+            except Exception:
+                structure.update(repr(items).encode())
+
+        def indices(meta):
+            idxs = meta['indices']
+            if idxs is None:
+                return None
+            try:
+                return idxs.shaped_array(flat=True).tobytes()
+            except Exception:
+                return repr(idxs)
+
+        add(aviary_version, openmdao.__version__, dm.__version__, mode)
+
+        # external subsystems are identified by name, since their builders have no
+        # stable representation
+        for info in (getattr(self, 'pre_mission_info', None), self.phase_info,
+                     getattr(self, 'post_mission_info', None)):
+            add(repr(_phase_info_structure(info)))
+
+        outputs = model.list_outputs(val=False, shape=True, prom_name=True,
+                                     out_stream=None)
+        add([(name, meta['prom_name'], meta['shape']) for name, meta in outputs])
+
+        inputs = model.list_inputs(val=False, shape=True, out_stream=None)
+        add([(name, model.get_source(name), meta['shape']) for name, meta in inputs])
+
+        for name, meta in model.get_design_vars(recurse=True, get_sizes=True).items():
+            add(name, meta['source'], meta['size'], indices(meta))
+
+        for name, meta in model.get_responses(recurse=True, get_sizes=True).items():
+            add(name, meta['source'], meta['type'], meta.get('linear'), meta['size'],
+                indices(meta))
+
+        for key, (val, units) in self.aviary_inputs:
+            if key in self.meta_data and self.meta_data[key]['option']:
+                add(key, val, units)
+
+        filename = f'total_coloring_{structure.hexdigest()[:16]}.pkl'
+
+        return Path(self.coloring_dir) / filename
+
+    def _load_stored_coloring(self):
+        """
+        Use the stored total coloring for this problem, if there is one.
+
+        Otherwise, the coloring files of the problem are written to a new directory
+        in the coloring store, from which the total coloring computed by the driver is
+        moved into the store.
+        """
+        path = self._coloring_path
+
+        if path is None:
+            return
+
+        if path.exists():
+            try:
+                coloring = Coloring.load(str(path))
+            except (OSError, EOFError, RuntimeError):
+                warnings.warn(f'Stored total coloring <{path}> could not be read and '
+                              'will be computed again.')
+            else:
+                self.driver.use_fixed_coloring(coloring)
+                return
+
+        # the driver creates the directory when it saves the coloring
+        self.options['coloring_dir'] = str(
+            path.parent / f'{path.stem}.{uuid.uuid4().hex}.tmp')
+
+    def _store_coloring(self):
+        """
+        Move the total coloring computed by the driver into the coloring store.
+        """
+        path = self._coloring_path
+
+        if path is None or path.exists():
+            return
+
+        coloring_file = Path(self.options['coloring_dir']) / 'total_coloring.pkl'
+
+        if not coloring_file.exists():
+            return
+
+        # the coloring is moved only once it is complete, so that other processes
+        # never read a partial coloring
+        try:
+            os.replace(coloring_file, path)
+        except OSError:
+            warnings.warn(f'Total coloring <{path}> could not be written.')
+            return
+
+        try:
+            coloring_file.parent.rmdir()
+        except OSError:
+            pass
+
     def set_initial_guesses(self):
         """
         Call `set_val` on the trajectory for states and controls to seed
@@ -2253,11 +2474,14 @@ class AviaryProblem(om.Problem):
             self.set_solver_print(level=0)
 
         if optimization_history_filename:
-            recorder = om.SqliteRecorder(optimization_history_filename)
-            self.driver.add_recorder(recorder)
+            self._add_recorder(self.driver, optimization_history_filename)
 
         # and run mission, and dynamics
         if run_driver:
+            # dymos only adds a recorder for a file that has none yet
+            self._add_recorder(self, record_filename)
+            self.recording_options['record_outputs'] = True
+
             failed = dm.run_problem(self, run_driver=run_driver, simulate=simulate, make_plots=make_plots,
                                     solution_record_file=record_filename, restart=restart_filename)
         else:
@@ -2272,6 +2496,17 @@ class AviaryProblem(om.Problem):
 
         return failed
 
+    def _add_recorder(self, owner, filename):
+        """
+        Add a recorder for a file to the problem or its driver, unless one was already
+        added by an earlier run.
+        """
+        key = (owner, filename)
+
+        if key not in self._recorders:
+            recorder = self._recorders[key] = _RestartableRecorder(filename)
+            owner.add_recorder(recorder)
+
     def _add_hybrid_objective(self, phase_info):
         phases = list(phase_info.keys())
         takeoff_mass = self.aviary_inputs.get_val(
@@ -2333,8 +2568,7 @@ class AviaryProblem(om.Problem):
         )
 
         landing = landing_options.build_phase(
-            False,
-        )
+            False, aviary_options=self.aviary_inputs)
         self.model.add_subsystem(
             'landing', landing, promotes_inputs=['aircraft:*', 'mission:*'],
             promotes_outputs=['mission:*'])
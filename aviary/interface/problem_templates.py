@@ -0,0 +1,406 @@
+"""
+Reuse set-up AviaryProblems for runs that only change input values.
+
+Setting up an AviaryProblem (building pre-mission, every phase, linkages and driver, then
+setting up and coloring the model) takes much longer than running it. A problem template
+keeps a set-up problem, together with everything its structure was built from, so that a
+later run that only changes the values of inputs can reuse it instead of building a new
+one.
+
+Classes
+-------
+ProblemTemplate : set-up AviaryProblem that can be restored for runs with new input
+    values.
+
+Functions
+---------
+problem_template_key : return the key of the template for a loaded AviaryProblem.
+get_problem_template : return the stored template for a loaded AviaryProblem.
+clear_problem_template_cache : remove all stored templates.
+"""
+import copy
+import hashlib
+import pickle
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+from openmdao.core.constants import _UNDEFINED
+
+from aviary.utils.aviary_values import AviaryValues
+
+# maximum number of set-up problems kept for reuse
+PROBLEM_TEMPLATE_CACHE_SIZE = 4
+
+# attributes of AviaryProblem that load_inputs sets from input values, which are used
+# while building the problem
+_VALUE_ATTRIBUTES = ('cruise_mass_final', 'target_range', 'cruise_mach')
+
+_problem_template_cache = OrderedDict()
+
+
+def clear_problem_template_cache():
+    """
+    Remove all problem templates.
+    """
+    _problem_template_cache.clear()
+
+
+def _digest(val):
+    """
+    Return a digest of a value, used to compare it with values from other runs.
+
+    Values that can not be pickled fall back to their repr, which for most objects
+    only compares equal for the same object.
+    """
+    try:
+        data = pickle.dumps(val, protocol=4)
+    except Exception:
+        data = repr(val).encode()
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def _record_reads(aviary_values, meta_data):
+    """
+    Start recording which items of an AviaryValues object are read, and their values.
+
+    Returns
+    -------
+    _ReadRecorder
+        The recorded reads.
+    """
+    recorder = _ReadRecorder(meta_data)
+    aviary_values.set_access_hook(recorder)
+
+    return recorder
+
+
+def _structure(val, meta_data):
+    """
+    Return a copy of a value without the input values it holds.
+
+    Objects with their own copy of the aircraft inputs, such as engine models, keep
+    only options.
+    """
+    if isinstance(val, (list, tuple)):
+        return type(val)(_structure(item, meta_data) for item in val)
+
+    options = getattr(val, 'options', None)
+
+    if isinstance(options, AviaryValues):
+        val = copy.copy(val)
+        val.options = AviaryValues()
+
+        for key, (option, units) in options:
+            if key not in meta_data or meta_data[key]['option']:
+                val.options.set_val(key, option, units, meta_data=meta_data)
+
+    return val
+
+
+def problem_template_key(prob, **build_options):
+    """
+    Return the key of the template for an AviaryProblem, after its inputs are loaded.
+
+    The key covers the phase_info (except the initial guesses of each phase) including
+    the pre-mission options, the mission, mass and analysis methods, and any other
+    options the problem is built with. Input values are not part of the key, they are
+    checked by get_problem_template.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Problem with loaded inputs, that has not been built yet.
+    **build_options
+        Other arguments the problem is built with, such as the optimizer.
+
+    Returns
+    -------
+    str
+        Template key.
+    """
+    phase_info = {
+        name: {key: val for key, val in info.items() if key != 'initial_guesses'}
+        if isinstance(info, dict) else info
+        for name, info in prob.phase_info.items()}
+
+    return _digest((phase_info, prob.pre_mission_info, prob.mission_method,
+                    prob.mass_method, prob.analysis_scheme,
+                    sorted(build_options.items())))
+
+
+def get_problem_template(key, prob):
+    """
+    Return the template stored with this key, if it can be reused for a problem.
+
+    Parameters
+    ----------
+    key : str
+        Template key, from problem_template_key.
+    prob : AviaryProblem
+        Problem with loaded inputs, that has not been built yet.
+
+    Returns
+    -------
+    ProblemTemplate or None
+        Stored template, or None if there is no template for this key or the inputs of
+        the problem change its structure.
+    """
+    template = _problem_template_cache.get(key)
+
+    if template is None or not template.matches(prob):
+        return None
+
+    _problem_template_cache.move_to_end(key)
+
+    return template
+
+
+class _ReadRecorder:
+    """
+    Access hook of AviaryValues that records which inputs are read, and their values.
+    """
+
+    def __init__(self, meta_data):
+        self.meta_data = meta_data
+        self.setting_up = False
+        self.values = {}
+        self.present = {}
+        self.setup_reads = set()
+        self.written = set()
+
+    def __call__(self, access, key, item):
+        if access == 'set':
+            self.written.add(key)
+            return
+
+        if key in self.written:
+            return
+
+        if access == 'read':
+            if key in self.values:
+                return
+
+            # objects in the inputs can change later, so they are compared as read
+            self.values[key] = (_digest(_structure(item, self.meta_data)),
+                                None if item is _UNDEFINED else np.shape(item[0]))
+
+        elif key not in self.present:
+            self.present[key] = item is not _UNDEFINED
+
+        else:
+            return
+
+        if self.setting_up:
+            self.setup_reads.add(key)
+
+
+class ProblemTemplate:
+    """
+    Set-up AviaryProblem that is reused for runs that only change input values.
+
+    A template is created for a problem with loaded inputs, before the problem is
+    built. From then until setup is called through the template, every aircraft input
+    read while building the problem is recorded: the template can only be reused for
+    problems with the same values of these inputs. The exceptions are inputs whose
+    values only set the value of a model input (trajectory parameters, and the
+    defaults set in AviaryProblem.setup), which are only compared by shape, and are set
+    again when the template is restored.
+
+    Attributes
+    ----------
+    key : str
+        Template key, from problem_template_key.
+    problem : AviaryProblem
+        The set-up problem.
+    reuses : int
+        Number of times the template was restored.
+    """
+
+    def __init__(self, key, prob):
+        self.key = key
+        self.problem = prob
+        self.reuses = 0
+
+        self._attributes = _digest([getattr(prob, name, None)
+                                    for name in _VALUE_ATTRIBUTES])
+        self._values = {}
+        self._shapes = {}
+        self._present = {}
+        self._value_names = []
+        self._outputs = None
+        self._coloring_dir = None
+
+        # record reads through the AviaryValues object shared by the whole model
+        self._reads = _record_reads(prob.aviary_inputs, prob.meta_data)
+
+    def setup(self, **kwargs):
+        """
+        Set up the problem, then store the template.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments passed to AviaryProblem.setup.
+        """
+        prob = self.problem
+        reads = self._reads
+
+        # the total coloring computed by the first run of the driver is reused through
+        # the coloring store, kept for the life of the template if none was given
+        if prob.use_coloring and prob.coloring_dir is None:
+            self._coloring_dir = tempfile.TemporaryDirectory()
+            prob.coloring_dir = self._coloring_dir.name
+
+        reads.setting_up = True
+        prob.setup(**kwargs)
+        prob.aviary_inputs.set_access_hook(None)
+
+        prob.final_setup()
+
+        model = prob.model
+        meta_data = prob.meta_data
+        input_names = {
+            meta['prom_name']
+            for _, meta in model.list_inputs(val=False, prom_name=True, out_stream=None)}
+
+        self._value_names = [
+            name for name in sorted(input_names)
+            if name in meta_data and not meta_data[name]['option'] and
+            model.get_source(name).startswith('_auto_ivc.')]
+
+        value_names = set(self._value_names)
+
+        param_names = set()
+
+        for subsys in model.system_iter(recurse=False):
+            if subsys.name == 'traj':
+                param_names = set(subsys.parameter_options)
+
+        # inputs that only set the value of a model input are set again on restore
+        reset_names = value_names & (param_names | reads.setup_reads)
+
+        for name, (digest, shape) in reads.values.items():
+            if name in reset_names:
+                if shape is not None:
+                    self._shapes[name] = shape
+            else:
+                self._values[name] = digest
+
+        self._present = {name: present for name, present in reads.present.items()
+                         if name not in reset_names}
+        self._reads = None
+
+        # every input is connected to an output, including the automatic ones, so the
+        # outputs cover the state of the model
+        self._outputs = {
+            name: copy.deepcopy(meta['val'])
+            for name, meta in model.list_outputs(val=True, prom_name=False,
+                                                 list_autoivcs=True, out_stream=None)}
+
+        _problem_template_cache[self.key] = self
+        _problem_template_cache.move_to_end(self.key)
+
+        while len(_problem_template_cache) > PROBLEM_TEMPLATE_CACHE_SIZE:
+            _problem_template_cache.popitem(last=False)
+
+    def matches(self, prob):
+        """
+        Return whether the inputs of a problem allow this template to be reused for it.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            Problem with loaded inputs, that has not been built yet.
+
+        Returns
+        -------
+        bool
+            True if the template can be restored for the problem.
+        """
+        if self._outputs is None:
+            return False
+
+        aviary_inputs = prob.aviary_inputs
+
+        if _digest([getattr(prob, name, None)
+                    for name in _VALUE_ATTRIBUTES]) != self._attributes:
+            return False
+
+        for name, present in self._present.items():
+            if (name in aviary_inputs) != present:
+                return False
+
+        for name, shape in self._shapes.items():
+            item = aviary_inputs.get_item(name, _UNDEFINED)
+
+            if item is not _UNDEFINED and np.shape(item[0]) != shape:
+                return False
+
+        meta_data = self.problem.meta_data
+
+        for name, digest in self._values.items():
+            item = aviary_inputs.get_item(name, _UNDEFINED)
+
+            if _digest(_structure(item, meta_data)) != digest:
+                return False
+
+        return True
+
+    def restore(self, prob):
+        """
+        Reset the set-up problem to the inputs of another problem.
+
+        The template problem takes the aircraft inputs, initial guesses and phase_info of
+        the other problem, and its model is reset to the state it had right after setup,
+        with the values of the new inputs. The total coloring computed by an earlier run
+        of the driver is reused. Initial guesses still need to be set.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            Problem with loaded inputs, that matches this template.
+
+        Returns
+        -------
+        AviaryProblem
+            The template problem, ready for set_initial_guesses.
+        """
+        template_prob = self.problem
+
+        # the model keeps references to the original AviaryValues object, so it is
+        # updated in place
+        aviary_inputs = template_prob.aviary_inputs
+        aviary_inputs.clear()
+        aviary_inputs.update(prob.aviary_inputs)
+
+        template_prob.initial_guesses = prob.initial_guesses
+        template_prob.phase_info = prob.phase_info
+
+        for name in _VALUE_ATTRIBUTES:
+            if hasattr(prob, name):
+                setattr(template_prob, name, getattr(prob, name))
+
+        template_prob._load_stored_coloring()
+
+        for name, val in self._outputs.items():
+            template_prob.set_val(name, val)
+
+        meta_data = template_prob.meta_data
+
+        for name in self._value_names:
+            if name in aviary_inputs:
+                val, units = aviary_inputs.get_item(name)
+            else:
+                val = meta_data[name]['default_value']
+                units = meta_data[name]['units']
+
+                if val is None:
+                    continue
+
+            template_prob.set_val(name, val, units=units)
+
+        self.reuses += 1
+
+        return template_prob
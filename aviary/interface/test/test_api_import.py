@@ -0,0 +1,64 @@
+import subprocess
+import sys
+import unittest
+
+
+def run_python(code):
+    """
+    Run code in a new Python process and return what it prints.
+    """
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                          check=True).stdout
+
+
+class APIImportTest(unittest.TestCase):
+    def test_lazy_import(self):
+        # importing the API, or light parts of it, does not import OpenMDAO
+        output = run_python(
+            'import sys\n'
+            'import aviary.api as av\n'
+            'print("openmdao" in sys.modules)\n'
+            'av.Aircraft, av.CoreMetaData, av.add_meta_data\n'
+            'print("openmdao" in sys.modules)\n'
+            'av.AviaryProblem\n'
+            'print("openmdao" in sys.modules)\n')
+
+        self.assertEqual(output.split(), ['False', 'False', 'True'])
+
+    def test_names(self):
+        import aviary.api as av
+        from aviary.variable_info.variable_meta_data import CoreMetaData, _MetaData
+
+        for name in av.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(hasattr(av, name))
+
+        self.assertIn('AviaryProblem', dir(av))
+        self.assertIs(av.CoreMetaData, CoreMetaData)
+        self.assertIsNot(CoreMetaData, _MetaData)
+
+        with self.assertRaises(AttributeError):
+            av.not_in_the_api
+
+
+class APIImportBenchmark(unittest.TestCase):
+    def bench_test_import_time(self):
+        num_runs = 5
+
+        print(f'\n{"import":<52}{"time (ms)":>12}')
+
+        for statement in ('import aviary.api',
+                          'from aviary.api import Aircraft, CoreMetaData',
+                          'from aviary.api import AviaryProblem'):
+            run_times = [float(run_python(
+                'import time\n'
+                't = time.perf_counter()\n'
+                f'{statement}\n'
+                'print(time.perf_counter() - t)\n'))
+                for _ in range(num_runs)]
+
+            print(f'{statement:<52}{1000 * min(run_times):>12.1f}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,6 +60,15 @@ class CommandEntryPointsTestCases(unittest.TestCase):
         cmd2 = f'aviary fortran_to_aviary {filepath} -o {outfile} --force -l GASP'
         self.run_and_test_cmd(cmd2)
 
+    def test_aero_grid_conversion(self):
+        filepath = pkg_resources.resource_filename(
+            'aviary', 'subsystems/aerodynamics/gasp_based/data/'
+                      'large_single_aisle_1_aero_flaps.txt')
+        outfile = Path.cwd() / 'flaps.grid'
+        cmd = f'aviary convert_aero_grid {filepath} -o {outfile} -t flaps'
+        self.run_and_test_cmd(cmd)
+        self.assertTrue(outfile.is_file())
+
 
 if __name__ == "__main__":
     unittest.main()
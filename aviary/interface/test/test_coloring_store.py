@@ -0,0 +1,47 @@
+import os
+import unittest
+from copy import deepcopy
+
+from openmdao.utils.coloring import Coloring
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.flops import phase_info
+from aviary.interface.methods_for_level1 import run_aviary, _build_aviary_problem
+
+
+deck = 'models/test_aircraft/aircraft_for_bench_FwFm.csv'
+
+
+@use_tempdirs
+class ColoringStoreTest(unittest.TestCase):
+    def test_coloring_store(self):
+        kwargs = {'optimizer': 'SLSQP', 'max_iter': 0, 'coloring_dir': 'colorings'}
+
+        prob = run_aviary(deck, phase_info, 'FLOPS', 'FLOPS', make_plots=False, **kwargs)
+        self.assertTrue(prob._coloring_path.exists())
+        coloring = Coloring.load(str(prob._coloring_path))
+        self.assertEqual(os.listdir('colorings'), [prob._coloring_path.name])
+
+        # a problem with the same structure uses the stored coloring instead of
+        # computing its own
+        prob = _build_aviary_problem(deck, phase_info, 'FLOPS', 'FLOPS', **kwargs)
+        prob.run_driver()
+        self.assertFalse(os.path.exists(
+            os.path.join(prob.options['coloring_dir'], 'total_coloring.pkl')))
+        self.assertEqual(os.listdir('colorings'), [prob._coloring_path.name])
+
+        # a problem with a different structure computes its own coloring
+        new_phase_info = deepcopy(phase_info)
+        new_phase_info['cruise']['user_options']['num_segments'] += 1
+        new_prob = _build_aviary_problem(deck, new_phase_info, 'FLOPS', 'FLOPS',
+                                         **kwargs)
+        self.assertNotEqual(new_prob._coloring_path, prob._coloring_path)
+        new_prob.run_driver()
+        self.assertTrue(new_prob._coloring_path.exists())
+        new_coloring = Coloring.load(str(new_prob._coloring_path))
+        self.assertNotEqual(new_coloring.total_solves(), 0)
+        self.assertEqual(len(os.listdir('colorings')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
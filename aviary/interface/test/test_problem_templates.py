@@ -0,0 +1,112 @@
+import os
+import unittest
+from copy import deepcopy
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.flops import phase_info
+from aviary.interface.methods_for_level1 import run_aviary
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.problem_templates import clear_problem_template_cache, \
+    problem_template_key, _problem_template_cache
+from aviary.utils.functions import get_path
+from aviary.variable_info.variables import Aircraft
+
+
+deck = 'models/test_aircraft/aircraft_for_bench_FwFm.csv'
+
+
+def write_deck(filename, line, new_line):
+    with open(get_path(deck)) as file:
+        text = file.read()
+
+    assert line in text
+
+    with open(filename, 'w') as file:
+        file.write(text.replace(line, new_line))
+
+    return filename
+
+
+@use_tempdirs
+class ProblemTemplateTest(unittest.TestCase):
+    def setUp(self):
+        clear_problem_template_cache()
+
+    def run_aviary(self, aircraft_filename, reuse_setup=True):
+        return run_aviary(aircraft_filename, phase_info, 'FLOPS', 'FLOPS',
+                          optimizer='SLSQP', run_driver=False, make_plots=False,
+                          reuse_setup=reuse_setup)
+
+    def test_reuse(self):
+        prob = self.run_aviary(deck)
+        empty_mass = prob.get_val(Aircraft.Design.EMPTY_MASS, 'lbm')
+        self.assertEqual(len(_problem_template_cache), 1)
+
+        # only an input value changes: the same problem is reused, with the same
+        # results as a new problem
+        new_deck = write_deck('sweep.csv', 'aircraft:wing:sweep,25.0,deg',
+                              'aircraft:wing:sweep,30.0,deg')
+        reused_prob = self.run_aviary(new_deck)
+        self.assertIs(reused_prob, prob)
+
+        new_prob = self.run_aviary(new_deck, reuse_setup=False)
+        assert_near_equal(reused_prob.get_val(Aircraft.Design.EMPTY_MASS, 'lbm'),
+                          new_prob.get_val(Aircraft.Design.EMPTY_MASS, 'lbm'), 1e-12)
+
+        # restoring the original inputs gives the original results
+        reused_prob = self.run_aviary(deck)
+        self.assertIs(reused_prob, prob)
+        assert_near_equal(reused_prob.get_val(Aircraft.Design.EMPTY_MASS, 'lbm'),
+                          empty_mass, 1e-12)
+
+        template, = _problem_template_cache.values()
+        self.assertEqual(template.reuses, 2)
+
+        # an option changes: a new problem is built
+        new_deck = write_deck('reduction.csv',
+                              'aircraft:wing:span_efficiency_reduction,False',
+                              'aircraft:wing:span_efficiency_reduction,True')
+        self.assertIsNot(self.run_aviary(new_deck), prob)
+
+    def test_run_driver(self):
+        def run(aircraft_filename):
+            return run_aviary(aircraft_filename, phase_info, 'FLOPS', 'FLOPS',
+                              optimizer='SLSQP', max_iter=1, make_plots=False,
+                              reuse_setup=True)
+
+        prob = run(deck)
+        empty_mass = prob.get_val(Aircraft.Design.EMPTY_MASS, 'lbm').copy()
+
+        # a reused problem records its new run, with the coloring of the first run
+        new_deck = write_deck('sweep.csv', 'aircraft:wing:sweep,25.0,deg',
+                              'aircraft:wing:sweep,30.0,deg')
+        self.assertIs(run(new_deck), prob)
+        self.assertTrue(prob._coloring_path.exists())
+        self.assertEqual(os.listdir(prob.coloring_dir), [prob._coloring_path.name])
+
+        case = om.CaseReader('dymos_solution.db').get_case('final')
+        case_empty_mass = case.get_val(Aircraft.Design.EMPTY_MASS, 'lbm')
+        assert_near_equal(case_empty_mass,
+                          prob.get_val(Aircraft.Design.EMPTY_MASS, 'lbm'), 1e-12)
+        self.assertNotAlmostEqual(case_empty_mass[0], empty_mass[0])
+
+    def test_key(self):
+        def key(phase_info):
+            prob = AviaryProblem(phase_info, 'FLOPS', 'FLOPS')
+            prob.load_inputs(deck)
+            return problem_template_key(prob, optimizer='SLSQP')
+
+        new_phase_info = deepcopy(phase_info)
+        new_phase_info['cruise']['initial_guesses']['altitude'] = ([30000., 31000.],
+                                                                   'ft')
+        self.assertEqual(key(new_phase_info), key(phase_info))
+
+        new_phase_info['cruise']['user_options']['num_segments'] += 1
+        self.assertNotEqual(key(new_phase_info), key(phase_info))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.flops import phase_info
+from aviary.interface import methods_for_level1
+from aviary.interface.methods_for_level1 import run_aviary_sweep
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.named_values import NamedValues
+from aviary.variable_info.variables import Aircraft
+
+
+@use_tempdirs
+class AviarySweepTest(unittest.TestCase):
+    def setUp(self):
+        self.args = ('models/test_aircraft/aircraft_for_bench_FwFm.csv', phase_info,
+                     'FLOPS', 'FLOPS')
+        self.kwargs = {'optimizer': 'SLSQP', 'run_driver': False}
+        self.outputs = {Aircraft.Design.EMPTY_MASS: 'lbm'}
+
+    def test_sweep(self):
+        cases = NamedValues()
+        cases.set_val(Aircraft.Wing.SWEEP, [20., 25., 30.], 'deg')
+
+        results = run_aviary_sweep(*self.args, cases, self.outputs, **self.kwargs)
+        empty_mass = results.get_val(Aircraft.Design.EMPTY_MASS, 'lbm')
+
+        assert_near_equal(results.get_val(Aircraft.Wing.SWEEP, 'deg'), [20., 25., 30.])
+        assert_near_equal(results.get_val('failed'), [0, 0, 0])
+        self.assertLess(empty_mass[0], empty_mass[1])
+        self.assertLess(empty_mass[1], empty_mass[2])
+
+        # results table is written to file, and cases can be read from file
+        written = read_data_file('sweep_results.csv')
+        assert_near_equal(written.get_val(Aircraft.Design.EMPTY_MASS, 'lbm'),
+                          empty_mass, 1e-12)
+
+        # cases do not depend on the order they are run in, or the number of processes
+        cases = NamedValues()
+        cases.set_val(Aircraft.Wing.SWEEP, [30., 20.], 'deg')
+        results = run_aviary_sweep(*self.args, cases, self.outputs,
+                                   results_filename=None, num_procs=2, **self.kwargs)
+        assert_near_equal(results.get_val(Aircraft.Design.EMPTY_MASS, 'lbm'),
+                          empty_mass[[2, 0]], 1e-10)
+
+    def test_failed_case(self):
+        cases = NamedValues()
+        cases.set_val(Aircraft.Wing.SWEEP, [20., 25., 30.], 'deg')
+
+        run_model = AviaryProblem.run_model
+
+        def fail_second_case(prob, *args, **kwargs):
+            if prob.get_val(Aircraft.Wing.SWEEP, 'deg')[0] == 25.:
+                raise RuntimeError('second case failed')
+
+            return run_model(prob, *args, **kwargs)
+
+        # any error is recorded as a failure of its case, and later cases still run
+        with patch.object(AviaryProblem, 'run_model', fail_second_case):
+            with self.assertWarnsRegex(UserWarning, 'second case failed'):
+                results = run_aviary_sweep(*self.args, cases, self.outputs,
+                                           results_filename=None, **self.kwargs)
+
+        assert_near_equal(results.get_val('failed'), [0, 1, 0])
+
+        # the problem is released when the sweep ends
+        self.assertIsNone(methods_for_level1._sweep_problem)
+
+    def test_bad_cases(self):
+        cases = NamedValues()
+        cases.set_val(Aircraft.Wing.SWEEP, [20., 25.], 'deg')
+        cases.set_val(Aircraft.Wing.AREA, [1370.], 'ft**2')
+
+        with self.assertRaises(ValueError):
+            run_aviary_sweep(*self.args, cases, self.outputs, **self.kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
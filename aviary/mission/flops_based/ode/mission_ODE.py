@@ -1,11 +1,11 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere import USatm1976Comp
 
 from aviary.mission.flops_based.ode.mission_EOM import MissionEOM
 from aviary.subsystems.aerodynamics.flops_based.mach_number import MachNumber
 
 from aviary.mission.flops_based.ode.mission_EOM import MissionEOM
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import promote_aircraft_and_mission_vars
 from aviary.variable_info.variable_meta_data import _MetaData
@@ -60,7 +60,7 @@ class MissionODE(om.Group):
             promotes_outputs=['*'])
         self.add_subsystem(
             name='atmosphere',
-            subsys=USatm1976Comp(num_nodes=nn),
+            subsys=get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
             promotes_outputs=[
                 ('sos', Dynamic.Mission.SPEED_OF_SOUND), ('rho', Dynamic.Mission.DENSITY),
@@ -1,8 +1,8 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere import USatm1976Comp
 
 from aviary.mission.flops_based.ode.simple_mission_EOM import MissionEOM
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import promote_aircraft_and_mission_vars
 from aviary.variable_info.variable_meta_data import _MetaData
@@ -61,7 +61,7 @@ class MissionODE(om.Group):
             promotes_outputs=['*'])
         self.add_subsystem(
             name='atmosphere',
-            subsys=USatm1976Comp(num_nodes=nn),
+            subsys=get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
             promotes_outputs=[
                 ('sos', Dynamic.Mission.SPEED_OF_SOUND), ('rho', Dynamic.Mission.DENSITY),
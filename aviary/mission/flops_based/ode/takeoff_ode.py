@@ -3,10 +3,10 @@ Define the ODE for takeoff.
 '''
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.mission.flops_based.ode.takeoff_eom import StallSpeed, TakeoffEOM
 from aviary.mission.gasp_based.flight_conditions import FlightConditions
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import set_aviary_initial_values, promote_aircraft_and_mission_vars
 from aviary.variable_info.variables import Aircraft
@@ -76,7 +76,7 @@ class TakeoffODE(om.Group):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(num_nodes=nn),
+            get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[("h", Dynamic.ALTITUDE)],
             promotes_outputs=[
                 "rho", ("sos", Dynamic.SPEED_OF_SOUND), ("temp", Dynamic.TEMPERATURE),
@@ -35,7 +35,7 @@ class Landing:
         "Cl_max_ldg",
     )
 
-    def build_phase(self, use_detailed=False):
+    def build_phase(self, use_detailed=False, aviary_options=None):
         """
         Construct and return a new phase for landing analysis.
         Parameters
@@ -43,6 +43,8 @@ class Landing:
         use_detailed : bool (False)
             tells whether to use simplified or detailed landing. Currently detailed is
             disabled.
+        aviary_options : AviaryValues (None)
+            collection of Aircraft/Mission specific options
         Returns
         -------
         Group
@@ -59,7 +61,7 @@ class Landing:
         # Add Inputs #
         ##############
 
-        landing = LandingGroup()
+        landing = LandingGroup(aviary_options=aviary_options)
         landing.set_input_defaults(
             Aircraft.Wing.AREA, val=self.ref_wing_area, units="ft**2"
         )
@@ -37,7 +37,7 @@ class Takeoff:
         "num_engines",
     )
 
-    def build_phase(self, use_detailed=False):
+    def build_phase(self, use_detailed=False, aviary_options=None):
         """
         Construct and return a new phase for takeoff analysis.
         Parameters
@@ -45,6 +45,8 @@ class Takeoff:
         use_detailed : bool(False)
             tells whether to use simplified or detailed takeoff. Currently detailed is
             disabled.
+        aviary_options : AviaryValues (None)
+            collection of Aircraft/Mission specific options
         Returns
         -------
         Group
@@ -61,7 +63,8 @@ class Takeoff:
         # Add Inputs #
         ##############
 
-        takeoff = TakeoffGroup(num_engines=self.num_engines)
+        takeoff = TakeoffGroup(num_engines=self.num_engines,
+                               aviary_options=aviary_options)
         takeoff.set_input_defaults(
             Dynamic.Mission.ALTITUDE,
             val=self.airport_altitude,
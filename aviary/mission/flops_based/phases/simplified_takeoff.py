@@ -1,7 +1,8 @@
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.constants import GRAV_ENGLISH_LBM, RHO_SEA_LEVEL_METRIC
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
+from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.functions import add_aviary_input, add_aviary_output
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
@@ -372,12 +373,15 @@ class FinalTakeoffConditions(om.ExplicitComponent):
 class TakeoffGroup(om.Group):
     def initialize(self):
         self.options.declare("num_engines", desc="number of engines on aircraft")
+        self.options.declare(
+            'aviary_options', types=AviaryValues, default=None, allow_none=True,
+            desc='collection of Aircraft/Mission specific options')
 
     def setup(self):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(num_nodes=1),
+            get_atmosphere_comp(1, self.options['aviary_options']),
             promotes_inputs=[("h", Dynamic.Mission.ALTITUDE)],
             promotes_outputs=["rho"],
         )
@@ -1,11 +1,11 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.mission.gasp_based.flight_conditions import FlightConditions
 from aviary.mission.gasp_based.ode.accel_eom import AccelerationRates
 from aviary.mission.gasp_based.ode.base_ode import BaseODE
 from aviary.mission.gasp_based.ode.params import ParamPort
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.mass.mass_to_weight import MassToWeight
 from aviary.variable_info.enums import AnalysisScheme, SpeedType
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
@@ -30,8 +30,7 @@ class AccelODE(BaseODE):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(
-                num_nodes=nn),
+            get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[
                 ("h",
                  Dynamic.Mission.ALTITUDE)],
@@ -1,6 +1,5 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.variable_info.enums import AlphaModes, AnalysisScheme
 from aviary.variable_info.variables import Aircraft, Mission, Dynamic
@@ -10,6 +9,7 @@ from aviary.mission.gasp_based.ode.ascent_eom import AscentEOM
 from aviary.mission.gasp_based.ode.base_ode import BaseODE
 from aviary.mission.gasp_based.ode.params import ParamPort
 from aviary.subsystems.aerodynamics.gasp_based.gaspaero import LowSpeedAero
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.propulsion.propulsion_mission import PropulsionMission
 from aviary.variable_info.enums import AlphaModes
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
@@ -44,8 +44,7 @@ class AscentODE(BaseODE):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(
-                num_nodes=nn),
+            get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[
                 ("h",
                  Dynamic.Mission.ALTITUDE)],
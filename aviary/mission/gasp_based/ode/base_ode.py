@@ -3,6 +3,8 @@ import numpy as np
 
 import openmdao.api as om
 
+from aviary.mission.gasp_based.ode.node_block_solver import NodeBlockDirectSolver
+from aviary.mission.gasp_based.ode.warm_start_solver import WarmStartNewtonSolver
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.enums import AnalysisScheme, AlphaModes
 from aviary.variable_info.variables import Aircraft, Mission, Dynamic
@@ -34,6 +36,18 @@ class BaseODE(om.Group):
             desc='dictionary of parameters to be passed to the subsystem builders'
         )
 
+        self.options.declare(
+            'node_block_solve', types=bool, default=False,
+            desc='if True, the balance groups solve each node independently of the '
+                 'others, otherwise the jacobian of all nodes is factored together'
+        )
+
+        self.options.declare(
+            'warm_start_balances', types=bool, default=False,
+            desc='if True, the Newton solvers of the balance groups start from the last '
+                 'converged solution of the group, kept when the problem is set up again'
+        )
+
     def AddAlphaControl(
         self,
         alpha_group=None,
@@ -152,13 +166,31 @@ class BaseODE(om.Group):
                                       )
 
             if add_default_solver and alpha_mode not in (AlphaModes.ROTATION,):
-                alpha_group.nonlinear_solver = om.NewtonSolver()
+                alpha_group.nonlinear_solver = self.balance_nonlinear_solver()
                 alpha_group.nonlinear_solver.options["solve_subsystems"] = True
                 alpha_group.nonlinear_solver.options["iprint"] = print_level
                 alpha_group.nonlinear_solver.options["atol"] = atol
                 alpha_group.nonlinear_solver.options["rtol"] = rtol
                 alpha_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-                alpha_group.linear_solver = om.DirectSolver(assemble_jac=True)
+                alpha_group.linear_solver = self.balance_linear_solver()
+
+    def balance_nonlinear_solver(self, **kwargs):
+        '''
+        Return a new Newton solver for a group of balances.
+        '''
+        if self.options['warm_start_balances']:
+            return WarmStartNewtonSolver(**kwargs)
+
+        return om.NewtonSolver(**kwargs)
+
+    def balance_linear_solver(self):
+        '''
+        Return a new linear solver for a group of balances that are solved with Newton.
+        '''
+        if self.options['node_block_solve']:
+            return NodeBlockDirectSolver(assemble_jac=True)
+
+        return om.DirectSolver(assemble_jac=True)
 
     def AddThrottleControl(
         self,
@@ -196,7 +228,7 @@ class BaseODE(om.Group):
             prop_group.linear_solver = om.DirectSolver()
             prop_group.linear_solver.options["iprint"] = print_level
 
-            prop_group.nonlinear_solver = om.NewtonSolver()
+            prop_group.nonlinear_solver = self.balance_nonlinear_solver()
             prop_group.nonlinear_solver.options["err_on_non_converge"] = False
             prop_group.nonlinear_solver.options["solve_subsystems"] = True
             prop_group.nonlinear_solver.options["maxiter"] = 20
@@ -204,7 +236,7 @@ class BaseODE(om.Group):
             prop_group.nonlinear_solver.options["atol"] = atol
             prop_group.nonlinear_solver.options["rtol"] = rtol
             prop_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-            prop_group.linear_solver = om.DirectSolver(assemble_jac=True)
+            prop_group.linear_solver = self.balance_linear_solver()
 
         if prop_group is not self:
             self.add_subsystem(
@@ -1,11 +1,11 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.mission.gasp_based.flight_conditions import FlightConditions
 from aviary.mission.gasp_based.ode.base_ode import BaseODE
 from aviary.mission.gasp_based.ode.params import ParamPort
 from aviary.mission.gasp_based.phases.breguet import RangeComp
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.mass.mass_to_weight import MassToWeight
 from aviary.subsystems.propulsion.propulsion_builder import PropulsionBuilderBase
 from aviary.variable_info.enums import SpeedType
@@ -23,8 +23,7 @@ class BreguetCruiseODESolution(BaseODE):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(
-                num_nodes=nn),
+            get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[
                 ("h",
                  Dynamic.Mission.ALTITUDE)],
@@ -100,7 +99,7 @@ class BreguetCruiseODESolution(BaseODE):
 
         prop_group.linear_solver = om.DirectSolver()
 
-        prop_group.nonlinear_solver = om.NewtonSolver(
+        prop_group.nonlinear_solver = self.balance_nonlinear_solver(
             solve_subsystems=True,
             maxiter=20,
             rtol=1e-12,
@@ -1,6 +1,5 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.mission.gasp_based.flight_conditions import FlightConditions
 from aviary.mission.gasp_based.ode.base_ode import BaseODE
@@ -10,6 +9,7 @@ from aviary.mission.gasp_based.ode.constraints.flight_constraints import \
 from aviary.mission.gasp_based.ode.constraints.speed_constraints import SpeedConstraints
 from aviary.mission.gasp_based.ode.params import ParamPort
 from aviary.subsystems.aerodynamics.aerodynamics_builder import AerodynamicsBuilderBase
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.propulsion.propulsion_builder import PropulsionBuilderBase
 from aviary.subsystems.propulsion.propulsion_mission import PropulsionMission
 from aviary.variable_info.enums import AnalysisScheme, AlphaModes, SpeedType
@@ -57,8 +57,7 @@ class ClimbODE(BaseODE):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(
-                num_nodes=nn),
+            get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[
                 ("h",
                  Dynamic.Mission.ALTITUDE)],
@@ -85,13 +84,13 @@ class ClimbODE(BaseODE):
                 "mach_balance_group", subsys=om.Group(), promotes=["*"]
             )
 
-            mach_balance_group.nonlinear_solver = om.NewtonSolver()
+            mach_balance_group.nonlinear_solver = self.balance_nonlinear_solver()
             mach_balance_group.nonlinear_solver.options["solve_subsystems"] = True
             mach_balance_group.nonlinear_solver.options["iprint"] = 0
             mach_balance_group.nonlinear_solver.options["atol"] = 1e-7
             mach_balance_group.nonlinear_solver.options["rtol"] = 1e-7
             mach_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-            mach_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+            mach_balance_group.linear_solver = self.balance_linear_solver()
             mach_balance_group.add_subsystem(
                 "speeds",
                 SpeedConstraints(
@@ -170,13 +169,13 @@ class ClimbODE(BaseODE):
                                        promotes_outputs=subsystem.mission_outputs(**kwargs))
 
         # maybe replace this with the solver in AddAlphaControl?
-        lift_balance_group.nonlinear_solver = om.NewtonSolver()
+        lift_balance_group.nonlinear_solver = self.balance_nonlinear_solver()
         lift_balance_group.nonlinear_solver.options["solve_subsystems"] = True
         lift_balance_group.nonlinear_solver.options["iprint"] = 0
         lift_balance_group.nonlinear_solver.options["atol"] = 1e-7
         lift_balance_group.nonlinear_solver.options["rtol"] = 1e-7
         lift_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        lift_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        lift_balance_group.linear_solver = self.balance_linear_solver()
 
         lift_balance_group.add_subsystem(
             "eom",
@@ -1,6 +1,5 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.variable_info.enums import AnalysisScheme, AlphaModes, SpeedType
 from aviary.variable_info.variables import Mission, Dynamic
@@ -18,6 +17,7 @@ from aviary.mission.gasp_based.ode.descent_eom import DescentRates
 from aviary.variable_info.enums import AnalysisScheme, SpeedType
 from aviary.variable_info.variables import Dynamic
 from aviary.subsystems.aerodynamics.aerodynamics_builder import AerodynamicsBuilderBase
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.propulsion.propulsion_builder import PropulsionBuilderBase
 
 
@@ -65,8 +65,7 @@ class DescentODE(BaseODE):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(
-                num_nodes=nn),
+            get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[
                 ("h",
                  Dynamic.Mission.ALTITUDE)],
@@ -95,13 +94,13 @@ class DescentODE(BaseODE):
                     "mach_balance_group", subsys=om.Group(), promotes=["*"]
                 )
 
-                mach_balance_group.nonlinear_solver = om.NewtonSolver()
+                mach_balance_group.nonlinear_solver = self.balance_nonlinear_solver()
                 mach_balance_group.nonlinear_solver.options["solve_subsystems"] = True
                 mach_balance_group.nonlinear_solver.options["iprint"] = 0
                 mach_balance_group.nonlinear_solver.options["atol"] = 1e-7
                 mach_balance_group.nonlinear_solver.options["rtol"] = 1e-7
                 mach_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-                mach_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+                mach_balance_group.linear_solver = self.balance_linear_solver()
 
                 speed_bal = om.BalanceComp(
                     name=Dynamic.Mission.MACH,
@@ -159,13 +158,13 @@ class DescentODE(BaseODE):
         )
 
         # maybe replace this with the solver in AddAlphaControl?
-        lift_balance_group.nonlinear_solver = om.NewtonSolver()
+        lift_balance_group.nonlinear_solver = self.balance_nonlinear_solver()
         lift_balance_group.nonlinear_solver.options["solve_subsystems"] = True
         lift_balance_group.nonlinear_solver.options["iprint"] = 0
         lift_balance_group.nonlinear_solver.options["atol"] = 1e-7
         lift_balance_group.nonlinear_solver.options["rtol"] = 1e-7
         lift_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        lift_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        lift_balance_group.linear_solver = self.balance_linear_solver()
 
         lift_balance_group.add_subsystem(
             "eom",
@@ -1,6 +1,6 @@
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.mass.mass_to_weight import MassToWeight
 
 from aviary.variable_info.enums import AlphaModes, AnalysisScheme, SpeedType
@@ -97,7 +97,7 @@ class FlightPathODE(BaseODE):
 
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(num_nodes=nn),
+            get_atmosphere_comp(nn, aviary_options),
             promotes_inputs=[("h", Dynamic.Mission.ALTITUDE)],
             promotes_outputs=["rho", ("sos", Dynamic.Mission.SPEED_OF_SOUND),
                               ("temp", Dynamic.Mission.TEMPERATURE), ("pres", Dynamic.Mission.STATIC_PRESSURE), "viscosity", "drhos_dh"],
@@ -0,0 +1,253 @@
+"""
+Define a direct linear solver for groups whose nodes are independent of each other.
+
+Classes
+-------
+NodeBlockDirectSolver : direct solver that factors the small per-node blocks of an
+    assembled jacobian, instead of the jacobian of the whole group.
+"""
+import numpy as np
+import openmdao.api as om
+from openmdao.solvers.linear.direct import format_singular_error
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+class NodeBlockDirectSolver(om.DirectSolver):
+    """
+    DirectSolver for groups made of vectorized components, where every node can be
+    solved independently of the others.
+
+    The assembled jacobian is split into its strongly connected blocks, which are
+    ordered in levels so that each block only depends on blocks of lower levels (for
+    example, a scalar computed from options that feeds every node). All blocks of a
+    level are inverted and solved together as a stack of small dense matrices, so the
+    cost of factoring and solving grows linearly with the number of nodes.
+
+    The block inverses replace the LU factorization of DirectSolver, which still runs
+    the solve itself. If the jacobian is not assembled as a sparse matrix, or has a
+    block larger than max_block_size (e.g. the nodes are coupled by an integration),
+    the solver falls back to a single LU factorization of the whole jacobian, the same
+    as DirectSolver.
+    """
+
+    SOLVER = 'LN: NodeBlockDirect'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._levels = None
+        self._structure = None
+
+    def _declare_options(self):
+        super()._declare_options()
+
+        self.options.declare(
+            'max_block_size', types=int, default=64, lower=1,
+            desc='Largest coupled block that is inverted directly. Jacobians with '
+                 'larger blocks are factored as a whole.')
+
+    def _linearize(self):
+        """
+        Perform factorization.
+        """
+        self._levels = None
+        matrix = self._get_sparse_jacobian()
+
+        if matrix is None:
+            super()._linearize()
+            return
+
+        # the sparsity pattern of an assembled jacobian does not change between
+        # linearizations, so the blocks only need to be found once
+        if self._structure is None or \
+                not np.array_equal(self._structure[0], matrix.indptr) or \
+                not np.array_equal(self._structure[1], matrix.indices):
+            self._structure = (matrix.indptr.copy(), matrix.indices.copy(),
+                               self._find_blocks(matrix))
+
+        structure = self._structure[2]
+
+        if structure is None:
+            super()._linearize()
+            return
+
+        data = matrix.data
+        levels = []
+
+        for rows, off_diagonal, off_diagonal_T, groups in structure:
+            off_diagonal, entries = off_diagonal
+            off_diagonal.data = data[entries]
+
+            off_diagonal_T, entries = off_diagonal_T
+            off_diagonal_T.data = data[entries]
+
+            inverses = []
+
+            for index, entries, location in groups:
+                mtx = np.zeros((index.shape[0], index.shape[1], index.shape[1]),
+                               dtype=data.dtype)
+                mtx[location] = data[entries]
+
+                try:
+                    inverses.append((index, np.linalg.inv(mtx)))
+                except np.linalg.LinAlgError:
+                    raise RuntimeError(format_singular_error(self._system(), matrix))
+
+            levels.append((rows, off_diagonal, off_diagonal_T, inverses))
+
+        self._levels = levels
+        # DirectSolver.solve uses the LU factorization of a sparse jacobian through
+        # its solve method only
+        self._lu = _NodeBlockLU(levels)
+
+    def _get_sparse_jacobian(self):
+        """
+        Return the assembled jacobian of the group as a CSC matrix.
+
+        Returns
+        -------
+        scipy.sparse.csc_matrix or None
+            The jacobian, or None if it is not assembled as a sparse matrix.
+        """
+        # OpenMDAO has no public access to the assembled matrix, checked against
+        # OpenMDAO 3.30; any other layout falls back to DirectSolver
+        try:
+            matrix = self._assembled_jac._int_mtx._matrix
+        except AttributeError:
+            return None
+
+        if not isinstance(matrix, csc_matrix):
+            return None
+
+        return matrix
+
+    def _find_blocks(self, matrix):
+        """
+        Split a sparse matrix into levels of independent blocks.
+
+        Parameters
+        ----------
+        matrix : scipy.sparse.csc_matrix
+            Assembled jacobian, with no duplicate entries.
+
+        Returns
+        -------
+        list or None
+            For each level, the variables of the level, the entries of the matrix that
+            couple them to other levels (as a matrix and its transpose, each with the
+            location of their data in the jacobian), and the blocks of the level grouped
+            by size. None if any block is larger than max_block_size.
+        """
+        size = matrix.shape[0]
+
+        num_blocks, labels = connected_components(matrix, directed=True,
+                                                  connection='strong')
+        block_sizes = np.bincount(labels, minlength=num_blocks)
+
+        if block_sizes.max(initial=0) > self.options['max_block_size']:
+            return None
+
+        # track where each entry is stored in the data of the jacobian
+        coo = csc_matrix((np.arange(matrix.nnz), matrix.indices, matrix.indptr),
+                         shape=matrix.shape).tocoo()
+        row_block = labels[coo.row]
+        col_block = labels[coo.col]
+        diagonal = row_block == col_block
+
+        # level of each block is one more than the highest level it depends on
+        dep_row = row_block[~diagonal]
+        dep_col = col_block[~diagonal]
+        block_level = np.zeros(num_blocks, dtype=int)
+
+        for _ in range(num_blocks):
+            new_level = block_level.copy()
+            np.maximum.at(new_level, dep_row, block_level[dep_col] + 1)
+
+            if np.array_equal(new_level, block_level):
+                break
+
+            block_level = new_level
+
+        # position of each variable within its block
+        order = np.argsort(labels, kind='stable')
+        block_start = np.concatenate(([0], np.cumsum(block_sizes)[:-1]))
+        position = np.empty(size, dtype=int)
+        position[order] = np.arange(size) - block_start[labels[order]]
+
+        # the entry indices are stored as data (offset by one, so none are dropped as
+        # explicit zeros) so the sliced matrices can be filled from the jacobian later
+        off_diagonal = csr_matrix(
+            (coo.data[~diagonal] + 1., (coo.row[~diagonal], coo.col[~diagonal])),
+            shape=matrix.shape)
+        off_diagonal_T = off_diagonal.T.tocsr()
+
+        levels = []
+
+        for level in range(block_level.max(initial=-1) + 1):
+            groups = []
+            level_blocks = np.flatnonzero(block_level == level)
+
+            for block_size in np.unique(block_sizes[level_blocks]):
+                blocks = level_blocks[block_sizes[level_blocks] == block_size]
+                index = order[block_start[blocks][:, np.newaxis] +
+                              np.arange(block_size)]
+
+                # which of the stacked blocks each variable belongs to
+                local = np.full(size, -1)
+                local[index] = np.arange(blocks.size)[:, np.newaxis]
+
+                mask = diagonal & (local[coo.row] >= 0)
+                location = (local[coo.row[mask]], position[coo.row[mask]],
+                            position[coo.col[mask]])
+
+                groups.append((index, coo.data[mask], location))
+
+            rows = np.concatenate([index.ravel() for index, _, _ in groups])
+
+            sliced = []
+            for mtx in (off_diagonal, off_diagonal_T):
+                mtx = mtx[rows]
+                sliced.append((mtx, mtx.data.astype(int) - 1))
+
+            levels.append((rows, *sliced, groups))
+
+        return levels
+
+
+class _NodeBlockLU(object):
+    """
+    Solve with the block inverses of NodeBlockDirectSolver, in place of the sparse LU
+    factorization used by DirectSolver.
+    """
+
+    def __init__(self, levels):
+        self.levels = levels
+
+    def solve(self, b, trans='N'):
+        """
+        Solve the linear system (or its transpose if trans is 'T') for b.
+        """
+        if trans == 'N':
+            levels = self.levels
+            subscripts = 'mij,mj->mi'
+        else:
+            levels = self.levels[::-1]
+            subscripts = 'mji,mj->mi'
+
+        x = np.zeros_like(b)
+
+        for rows, off_diagonal, off_diagonal_T, inverses in levels:
+            if trans == 'N':
+                rhs = b[rows] - off_diagonal @ x
+            else:
+                rhs = b[rows] - off_diagonal_T @ x
+
+            start = 0
+            for index, inverse in inverses:
+                end = start + index.size
+                x[index] = np.einsum(subscripts, inverse,
+                                     rhs[start:end].reshape(index.shape))
+                start = end
+
+        return x
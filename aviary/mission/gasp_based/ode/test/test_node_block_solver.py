@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.mission.gasp_based.ode.node_block_solver import NodeBlockDirectSolver
+
+
+def build_balance_problem(linear_solver, num_nodes=5, coupled=False, mode='auto',
+                          jac_type='csc'):
+    nn = num_nodes
+
+    prob = om.Problem()
+    group = prob.model.add_subsystem('group', om.Group(), promotes=['*'])
+    group.options['assembled_jac_type'] = jac_type
+
+    # scalar that feeds every node
+    group.add_subsystem('scale', om.ExecComp('s = 2*c', c=3.), promotes=['*'])
+
+    if coupled:
+        # running sum over nodes couples every node to the ones before it
+        group.add_subsystem(
+            'eom',
+            om.ExecComp('y = s*x**2 + dot(L, x) - a',
+                        x={'shape': nn}, y={'shape': nn}, a={'shape': nn},
+                        L={'val': np.tril(np.ones((nn, nn)))}),
+            promotes=['*'])
+    else:
+        group.add_subsystem(
+            'aux',
+            om.ExecComp('z = 0.5*x*a', x={'shape': nn}, z={'shape': nn},
+                        a={'shape': nn}, has_diag_partials=True),
+            promotes=['*'])
+        group.add_subsystem(
+            'eom',
+            om.ExecComp('y = s*x**2 + z - a', x={'shape': nn}, y={'shape': nn},
+                        z={'shape': nn}, a={'shape': nn}, has_diag_partials=True),
+            promotes=['*'])
+
+    group.add_subsystem('balance', om.BalanceComp('x', val=np.ones(nn), lhs_name='y',
+                                                  rhs_val=0.), promotes=['*'])
+
+    group.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-12,
+                                             rtol=1e-12, iprint=0)
+    group.linear_solver = linear_solver
+
+    prob.setup(mode=mode)
+    prob.set_val('a', np.linspace(1., 10., nn))
+
+    return prob
+
+
+class NodeBlockDirectSolverTest(unittest.TestCase):
+    def test_block_solve(self):
+        expected = build_balance_problem(om.DirectSolver(assemble_jac=True))
+        expected.run_model()
+        expected_totals = expected.compute_totals(['x', 'z'], ['a', 'c'])
+
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                solver = NodeBlockDirectSolver(assemble_jac=True)
+                prob = build_balance_problem(solver, mode=mode)
+                prob.run_model()
+
+                assert_near_equal(prob.get_val('x'), expected.get_val('x'), 1e-12)
+                # the nodes, and the scalar feeding them, are solved as separate blocks
+                self.assertIsNotNone(solver._levels)
+                self.assertEqual(max(index.shape[1] for _, _, _, inverses
+                                     in solver._levels for index, _ in inverses), 3)
+
+                totals = prob.compute_totals(['x', 'z'], ['a', 'c'])
+                for key, val in expected_totals.items():
+                    assert_near_equal(totals[key], val, 1e-10)
+
+    def test_coupled_nodes(self):
+        expected = build_balance_problem(om.DirectSolver(assemble_jac=True),
+                                         coupled=True)
+        expected.run_model()
+
+        solver = NodeBlockDirectSolver(assemble_jac=True, max_block_size=4)
+        prob = build_balance_problem(solver, coupled=True)
+        prob.run_model()
+
+        # nodes are coupled, so the whole jacobian is factored the same as DirectSolver
+        self.assertIsNone(solver._levels)
+        assert_near_equal(prob.get_val('x'), expected.get_val('x'), 1e-12)
+
+        totals = prob.compute_totals(['x'], ['a'])
+        expected_totals = expected.compute_totals(['x'], ['a'])
+        assert_near_equal(totals['x', 'a'], expected_totals['x', 'a'], 1e-10)
+
+    def test_dense_jacobian(self):
+        expected = build_balance_problem(om.DirectSolver(assemble_jac=True))
+        expected.run_model()
+
+        solver = NodeBlockDirectSolver(assemble_jac=True)
+        prob = build_balance_problem(solver, jac_type='dense')
+        prob.run_model()
+
+        # a dense jacobian is factored the same as DirectSolver
+        self.assertIsNone(solver._levels)
+        assert_near_equal(prob.get_val('x'), expected.get_val('x'), 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,399 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.mission.gasp_based.ode.time_integration_base_classes import SimuPyProblem, \
+    _node_totals
+from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
+
+
+def build_decay_problem(**kwargs):
+    ode = om.Group()
+    ode.add_subsystem(
+        'eom',
+        om.ExecComp(
+            ['x_rate = -k*x', 'y = 2*x'],
+            x={'units': 'unitless'},
+            x_rate={'units': '1/s'},
+            k={'units': '1/s'},
+            y={'units': 'unitless'},
+        ),
+        promotes=['*'],
+    )
+
+    return SimuPyProblem(
+        ode,
+        time_independent=True,
+        state_names=['x'],
+        state_units=['unitless'],
+        state_rate_names=['x_rate'],
+        state_rate_units=['1/s'],
+        parameter_names=['k'],
+        parameter_units=['1/s'],
+        output_names=['y'],
+        output_units=['unitless'],
+        **kwargs,
+    )
+
+
+class BatchedDecayODE(om.Group):
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, types=int)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        self.add_subsystem(
+            'eom',
+            om.ExecComp(
+                ['x_rate = -k*x', 'y = 2*x'],
+                x={'units': 'unitless', 'shape': nn},
+                x_rate={'units': '1/s', 'shape': nn},
+                k={'units': '1/s', 'shape': nn},
+                y={'units': 'unitless', 'shape': nn},
+            ),
+            promotes=['*'],
+        )
+
+
+class BatchedDecayProblem(SimuPyProblem):
+    def __init__(self, num_nodes, x_end):
+        super().__init__(
+            BatchedDecayODE(num_nodes=num_nodes),
+            time_independent=True,
+            state_names=['x'],
+            state_units=['unitless'],
+            state_rate_names=['x_rate'],
+            state_rate_units=['1/s'],
+            parameter_names=['k'],
+            parameter_units=['1/s'],
+            output_names=['y'],
+            output_units=['unitless'],
+        )
+        self.x_end = x_end
+        self.event_channel_names = ['x']
+        self.num_events = len(self.event_channel_names) * self.num_nodes
+
+    def event_equation_function(self, t, x):
+        return x - self.x_end
+
+
+class TimedDecayODE(om.Group):
+    def initialize(self):
+        self.options.declare('num_nodes', default=1, types=int)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        self.add_subsystem(
+            'eom',
+            om.ExecComp(
+                ['x_rate = -c*k*x', 's_rate = 1. + 0.*s', 'y = 2*x'],
+                x={'units': 'unitless', 'shape': nn},
+                s={'units': 's', 'shape': nn},
+                x_rate={'units': '1/s', 'shape': nn},
+                s_rate={'units': 'unitless', 'shape': nn},
+                k={'units': '1/s', 'shape': nn},
+                c={'units': 'unitless'},
+                y={'units': 'unitless', 'shape': nn},
+            ),
+            promotes=['*'],
+        )
+
+
+class TimedDecayProblem(SimuPyProblem):
+    def __init__(self, num_nodes, s_end):
+        super().__init__(
+            TimedDecayODE(num_nodes=num_nodes),
+            time_independent=True,
+            state_names=['x', 's'],
+            state_units=['unitless', 's'],
+            state_rate_names=['x_rate', 's_rate'],
+            state_rate_units=['1/s', 'unitless'],
+            parameter_names=['k', 'c'],
+            parameter_units=['1/s', 'unitless'],
+            output_names=['y'],
+            output_units=['unitless'],
+        )
+        self.s_end = s_end
+        self.event_channel_names = ['s']
+        self.num_events = len(self.event_channel_names) * self.num_nodes
+
+    def event_equation_function(self, t, x):
+        return x.reshape(2, -1)[1] - self.s_end
+
+
+class SimuPyProblemCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.problem = build_decay_problem(cache_size=2)
+        self.problem.output_nan = False
+
+    def test_repeated_evaluation(self):
+        problem = self.problem
+        problem.set_val('k', 0.5, units='1/s')
+
+        assert_near_equal(problem.state_equation_function(0., np.array([4.])), [-2.])
+        assert_near_equal(problem.output_equation_function(0., np.array([4.])), [8.])
+        self.assertEqual((problem.cache_hits, problem.cache_misses), (1, 1))
+
+        # a new point must run the model, returning to the old one must not
+        assert_near_equal(problem.state_equation_function(0., np.array([2.])), [-1.])
+        assert_near_equal(problem.state_equation_function(0., np.array([4.])), [-2.])
+        self.assertEqual((problem.cache_hits, problem.cache_misses), (2, 2))
+
+        # outputs read from the model are current with the last requested point
+        assert_near_equal(problem.get_val('y'), [8.])
+
+        # changing a parameter changes the key
+        problem.set_val('k', 1.0, units='1/s')
+        assert_near_equal(problem.state_equation_function(0., np.array([4.])), [-4.])
+        self.assertEqual((problem.cache_hits, problem.cache_misses), (2, 3))
+
+    def test_cache_size(self):
+        problem = self.problem
+        problem.set_val('k', 0.5, units='1/s')
+
+        for x in (1., 2., 3., 1.):
+            problem.state_equation_function(0., np.array([x]))
+
+        # the cache only holds the two most recent points
+        self.assertEqual((problem.cache_hits, problem.cache_misses), (0, 4))
+
+        problem.clear_cache()
+        self.assertEqual((problem.cache_hits, problem.cache_misses), (0, 0))
+
+        problem = build_decay_problem(cache_size=0)
+        problem.set_val('k', 0.5, units='1/s')
+
+        for x in (1., 1.):
+            assert_near_equal(problem.state_equation_function(0., np.array([x])),
+                              [-0.5])
+
+        self.assertEqual((problem.cache_hits, problem.cache_misses), (0, 0))
+
+    def test_lagged_feedback(self):
+        # 'rate' runs before the component that computes its input
+        ode = om.Group()
+        ode.add_subsystem('rate', om.ExecComp('x_rate = -z'), promotes=['*'])
+        ode.add_subsystem('lag', om.ExecComp('z = k*x'), promotes=['*'])
+
+        problem = SimuPyProblem(
+            ode,
+            time_independent=True,
+            state_names=['x'],
+            state_units=['unitless'],
+            state_rate_names=['x_rate'],
+            state_rate_units=['unitless'],
+            parameter_names=['k'],
+            parameter_units=['unitless'],
+            output_names=['z'],
+            output_units=['unitless'],
+        )
+        problem.output_nan = False
+        problem.set_val('k', 0.5)
+
+        self.assertTrue(problem.lagged)
+        self.assertFalse(self.problem.lagged)
+
+        # each evaluation runs the model, as the lagged output changes between runs
+        assert_near_equal(problem.state_equation_function(0., np.array([4.])), [-1.])
+        assert_near_equal(problem.state_equation_function(0., np.array([4.])), [-2.])
+        self.assertEqual((problem.cache_hits, problem.cache_misses), (0, 0))
+
+
+class SimuPyProblemAccessTestCase(unittest.TestCase):
+    def test_unit_conversion(self):
+        ode = om.Group()
+        ode.add_subsystem(
+            'eom',
+            om.ExecComp(
+                ['h_rate = v', 'T = 288.15 - 0.0065*h'],
+                h={'units': 'm'},
+                v={'units': 'm/s'},
+                h_rate={'units': 'm/s'},
+                T={'units': 'K'},
+            ),
+            promotes=['*'],
+        )
+
+        problem = SimuPyProblem(
+            ode,
+            time_independent=True,
+            state_names=['h'],
+            state_units=['ft'],
+            state_rate_names=['h_rate'],
+            state_rate_units=['ft/s'],
+            parameter_names=['v'],
+            parameter_units=['ft/s'],
+            output_names=['T'],
+            output_units=['degC'],
+        )
+        problem.output_nan = False
+
+        problem.state = np.array([1000.])
+        problem.parameter = np.array([10.])
+        assert_near_equal(problem.get_val('h', units='m'), [304.8], 1e-12)
+        assert_near_equal(problem.get_val('v', units='m/s'), [3.048], 1e-12)
+
+        assert_near_equal(problem.state_equation_function(0., np.array([2000.])),
+                          [10.], 1e-12)
+        assert_near_equal(problem.output_equation_function(0., np.array([2000.])),
+                          [15. - 0.0065 * 609.6], 1e-12)
+        assert_near_equal(problem.state, [2000.], 1e-12)
+        assert_near_equal(problem.parameter, [10.], 1e-12)
+
+
+class SimuPyProblemCheckpointTestCase(unittest.TestCase):
+    def setUp(self):
+        problem = self.problem = BatchedDecayProblem(1, x_end=1.)
+        problem.set_val('k', 0.5, units='1/s')
+        problem.initial_condition = np.array([4.])
+
+        self.run_count = 0
+        run_model = problem.prob.run_model
+
+        def counted_run_model(*args, **kwargs):
+            self.run_count += 1
+            return run_model(*args, **kwargs)
+
+        problem.prob.run_model = counted_run_model
+
+    def test_restore(self):
+        problem = self.problem
+        problem.record_checkpoints(2**20)
+        result = problem.simulate((0., 100.))
+        # SimuPy also evaluates the first point past the event, which is not stored
+        self.assertEqual(len(problem.checkpoints), result.t.size + 1)
+
+        # recorded points do not re-run the model
+        run_count = self.run_count
+        for t, x in zip(result.t[::-1], result.x[::-1]):
+            problem.restore_checkpoint(t, x)
+            assert_near_equal(problem.get_val('y'), 2. * x, 1e-12)
+        self.assertEqual(self.run_count, run_count)
+
+        # other points are re-run
+        problem.restore_checkpoint(0.5, np.array([3.]))
+        assert_near_equal(problem.get_val('y'), [6.], 1e-12)
+        self.assertEqual(self.run_count, run_count + 1)
+
+    def test_memory(self):
+        problem = self.problem
+        problem.record_checkpoints(2**20)
+        problem.simulate((0., 100.))
+        size = problem.checkpoint_bytes // len(problem.checkpoints)
+
+        problem.record_checkpoints(4 * size)
+        result = problem.simulate((0., 100.))
+
+        # every other point is discarded each time the memory is exceeded
+        self.assertLessEqual(problem.checkpoint_bytes, 4 * size)
+        self.assertEqual(len(problem.checkpoints),
+                         problem.checkpoint_bytes // size)
+        self.assertGreater(problem._checkpoint_stride, 1)
+
+        for t, x in zip(result.t, result.x):
+            problem.restore_checkpoint(t, x)
+            assert_near_equal(problem.get_val('y'), 2. * x, 1e-12)
+
+
+class SimuPyProblemBatchTestCase(unittest.TestCase):
+    def test_separate_events(self):
+        k = np.array([0.5, 1., 2.])
+        problem = BatchedDecayProblem(3, x_end=1.)
+        self.assertEqual(problem.dim_state, 3)
+
+        problem.set_val('k', k, units='1/s')
+        problem.initial_condition = np.full(3, 4.)
+        result = problem.simulate((0., 100.))
+
+        # each trajectory is held at its own event until the slowest one ends
+        assert_near_equal(result.x[-1], np.ones(3), 1e-4)
+        assert_near_equal(result.t[-1], np.log(4.) / k[0], 1e-4)
+        assert_near_equal(problem.node_time(result.t[-1]), np.log(4.) / k, 1e-4)
+
+    def test_initial_node_time(self):
+        problem = BatchedDecayProblem(2, x_end=1.)
+        problem.set_val('k', [1., 1.], units='1/s')
+        problem.initial_condition = np.array([4., 2.])
+        problem.initial_node_time = np.array([10., 20.])
+        result = problem.simulate((0., 100.))
+
+        assert_near_equal(problem.node_time(result.t[-1]),
+                          [10. + np.log(4.), 20. + np.log(2.)], 1e-4)
+
+
+class FlexibleTrajBatchTestCase(unittest.TestCase):
+    def run_traj(self, k, s0):
+        nn = len(k)
+        vals_to_set = {'k': {'val': k, 'units': '1/s'}}
+        phases = {
+            f'decay{s_end}': {
+                'ode': TimedDecayProblem(nn, s_end=s_end),
+                'vals_to_set': vals_to_set,
+            }
+            for s_end in (1., 2.)
+        }
+
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'traj',
+            FlexibleTraj(
+                num_nodes=nn,
+                Phases=phases,
+                param_dict={'c': {'val': 1., 'units': 'unitless'}},
+                traj_final_state_output=['x'],
+                traj_promote_final_output=['y'],
+                traj_initial_state_input=['x', 's'],
+            ),
+            promotes=['*'],
+        )
+        prob.setup()
+        prob.set_val('x_initial', 4.)
+        prob.set_val('s_initial', s0)
+        prob.set_val('c', 0.5)
+        prob.run_model()
+
+        return prob
+
+    def test_batch(self):
+        k = np.array([1., 2., 0.5])
+        s0 = np.array([0., 0.5, 0.8])
+        of = ['x_final', 'y_final']
+        wrt = ['x_initial', 's_initial', 'c']
+
+        # the trajectories end each phase at different times
+        prob = self.run_traj(k, s0)
+        assert_near_equal(prob.get_val('x_final'), 4. * np.exp(-0.5 * k * (2. - s0)),
+                          1e-4)
+        totals = prob.compute_totals(of, wrt)
+
+        for node in range(k.size):
+            single_prob = self.run_traj(k[[node]], s0[[node]])
+            assert_near_equal(prob.get_val('x_final')[node],
+                              single_prob.get_val('x_final'), 1e-4)
+            assert_near_equal(prob.get_val('y_final')[node],
+                              single_prob.get_val('y_final'), 1e-4)
+
+            single_totals = single_prob.compute_totals(of, wrt)
+            for key, single_total in single_totals.items():
+                # outputs only depend on the initial states of their own trajectory
+                total = totals[key][node]
+                if key[1] != 'c':
+                    assert_near_equal(np.delete(total, node), np.zeros(k.size - 1))
+                    total = total[node]
+
+                assert_near_equal(total, single_total.squeeze(), 1e-3)
+
+    def test_node_totals(self):
+        totals = np.arange(9.).reshape(3, 3)
+        assert_near_equal(_node_totals(totals, 3), [0., 4., 8.])
+
+        # single values are shared by every trajectory
+        assert_near_equal(_node_totals(totals[:, :1], 3), [0., 3., 6.])
+        assert_near_equal(_node_totals(totals[:1], 3), [0., 1., 2.])
+        assert_near_equal(_node_totals(np.array(2.), 3), [2., 2., 2.])
+
+
+if __name__ == "__main__":
+    unittest.main()
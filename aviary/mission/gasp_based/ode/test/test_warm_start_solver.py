@@ -0,0 +1,141 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.mission.gasp_based.ode.warm_start_solver import WarmStartNewtonSolver, \
+    clear_warm_start_cache, _warm_start_cache
+
+
+class BalanceModel(om.Group):
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare('solver_options', types=dict, default={})
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        group = self.add_subsystem('group', om.Group(), promotes=['*'])
+
+        group.add_subsystem(
+            'eom',
+            om.ExecComp('y = x**3 + x - a', x={'shape': nn}, y={'shape': nn},
+                        a={'shape': nn}, has_diag_partials=True),
+            promotes=['*'])
+        group.add_subsystem('balance', om.BalanceComp('x', val=np.full(nn, 10.),
+                                                      lhs_name='y', rhs_val=0.),
+                            promotes=['*'])
+        group.nonlinear_solver = WarmStartNewtonSolver(
+            solve_subsystems=False, atol=1e-12, rtol=1e-12, iprint=-1,
+            **self.options['solver_options'])
+        group.linear_solver = om.DirectSolver()
+
+
+def build_balance_problem(num_nodes, **kwargs):
+    prob = om.Problem(BalanceModel(num_nodes=num_nodes, solver_options=kwargs))
+    prob.setup()
+
+    return prob
+
+
+def setup_again(prob, num_nodes):
+    # like the refinement of a grid, the model is set up again with new nodes
+    prob.model.options['num_nodes'] = num_nodes
+    prob.setup()
+    prob.final_setup()
+
+    return prob
+
+
+def solve(prob, t):
+    # x**3 + x - a = 0 is solved by x = t
+    prob.set_val('a', t**3 + t)
+    prob.run_model()
+
+    return prob.model.group.nonlinear_solver
+
+
+class WarmStartNewtonSolverTest(unittest.TestCase):
+    def setUp(self):
+        clear_warm_start_cache()
+
+    def test_warm_start(self):
+        t = np.linspace(1., 2., 5)
+        prob = build_balance_problem(5)
+        solver = solve(prob, t)
+        cold_iterations = solver._iter_count
+        self.assertEqual(solver.warm_starts, 0)
+        self.assertEqual(solver.cold_solves, 1)
+        self.assertEqual(solver.cold_iterations, cold_iterations)
+
+        # setting up the problem again starts from the stored solution instead of the
+        # initial value
+        setup_again(prob, 5)
+        solver = solve(prob, t)
+        assert_near_equal(prob.get_val('x'), t, 1e-12)
+        self.assertEqual(solver.warm_starts, 1)
+        self.assertLess(solver._iter_count, cold_iterations)
+        self.assertEqual(solver.warm_iterations, solver._iter_count)
+        self.assertEqual(solver.cold_solves, 0)
+
+    def test_separate_problems(self):
+        t = np.linspace(1., 2., 5)
+        prob = build_balance_problem(5)
+        solve(prob, t)
+
+        # another problem with the same group does not use the solution of the first
+        other_prob = build_balance_problem(5)
+        solver = solve(other_prob, 10. * t)
+        assert_near_equal(other_prob.get_val('x'), 10. * t, 1e-12)
+        self.assertEqual(solver.warm_starts, 0)
+
+        # each problem keeps its own solution
+        setup_again(prob, 5)
+        solver = solve(prob, t)
+        self.assertEqual(solver.warm_starts, 1)
+        self.assertEqual(len(_warm_start_cache), 2)
+
+    def test_cache_size(self):
+        t = np.linspace(1., 2., 5)
+        probs = [build_balance_problem(5) for _ in range(3)]
+
+        with patch('aviary.mission.gasp_based.ode.warm_start_solver.'
+                   'WARM_START_CACHE_SIZE', 2):
+            for prob in probs:
+                solve(prob, t)
+
+            self.assertEqual(len(_warm_start_cache), 2)
+
+            # the least recently used solution was discarded
+            setup_again(probs[0], 5)
+            solver = solve(probs[0], t)
+            self.assertEqual(solver.warm_starts, 0)
+
+    def test_new_nodes(self):
+        prob = build_balance_problem(3)
+        solve(prob, np.linspace(1., 2., 3))
+
+        # relative position of the nodes
+        setup_again(prob, 5)
+        prob.model.group.nonlinear_solver.options['maxiter'] = 0
+        solve(prob, np.linspace(1., 2., 5))
+        assert_near_equal(prob.get_val('x'), np.linspace(1., 2., 5), 1e-8)
+
+    def test_failed_solve(self):
+        t = np.linspace(1., 2., 5)
+        prob = build_balance_problem(5)
+        solve(prob, t)
+        solution, = _warm_start_cache.values()
+        stored = solution['x'].copy()
+
+        prob.model.group.nonlinear_solver.options['maxiter'] = 1
+        solve(prob, 10. * t)
+
+        solution, = _warm_start_cache.values()
+        assert_near_equal(solution['x'], stored)
+
+
+if __name__ == '__main__':
+    unittest.main()
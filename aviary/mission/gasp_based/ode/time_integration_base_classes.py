@@ -1,5 +1,9 @@
+from collections import OrderedDict
+from types import SimpleNamespace
+
 import numpy as np
 import openmdao.api as om
+from openmdao.core.component import Component
 from openmdao.utils import units
 from scipy import interpolate
 from simupy.block_diagram import DEFAULT_INTEGRATOR_OPTIONS, SimulationMixin
@@ -8,6 +12,46 @@ from simupy.systems import DynamicalSystem
 from aviary.mission.gasp_based.ode.params import ParamPort
 
 
+def _has_lagged_feedback(model):
+    """
+    Return True if a component of the model uses an output of a component that runs
+    after it, without a nonlinear solver iterating over both. A single run of such a
+    model uses the outputs of its previous run, so it is not a function of its inputs.
+    """
+    order = {
+        comp.pathname: idx
+        for idx, comp in enumerate(model.system_iter(recurse=True, typ=Component))
+    }
+    solvers = {
+        group.pathname: group.nonlinear_solver
+        for group in model.system_iter(include_self=True, recurse=True, typ=om.Group)
+    }
+
+    for name, _ in model.list_inputs(val=False, out_stream=None):
+        src = model.get_source(name)
+        comp = name.rpartition('.')[0]
+        src_comp = src.rpartition('.')[0]
+
+        if src_comp not in order or order[src_comp] < order[comp]:
+            continue
+
+        # the feedback is converged if the common parent, or any group above it,
+        # iterates
+        path = comp.split('.')
+        src_path = src_comp.split('.')
+        depth = 0
+        while path[depth] == src_path[depth]:
+            depth += 1
+
+        parents = ['.'.join(path[:idx]) for idx in range(depth + 1)]
+        if all(solvers[parent] is None
+               or isinstance(solvers[parent], om.NonlinearRunOnce)
+               for parent in parents):
+            return True
+
+    return False
+
+
 # Subproblem used as a basis for forward in time integration phases.
 class SimuPyProblem(SimulationMixin):
     def __init__(
@@ -33,11 +77,20 @@ class SimuPyProblem(SimulationMixin):
         DEBUG=False,
         max_allowable_time=1_000_000,
         adjoint_int_opts=DEFAULT_INTEGRATOR_OPTIONS.copy(),
-
+        cache_size=128,
     ):
         """
         include_state_outputs : automatically add the state to the input
         works well for auto-parsed naming, does not check for duplication before adding
+        cache_size : maximum number of ODE evaluations (state rate and output at a given
+        time, state, control, and parameter vector) remembered so repeated evaluations
+        of the same point do not re-run the model; 0 disables the cache
+
+        If the ODE has a num_nodes option, each node is integrated as a separate
+        trajectory. The state, output, and control vectors seen by SimuPy contain the
+        values of every node for each variable in turn. Each trajectory ends (its states
+        are held constant) when one of its own events occurs, and integration stops once
+        every trajectory has ended.
         """
         self.DEBUG = DEBUG
         self.max_allowable_time = max_allowable_time
@@ -46,6 +99,16 @@ class SimuPyProblem(SimulationMixin):
         self.adjoint_int_opts['name'] = "dop853"
 
         self.dt = 0.0
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        # True when the model outputs are consistent with its current inputs
+        self._model_current = False
+        # model outputs recorded during simulation, see record_checkpoints
+        self.checkpoints = None
+        self._checkpoint_names = None
+
         prob = om.Problem()
         prob.model.add_subsystem(
             "ODE_group",
@@ -53,6 +116,12 @@ class SimuPyProblem(SimulationMixin):
             promotes=["*"],
         )
         self.ode = ode
+        if 'num_nodes' in ode.options:
+            self.num_nodes = ode.options['num_nodes']
+        else:
+            self.num_nodes = 1
+        # times of each trajectory at the start of integration, set by the trajectory
+        self.initial_node_time = None
 
         self.prob = prob
         prob.setup(check=False, force_alloc_complex=True)
@@ -180,9 +249,52 @@ class SimuPyProblem(SimulationMixin):
         self.parameter_names = parameter_names
         self.output_names = output_names
 
-        self.dim_state = len(state_names)
-        self.dim_output = len(output_names)
-        self.dim_input = len(control_names)
+        # parameters computed by the model do not identify an ODE evaluation, only the
+        # independent ones are part of the cache key
+        self._key_parameter_names = [
+            name for name in parameter_names
+            if prob.model.get_source(name).startswith('_auto_ivc.')
+        ]
+        self._key_names = {
+            t_name, *state_names, *control_names, *self._key_parameter_names
+        }
+
+        # the outputs of models with lagged feedback also depend on their previous run,
+        # so their evaluations are neither cached nor skipped
+        self.lagged = _has_lagged_feedback(prob.model)
+        if self.lagged:
+            self.cache_size = 0
+
+        # metadata used to precompute the sources, indices and unit conversions of each
+        # variable, so the vectors passed to and from SimuPy are converted without
+        # looking up units on every call
+        model = prob.model
+        self._output_meta = model.get_io_metadata(
+            iotypes='output', metadata_keys=['units', 'size'], return_rel_names=False)
+        self._input_meta = {}
+        for meta in model.get_io_metadata(
+                iotypes='input', metadata_keys=['units', 'src_indices'],
+                return_rel_names=False).values():
+            self._input_meta.setdefault(meta['prom_name'], meta)
+
+        nn = self.num_nodes
+        if time_independent:
+            self._time_map = None
+        else:
+            self._time_map = self._get_var_map([t_name], num_nodes=nn)
+        self._state_map = self._get_var_map(state_names, self.state_units, nn)
+        self._control_map = self._get_var_map(control_names, self.control_units, nn)
+        # built on first use
+        self._parameter_map = None
+        self._key_parameter_map = self._get_var_map(
+            self._key_parameter_names, num_nodes=None)
+        self._state_rate_map = self._get_var_map(
+            state_rate_names, self.state_rate_units, nn)
+        self._output_map = self._get_var_map(output_names, self.output_units, nn)
+
+        self.dim_state = len(state_names) * nn
+        self.dim_output = len(output_names) * nn
+        self.dim_input = len(control_names) * nn
         self.dim_parameters = len(parameter_names)
         # TODO: add defensive checks to make sure dimensions match in both setup and
         # calls
@@ -194,33 +306,96 @@ class SimuPyProblem(SimulationMixin):
             print(state_rate_names)
             print(self.state_rate_units)
 
+    def _get_var_map(self, names, var_units=None, num_nodes=1):
+        """
+        Return the source, indices in the source, and unit conversion factor and offset
+        used to get the first num_nodes values (or all values if num_nodes is None) of
+        each named variable in the requested units. Values are read from and written
+        to the source of each variable in its own units, so the unit conversion is
+        only computed here once.
+        """
+        model = self.prob.model
+        if var_units is None:
+            var_units = [None] * len(names)
+
+        var_map = []
+
+        for name, unit in zip(names, var_units):
+            src = model.get_source(name)
+            src_units = self._output_meta[src]['units']
+            var_idx = np.arange(self._output_meta[src]['size'])
+
+            meta = self._input_meta.get(name)
+            if meta is not None:
+                if meta['src_indices'] is not None:
+                    var_idx = meta['src_indices'].shaped_array(flat=True)
+                # values of inputs are given in the units of the input, unitless
+                # sources are assumed to already be in those units
+                if unit is None:
+                    unit = meta['units']
+                if src_units is None:
+                    src_units = meta['units']
+
+            if num_nodes is not None:
+                if var_idx.size < num_nodes:
+                    raise ValueError(f"{self.ode.msginfo}: '{name}' has {var_idx.size} "
+                                     f"value(s), but {num_nodes} nodes are integrated.")
+                var_idx = var_idx[:num_nodes]
+
+            if unit is not None and src_units is not None and unit != src_units:
+                factor, offset = units.unit_conversion(src_units, unit)
+            else:
+                factor, offset = 1.0, 0.0
+
+            var_map.append((src, var_idx, factor, offset))
+
+        return var_map
+
+    def _gather(self, var_map):
+        get_val = self.prob.get_val
+        values = [
+            (get_val(src, indices=idx).ravel() + offset) * factor
+            for src, idx, factor, offset in var_map
+        ]
+        if not values:
+            return np.array([])
+        return np.concatenate(values)
+
+    def _scatter(self, var_map, value):
+        set_val = self.prob.set_val
+        value = np.atleast_1d(value)
+        start = 0
+        for src, idx, factor, offset in var_map:
+            end = start + idx.size
+            set_val(src, value[start:end] / factor - offset, indices=idx)
+            start = end
+
     @property
     def time(self):
-        return self.prob.get_val(self.t_name)[0]
+        if self._time_map is None:
+            return self.prob.get_val(self.t_name)[0]
+        time = self._gather(self._time_map)
+        if self.num_nodes == 1:
+            return time[0]
+        return time
 
     @time.setter
     def time(self, value):
-        if self.time_independent or self.time == value:
+        if self.time_independent or np.all(self.time == value):
             return
-        self.prob.set_val(self.t_name, value)
+        self._scatter(self._time_map, value)
+        self._model_current = False
 
     @property
     def state(self):
-        return np.array(
-            [
-                self.prob.get_val(state_name, units=unit)[0]
-                for state_name, unit in zip(self.state_names, self.state_units)
-            ]
-        )
+        return self._gather(self._state_map)
 
     @state.setter
     def state(self, value):
         if np.all(self.state == value):
             return
-        for state_name, elem_val, unit in zip(
-            self.state_names, value, self.state_units
-        ):
-            self.prob.set_val(state_name, elem_val, units=unit)
+        self._scatter(self._state_map, value)
+        self._model_current = False
 
     def compute_along_traj(self, ts, xs):
         self.prob.set_val(self.t_name, ts)
@@ -228,66 +403,44 @@ class SimuPyProblem(SimulationMixin):
             self.prob.set_val(state_name, elem_val, units=unit)
 
         self.prob.run_model()
+        self._model_current = True
 
     @property
     def control(self):
-        return np.array(
-            [
-                self.prob.get_val(control_name, units=unit)[0]
-                for control_name, unit in zip(self.control_names, self.control_units)
-            ]
-        )
+        return self._gather(self._control_map)
 
     @control.setter
     def control(self, value):
         if value is None:
             value = np.array([])
+        # SimuPy passes the output of systems without inputs in place of the control
+        value = value[:self.dim_input]
         if (self.control.size == value.size) and np.all(self.control == value):
             return
-        for control_name, elem_val, unit in zip(
-            self.control_names, value, self.control_units
-        ):
-            self.prob.set_val(control_name, elem_val, units=unit)
+        self._scatter(self._control_map, value)
+        self._model_current = False
 
     @property
     def parameter(self):
-        return np.array(
-            [
-                self.prob.get_val(parameter_name, units=unit)[0]
-                for parameter_name, unit in zip(
-                    self.parameter_names, self.parameter_units
-                )
-            ]
-        )
+        if self._parameter_map is None:
+            self._parameter_map = self._get_var_map(
+                self.parameter_names, self.parameter_units)
+        return self._gather(self._parameter_map)
 
     @parameter.setter
     def parameter(self, value):
         if np.all(self.parameter == value):
             return
-        for parameter_name, elem_val, unit in zip(
-            self.parameter_names, value, self.parameter_units
-        ):
-            self.prob.set_val(parameter_name, elem_val)
+        self._scatter(self._parameter_map, value)
+        self._model_current = False
 
     @property
     def state_rate(self):
-        return np.array(
-            [
-                self.prob.get_val(state_rate_name, units=unit)[0]
-                for state_rate_name, unit in zip(
-                    self.state_rate_names, self.state_rate_units
-                )
-            ]
-        )
+        return self._gather(self._state_rate_map)
 
     @property
     def output(self):
-        return np.array(
-            [
-                self.prob.get_val(output_name, units=unit)[0]
-                for output_name, unit in zip(self.output_names, self.output_units)
-            ]
-        )
+        return self._gather(self._output_map)
 
     @property
     def events(self):
@@ -298,51 +451,331 @@ class SimuPyProblem(SimulationMixin):
             ]
         )
 
-    @property
     def compute(self):
-        # TODO: create cache -- t, x (optionally u) as hash
-        # I guess just set_val for every input and output?
-        # for compute_totals, force run_model. anywhere else that needs forced
-        # run_model?
-        return self.prob.run_model
+        """
+        Run the model, unless its outputs are already current with its inputs. Models
+        with lagged feedback are always run.
+        """
+        if self.lagged or not self._model_current:
+            self.prob.run_model()
+            self._model_current = True
+
+    def clear_cache(self):
+        """
+        Forget all cached ODE evaluations and reset the cache hit and miss counters.
+        """
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def evaluate(self, t, x, u=None):
+        """
+        Return the state rate and output at the given time, state, and control.
+
+        Evaluations are cached (least recently used entries are discarded first) using
+        the exact time, state, control, and parameter values as the key. On a cache hit
+        only the inputs of the model are updated; the model is re-run lazily if anything
+        else (get_val, compute_totals) needs its outputs at that point.
+        """
+        t = self.node_time(t)
+        self.time = t
+        self.state = x
+        self.control = u
+
+        if self.cache_size <= 0:
+            self.compute()
+            return self.state_rate, self.output
+
+        key = (
+            None if self.time_independent else np.asarray(t, dtype=float).tobytes(),
+            np.asarray(x, dtype=float).tobytes(),
+            self.control.tobytes(),
+            self._gather(self._key_parameter_map).tobytes(),
+        )
+
+        cache = self._cache
+        if key in cache:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+        else:
+            self.compute()
+            self.cache_misses += 1
+            cache[key] = (self.state_rate, self.output)
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+        state_rate, output = cache[key]
+        return state_rate.copy(), output.copy()
 
     @property
     def compute_totals(self):
+        # models with lagged feedback are linearized where they were last run
+        if not self.lagged:
+            self.compute()
         return self.prob.compute_totals
 
-    def state_equation_function(self, t, x, u=None):
-        self.time = t
+    def record_checkpoints(self, max_bytes):
+        """
+        Record the model outputs at every point of the following simulations, so the
+        model can later be linearized at those points without solving it again. Once
+        the checkpoints use more than max_bytes, every other one is discarded and only
+        every other point is recorded from then on.
+        """
+        if self._checkpoint_names is None:
+            self._checkpoint_names = [
+                name for name, _ in self.prob.model.list_outputs(
+                    val=False, prom_name=False, list_autoivcs=True, out_stream=None)]
+
+        self.checkpoints = {}
+        self.checkpoint_bytes = 0
+        self._checkpoint_max_bytes = max_bytes
+        self._checkpoint_stride = 1
+        self._checkpoint_count = 0
+
+    def clear_checkpoints(self):
+        """
+        Stop recording checkpoints and free the recorded ones.
+        """
+        self.checkpoints = None
+
+    def _checkpoint_key(self, t, x):
+        return (np.asarray(t, dtype=float).tobytes(),
+                np.asarray(x, dtype=float).tobytes())
+
+    def _record_checkpoint(self, t, x):
+        key = self._checkpoint_key(t, x)
+        if key in self.checkpoints:
+            return
+
+        count = self._checkpoint_count
+        self._checkpoint_count += 1
+        if count % self._checkpoint_stride:
+            return
+
+        self.time = self.node_time(t)
         self.state = x
-        self.control = u
         self.compute()
-        return self.state_rate
+
+        get_val = self.prob.get_val
+        values = [np.array(get_val(name)) for name in self._checkpoint_names]
+        size = sum(val.nbytes for val in values)
+        if size > self._checkpoint_max_bytes:
+            return
+
+        self.checkpoints[key] = (count, t, values)
+        self.checkpoint_bytes += size
+
+        while self.checkpoint_bytes > self._checkpoint_max_bytes:
+            self._checkpoint_stride *= 2
+            for key, (idx, *_) in list(self.checkpoints.items()):
+                if idx % self._checkpoint_stride:
+                    del self.checkpoints[key]
+                    self.checkpoint_bytes -= size
+
+    def restore_checkpoint(self, t, x):
+        """
+        Set the model to the point at time t and state x. If that point was recorded,
+        the recorded model outputs are restored and passed on to the model inputs,
+        without solving the model again. Otherwise the model is re-run starting from
+        the nearest recorded point in time, so any nonlinear solvers start from a
+        nearby solution.
+        """
+        if self.checkpoints:
+            checkpoint = self.checkpoints.get(self._checkpoint_key(t, x))
+            exact = checkpoint is not None
+            if not exact:
+                checkpoint = min(self.checkpoints.values(),
+                                 key=lambda checkpoint: abs(checkpoint[1] - t))
+
+            set_val = self.prob.set_val
+            for name, val in zip(self._checkpoint_names, checkpoint[2]):
+                set_val(name, val)
+            self._model_current = False
+
+            self.time = self.node_time(t)
+            self.state = x
+
+            if exact:
+                # evaluating the residuals passes the restored outputs on to the inputs
+                # and leaves the outputs unchanged
+                self.prob.model.run_apply_nonlinear()
+                self._model_current = True
+
+        else:
+            self.time = self.node_time(t)
+            self.state = x
+
+        self.compute()
+
+    def computation_step(self, t, state, output=None, do_events=False):
+        result = super().computation_step(t, state, output, do_events)
+        # SimuPy computes events at every point it stores in the results
+        if do_events and self.checkpoints is not None and not self.output_nan:
+            self._record_checkpoint(t, state)
+        return result
+
+    def node_time(self, t):
+        """
+        Return the time of each trajectory when the integration time is t.
+        """
+        if self.num_nodes == 1:
+            return t
+        return self._node_t0 + np.minimum(t, self._t_final) - self._t_start
+
+    def state_equation_function(self, t, x, u=None):
+        state_rate = self.evaluate(t, x, u)[0]
+        if self.num_nodes > 1:
+            # trajectories that have ended are held at their final state
+            state_rate.reshape(-1, self.num_nodes)[:, ~self.active] = 0.
+        return state_rate
 
     def output_equation_function(self, t, x):
         if self.output_nan:
             return np.ones(self.dim_output) * np.nan
-        self.time = t
-        self.state = x
-        self.compute()
-        return self.output
+        return self.evaluate(t, x, self.control)[1]
 
     def prepare_to_integrate(self, t0, x0):
         self.output_nan = False
+        if self.num_nodes > 1:
+            nn = self.num_nodes
+            self._t_start = t0
+            self._t_final = np.full(nn, np.inf)
+            if self.initial_node_time is None:
+                self._node_t0 = np.full(nn, t0)
+            else:
+                self._node_t0 = np.broadcast_to(self.initial_node_time, nn)
+            self.active = np.ones(nn, dtype=bool)
+            self._initial_event_signs = np.sign(
+                self.event_equation_function(t0, x0)).reshape(-1, nn)
         # self.time = t0
         # self.state = x0
         # self.prob.run_model()
         return self.output_equation_function(t0, x0)
 
     def update_equation_function(self, t, x, event_channels=None):
+        if self.num_nodes > 1:
+            nn = self.num_nodes
+            # only end the trajectories whose events have been crossed by time t,
+            # SimuPy reports every channel that crossed during the last step
+            event_signs = np.sign(self.event_equation_function(t, x)).reshape(-1, nn)
+            ended = np.any(event_signs != self._initial_event_signs, axis=0)
+            ended &= self.active
+            if not np.any(ended):
+                ended[np.asarray(event_channels) % nn] = True
+
+            self._t_final[ended] = t
+            self.active &= ~ended
+            if np.any(self.active):
+                return x
+
         self.output_nan = True
         return x
 
-    @property
-    def get_val(self):
-        return self.prob.get_val
+    def get_val(self, name, *args, **kwargs):
+        if not self.lagged and name not in self._key_names:
+            self.compute()
+        return self.prob.get_val(name, *args, **kwargs)
+
+    def set_val(self, name, *args, **kwargs):
+        # cached evaluations are only identified by the variables in the cache key
+        if name not in self._key_names:
+            self._cache.clear()
+        self.prob.set_val(name, *args, **kwargs)
+        self._model_current = False
+
+
+def _node_totals(totals, num_nodes):
+    """
+    Return the total derivative of each trajectory, from the totals of a SimuPyProblem
+    that integrates num_nodes trajectories. Variables with a single value (such as
+    parameters) are shared by every trajectory.
+    """
+    totals = np.atleast_2d(totals)
+    rows, cols = (np.arange(num_nodes) if size == num_nodes else np.zeros(num_nodes, int)
+                  for size in totals.shape)
+    return totals[rows, cols]
+
+
+class _TrajectoryPoints:
+    """
+    The points of the simulation of a SimuPyProblem that integrates several
+    trajectories, with the values computed at each point for every trajectory. They are
+    shared by the _TrajectoryNode of each trajectory, so the model is restored and
+    linearized once per point for all trajectories.
+    """
+
+    def __init__(self, problem, res):
+        self.problem = problem
+        self.res = res
+        self.values = {}
+        self._current = None
+
+    def get(self, idx, key, compute):
+        """
+        Return the values of every trajectory computed by compute at point idx, as
+        an array with the trajectories along the last axis.
+        """
+        if (idx, key) not in self.values:
+            if self._current != idx:
+                self.problem.restore_checkpoint(self.res.t[idx], self.res.x[idx])
+                self._current = idx
+            self.values[idx, key] = compute()
+        return self.values[idx, key]
+
+
+class _TrajectoryNode:
+    """
+    A single trajectory of a SimuPyProblem that integrates several, with the parts of
+    the SimuPyProblem interface used to solve the adjoint of a trajectory. Values are
+    those of the trajectory, in the same order as for a SimuPyProblem with one node.
+    Only the points of the simulation, given by the index of each node time in the
+    shared _TrajectoryPoints, are evaluated.
+    """
+
+    def __init__(self, points, node, point_indices):
+        problem = points.problem
+        self.problem = problem
+        self.points = points
+        self.node = node
+        self.point_indices = point_indices
+        self.t_name = problem.t_name
+        self.state_names = problem.state_names
+        self.state_rate_names = problem.state_rate_names
+        self.output_names = problem.output_names
+        self.event_channel_names = problem.event_channel_names
+        self.dim_state = len(problem.state_names)
+        self._point = None
+
+    def restore_checkpoint(self, t, x):
+        """
+        Select the point at time t of the trajectory, the model is only restored to it
+        when a value that was not computed yet for any trajectory is needed.
+        """
+        self._point = self.point_indices[t]
 
-    @property
-    def set_val(self):
-        return self.prob.set_val
+    def state_equation_function(self, t, x):
+        self.restore_checkpoint(t, x)
+        nn = self.problem.num_nodes
+        state_rate = self.points.get(
+            self._point, ('state_rate',),
+            lambda: self.problem.state_rate.reshape(-1, nn).copy())
+        return state_rate[:, self.node]
+
+    def compute_totals(self, of, wrt, return_format='array'):
+        of = [of] if isinstance(of, str) else of
+        wrt = [wrt] if isinstance(wrt, str) else wrt
+        nn = self.problem.num_nodes
+
+        # nodes do not depend on each other, only the partials of the trajectory with
+        # respect to its own values (or to values shared by every node) are kept
+        def compute():
+            totals = self.problem.compute_totals(of, wrt, return_format='dict')
+            return np.array([[_node_totals(totals[of_name][wrt_name], nn)
+                              for wrt_name in wrt] for of_name in of])
+
+        totals = self.points.get(self._point, ('totals', tuple(of), tuple(wrt)),
+                                 compute)
+        return totals[..., self.node]
 
 
 class SGMTrajBase(om.ExplicitComponent):
@@ -351,6 +784,18 @@ class SGMTrajBase(om.ExplicitComponent):
         # TODO: param_dict
         self.options.declare("param_dict",
                              default=ParamPort.param_data)
+        self.options.declare(
+            "num_nodes", default=1, types=int,
+            desc="Number of trajectories integrated together. The ODE of every phase "
+                 "must have this many nodes; initial states and final outputs have one "
+                 "value per trajectory, parameters are shared by all trajectories.")
+        self.options.declare(
+            "checkpoint_memory", default=0, types=int,
+            desc="Maximum number of bytes used to record the ODE model at the points "
+                 "of the integrated trajectory, so compute_partials can linearize the "
+                 "model there without solving it again. Points that are not recorded "
+                 "are re-run starting from the nearest recorded point. Defaults to 0, "
+                 "which records nothing.")
         self.DEBUG = False
         self.max_allowable_time = 1_000_000
         self.adjoint_int_opts = DEFAULT_INTEGRATOR_OPTIONS.copy()
@@ -386,6 +831,13 @@ class SGMTrajBase(om.ExplicitComponent):
         if traj_event_trigger_input is None:
             traj_event_trigger_input = []
 
+        nn = self.options["num_nodes"]
+        for ode in ODEs:
+            if ode.num_nodes != nn:
+                raise ValueError(
+                    f"{self.msginfo}: {nn} trajectories are integrated together, but "
+                    f"the ODE of {ode.__class__.__name__} has {ode.num_nodes} nodes.")
+
         for name, kwargs in self.options["param_dict"].items():
             self.add_input(name, **kwargs)
         final_suffix = "_final"
@@ -397,6 +849,7 @@ class SGMTrajBase(om.ExplicitComponent):
                 ),
                 **self.add_output(
                     final_state_output+final_suffix,
+                    shape=nn,
                     units=ODEs[-1].state_units[
                         ODEs[-1].state_names.index(final_state_output)
                     ],
@@ -412,6 +865,7 @@ class SGMTrajBase(om.ExplicitComponent):
                 ),
                 **self.add_output(
                     promoted_final_output+final_suffix,
+                    shape=nn,
                     units=ODEs[-1].output_units[
                         ODEs[-1].output_names.index(promoted_final_output)
                     ],
@@ -429,6 +883,7 @@ class SGMTrajBase(om.ExplicitComponent):
                 **dict(name=initial_state_input+initial_suffix),
                 **self.add_input(
                     initial_state_input+initial_suffix,
+                    shape=nn,
                     units=ODEs[0].state_units[
                         ODEs[0].state_names.index(initial_state_input)
                     ],
@@ -480,22 +935,30 @@ class SGMTrajBase(om.ExplicitComponent):
     def compute_traj_loop(self, first_problem, inputs, outputs, t0=0., state0=None):
         if self.DEBUG:
             print("initializing compute_traj_loop")
+        nn = self.options["num_nodes"]
+        checkpoint_memory = self.options["checkpoint_memory"]
+        for ode in self.ODEs:
+            ode.clear_checkpoints()
         sim_results = []
         sim_problems = [first_problem]
         t = t0
+        node_t = t0
         if state0 is not None:
             state = state0
         else:
             state = np.array([
-                inputs[state_name+"_initial"].squeeze()
+                np.broadcast_to(inputs[state_name+"_initial"], nn)
                 if state_name in self.traj_initial_state_input
-                else 0.
+                else np.zeros(nn)
                 for state_name in first_problem.state_names
-            ]).squeeze()
+            ]).ravel()
 
         while True:
             current_problem = sim_problems[-1]
             current_problem.initial_condition = state
+            current_problem.initial_node_time = node_t
+            if checkpoint_memory > 0:
+                current_problem.record_checkpoints(checkpoint_memory)
 
             sim_result = current_problem.simulate(
                 (t, self.max_allowable_time),
@@ -503,6 +966,8 @@ class SGMTrajBase(om.ExplicitComponent):
             if sim_result.t.shape[0] == 2:
                 print("\n"*3, "IMMEDIATE PHASE TERMINATION", current_problem, "\n"*2)
             sim_results.append(sim_result)
+            if current_problem.checkpoints is not None:
+                checkpoint_memory -= current_problem.checkpoint_bytes
 
             t = sim_result.t[-1]
             x = sim_result.x[-1, :]
@@ -531,14 +996,15 @@ class SGMTrajBase(om.ExplicitComponent):
                           "\n got back:", next_problem)
             # compute the output at the final condition to make sure all outputs are current
             current_problem.output_equation_function(t, x)
+            node_t = current_problem.node_time(t)
             state = np.array(
                 [
-                    current_problem.prob.get_val(state_name, units=unit)
+                    current_problem.get_val(state_name, units=unit)[:nn]
                     for state_name, unit in zip(
                         next_problem.state_names, next_problem.state_units
                     )
                 ]
-            ).squeeze()
+            ).ravel()
             sim_problems.append(next_problem)
 
         if self.DEBUG:
@@ -553,8 +1019,7 @@ class SGMTrajBase(om.ExplicitComponent):
             output_name = self.traj_final_state_output[output]["name"]
             state_name = self.traj_final_state_output[output]["state_name"]
 
-            outputs[output_name] = sim_results[-1].x[
-                -1,
+            outputs[output_name] = sim_results[-1].x[-1].reshape(-1, nn)[
                 sim_problems[-1].state_names.index(state_name)
             ]
 
@@ -562,12 +1027,11 @@ class SGMTrajBase(om.ExplicitComponent):
             promoted_name = self.traj_promote_final_output[output]["name"]
             output_name = self.traj_promote_final_output[output]["output_name"]
 
-            outputs[promoted_name] = sim_results[-1].y[
-                -1,
+            outputs[promoted_name] = sim_results[-1].y[-1].reshape(-1, nn)[
                 sim_problems[-1].output_names.index(output_name)
             ]
 
-        self.last_inputs = np.array(list(inputs.values()))
+        self.last_inputs = np.concatenate([np.ravel(val) for val in inputs.values()])
 
     def compute_partials(self, inputs, J):
         self.compute_params(inputs)
@@ -575,26 +1039,80 @@ class SGMTrajBase(om.ExplicitComponent):
         # deep copy
         # just calling compute_params doesn't fix it -- possibly different trajectory!
 
-        if np.any(self.last_inputs != np.array(list(inputs.values()))):
+        last_inputs = np.concatenate([np.ravel(val) for val in inputs.values()])
+        if np.any(self.last_inputs != last_inputs):
             raise ValueError(
                 "Attempting to run compute_partials when the last compute"
                 " inputs did not match",
             )
 
+        nn = self.options["num_nodes"]
+        if nn == 1:
+            self.costate_reses = self.compute_traj_partials(
+                self.sim_results, self.sim_problems, J)
+            return
+
+        # the trajectories are independent, so the adjoint of each one is solved in
+        # turn and only gives the row of its own outputs (and the diagonal of the
+        # initial states)
+        initial_state_inputs = [
+            metadata["name"] for metadata in self.traj_initial_state_input.values()]
+        points = [_TrajectoryPoints(prob, res)
+                  for res, prob in zip(self.sim_results, self.sim_problems)]
+        partials = {}
+        self.costate_reses = []
+        for node in range(nn):
+            node_results = []
+            node_problems = []
+            for res, prob, prob_points in zip(self.sim_results, self.sim_problems,
+                                              points):
+                node_t = np.array([prob.node_time(t)[node] for t in res.t])
+                # the points recorded once the trajectory has ended, and repeated
+                # points at the events of other trajectories, are not part of it
+                keep = np.hstack([True, np.diff(node_t) > 0.])
+                keep[np.argmax(node_t) + 1:] = False
+                node_results.append(SimpleNamespace(
+                    t=node_t[keep],
+                    **{name: getattr(res, name)[keep].reshape(keep.sum(), -1, nn)[
+                        ..., node] for name in ("x", "y", "e")}))
+                node_problems.append(_TrajectoryNode(
+                    prob_points, node, dict(zip(node_t[keep], np.flatnonzero(keep)))))
+
+            node_partials = {}
+            self.costate_reses.append(self.compute_traj_partials(
+                node_results, node_problems, node_partials))
+
+            for key, val in node_partials.items():
+                if key not in partials:
+                    partials[key] = np.zeros(J[key].shape)
+                if key[1] in initial_state_inputs:
+                    partials[key][node, node] = np.ravel(val)[0]
+                else:
+                    partials[key][node] = np.ravel(val)
+
+        for key, val in partials.items():
+            J[key] = val
+
+    def compute_traj_partials(self, sim_results, sim_problems, J):
+        """
+        Solve the adjoint of a single trajectory, simulated as sim_results by
+        sim_problems, and set the partials of each trajectory output in J. Returns the
+        co-state results of each output.
+        """
         param_dict = self.options["param_dict"]
 
         # assume the first problem has the most states?
         costate_reses = {output: [] for output in self.all_traj_outputs}
-        tf_total = self.sim_results[-1].t[-1]
+        tf_total = sim_results[-1].t[-1]
 
-        next_res = self.sim_results[-1]
-        next_prob = self.sim_problems[-1]
+        next_res = sim_results[-1]
+        next_prob = sim_problems[-1]
 
         df_dxs = []
         df_dparams = []
         dg_dxs = []
         f_minuses = []
-        f_pluses = [np.zeros(self.sim_problems[-1].dim_state)]
+        f_pluses = [np.zeros(sim_problems[-1].dim_state)]
         state_updates = [next_res.x[-1, :]]
         dh_dxs = [np.eye(next_prob.dim_state)]
 
@@ -615,6 +1133,7 @@ class SGMTrajBase(om.ExplicitComponent):
                 costate[next_prob.state_names.index(output)] = 1.
             else:  # in self.traj_promote_final_output
 
+                next_prob.restore_checkpoint(next_res.t[-1], next_res.x[-1, :])
                 next_prob.state_equation_function(next_res.t[-1], next_res.x[-1, :])
                 costate[:] = next_prob.compute_totals(
                     output,
@@ -633,9 +1152,9 @@ class SGMTrajBase(om.ExplicitComponent):
 
         # pre-compute data for adjoint
         for phase_idx, res, prob in zip(
-            range(len(self.sim_results), 0, -1),
-            self.sim_results[::-1],
-            self.sim_problems[::-1],
+            range(len(sim_results), 0, -1),
+            sim_results[::-1],
+            sim_problems[::-1],
         ):
             # build time-varying co-state matrix
             df_dx_data = np.empty(res.x.shape + (res.x.shape[-1],))
@@ -647,8 +1166,9 @@ class SGMTrajBase(om.ExplicitComponent):
 
             num_active_event_channels = 0
 
+            prob.restore_checkpoint(res.t[-1], res.x[-1, :])
             state_rate = prob.state_equation_function(res.t[-1], res.x[-1, :])
-            if (prob is not self.sim_problems[0]):
+            if (prob is not sim_problems[0]):
                 f_minuses.append(state_rate)
 
             for channel_idx, channel_name in enumerate(prob.event_channel_names):
@@ -682,10 +1202,11 @@ class SGMTrajBase(om.ExplicitComponent):
                                  "events are used")
 
             for idx, (t, x) in enumerate(zip(res.t[::-1], res.x[::-1, :])):
+                prob.restore_checkpoint(t, x)
                 state_rate = prob.state_equation_function(t, x)
 
-                if (idx == last_res_idx) and (prob is not self.sim_problems[0]):
-                    next_prob = self.sim_problems[self.sim_problems.index(prob)-1]
+                if (idx == last_res_idx) and (prob is not sim_problems[0]):
+                    next_prob = sim_problems[sim_problems.index(prob)-1]
 
                     f_plus = np.zeros(next_prob.dim_state)
                     plus_rate = state_rate
@@ -805,7 +1326,7 @@ class SGMTrajBase(om.ExplicitComponent):
             print("f-", f_minuses)
             print("f+", f_pluses)
 
-            print("size check:", len(self.sim_problems), len(dg_dxs), len(f_minuses),
+            print("size check:", len(sim_problems), len(dg_dxs), len(f_minuses),
                   len(f_pluses), )
 
         # main loop
@@ -813,11 +1334,11 @@ class SGMTrajBase(om.ExplicitComponent):
                                                    param_derivs):
 
             output_name = self.all_traj_outputs[output]["name"]
-            next_prob = self.sim_problems[-1]
+            next_prob = sim_problems[-1]
             costate = costate_ic
             lamda_dot_plus = np.zeros_like(costate)
 
-            # self.sim_results[-1].x[-1, next_prob.state_names.index(output)]
+            # sim_results[-1].x[-1, next_prob.state_names.index(output)]
             if self.DEBUG:
                 print("\nstarting partial for %s" % output, costate)
 
@@ -836,9 +1357,9 @@ class SGMTrajBase(om.ExplicitComponent):
                 dh_dx,
                 dh_dparam,
             ) in zip(
-                range(len(self.sim_results), 0, -1),
-                self.sim_results[::-1],
-                self.sim_problems[::-1],
+                range(len(sim_results), 0, -1),
+                sim_results[::-1],
+                sim_problems[::-1],
                 df_dxs,
                 df_dparams,
                 dg_dxs,
@@ -895,8 +1416,11 @@ class SGMTrajBase(om.ExplicitComponent):
                         # TODO: is this wrong?
                         costate[:] = np.sum(costate_update_terms, axis=0).squeeze()
 
+                    # event triggers are given for the ODE, not for a single
+                    # trajectory of it
+                    ode = getattr(prob, "problem", prob)
                     if (
-                        (event_key := (prob, channel_name, channel_idx))
+                        (event_key := (ode, channel_name, channel_idx))
                         in self.traj_event_trigger_input
                     ):
                         event_trigger_name = self.traj_event_trigger_input[event_key]["name"]
@@ -966,8 +1490,8 @@ class SGMTrajBase(om.ExplicitComponent):
                     )
 
                 # consume initial condition
-                if prob is not self.sim_problems[0]:
-                    next_prob = self.sim_problems[self.sim_problems.index(prob)-1]
+                if prob is not sim_problems[0]:
+                    next_prob = sim_problems[sim_problems.index(prob)-1]
                 else:
                     break
                 costate = np.zeros(next_prob.dim_state)
@@ -990,4 +1514,5 @@ class SGMTrajBase(om.ExplicitComponent):
                 ]
             for param_deriv_val, param_deriv_name in zip(param_deriv, param_dict):
                 J[output_name, param_deriv_name] = param_deriv_val
-        self.costate_reses = costate_reses
+
+        return costate_reses
@@ -0,0 +1,189 @@
+"""
+Define a Newton solver that starts from the last converged solution of its group.
+
+Classes
+-------
+WarmStartNewtonSolver : Newton solver that seeds the implicit outputs of its group with
+    the last converged solution.
+
+Functions
+---------
+clear_warm_start_cache : remove all stored solutions.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import openmdao.api as om
+
+# maximum number of groups with a stored solution, over all problems
+WARM_START_CACHE_SIZE = 256
+
+# stored solutions, by the problem and the pathname of their group
+_warm_start_cache = OrderedDict()
+
+
+def clear_warm_start_cache():
+    """
+    Remove all solutions stored by WarmStartNewtonSolver.
+    """
+    _warm_start_cache.clear()
+
+
+class WarmStartNewtonSolver(om.NewtonSolver):
+    """
+    NewtonSolver that seeds the implicit outputs of its group (e.g. the outputs of
+    BalanceComps) with the last converged solution before each solve.
+
+    Solutions are stored by the problem that owns the group and the pathname of the
+    group, so they are kept when the problem is set up again (such as for each
+    refinement of a grid) but never shared with other problems. Only the most recently
+    used WARM_START_CACHE_SIZE solutions are kept, so the solutions of problems that
+    are no longer used are discarded as new ones are stored.
+
+    If the number of nodes changed since the solution was stored, it is interpolated
+    onto the new nodes by the relative position of the nodes. The node times are not
+    used, since the balance groups of the ODEs do not contain them. A solve that fails
+    to converge does not replace the stored solution, so the next solve does not start
+    from a failed point.
+
+    Attributes
+    ----------
+    cold_solves : int
+        Number of converged solves that were not seeded with a stored solution.
+    cold_iterations : int
+        Total number of Newton iterations of the cold solves.
+    warm_starts : int
+        Number of converged solves that were seeded with a stored solution.
+    warm_iterations : int
+        Total number of Newton iterations of the warm started solves.
+    """
+
+    SOLVER = 'NL: WarmStartNewton'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.cold_solves = 0
+        self.cold_iterations = 0
+        self.warm_starts = 0
+        self.warm_iterations = 0
+
+        self._warm_started = False
+        self._output_names = None
+
+    def _setup_solvers(self, system, depth):
+        super()._setup_solvers(system, depth)
+
+        # the outputs of the group may change each time it is set up
+        self._output_names = None
+
+    def _cache_key(self):
+        """
+        Return the key of the solution of the group in the cache.
+
+        Returns
+        -------
+        tuple
+            Reports directory of the problem, which is named after the problem, and
+            the pathname of the group.
+        """
+        system = self._system()
+
+        return (str(system.get_reports_dir()), system.pathname)
+
+    def _implicit_outputs(self):
+        """
+        Return the promoted names of the implicit outputs of the group.
+
+        Returns
+        -------
+        list of str
+            Output names, relative to the group.
+        """
+        if self._output_names is None:
+            outputs = self._system().list_outputs(
+                explicit=False, implicit=True, prom_name=True, val=False,
+                out_stream=None)
+
+            self._output_names = list(dict.fromkeys(
+                meta['prom_name'] for _, meta in outputs))
+
+        return self._output_names
+
+    def _iter_initialize(self):
+        """
+        Seed the implicit outputs with the stored solution, then initialize Newton.
+
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        system = self._system()
+        key = self._cache_key()
+        values = _warm_start_cache.get(key)
+
+        self._warm_started = False
+
+        if values is not None and not system.under_complex_step and \
+                not system.under_approx:
+            _warm_start_cache.move_to_end(key)
+            names = self._implicit_outputs()
+
+            for name, val in values.items():
+                if name not in names:
+                    continue
+
+                shape = np.shape(system.get_val(name))
+                size = int(np.prod(shape))
+
+                if size == val.size:
+                    new_val = val
+
+                elif val.size < 2 or size < 2:
+                    continue
+
+                else:
+                    new_val = np.interp(np.linspace(0., 1., size),
+                                        np.linspace(0., 1., val.size), val)
+
+                system.set_val(name, np.reshape(new_val, shape))
+                self._warm_started = True
+
+        return super()._iter_initialize()
+
+    def _solve(self):
+        """
+        Run the Newton solver, then store the solution if it converged.
+        """
+        super()._solve()
+
+        system = self._system()
+
+        if system.under_complex_step or system.under_approx:
+            return
+
+        norm = self._iter_get_norm()
+
+        if not np.isfinite(norm) or (norm > self.options['atol'] and
+                                     norm / self._norm0 > self.options['rtol']):
+            return
+
+        if self._warm_started:
+            self.warm_starts += 1
+            self.warm_iterations += self._iter_count
+
+        else:
+            self.cold_solves += 1
+            self.cold_iterations += self._iter_count
+
+        key = self._cache_key()
+        _warm_start_cache[key] = {
+            name: np.array(system.get_val(name), dtype=float).ravel()
+            for name in self._implicit_outputs()}
+        _warm_start_cache.move_to_end(key)
+
+        while len(_warm_start_cache) > WARM_START_CACHE_SIZE:
+            _warm_start_cache.popitem(last=False)
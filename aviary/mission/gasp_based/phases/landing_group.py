@@ -1,4 +1,3 @@
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.mission.gasp_based.flight_conditions import FlightConditions
 from aviary.mission.gasp_based.ode.base_ode import BaseODE
@@ -7,6 +6,7 @@ from aviary.mission.gasp_based.phases.landing_components import (
     GlideConditionComponent, LandingAltitudeComponent,
     LandingGroundRollComponent)
 from aviary.subsystems.aerodynamics.gasp_based.gaspaero import LowSpeedAero
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.propulsion.propulsion_mission import PropulsionMission
 from aviary.variable_info.enums import SpeedType
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
@@ -29,7 +29,7 @@ class LandingSegment(BaseODE):
 
         self.add_subsystem(
             "USatm_app",
-            USatm1976Comp(num_nodes=1),
+            get_atmosphere_comp(1, self.options['aviary_options']),
             promotes_inputs=[("h", Mission.Landing.INITIAL_ALTITUDE)],
             promotes_outputs=[
                 ("rho", "rho_app"),
@@ -121,7 +121,7 @@ class LandingSegment(BaseODE):
 
         self.add_subsystem(
             "USatm_td",
-            USatm1976Comp(num_nodes=1),
+            get_atmosphere_comp(1, self.options['aviary_options']),
             promotes_inputs=[("h", Mission.Landing.AIRPORT_ALTITUDE)],
             promotes_outputs=[
                 ("rho", "rho_td"),
@@ -1,10 +1,10 @@
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.functions import add_opts2vals, create_opts2vals
 
 from aviary.mission.gasp_based.ode.base_ode import BaseODE
 from aviary.mission.gasp_based.ode.params import ParamPort
 from aviary.mission.gasp_based.phases.taxi_component import TaxiFuelComponent
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.subsystems.propulsion.propulsion_mission import \
     PropulsionMission
 from aviary.variable_info.variables import Dynamic, Mission
@@ -16,7 +16,7 @@ class TaxiSegment(BaseODE):
         self.add_subsystem("params", ParamPort(), promotes=["*"])
         self.add_subsystem(
             "USatm",
-            USatm1976Comp(num_nodes=1),
+            get_atmosphere_comp(1, options),
             promotes_inputs=[("h", Mission.Takeoff.AIRPORT_ALTITUDE)],
             promotes_outputs=[("temp", Dynamic.Mission.TEMPERATURE),
                               ("pres", Dynamic.Mission.STATIC_PRESSURE)],
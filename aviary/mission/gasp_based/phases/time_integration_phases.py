@@ -48,10 +48,10 @@ class SGMGroundroll(SimuPyProblem):
         self.VR_value = VR_value
         self.VR_units = VR_units
         self.event_channel_names = ["TAS"]
-        self.num_events = len(self.event_channel_names)
+        self.num_events = len(self.event_channel_names) * self.num_nodes
 
     def event_equation_function(self, t, x):
-        self.time = t
+        self.time = self.node_time(t)
         self.state = x
         return self.get_val("TAS", units='ft/s') - self.VR_value
         return self.get_val("TAS", units=self.VR_units) - self.VR_value
@@ -82,7 +82,7 @@ class SGMRotation(SimuPyProblem):
 
         self.phase_name = phase_name
         self.event_channel_names = ["normal_force"]
-        self.num_events = len(self.event_channel_names)
+        self.num_events = len(self.event_channel_names) * self.num_nodes
 
     def event_equation_function(self, t, x):
         self.output_equation_function(t, x)
@@ -134,6 +134,8 @@ class SGMAscent(SimuPyProblem):
             control_names=control_names,
             **simupy_args,
         )
+        if self.num_nodes > 1:
+            raise ValueError("SGMAscent can only integrate a single trajectory.")
 
         self.phase_name = phase_name
         self.event_channel_names = [
@@ -141,7 +143,7 @@ class SGMAscent(SimuPyProblem):
             Dynamic.Mission.ALTITUDE,
             Dynamic.Mission.ALTITUDE,
         ]
-        self.num_events = len(self.event_channel_names)
+        self.num_events = len(self.event_channel_names) * self.num_nodes
 
         self.event_names = [
             "termination",
@@ -245,6 +247,14 @@ class SGMAscentCombined(SGMAscent):
         for ode in self.odes:
             ode.set_val(*args, **kwargs)
 
+    def record_checkpoints(self, max_bytes):
+        # the model of each alpha mode is evaluated in turn, so the points of the
+        # trajectory are not recorded
+        pass
+
+    def restore_checkpoint(self, t, x):
+        pass
+
     def compute_alpha(self, ode, t, x):
         return ode.output_equation_function(t, x)[ode.output_names.index("alpha")]
 
@@ -331,6 +341,9 @@ class SGMAscentCombined(SGMAscent):
     def compute_totals(self):
         return self.get_prob(self.time, self.state).compute_totals
 
+    def get_val(self, *args, **kwargs):
+        return self.get_prob(self.time, self.state).get_val(*args, **kwargs)
+
     def output_equation_function(self, t, x):
         if np.any(np.isnan(x)) or self.output_nan:
             return np.ones(self.dim_output) * np.nan
@@ -378,7 +391,7 @@ class SGMAccel(SimuPyProblem):
         self.event_channel_names = [
             "EAS",
         ]
-        self.num_events = len(self.event_channel_names)
+        self.num_events = len(self.event_channel_names) * self.num_nodes
 
     def event_equation_function(self, t, x):
         self.output_equation_function(t, x)
@@ -443,7 +456,7 @@ class SGMClimb(SimuPyProblem):
             Dynamic.Mission.ALTITUDE,
             self.speed_trigger_name,
         ]
-        self.num_events = len(self.event_channel_names)
+        self.num_events = len(self.event_channel_names) * self.num_nodes
 
     def event_equation_function(self, t, x):
         self.output_equation_function(t, x)
@@ -457,7 +470,7 @@ class SGMClimb(SimuPyProblem):
         speed_trigger = self.get_val(
             "speed_trigger", units=self.speed_trigger_units
         ).squeeze()
-        return np.array([alt - alt_trigger, speed - speed_trigger])
+        return np.hstack([alt - alt_trigger, speed - speed_trigger])
 
 
 class SGMCruise(SimuPyProblem):
@@ -508,7 +521,7 @@ class SGMCruise(SimuPyProblem):
             Dynamic.Mission.MASS,
             Dynamic.Mission.DISTANCE,
         ]
-        self.num_events = len(self.event_channel_names)
+        self.num_events = len(self.event_channel_names) * self.num_nodes
 
     def event_equation_function(self, t, x):
         self.output_equation_function(t, x)
@@ -520,7 +533,7 @@ class SGMCruise(SimuPyProblem):
         distance_trigger = self.get_val(
             "distance_trigger", units=self.distance_trigger_units).squeeze()
 
-        return np.array([
+        return np.hstack([
             current_mass - mass_trigger,
             distance - distance_trigger
         ])
@@ -583,7 +596,7 @@ class SGMDescent(SimuPyProblem):
             Dynamic.Mission.ALTITUDE,
             self.speed_trigger_name,
         ]
-        self.num_events = len(self.event_channel_names)
+        self.num_events = len(self.event_channel_names) * self.num_nodes
 
     def event_equation_function(self, t, x):
         self.output_equation_function(t, x)
@@ -597,4 +610,4 @@ class SGMDescent(SimuPyProblem):
         speed_trigger = self.get_val(
             "speed_trigger", units=self.speed_trigger_units
         ).squeeze()
-        return np.array([alt - alt_trigger, speed - speed_trigger])
+        return np.hstack([alt - alt_trigger, speed - speed_trigger])
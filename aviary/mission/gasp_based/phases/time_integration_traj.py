@@ -76,7 +76,7 @@ class FlexibleTraj(TimeIntegrationTrajBase):
             t_final = sim_result.t[-1]
             x_final = sim_result.x[-1, :]
             if type(current_problem) is SGMGroundroll:
-                t_start_rotation = t_final
+                t_start_rotation = current_problem.node_time(t_final)
 
             ode_index += 1
             try:
@@ -87,7 +87,7 @@ class FlexibleTraj(TimeIntegrationTrajBase):
             print('Finished: '+current_problem.phase_name)
             if next_problem is not None:
                 if type(current_problem) is SGMGroundroll:
-                    next_problem.prob.set_val("start_rotation", t_start_rotation)
+                    next_problem.set_val("start_rotation", t_start_rotation)
                 elif type(current_problem) is SGMRotation:
                     next_problem.rotation.set_val("start_rotation", t_start_rotation)
                 print('Starting: '+next_problem.phase_name)
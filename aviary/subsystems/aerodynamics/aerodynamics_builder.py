@@ -7,6 +7,7 @@ AerodynamicsBuilderBase : the interface for an aerodynamics subsystem builder.
 
 CoreAerodynamicsBuilder : the interface for Aviary's core aerodynamics subsystem builder
 """
+import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.variables import Aircraft, Mission, Dynamic
@@ -21,6 +22,8 @@ from aviary.subsystems.aerodynamics.gasp_based.table_based import CruiseAero as
 from aviary.subsystems.aerodynamics.gasp_based.table_based import LowSpeedAero as TabularLowSpeedAero
 from aviary.subsystems.aerodynamics.flops_based.computed_aero_group import \
     ComputedAeroGroup
+from aviary.subsystems.aerodynamics.flops_based.computed_aero_polar import \
+    ComputedAeroPolar, get_polar_data, get_polar_grid, polar_drag_error
 from aviary.subsystems.aerodynamics.flops_based.takeoff_aero_group import \
     TakeoffAeroGroup
 from aviary.subsystems.aerodynamics.flops_based.solved_alpha_group import \
@@ -55,10 +58,35 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
 
         self.code_origin = code_origin
 
+        # grids of the drag polar sampled in pre-mission, for the 'computed_polar'
+        # method
+        self.polar_grid = None
+
         super().__init__(name=name, meta_data=meta_data)
 
-    def build_pre_mission(self, aviary_inputs):
+    def preprocess_inputs(self, aviary_inputs, **kwargs):
+        method = kwargs.pop('method', None)
+
+        if self.code_origin == 'FLOPS' and method == 'computed_polar':
+            self.polar_grid = grid = get_polar_grid(**kwargs)
+
+            # the drag polar tables are computed in pre-mission, their values here only
+            # give the shapes of the mission parameters
+            num_mach = grid['mach'].size
+
+            aviary_inputs.set_val(
+                Aircraft.Design.ZERO_LIFT_DRAG_POLAR,
+                np.zeros((grid['altitude'].size, num_mach)), 'unitless')
+
+            aviary_inputs.set_val(
+                Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR,
+                np.zeros((num_mach, grid['lift_coefficient'].size)), 'unitless')
+
+        return aviary_inputs
+
+    def build_pre_mission(self, aviary_inputs, **kwargs):
         code_origin = self.code_origin
+        method = kwargs.pop('method', None)
 
         if code_origin == 'GASP':
             aero_group = PreMissionAero(aviary_options=aviary_inputs)
@@ -75,6 +103,19 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                 promotes_inputs=['*'],
                 promotes_outputs=['*'])
 
+            if method == 'computed_polar':
+                self.polar_grid = get_polar_grid(**kwargs)
+
+                aero_group.add_subsystem(
+                    'polar', ComputedAeroPolar(aviary_options=aviary_inputs,
+                                               **self.polar_grid),
+                    promotes_inputs=['aircraft:*', 'mission:*'],
+                    promotes_outputs=['aircraft:*'])
+
+            elif method is not None:
+                raise ValueError('FLOPS-based pre-mission aero method is not one of '
+                                 'the following: (computed_polar)')
+
         return aero_group
 
     def build_mission(self, num_nodes, aviary_inputs, **kwargs):
@@ -111,9 +152,25 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                                               CDI_data=kwargs.pop('CDI_data'),
                                               **kwargs)
 
+            # drag polar sampled from the computed aero in pre-mission
+            elif method == 'computed_polar':
+                if self.polar_grid is None:
+                    raise ValueError('The computed_polar aero method needs the drag '
+                                     'polar from pre-mission, set "method": '
+                                     '"computed_polar" in the subsystem_options of '
+                                     f'{self.name} in the pre_mission phase_info.')
+
+                CD0_data, CDI_data = get_polar_data(self.polar_grid)
+                aero_group = TabularAeroGroup(num_nodes=num_nodes,
+                                              CD0_data=CD0_data,
+                                              CDI_data=CDI_data,
+                                              training_data=True,
+                                              **kwargs)
+
             else:
                 raise ValueError('FLOPS-based aero method is not one of the following: '
-                                 '(computed, low_speed, solved_alpha, tabular)')
+                                 '(computed, low_speed, solved_alpha, tabular, '
+                                 'computed_polar)')
 
         elif self.code_origin == 'GASP':
             if method is None:
@@ -189,9 +246,22 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                             Dynamic.Mission.DENSITY,
                             'aircraft:*']
 
+            elif method == 'computed_polar':
+                promotes = [Dynamic.Mission.ALTITUDE,
+                            Dynamic.Mission.MACH,
+                            Dynamic.Mission.MASS,
+                            Dynamic.Mission.VELOCITY,
+                            Dynamic.Mission.DENSITY,
+                            ('zero_lift_drag_coefficient_train',
+                             Aircraft.Design.ZERO_LIFT_DRAG_POLAR),
+                            ('lift_dependent_drag_coefficient_train',
+                             Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR),
+                            'aircraft:*']
+
             else:
                 raise ValueError('FLOPS-based aero method is not one of the following: '
-                                 '(computed, low_speed, solved_alpha, tabular)')
+                                 '(computed, low_speed, solved_alpha, tabular, '
+                                 'computed_polar)')
 
         elif self.code_origin == 'GASP':
             if method == 'low_speed':
@@ -257,8 +327,30 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
             Location of the subsystems_report folder this report will be placed in
         """
         if self.code_origin == 'FLOPS':
-            # FLOPS aero report goes here
-            return
+            phase_names = [
+                phase_name for phase_name, info in prob.phase_info.items()
+                if info.get('subsystem_options', {}).get(self.name, {}).get('method')
+                == 'computed_polar']
+
+            if not phase_names:
+                return
+
+            filepath = reports_folder / (self.name + '.md')
+
+            with open(filepath, mode='w') as f:
+                f.write('# AERODYNAMICS')
+                f.write('\n## Drag Polar Error\n')
+                f.write('\nDrag interpolated from the drag polar, relative to the drag '
+                        'computed directly, at the timeseries points of each phase.\n')
+                f.write('\n| Phase | Max Error (%) | RMS Error (%) |\n')
+                f.write('| :- | :- | :- |\n')
+
+                for phase_name in phase_names:
+                    drag, direct_drag = polar_drag_error(prob, phase_name)
+                    error = 100. * (drag - direct_drag) / direct_drag
+
+                    f.write(f'| {phase_name} | {np.max(np.abs(error)):.4f} | '
+                            f'{np.sqrt(np.mean(error**2)):.4f} |\n')
         elif self.code_origin == 'GASP':
             # GASP aero report goes here
             return
@@ -14,7 +14,8 @@ from aviary.subsystems.aerodynamics.flops_based.lift import LiftEqualsWeight
 from aviary.subsystems.aerodynamics.flops_based.lift_dependent_drag import \
     LiftDependentDrag
 from aviary.subsystems.aerodynamics.flops_based.mux_component import MuxComponent
-from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import \
+    PointwiseSkinFriction, SkinFriction
 from aviary.subsystems.aerodynamics.flops_based.skin_friction_drag import \
     SkinFrictionDrag
 from aviary.utils.aviary_values import AviaryValues
@@ -33,6 +34,15 @@ class ComputedAeroGroup(om.Group):
         self.options.declare(
             'aviary_options', types=AviaryValues,
             desc='collection of Aircraft/Mission specific options')
+        self.options.declare(
+            'pointwise_skin_friction', default=False, types=bool,
+            desc='if True, the skin friction equations of each point are solved '
+                 'separately and explicitly, otherwise with a Newton solver over all '
+                 'points')
+        self.options.declare(
+            'total_drag', default=True, types=bool,
+            desc='if False, only the drag coefficients CD0 and CDI are computed, '
+                 'without the total drag')
 
     def setup(self):
         num_nodes = self.options["num_nodes"]
@@ -101,7 +111,12 @@ class ComputedAeroGroup(om.Group):
                 Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
                 Aircraft.Fuselage.LENGTH_TO_DIAMETER])
 
-        comp = SkinFriction(num_nodes=num_nodes, aviary_options=aviary_options)
+        if self.options['pointwise_skin_friction']:
+            comp = PointwiseSkinFriction(
+                num_nodes=num_nodes, aviary_options=aviary_options)
+        else:
+            comp = SkinFriction(num_nodes=num_nodes, aviary_options=aviary_options)
+
         self.add_subsystem(
             'SkinFrictionCoef', comp,
             promotes_inputs=[
@@ -117,16 +132,23 @@ class ComputedAeroGroup(om.Group):
                 'laminar_fractions_upper', 'laminar_fractions_lower',
                 Aircraft.Wing.AREA])
 
-        comp = ComputedDrag(num_nodes=num_nodes)
-        self.add_subsystem(
-            'Drag', comp,
-            promotes_inputs=[
-                Dynamic.Mission.DYNAMIC_PRESSURE, Dynamic.Mission.MACH, Aircraft.Wing.AREA,
-                Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
-                Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
-                Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
-                Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR],
-            promotes_outputs=['CDI', 'CD0', 'drag_coefficient', Dynamic.Mission.DRAG])
+        total_drag = self.options['total_drag']
+        comp = ComputedDrag(num_nodes=num_nodes, total_drag=total_drag)
+
+        if total_drag:
+            self.add_subsystem(
+                'Drag', comp,
+                promotes_inputs=[
+                    Dynamic.Mission.DYNAMIC_PRESSURE, Dynamic.Mission.MACH,
+                    Aircraft.Wing.AREA,
+                    Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
+                    Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
+                    Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
+                    Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR],
+                promotes_outputs=[
+                    'CDI', 'CD0', 'drag_coefficient', Dynamic.Mission.DRAG])
+        else:
+            self.add_subsystem('Drag', comp, promotes_outputs=['CDI', 'CD0'])
 
         buf = BuffetLift(num_nodes=num_nodes)
         self.add_subsystem(
@@ -151,6 +173,9 @@ class ComputedDrag(om.Group):
 
     def initialize(self):
         self.options.declare('num_nodes', types=int)
+        self.options.declare(
+            'total_drag', default=True, types=bool,
+            desc='if False, only the drag coefficients CD0 and CDI are computed')
 
     def setup(self):
         nn = self.options["num_nodes"]
@@ -167,6 +192,9 @@ class ComputedDrag(om.Group):
             output='CD0',
             desc='zero-lift drag coefficient')
 
+        if not self.options['total_drag']:
+            return
+
         self.add_subsystem(
             Dynamic.Mission.DRAG, TotalDrag(num_nodes=nn),
             promotes_inputs=[
@@ -0,0 +1,414 @@
+"""
+Drag polar tables sampled from the FLOPS-based computed aerodynamics.
+
+For a given geometry, the zero-lift drag coefficient computed by ComputedAeroGroup
+(skin friction and compressibility drag) only depends on altitude and Mach number, and
+the lift-dependent drag coefficient (pressure and induced drag) only depends on Mach
+number and lift coefficient. ComputedAeroPolar samples both on structured grids during
+pre-mission, with a single evaluation of ComputedAeroGroup, and outputs them as tables
+that TabularAeroGroup interpolates in each phase of the mission. The tables are
+differentiated with respect to the aircraft inputs, so derivatives still propagate to the
+geometry design variables.
+
+Classes
+-------
+ComputedAeroPolar : sample ComputedAeroGroup on the drag polar grids.
+
+Functions
+---------
+get_polar_grid : return the checked grids of a drag polar.
+get_polar_data : return the grids of a drag polar in the format of TabularAeroGroup.
+polar_drag_error : compare drag interpolated from the polar to the direct computation.
+"""
+import numpy as np
+import openmdao.api as om
+
+import aviary.constants as constants
+from aviary.subsystems.aerodynamics.flops_based.computed_aero_group import \
+    ComputedAeroGroup
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.named_values import NamedValues
+from aviary.variable_info.functions import add_aviary_input, add_aviary_output
+from aviary.variable_info.variables import Aircraft, Dynamic
+
+grav_metric = constants.GRAV_METRIC_FLOPS
+
+# default grids of the drag polar, which cover the flight envelope of transport aircraft;
+# the Mach number grid is finer, to follow the compressibility drag rise
+DEFAULT_POLAR_ALTITUDES = np.linspace(0., 45000., 7)  # ft
+DEFAULT_POLAR_MACH_NUMBERS = np.linspace(0.1, 0.9, 33)
+DEFAULT_POLAR_LIFT_COEFFICIENTS = np.linspace(0., 1.2, 13)
+
+# lift coefficient of the zero-lift drag samples, and altitude of the lift-dependent
+# drag samples: neither drag coefficient depends on them
+_SAMPLE_LIFT_COEFFICIENT = 0.5
+_SAMPLE_ALTITUDE = 0.  # ft
+
+# the tables are interpolated with 'lagrange3', which needs four points on each axis
+_MIN_GRID_POINTS = 4
+
+
+def get_polar_grid(altitude=None, mach=None, lift_coefficient=None):
+    """
+    Return the grids of a drag polar, using the default grid for any that is not given.
+
+    Parameters
+    ----------
+    altitude : array_like or None
+        Altitudes of the zero-lift drag table, in ft.
+    mach : array_like or None
+        Mach numbers of both tables.
+    lift_coefficient : array_like or None
+        Lift coefficients of the lift-dependent drag table.
+
+    Returns
+    -------
+    dict
+        Grids keyed by 'altitude', 'mach' and 'lift_coefficient'.
+    """
+    grid = {'altitude': DEFAULT_POLAR_ALTITUDES if altitude is None else altitude,
+            'mach': DEFAULT_POLAR_MACH_NUMBERS if mach is None else mach,
+            'lift_coefficient': DEFAULT_POLAR_LIFT_COEFFICIENTS
+            if lift_coefficient is None else lift_coefficient}
+
+    for key, val in grid.items():
+        val = np.array(val, dtype=float).ravel()
+
+        if val.size < _MIN_GRID_POINTS or np.any(np.diff(val) <= 0.):
+            raise ValueError(f'Drag polar grid <{key}> must have at least '
+                             f'{_MIN_GRID_POINTS} values in strictly ascending order.')
+
+        grid[key] = val
+
+    return grid
+
+
+def get_polar_data(grid):
+    """
+    Return the grids of a drag polar as TabularAeroGroup data, without table values.
+
+    Parameters
+    ----------
+    grid : dict
+        Grids of the drag polar, from get_polar_grid.
+
+    Returns
+    -------
+    CD0_data : NamedValues
+        Axes of the zero-lift drag coefficient table.
+    CDI_data : NamedValues
+        Axes of the lift-dependent drag coefficient table.
+    """
+    CD0_data = NamedValues()
+    CD0_data.set_val(Dynamic.Mission.ALTITUDE, grid['altitude'], 'ft')
+    CD0_data.set_val(Dynamic.Mission.MACH, grid['mach'], 'unitless')
+
+    CDI_data = NamedValues()
+    CDI_data.set_val(Dynamic.Mission.MACH, grid['mach'], 'unitless')
+    CDI_data.set_val('lift_coefficient', grid['lift_coefficient'], 'unitless')
+
+    return CD0_data, CDI_data
+
+
+class ComputedAeroPolar(om.Group):
+    '''
+    Sample ComputedAeroGroup on the grids of the drag polar.
+
+    The zero-lift drag coefficient is sampled on the (altitude, Mach) grid and the
+    lift-dependent drag coefficient on the (Mach, lift coefficient) grid, both in a
+    single evaluation of ComputedAeroGroup. The mass of each sample is set so that the
+    lift equals its weight at the sampled lift coefficient.
+    '''
+
+    def initialize(self):
+        self.options.declare(
+            'aviary_options', types=AviaryValues,
+            desc='collection of Aircraft/Mission specific options')
+
+        self.options.declare(
+            'altitude', default=None, allow_none=True,
+            desc='altitudes of the zero-lift drag table, in ft')
+
+        self.options.declare(
+            'mach', default=None, allow_none=True,
+            desc='Mach numbers of both drag tables')
+
+        self.options.declare(
+            'lift_coefficient', default=None, allow_none=True,
+            desc='lift coefficients of the lift-dependent drag table')
+
+        self.options.declare(
+            'gamma', default=1.4,
+            desc='Ratio of specific heats for air.')
+
+    def setup(self):
+        options = self.options
+        gamma = options['gamma']
+
+        grid = get_polar_grid(
+            options['altitude'], options['mach'], options['lift_coefficient'])
+
+        altitude = grid['altitude']
+        mach = grid['mach']
+        lift_coefficient = grid['lift_coefficient']
+
+        num_alt = altitude.size
+        num_mach = mach.size
+        num_cl = lift_coefficient.size
+
+        # zero-lift drag samples, by altitude then Mach, followed by the lift-dependent
+        # drag samples, by Mach then lift coefficient
+        num_cd0 = num_alt * num_mach
+        num_cdi = num_mach * num_cl
+        num_nodes = num_cd0 + num_cdi
+
+        sample_points = om.IndepVarComp()
+
+        sample_points.add_output(
+            Dynamic.Mission.ALTITUDE,
+            np.concatenate((np.repeat(altitude, num_mach),
+                            np.full(num_cdi, _SAMPLE_ALTITUDE))),
+            units='ft')
+
+        sample_points.add_output(
+            Dynamic.Mission.MACH,
+            np.concatenate((np.tile(mach, num_alt), np.repeat(mach, num_cl))),
+            units='unitless')
+
+        sample_points.add_output(
+            'lift_coefficient',
+            np.concatenate((np.full(num_cd0, _SAMPLE_LIFT_COEFFICIENT),
+                            np.tile(lift_coefficient, num_mach))),
+            units='unitless')
+
+        self.add_subsystem('sample_points', sample_points, promotes_outputs=['*'])
+
+        self.add_subsystem(
+            'atmosphere', get_atmosphere_comp(num_nodes, options['aviary_options']),
+            promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
+            promotes_outputs=[
+                ('temp', Dynamic.Mission.TEMPERATURE),
+                ('pres', Dynamic.Mission.STATIC_PRESSURE)])
+
+        self.add_subsystem(
+            'sample_mass', _SampleMass(num_nodes=num_nodes, gamma=gamma),
+            promotes_inputs=[
+                Aircraft.Wing.AREA, Dynamic.Mission.MACH,
+                Dynamic.Mission.STATIC_PRESSURE, 'lift_coefficient'],
+            promotes_outputs=[Dynamic.Mission.MASS])
+
+        self.add_subsystem(
+            'aero',
+            ComputedAeroGroup(num_nodes=num_nodes, gamma=gamma,
+                              aviary_options=options['aviary_options'],
+                              total_drag=False),
+            promotes_inputs=[
+                Dynamic.Mission.MACH, Dynamic.Mission.STATIC_PRESSURE,
+                Dynamic.Mission.TEMPERATURE, Dynamic.Mission.MASS,
+                'aircraft:*', 'mission:*'],
+            promotes_outputs=['CD0', 'CDI'])
+
+        self.add_subsystem(
+            'tables',
+            _PolarTables(num_alt=num_alt, num_mach=num_mach, num_cl=num_cl),
+            promotes_inputs=['CD0', 'CDI'],
+            promotes_outputs=['aircraft:*'])
+
+
+class _SampleMass(om.ExplicitComponent):
+    '''
+    Calculate the mass for which lift equals weight at the sampled lift coefficient.
+    '''
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+        self.options.declare(
+            'gamma', default=1.4, desc='Ratio of specific heats for air.')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+
+        add_aviary_input(self, Aircraft.Wing.AREA, val=1., units='m**2')
+
+        self.add_input(
+            Dynamic.Mission.STATIC_PRESSURE, val=np.ones(nn), units='N/m**2')
+
+        self.add_input(Dynamic.Mission.MACH, val=np.ones(nn), units='unitless')
+
+        self.add_input('lift_coefficient', val=np.ones(nn), units='unitless')
+
+        self.add_output(Dynamic.Mission.MASS, val=np.ones(nn), units='kg')
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        rows_cols = np.arange(nn)
+
+        self.declare_partials(Dynamic.Mission.MASS, Aircraft.Wing.AREA)
+
+        self.declare_partials(
+            Dynamic.Mission.MASS,
+            [Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH, 'lift_coefficient'],
+            rows=rows_cols, cols=rows_cols)
+
+    def compute(self, inputs, outputs):
+        S = inputs[Aircraft.Wing.AREA]
+        q = self._dynamic_pressure(inputs)
+        CL = inputs['lift_coefficient']
+
+        outputs[Dynamic.Mission.MASS] = CL * q * S / grav_metric
+
+    def compute_partials(self, inputs, partials):
+        gamma = self.options['gamma']
+        S = inputs[Aircraft.Wing.AREA]
+        P = inputs[Dynamic.Mission.STATIC_PRESSURE]
+        mach = inputs[Dynamic.Mission.MACH]
+        q = self._dynamic_pressure(inputs)
+        CL = inputs['lift_coefficient']
+
+        partials[Dynamic.Mission.MASS, Aircraft.Wing.AREA] = CL * q / grav_metric
+
+        partials[Dynamic.Mission.MASS, Dynamic.Mission.STATIC_PRESSURE] = \
+            CL * 0.5 * gamma * mach**2 * S / grav_metric
+
+        partials[Dynamic.Mission.MASS, Dynamic.Mission.MACH] = \
+            CL * gamma * P * mach * S / grav_metric
+
+        partials[Dynamic.Mission.MASS, 'lift_coefficient'] = q * S / grav_metric
+
+    def _dynamic_pressure(self, inputs):
+        P = inputs[Dynamic.Mission.STATIC_PRESSURE]
+        mach = inputs[Dynamic.Mission.MACH]
+
+        return 0.5 * self.options['gamma'] * P * mach**2
+
+
+class _PolarTables(om.ExplicitComponent):
+    '''
+    Arrange the sampled drag coefficients into the tables of the drag polar.
+    '''
+
+    def initialize(self):
+        self.options.declare('num_alt', types=int)
+        self.options.declare('num_mach', types=int)
+        self.options.declare('num_cl', types=int)
+
+    def setup(self):
+        num_alt = self.options['num_alt']
+        num_mach = self.options['num_mach']
+        num_cl = self.options['num_cl']
+
+        num_cd0 = num_alt * num_mach
+        num_nodes = num_cd0 + num_mach * num_cl
+
+        self.add_input('CD0', val=np.ones(num_nodes), units='unitless')
+        self.add_input('CDI', val=np.ones(num_nodes), units='unitless')
+
+        add_aviary_output(
+            self, Aircraft.Design.ZERO_LIFT_DRAG_POLAR,
+            val=np.zeros((num_alt, num_mach)), units='unitless')
+
+        add_aviary_output(
+            self, Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR,
+            val=np.zeros((num_mach, num_cl)), units='unitless')
+
+        # each table entry is one sample
+        rows = np.arange(num_cd0)
+        self.declare_partials(
+            Aircraft.Design.ZERO_LIFT_DRAG_POLAR, 'CD0', rows=rows, cols=rows, val=1.)
+
+        rows = np.arange(num_nodes - num_cd0)
+        self.declare_partials(
+            Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR, 'CDI',
+            rows=rows, cols=rows + num_cd0, val=1.)
+
+    def compute(self, inputs, outputs):
+        num_cd0 = self.options['num_alt'] * self.options['num_mach']
+
+        outputs[Aircraft.Design.ZERO_LIFT_DRAG_POLAR] = inputs['CD0'][:num_cd0].reshape(
+            outputs[Aircraft.Design.ZERO_LIFT_DRAG_POLAR].shape)
+
+        outputs[Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR] = \
+            inputs['CDI'][num_cd0:].reshape(
+                outputs[Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR].shape)
+
+
+def polar_drag_error(prob, phase_name):
+    """
+    Compare the drag of a phase interpolated from the drag polar to the drag computed
+    directly by ComputedAeroGroup, at the same points of the phase timeseries.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        Problem that was run, with a phase that uses the 'computed_polar' aerodynamics.
+    phase_name : str
+        Name of the phase.
+
+    Returns
+    -------
+    drag : ndarray
+        Drag of the phase interpolated from the drag polar, in N.
+    direct_drag : ndarray
+        Drag computed directly, in N.
+    """
+    altitude = _get_timeseries_val(prob, phase_name, Dynamic.Mission.ALTITUDE, 'ft')
+    mach = _get_timeseries_val(prob, phase_name, Dynamic.Mission.MACH, 'unitless')
+    mass = _get_timeseries_val(prob, phase_name, Dynamic.Mission.MASS, 'kg')
+    drag = _get_timeseries_val(prob, phase_name, Dynamic.Mission.DRAG, 'N')
+
+    num_nodes = altitude.size
+
+    direct = om.Problem(reports=False)
+    model = direct.model
+
+    model.add_subsystem(
+        'atmosphere', get_atmosphere_comp(num_nodes, prob.aviary_inputs),
+        promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
+        promotes_outputs=[
+            ('temp', Dynamic.Mission.TEMPERATURE),
+            ('pres', Dynamic.Mission.STATIC_PRESSURE)])
+
+    model.add_subsystem(
+        'aero',
+        ComputedAeroGroup(num_nodes=num_nodes, aviary_options=prob.aviary_inputs),
+        promotes=['*'])
+
+    direct.setup()
+
+    meta_data = prob.meta_data
+
+    # the direct computation uses the aircraft inputs of the mission
+    inputs = model.list_inputs(val=False, prom_name=True, out_stream=None)
+    names = {meta['prom_name'] for _, meta in inputs}
+
+    for name in sorted(names):
+        if name.startswith(('aircraft:', 'mission:')) and name in meta_data:
+            units = meta_data[name]['units']
+            direct.set_val(name, prob.get_val(name, units=units), units=units)
+
+    direct.set_val(Dynamic.Mission.ALTITUDE, altitude, units='ft')
+    direct.set_val(Dynamic.Mission.MACH, mach)
+    direct.set_val(Dynamic.Mission.MASS, mass, units='kg')
+
+    direct.run_model()
+
+    return drag, direct.get_val(Dynamic.Mission.DRAG, units='N')
+
+
+def _get_timeseries_val(prob, phase_name, name, units):
+    """
+    Return the timeseries of a variable of a phase, whether it is a state, a control or
+    an output of the ODE.
+    """
+    timeseries = f'traj.{phase_name}.timeseries.'
+
+    for prefix in ('', 'states:', 'controls:', 'polynomial_controls:'):
+        try:
+            return prob.get_val(timeseries + prefix + name, units=units).ravel()
+        except KeyError:
+            continue
+
+    raise KeyError(
+        f'Variable <{name}> is not in the timeseries of phase <{phase_name}>.')
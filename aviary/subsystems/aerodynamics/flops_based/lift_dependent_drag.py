@@ -1,4 +1,6 @@
 # %%
+from collections import OrderedDict
+
 import numpy as np
 import openmdao.api as om
 from openmdao.components.interp_util.interp import InterpND
@@ -68,37 +70,32 @@ class LiftDependentDrag(om.ExplicitComponent):
         # Derivative of FCDP w.r.t A variable at value of A
         dFCDP_dA = 2.0 * FCDP1 * FCDP2 * (FCDP2 - FCDP1) * den ** 2
 
-        dFCDP_dDEL = 2.0 * den * (dFCDP1 * (FCDP2 - FCDP1 * FCDP2 * den * (A - A1)) +
-                                  dFCDP2 * (FCDP1 + FCDP1 * FCDP2 * den * (A - A2)))
+        dFCDP_dDEL = 2.0 * den[:, np.newaxis] * (
+            dFCDP1 * (FCDP2 - FCDP1 * FCDP2 * den * (A - A1))[:, np.newaxis] +
+            dFCDP2 * (FCDP1 + FCDP1 * FCDP2 * den * (A - A2))[:, np.newaxis])
 
         return FCDP, dFCDP_dDEL[:, 0], dFCDP_dDEL[:, 1], dFCDP_dA
 
-    def inner_interp(self, arrA, FCDP1, FCDP2, FCDP3, FCDP4, FCDP5, dFCDP1, dFCDP2, dFCDP3, dFCDP4, dFCDP5, A):
+    def inner_interp(self, arrA, arrFCDP, arrdFCDP, A):
+
+        # Interpolation across A is linear in the tabulated values, so the same weights
+        # (and their derivatives w.r.t. A) apply to FCDP and its derivatives at every
+        # node
+        weights = np.empty(len(arrA), dtype=np.result_type(A, float))
+        dweights_dA = np.empty_like(weights)
+        for idx, weight_table in enumerate(_get_weight_tables(arrA)):
+            weight, deriv = weight_table.interpolate(A, compute_derivative=True)
+            weights[idx] = weight[0]
+            dweights_dA[idx] = deriv[0, 0]
+
+        FCDP = weights @ arrFCDP
 
         # Derivative of FCDP w.r.t A variable at value of A
-        arrFCDP = np.array([FCDP1, FCDP2, FCDP3, FCDP4, FCDP5])
-        arrFCDP = np.reshape(arrFCDP, (5))
-        interp_arrFCDP = InterpND(method='lagrange2', points=(arrA), values=arrFCDP)
-        FCDP, deriv = interp_arrFCDP.interpolate(A, compute_derivative=True)  # at A
-        dFCDP_dA = deriv[:, 0]  # at A
-
-        # Derivative of FCDP w.r.t DELM variable at value of A
-        arrdFCDP_dDELM = np.array(
-            [dFCDP1[:, 0], dFCDP2[:, 0], dFCDP3[:, 0], dFCDP4[:, 0], dFCDP5[:, 0]])
-        arrdFCDP_dDELM = np.reshape(arrdFCDP_dDELM, (5))
-        interp_arrdFCDP_dDELM = InterpND(
-            method='lagrange2', points=(arrA), values=arrdFCDP_dDELM)
-        dFCDP_dDELM, deriv = interp_arrdFCDP_dDELM.interpolate(
-            A, compute_derivative=True)  # at A
-
-        # Derivative of FCDP w.r.t DELCL variable at value of A
-        arrdFCDP_dDELCL = np.array(
-            [dFCDP1[:, 1], dFCDP2[:, 1], dFCDP3[:, 1], dFCDP4[:, 1], dFCDP5[:, 1]])
-        arrdFCDP_dDELCL = np.reshape(arrdFCDP_dDELCL, (5))
-        interp_arrdFCDP_dDELCL = InterpND(
-            method='lagrange2', points=(arrA), values=arrdFCDP_dDELCL)
-        dFCDP_dDELCL, deriv = interp_arrdFCDP_dDELCL.interpolate(
-            A, compute_derivative=True)  # at A
+        dFCDP_dA = dweights_dA @ arrFCDP
+
+        # Derivatives of FCDP w.r.t DELM and DELCL variables at value of A
+        dFCDP_dDELM = weights @ arrdFCDP[..., 0]
+        dFCDP_dDELCL = weights @ arrdFCDP[..., 1]
 
         return FCDP, dFCDP_dDELM, dFCDP_dDELCL, dFCDP_dA
 
@@ -127,107 +124,73 @@ class LiftDependentDrag(om.ExplicitComponent):
         DELM = mach - MDES
         A = self.A = AR * TC ** (1.0/3.0)
 
-        for i in range(0, nn):
-
-            x = np.array([DELM[i], DELCL[i]])
-
-            if DELM[i].real <= 0.075:
-
-                if A.real < 0.5:
+        x = np.stack((DELM, DELCL), axis=-1)
 
-                    FCDP1, dFCDP1 = AR05table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = AR1table.interpolate(x, compute_derivative=True)
+        # A is the same at every node, so nodes only differ in which group of tables
+        # (subsonic or supersonic) they use - interpolate each group all at once
+        subsonic = DELM.real <= 0.075
 
-                    A1 = 0.5
-                    A2 = 1.0
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
+        for mask, is_subsonic in ((subsonic, True), (~subsonic, False)):
+            if not np.any(mask):
+                continue
 
-                elif 0.5 <= A.real < 6:
+            arrA, tables = self._get_tables(A, is_subsonic)
 
-                    FCDP1, dFCDP1 = AR05table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = AR1table.interpolate(x, compute_derivative=True)
-                    FCDP3, dFCDP3 = AR2table.interpolate(x, compute_derivative=True)
-                    FCDP4, dFCDP4 = AR4table.interpolate(x, compute_derivative=True)
-                    FCDP5, dFCDP5 = AR6table.interpolate(x, compute_derivative=True)
-
-                    arrA = np.array([0.5, 1, 2, 4, 6])
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.inner_interp(
-                        arrA, FCDP1, FCDP2, FCDP3, FCDP4, FCDP5, dFCDP1, dFCDP2, dFCDP3, dFCDP4, dFCDP5, A
-                    )
-
-                else:
-
-                    FCDP1, dFCDP1 = AR4table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = AR6table.interpolate(x, compute_derivative=True)
-
-                    A1 = 4.0
-                    A2 = 6.0
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
+            results = [_interpolate(table, x[mask]) for table in tables]
+            arrFCDP = np.array([result[0] for result in results])
+            arrdFCDP = np.array([result[1] for result in results])
 
+            if len(tables) == 2:
+                FCDP[mask], dFCDP_dDELM[mask], dFCDP_dDELCL[mask], dFCDP_dA[mask] = \
+                    self.edge_interp(*arrA, *arrFCDP, *arrdFCDP, A)
             else:
+                FCDP[mask], dFCDP_dDELM[mask], dFCDP_dDELCL[mask], dFCDP_dA[mask] = \
+                    self.inner_interp(arrA, arrFCDP, arrdFCDP, A)
 
-                if A.real < 0.7:
-
-                    FCDP1, dFCDP1 = ARS07table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS08table.interpolate(x, compute_derivative=True)
+        DCDP = FCDP * (1.0 + CAM/10.0) * A/AR
+        self.clamp_indices = np.where(DCDP < 0)
+        DCDP[DCDP < 0] = 0.0
 
-                    A1 = 0.7
-                    A2 = 0.8
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
+        self.FCDP = FCDP
+        self.dFCDP_dA = dFCDP_dA
+        self.dFCDP_dDELM = dFCDP_dDELM
+        self.dFCDP_dDELCL = dFCDP_dDELCL
 
-                elif 0.7 <= A.real <= 1.4:
+        outputs["CD"] = DCDP
 
-                    FCDP1, dFCDP1 = ARS07table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS08table.interpolate(x, compute_derivative=True)
-                    FCDP3, dFCDP3 = ARS10table.interpolate(x, compute_derivative=True)
-                    FCDP4, dFCDP4 = ARS12table.interpolate(x, compute_derivative=True)
-                    FCDP5, dFCDP5 = ARS14table.interpolate(x, compute_derivative=True)
+    def _get_tables(self, A, subsonic):
+        """
+        Return the values of A and the tables to interpolate between for the given
+        regime. Two tables are extrapolated using edge_interp(), five are interpolated
+        using inner_interp().
+        """
+        if subsonic:
 
-                    arrA = np.array([0.7, 0.8, 1.0, 1.2, 1.4])
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.inner_interp(
-                        arrA, FCDP1, FCDP2, FCDP3, FCDP4, FCDP5, dFCDP1, dFCDP2, dFCDP3, dFCDP4, dFCDP5, A
-                    )
+            if A.real < 0.5:
+                return (0.5, 1.0), (AR05table, AR1table)
 
-                elif 1.4 < A.real <= 2.0:
+            elif 0.5 <= A.real < 6:
+                return (0.5, 1, 2, 4, 6), \
+                    (AR05table, AR1table, AR2table, AR4table, AR6table)
 
-                    FCDP1, dFCDP1 = ARS12table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS14table.interpolate(x, compute_derivative=True)
-                    FCDP3, dFCDP3 = ARS16table.interpolate(x, compute_derivative=True)
-                    FCDP4, dFCDP4 = ARS18table.interpolate(x, compute_derivative=True)
-                    FCDP5, dFCDP5 = ARS20table.interpolate(x, compute_derivative=True)
+            else:
+                return (4.0, 6.0), (AR4table, AR6table)
 
-                    arrA = np.array([1.2, 1.4, 1.6, 1.8, 2.0])
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.inner_interp(
-                        arrA, FCDP1, FCDP2, FCDP3, FCDP4, FCDP5, dFCDP1, dFCDP2, dFCDP3, dFCDP4, dFCDP5, A
-                    )
+        else:
 
-                else:
+            if A.real < 0.7:
+                return (0.7, 0.8), (ARS07table, ARS08table)
 
-                    FCDP1, dFCDP1 = ARS18table.interpolate(x, compute_derivative=True)
-                    FCDP2, dFCDP2 = ARS20table.interpolate(x, compute_derivative=True)
+            elif 0.7 <= A.real <= 1.4:
+                return (0.7, 0.8, 1.0, 1.2, 1.4), \
+                    (ARS07table, ARS08table, ARS10table, ARS12table, ARS14table)
 
-                    A1 = 1.8
-                    A2 = 2.0
-                    FCDP[i], dFCDP_dDELM[i], dFCDP_dDELCL[i], dFCDP_dA[i] = self.edge_interp(
-                        A1, A2, FCDP1, FCDP2, dFCDP1, dFCDP2, A
-                    )
+            elif 1.4 < A.real <= 2.0:
+                return (1.2, 1.4, 1.6, 1.8, 2.0), \
+                    (ARS12table, ARS14table, ARS16table, ARS18table, ARS20table)
 
-        DCDP = FCDP * (1.0 + CAM/10.0) * A/AR
-        self.clamp_indices = np.where(DCDP < 0)
-        DCDP[DCDP < 0] = 0.0
-
-        self.FCDP = FCDP
-        self.dFCDP_dA = dFCDP_dA
-        self.dFCDP_dDELM = dFCDP_dDELM
-        self.dFCDP_dDELCL = dFCDP_dDELCL
-
-        outputs["CD"] = DCDP
+            else:
+                return (1.8, 2.0), (ARS18table, ARS20table)
 
     def compute_partials(self, inputs, partials):
         """
@@ -591,29 +554,80 @@ ARS20 = np.array(
          0.084000,  0.108000,  0.131000,  0.210000,  0.290000],
      [1.100000,   0.000000,  0.003600,  0.022000,  0.048000,  0.075000,  0.102000,  0.128000,  0.155000,  0.269000,  0.375000]])
 
-AR05table = InterpND(method='lagrange2', points=(
+AR05table = InterpND(method='2D-lagrange2', points=(
     AR05[1:, 0], AR05[0, 1:]), values=AR05[1:, 1:], extrapolate=True)
-AR1table = InterpND(method='lagrange2', points=(
+AR1table = InterpND(method='2D-lagrange2', points=(
     AR1[1:, 0], AR1[0, 1:]), values=AR1[1:, 1:], extrapolate=True)
-AR2table = InterpND(method='lagrange2', points=(
+AR2table = InterpND(method='2D-lagrange2', points=(
     AR2[1:, 0], AR2[0, 1:]), values=AR2[1:, 1:], extrapolate=True)
-AR4table = InterpND(method='lagrange2', points=(
+AR4table = InterpND(method='2D-lagrange2', points=(
     AR4[1:, 0], AR4[0, 1:]), values=AR4[1:, 1:], extrapolate=True)
-AR6table = InterpND(method='lagrange2', points=(
+AR6table = InterpND(method='2D-lagrange2', points=(
     AR6[1:, 0], AR6[0, 1:]), values=AR6[1:, 1:], extrapolate=True)
-ARS07table = InterpND(method='lagrange2', points=(
+ARS07table = InterpND(method='2D-lagrange2', points=(
     ARS07[1:, 0], ARS07[0, 1:]), values=ARS07[1:, 1:], extrapolate=True)
-ARS08table = InterpND(method='lagrange2', points=(
+ARS08table = InterpND(method='2D-lagrange2', points=(
     ARS08[1:, 0], ARS08[0, 1:]), values=ARS08[1:, 1:], extrapolate=True)
-ARS10table = InterpND(method='lagrange2', points=(
+ARS10table = InterpND(method='2D-lagrange2', points=(
     ARS10[1:, 0], ARS10[0, 1:]), values=ARS10[1:, 1:], extrapolate=True)
-ARS12table = InterpND(method='lagrange2', points=(
+ARS12table = InterpND(method='2D-lagrange2', points=(
     ARS12[1:, 0], ARS12[0, 1:]), values=ARS12[1:, 1:], extrapolate=True)
-ARS14table = InterpND(method='lagrange2', points=(
+ARS14table = InterpND(method='2D-lagrange2', points=(
     ARS14[1:, 0], ARS14[0, 1:]), values=ARS14[1:, 1:], extrapolate=True)
-ARS16table = InterpND(method='lagrange2', points=(
+ARS16table = InterpND(method='2D-lagrange2', points=(
     ARS16[1:, 0], ARS16[0, 1:]), values=ARS16[1:, 1:], extrapolate=True)
-ARS18table = InterpND(method='lagrange2', points=(
+ARS18table = InterpND(method='2D-lagrange2', points=(
     ARS18[1:, 0], ARS18[0, 1:]), values=ARS18[1:, 1:], extrapolate=True)
-ARS20table = InterpND(method='lagrange2', points=(
+ARS20table = InterpND(method='2D-lagrange2', points=(
     ARS20[1:, 0], ARS20[0, 1:]), values=ARS20[1:, 1:], extrapolate=True)
+
+# OpenMDAO's '2D-lagrange2' tables cache their coefficients differently for single-point
+# and vectorized lookups, and fail if both kinds of lookup are done on the same table.
+# Single points are looked up on a separate copy of each table
+_single_point_tables = {
+    table: InterpND(method='2D-lagrange2', points=table.grid, values=table.values,
+                    extrapolate=True)
+    for table in (AR05table, AR1table, AR2table, AR4table, AR6table,
+                  ARS07table, ARS08table, ARS10table, ARS12table, ARS14table,
+                  ARS16table, ARS18table, ARS20table)}
+
+
+def _interpolate(table, x):
+    """
+    Interpolate the given table at each row of x, returning values and derivatives.
+    """
+    if x.shape[0] == 1:
+        table = _single_point_tables[table]
+
+    return table.interpolate(x, compute_derivative=True)
+
+
+# maximum number of sets of A values remembered by _get_weight_tables()
+WEIGHT_TABLE_CACHE_SIZE = 8
+
+# Interpolants giving the weight of each tabulated value when interpolating across A.
+# The fixed-dimension ('1D-', '2D-') methods evaluate all points in one vectorized call
+_weight_table_cache = OrderedDict()
+
+
+def clear_weight_table_cache():
+    """
+    Forget all interpolants remembered by _get_weight_tables(), so they are created
+    again the next time they are requested.
+    """
+    _weight_table_cache.clear()
+
+
+def _get_weight_tables(arrA):
+    if arrA in _weight_table_cache:
+        _weight_table_cache.move_to_end(arrA)
+
+    else:
+        _weight_table_cache[arrA] = [
+            InterpND(method='1D-lagrange2', points=(np.array(arrA, dtype=float),),
+                     values=np.eye(len(arrA))[idx])
+            for idx in range(len(arrA))]
+        if len(_weight_table_cache) > WEIGHT_TABLE_CACHE_SIZE:
+            _weight_table_cache.popitem(last=False)
+
+    return _weight_table_cache[arrA]
@@ -5,27 +5,23 @@ from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Aircraft, Dynamic
 
 
-class SkinFriction(om.ImplicitComponent):
+class _SkinFrictionEquations:
     """
-    Computes skin friction coefficient using the Sommer and Short T Prime method as used
-    in FLOPS AERSCL.
+    Variables and equations of the Sommer and Short T Prime method as used in FLOPS
+    AERSCL, shared by SkinFriction and PointwiseSkinFriction.
 
-    The fixed-point iteration scheme has been replaced with Newton's method, which can
-    converge the equations for multiple mach numbers and characteristic lengths
-    simultaneously.
+    For each mach number and characteristic length, the wall temperature and skin
+    friction coefficient are found from a pair of residual equations.
     """
 
+    CONLOG = 2.302585
+    sea_level_pressure = 14.6959 * 144  # psi -> psf
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self.CONLOG = 2.302585
+        # adiabatic wall temperature, set by the initial guess
         self.TAW = 1.0
-        self.sea_level_pressure = 14.6959 * 144  # psi -> psf
-
-        self.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
-        self.linear_solver = om.DirectSolver()
-        self.nonlinear_solver.options['iprint'] = -1
-        self.linear_solver.options['iprint'] = -1
 
     def initialize(self):
         """
@@ -64,44 +60,7 @@ class SkinFriction(om.ImplicitComponent):
         self.add_output('Re', np.ones((nn, nc)), units='unitless')
         self.add_output('wall_temp', np.ones((nn, nc)), units='degR')
 
-    def setup_partials(self):
-        nn = self.options["num_nodes"]
-        nc = self.nc
-        n = nn * nc
-
-        row_col = np.arange(n)
-        self.declare_partials('Re', 'Re', rows=row_col, cols=row_col, val=1.0)
-        self.declare_partials(
-            'skin_friction_coeff', 'skin_friction_coeff',
-            rows=row_col, cols=row_col, val=1.0)
-
-        self.declare_partials(
-            'cf_iter', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
-        self.declare_partials(
-            'wall_temp', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
-        self.declare_partials(
-            'skin_friction_coeff', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
-
-        col = np.arange(nn)
-        cols = np.repeat(col, nc)
-        self.declare_partials(
-            'cf_iter', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
-        self.declare_partials(
-            'wall_temp', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
-        self.declare_partials(
-            'Re', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
-        self.declare_partials(
-            'skin_friction_coeff', [Dynamic.Mission.TEMPERATURE,
-                                    Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH],
-            rows=row_col, cols=cols)
-
-        col = np.arange(nc)
-        cols = np.tile(col, nn)
-        self.declare_partials('Re', 'characteristic_lengths', rows=row_col, cols=cols)
-        self.declare_partials(
-            'cf_iter', 'characteristic_lengths', rows=row_col, cols=cols)
-
-    def guess_nonlinear(self, inputs, outputs, resids):
+    def _cf_guess(self, inputs, outputs):
         nn = self.options["num_nodes"]
         nc = self.nc
 
@@ -124,7 +83,7 @@ class SkinFriction(om.ImplicitComponent):
         # INITIAL GUESS AT SKIN FRICTION COEFFICIENT
         outputs['cf_iter'] = (0.242 / (np.log(reynolds_num * 0.0015) / self.CONLOG)) ** 2
 
-    def apply_nonlinear(self, inputs, outputs, residuals):
+    def _cf_residuals(self, inputs, outputs, residuals):
         T, pressure, mach, length = inputs.values()
         cf = outputs['cf_iter']
         wall_temp = outputs['wall_temp']
@@ -166,7 +125,7 @@ class SkinFriction(om.ImplicitComponent):
         residuals['skin_friction_coeff'] = \
             outputs['skin_friction_coeff'] - outputs['cf_iter'] / wall_temp_ratio
 
-    def linearize(self, inputs, outputs, partials):
+    def _cf_partials(self, inputs, outputs, partials):
         nn = self.options["num_nodes"]
         nc = self.nc
 
@@ -276,3 +235,192 @@ class SkinFriction(om.ImplicitComponent):
         partials['skin_friction_coeff', 'wall_temp'] = np.einsum(
             'ij,i->ij', dskf_dwtr, dwtr_dwt).ravel()
         partials['skin_friction_coeff', 'cf_iter'] = (- 1.0 / wall_temp_ratio).ravel()
+
+
+class SkinFriction(_SkinFrictionEquations, om.ImplicitComponent):
+    """
+    Computes skin friction coefficient using the Sommer and Short T Prime method as used
+    in FLOPS AERSCL.
+
+    The fixed-point iteration scheme has been replaced with Newton's method, which can
+    converge the equations for multiple mach numbers and characteristic lengths
+    simultaneously.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        self.linear_solver = om.DirectSolver()
+        self.nonlinear_solver.options['iprint'] = -1
+        self.linear_solver.options['iprint'] = -1
+
+    def setup_partials(self):
+        nn = self.options["num_nodes"]
+        nc = self.nc
+        n = nn * nc
+
+        row_col = np.arange(n)
+        self.declare_partials('Re', 'Re', rows=row_col, cols=row_col, val=1.0)
+        self.declare_partials(
+            'skin_friction_coeff', 'skin_friction_coeff',
+            rows=row_col, cols=row_col, val=1.0)
+
+        self.declare_partials(
+            'cf_iter', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
+        self.declare_partials(
+            'wall_temp', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
+        self.declare_partials(
+            'skin_friction_coeff', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
+
+        col = np.arange(nn)
+        cols = np.repeat(col, nc)
+        self.declare_partials(
+            'cf_iter', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
+        self.declare_partials(
+            'wall_temp', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
+        self.declare_partials(
+            'Re', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
+        self.declare_partials(
+            'skin_friction_coeff', [Dynamic.Mission.TEMPERATURE,
+                                    Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH],
+            rows=row_col, cols=cols)
+
+        col = np.arange(nc)
+        cols = np.tile(col, nn)
+        self.declare_partials('Re', 'characteristic_lengths', rows=row_col, cols=cols)
+        self.declare_partials(
+            'cf_iter', 'characteristic_lengths', rows=row_col, cols=cols)
+
+    def guess_nonlinear(self, inputs, outputs, resids):
+        self._cf_guess(inputs, outputs)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        self._cf_residuals(inputs, outputs, residuals)
+
+    def linearize(self, inputs, outputs, partials):
+        self._cf_partials(inputs, outputs, partials)
+
+
+class PointwiseSkinFriction(_SkinFrictionEquations, om.ExplicitComponent):
+    """
+    Computes skin friction coefficient using the Sommer and Short T Prime method as used
+    in FLOPS AERSCL, with the same equations as SkinFriction.
+
+    The wall temperature and skin friction coefficient of each mach number and
+    characteristic length are an independent pair of equations, so instead of a Newton
+    solver over all of them, Newton's method is applied to every pair at once with
+    vectorized 2x2 solves. Derivatives are computed from the 2x2 blocks with the
+    implicit function theorem.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.max_iter = 50
+        self.tol = 1e-13
+
+        # converged outputs of the last call of compute
+        self._solution = None
+
+    def setup_partials(self):
+        nn = self.options["num_nodes"]
+        nc = self.nc
+        n = nn * nc
+
+        outputs = ['Re', 'wall_temp', 'cf_iter', 'skin_friction_coeff']
+
+        row_col = np.arange(n)
+        cols = np.repeat(np.arange(nn), nc)
+        self.declare_partials(
+            outputs, [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE,
+                      Dynamic.Mission.MACH], rows=row_col, cols=cols)
+
+        cols = np.tile(np.arange(nc), nn)
+        self.declare_partials(outputs, 'characteristic_lengths', rows=row_col, cols=cols)
+
+    def compute(self, inputs, outputs):
+        # the initial guess also sets Re and the adiabatic wall temperature
+        self._cf_guess(inputs, outputs)
+
+        residuals = {}
+        partials = {}
+
+        for _ in range(self.max_iter):
+            self._cf_residuals(inputs, outputs, residuals)
+            self._cf_partials(inputs, outputs, partials)
+
+            d_wall_temp, d_cf = _solve_blocks(
+                partials, -residuals['wall_temp'].ravel(), -residuals['cf_iter'].ravel())
+
+            wall_temp = outputs['wall_temp']
+            cf = outputs['cf_iter']
+            d_wall_temp = d_wall_temp.reshape(wall_temp.shape)
+            d_cf = d_cf.reshape(cf.shape)
+
+            outputs['wall_temp'] = wall_temp + d_wall_temp
+            outputs['cf_iter'] = cf + d_cf
+
+            if np.max(np.abs(d_wall_temp / wall_temp)) < self.tol and \
+                    np.max(np.abs(d_cf / cf)) < self.tol:
+                break
+
+        self._cf_residuals(inputs, outputs, residuals)
+        outputs['skin_friction_coeff'] = \
+            outputs['skin_friction_coeff'] - residuals['skin_friction_coeff']
+
+        self._solution = {name: outputs[name].copy() for name in
+                          ['cf_iter', 'skin_friction_coeff', 'Re', 'wall_temp']}
+
+    def compute_partials(self, inputs, partials):
+        nc = self.nc
+        outputs = self._solution
+
+        T = inputs[Dynamic.Mission.TEMPERATURE]
+        mach = inputs[Dynamic.Mission.MACH]
+
+        residuals = {}
+        res_partials = {}
+        self._cf_residuals(inputs, outputs, residuals)
+        self._cf_partials(inputs, outputs, res_partials)
+
+        # the adiabatic wall temperature is a constant of the residuals, but depends on
+        # temperature and mach
+        dreswt_dTAW = (
+            (residuals['wall_temp'] + 0.5 * outputs['wall_temp']) / self.TAW).ravel()
+        dTAW = {
+            Dynamic.Mission.TEMPERATURE: np.repeat(1.0 + 0.176 * mach * mach, nc),
+            Dynamic.Mission.MACH: np.repeat(0.352 * mach * T, nc)}
+
+        for wrt in [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE,
+                    Dynamic.Mission.MACH, 'characteristic_lengths']:
+            dreswt = res_partials.get(('wall_temp', wrt), 0.0)
+
+            if wrt in dTAW:
+                dreswt = dreswt + dreswt_dTAW * dTAW[wrt]
+
+            dwt, dcf = _solve_blocks(
+                res_partials, -dreswt * np.ones(nc * len(T)),
+                -res_partials[('cf_iter', wrt)])
+
+            partials['Re', wrt] = -res_partials[('Re', wrt)]
+            partials['wall_temp', wrt] = dwt
+            partials['cf_iter', wrt] = dcf
+            partials['skin_friction_coeff', wrt] = -(
+                res_partials.get(('skin_friction_coeff', wrt), 0.0)
+                + res_partials[('skin_friction_coeff', 'wall_temp')] * dwt
+                + res_partials[('skin_friction_coeff', 'cf_iter')] * dcf)
+
+
+def _solve_blocks(partials, rhs_wall_temp, rhs_cf):
+    """
+    Solve the 2x2 systems of the wall temperature and skin friction coefficient
+    residuals of every point, with their partials from _cf_partials.
+    """
+    a = partials[('wall_temp', 'wall_temp')]
+    b = partials[('wall_temp', 'cf_iter')]
+    c = partials[('cf_iter', 'wall_temp')]
+    d = partials[('cf_iter', 'cf_iter')]
+    det = a * d - b * c
+
+    return (d * rhs_wall_temp - b * rhs_cf) / det, (a * rhs_cf - c * rhs_wall_temp) / det
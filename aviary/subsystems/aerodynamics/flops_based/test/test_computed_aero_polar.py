@@ -0,0 +1,269 @@
+import unittest
+from copy import deepcopy
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+from dymos.models.atmosphere import USatm1976Comp
+from openmdao.utils.assert_utils import assert_check_partials, assert_check_totals, \
+    assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.constants import GRAV_METRIC_FLOPS
+from aviary.interface.default_phase_info.flops import phase_info, prop, geom
+from aviary.interface.methods_for_level1 import run_aviary
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.subsystems.aerodynamics.aerodynamics_builder import CoreAerodynamicsBuilder
+from aviary.subsystems.aerodynamics.flops_based.computed_aero_polar import \
+    _PolarTables, _SampleMass, get_polar_grid, polar_drag_error
+from aviary.subsystems.premission import CorePreMission
+from aviary.utils.aviary_values import get_items
+from aviary.utils.functions import set_aviary_initial_values
+from aviary.validation_cases.validation_tests import get_flops_inputs, get_flops_outputs
+from aviary.variable_info.variables import Aircraft, Dynamic
+from aviary.variable_info.variables_in import VariablesIn
+
+
+polar_options = {'method': 'computed_polar',
+                 'altitude': [0., 10000., 20000., 30000., 40000.],
+                 'mach': [0.2, 0.4, 0.6, 0.7, 0.8],
+                 'lift_coefficient': [0., 0.3, 0.6, 0.9]}
+
+
+class ComputedAeroPolarTest(unittest.TestCase):
+
+    def setUp(self):
+        flops_inputs = get_flops_inputs('LargeSingleAisle1FLOPS')
+        flops_outputs = get_flops_outputs('LargeSingleAisle1FLOPS')
+
+        key = Aircraft.Propulsion.TOTAL_SCALED_SLS_THRUST
+        flops_inputs.set_val(key, *(flops_outputs.get_item(key)))
+
+        aero = CoreAerodynamicsBuilder('core_aerodynamics', code_origin='FLOPS')
+        flops_inputs = aero.preprocess_inputs(flops_inputs, **deepcopy(polar_options))
+
+        grid = aero.polar_grid
+
+        # direct computation at the points of the zero-lift drag table with another
+        # lift coefficient, and at the points of the lift-dependent drag table at
+        # another altitude
+        num_mach = grid['mach'].size
+        num_cl = grid['lift_coefficient'].size
+        num_alt = grid['altitude'].size
+
+        altitude = np.concatenate((np.repeat(grid['altitude'], num_mach),
+                                   np.full(num_mach * num_cl, 35000.)))
+
+        mach = np.concatenate((np.tile(grid['mach'], num_alt),
+                               np.repeat(grid['mach'], num_cl)))
+
+        self.lift_coefficient = np.concatenate((
+            np.full(num_alt * num_mach, 0.8),
+            np.tile(grid['lift_coefficient'], num_mach)))
+
+        nn = altitude.size
+
+        prob = self.prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem(
+            'pre_mission',
+            CorePreMission(aviary_options=flops_inputs,
+                           subsystems=[prop, geom, aero],
+                           subsystem_options={'core_aerodynamics': polar_options}),
+            promotes_inputs=['aircraft:*', 'mission:*'],
+            promotes_outputs=['aircraft:*', 'mission:*'])
+
+        model.add_subsystem(
+            'atmosphere', USatm1976Comp(num_nodes=nn),
+            promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
+            promotes_outputs=[
+                ('temp', Dynamic.Mission.TEMPERATURE),
+                ('pres', Dynamic.Mission.STATIC_PRESSURE)])
+
+        model.add_subsystem(
+            'aero', aero.build_mission(num_nodes=nn, aviary_inputs=flops_inputs,
+                                       method='computed'),
+            promotes=['*'])
+
+        model.add_subsystem(
+            'input_sink',
+            VariablesIn(aviary_options=flops_inputs),
+            promotes_inputs=['*'],
+            promotes_outputs=['*'])
+
+        set_aviary_initial_values(model, flops_inputs)
+
+        prob.setup(force_alloc_complex=True)
+
+        for (key, (val, units)) in get_items(flops_inputs):
+            try:
+                prob.set_val(key, val, units)
+
+            except Exception:
+                # Should be an option or an overridden output.
+                continue
+
+        prob.set_val(Dynamic.Mission.ALTITUDE, altitude, 'ft')
+        prob.set_val(Dynamic.Mission.MACH, mach)
+
+    def run_model(self):
+        prob = self.prob
+
+        prob.run_model()
+
+        # mass for which lift equals weight at the requested lift coefficient
+        S = prob.get_val(Aircraft.Wing.AREA, 'm**2')
+        P = prob.get_val(Dynamic.Mission.STATIC_PRESSURE, 'N/m**2')
+        mach = prob.get_val(Dynamic.Mission.MACH)
+        q = 0.5 * 1.4 * P * mach**2
+
+        prob.set_val(Dynamic.Mission.MASS,
+                     self.lift_coefficient * q * S / GRAV_METRIC_FLOPS, 'kg')
+
+        prob.run_model()
+
+    def test_polar(self):
+        prob = self.prob
+        self.run_model()
+
+        CD0_table = prob.get_val(Aircraft.Design.ZERO_LIFT_DRAG_POLAR)
+        CDI_table = prob.get_val(Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR)
+
+        self.assertEqual(CD0_table.shape, (5, 5))
+        self.assertEqual(CDI_table.shape, (5, 4))
+
+        num_cd0 = CD0_table.size
+
+        # each drag coefficient only depends on the axes of its table
+        assert_near_equal(CD0_table.ravel(), prob.get_val('CD0')[:num_cd0], 1e-10)
+        assert_near_equal(CDI_table.ravel(), prob.get_val('CDI')[num_cd0:], 1e-10)
+
+    def test_derivatives(self):
+        prob = self.prob
+        self.run_model()
+
+        # derivatives of the tables propagate back to the geometry
+        data = prob.check_totals(
+            of=[Aircraft.Design.ZERO_LIFT_DRAG_POLAR],
+            wrt=[Aircraft.Wing.AREA, Aircraft.Wing.SWEEP, Aircraft.Wing.ASPECT_RATIO],
+            method='fd', form='central', out_stream=None)
+
+        assert_check_totals(data, atol=1e-8, rtol=1e-5)
+
+        # the lift-dependent drag coefficient does not depend on the wing area
+        data = prob.check_totals(
+            of=[Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR],
+            wrt=[Aircraft.Wing.SWEEP, Aircraft.Wing.ASPECT_RATIO],
+            method='fd', form='central', out_stream=None)
+
+        assert_check_totals(data, atol=1e-8, rtol=1e-5)
+
+    def test_grid(self):
+        grid = get_polar_grid(mach=[0.2, 0.4, 0.6, 0.8])
+        assert_near_equal(grid['mach'], np.array([0.2, 0.4, 0.6, 0.8]))
+        self.assertEqual(grid['altitude'].size, 7)
+
+        with self.assertRaises(ValueError) as cm:
+            get_polar_grid(lift_coefficient=[0., 0.5, 1.])
+
+        self.assertEqual(
+            str(cm.exception), 'Drag polar grid <lift_coefficient> must have at least '
+            '4 values in strictly ascending order.')
+
+        with self.assertRaises(ValueError):
+            get_polar_grid(altitude=[0., 10000., 5000., 20000.])
+
+
+class PolarComponentsTest(unittest.TestCase):
+
+    def test_partials(self):
+        nn = 5 * 4 + 4 * 3
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('mass', _SampleMass(num_nodes=nn), promotes=['*'])
+
+        model.add_subsystem(
+            'tables', _PolarTables(num_alt=5, num_mach=4, num_cl=3), promotes=['*'])
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val(Aircraft.Wing.AREA, 1370., 'ft**2')
+        prob.set_val(Dynamic.Mission.STATIC_PRESSURE,
+                     np.linspace(101325., 18000., nn), 'N/m**2')
+        prob.set_val(Dynamic.Mission.MACH, np.linspace(0.2, 0.85, nn))
+        prob.set_val('lift_coefficient', np.linspace(0., 1.2, nn))
+        prob.set_val('CD0', np.linspace(0.02, 0.03, nn))
+        prob.set_val('CDI', np.linspace(0., 0.05, nn))
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val(Aircraft.Design.ZERO_LIFT_DRAG_POLAR)[1, 2],
+                          prob.get_val('CD0')[6])
+        assert_near_equal(prob.get_val(Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR)[1, 2],
+                          prob.get_val('CDI')[25])
+
+        partial_data = prob.check_partials(method='cs', out_stream=None)
+        assert_check_partials(partial_data, atol=1e-9, rtol=1e-12)
+
+
+@use_tempdirs
+class ComputedPolarMissionTest(unittest.TestCase):
+
+    def test_mission(self):
+        local_phase_info = deepcopy(phase_info)
+        local_phase_info['pre_mission']['subsystem_options'] = {
+            'core_aerodynamics': {'method': 'computed_polar'}}
+
+        phase_names = ['climb', 'cruise', 'descent']
+
+        for phase_name in phase_names:
+            local_phase_info[phase_name]['subsystem_options']['core_aerodynamics'] = {
+                'method': 'computed_polar'}
+
+        prob = run_aviary('models/test_aircraft/aircraft_for_bench_FwFm.csv',
+                          local_phase_info, 'FLOPS', 'FLOPS', optimizer='SLSQP',
+                          run_driver=False, make_plots=False)
+
+        self.assertEqual(
+            prob.get_val(Aircraft.Design.ZERO_LIFT_DRAG_POLAR).shape, (7, 33))
+
+        self.assertIn(Aircraft.Design.ZERO_LIFT_DRAG_POLAR,
+                      prob.traj.parameter_options)
+
+        for phase_name in phase_names:
+            drag, direct_drag = polar_drag_error(prob, phase_name)
+            assert_near_equal(drag, direct_drag, 0.01)
+
+        # the report compares both for every phase
+        prob.core_subsystems['aerodynamics'].report(prob, Path('.'))
+
+        with open('core_aerodynamics.md') as f:
+            text = f.read()
+
+        for phase_name in phase_names:
+            self.assertIn(f'| {phase_name} |', text)
+
+    def test_no_polar_parameters(self):
+        # missions that do not use the polar do not get its tables as parameters
+        prob = AviaryProblem(deepcopy(phase_info), 'FLOPS', 'FLOPS')
+        prob.load_inputs('models/test_aircraft/aircraft_for_bench_FwFm.csv')
+        prob.check_inputs()
+        prob.add_pre_mission_systems()
+        prob.add_phases()
+
+        for name in (Aircraft.Design.ZERO_LIFT_DRAG_POLAR,
+                     Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR):
+            self.assertNotIn(name, prob.traj.parameter_options)
+
+    def test_missing_polar(self):
+        aero = CoreAerodynamicsBuilder('core_aerodynamics', code_origin='FLOPS')
+
+        with self.assertRaises(ValueError):
+            aero.build_mission(num_nodes=5, aviary_inputs=None, method='computed_polar')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,11 @@
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_check_partials
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
+from aviary.subsystems.aerodynamics.flops_based import lift_dependent_drag
 from aviary.subsystems.aerodynamics.flops_based.lift_dependent_drag import \
     LiftDependentDrag
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
@@ -83,6 +85,67 @@ class LiftDependentDragTest(unittest.TestCase):
         # TODO: need to test outputs too
         assert_check_partials(derivs, atol=1e-12, rtol=1e-12)
 
+    def test_mixed_regimes(self):
+        # one node uses the supersonic tables, the others use the subsonic tables
+        P = 2.60239151
+        Sref = 1370.0
+
+        CL = np.array([0.3, 0.35, 0.4, 0.45, 0.5, 0.55])
+        mach = np.array([0.4, 0.45, 0.5, 0.55, 0.6, 0.95])
+        lift = 0.5 * CL * Sref * 1.4 * P * mach ** 2
+
+        def run(mach, lift):
+            nn = len(mach)
+
+            prob = om.Problem(model=om.Group())
+            prob.model.add_subsystem('drag', LiftDependentDrag(num_nodes=nn),
+                                     promotes=['*'])
+            prob.setup(force_alloc_complex=True)
+
+            prob.set_val(Dynamic.Mission.MACH, val=mach)
+            prob.set_val(Dynamic.Mission.LIFT, val=lift)
+            prob.set_val(Dynamic.Mission.STATIC_PRESSURE, val=P)
+            prob.set_val(Aircraft.Wing.AREA, val=Sref)
+            prob.set_val(Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN, val=1.0)
+            prob.set_val(Aircraft.Wing.SWEEP, val=25.03)
+            prob.set_val(Aircraft.Wing.ASPECT_RATIO, val=2.0)
+            prob.set_val(Aircraft.Wing.THICKNESS_TO_CHORD, val=0.123)
+            prob.set_val(Mission.Design.LIFT_COEFFICIENT, val=0.4813)
+            prob.set_val(Mission.Design.MACH, val=0.765)
+
+            prob.run_model()
+
+            return prob
+
+        prob = run(mach, lift)
+
+        # interpolating all nodes together matches interpolating each node by itself
+        for i in range(len(mach)):
+            assert_near_equal(prob.get_val('CD')[i],
+                              run(mach[i:i+1], lift[i:i+1]).get_val('CD'), 1e-12)
+
+        derivs = prob.check_partials(out_stream=None, method="cs")
+        assert_check_partials(derivs, atol=1e-12, rtol=1e-12)
+
+    def test_weight_table_cache(self):
+        lift_dependent_drag.clear_weight_table_cache()
+        cache = lift_dependent_drag._weight_table_cache
+        get_weight_tables = lift_dependent_drag._get_weight_tables
+
+        with patch.object(lift_dependent_drag, 'WEIGHT_TABLE_CACHE_SIZE', 2):
+            tables = get_weight_tables((0.5, 1.0, 2.0))
+            self.assertIs(get_weight_tables((0.5, 1.0, 2.0)), tables)
+
+            # least recently used set of A values is forgotten first
+            get_weight_tables((1.0, 2.0, 4.0))
+            get_weight_tables((0.5, 1.0, 2.0))
+            get_weight_tables((2.0, 4.0, 6.0))
+            self.assertEqual(list(cache), [(0.5, 1.0, 2.0), (2.0, 4.0, 6.0)])
+
+        lift_dependent_drag.clear_weight_table_cache()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNot(get_weight_tables((0.5, 1.0, 2.0)), tables)
+
 
 if __name__ == "__main__":
     unittest.main()
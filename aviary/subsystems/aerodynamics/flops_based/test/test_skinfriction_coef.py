@@ -4,7 +4,8 @@ import numpy as np
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
-from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import \
+    PointwiseSkinFriction, SkinFriction
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Aircraft
 
@@ -127,5 +128,54 @@ class SkinFrictionCoeffTest(unittest.TestCase):
         assert_near_equal(np.max(Re_diff), 0.0, 1e-4)
 
 
+class PointwiseSkinFrictionCoeffTest(unittest.TestCase):
+
+    def setup_prob(self, skin_friction_class):
+        n = 12
+        nc = 4
+
+        machs = np.array([.2, .3, .4, .5, .6, .7, .75, .775, .8, .825, .85, .875])
+        lens = np.linspace(1, 100, nc)
+        temp = np.linspace(389.97, 518.67, n)
+        pres = np.linspace(374.74437747, 2116.22, n)
+
+        prob = om.Problem()
+        model = prob.model
+
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = (1, 'unitless')
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = (1, 'unitless')
+        options[Aircraft.Engine.NUM_ENGINES] = ([0], 'unitless')
+
+        model.add_subsystem(
+            'cf', skin_friction_class(num_nodes=n, aviary_options=AviaryValues(options)))
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val('cf.temperature', temp)
+        prob.set_val('cf.static_pressure', pres)
+        prob.set_val('cf.mach', machs)
+        prob.set_val('cf.characteristic_lengths', lens)
+
+        prob.run_model()
+
+        return prob
+
+    def test_derivs(self):
+        prob = self.setup_prob(PointwiseSkinFriction)
+
+        derivs = prob.check_partials(method='cs', out_stream=None)
+
+        # Atol set higher because derivs of Re are on the order 1e8
+        assert_check_partials(derivs, atol=1e-06, rtol=1e-10)
+
+    def test_matches_implicit(self):
+        prob = self.setup_prob(PointwiseSkinFriction)
+        implicit_prob = self.setup_prob(SkinFriction)
+
+        for name in ['cf.skin_friction_coeff', 'cf.Re', 'cf.wall_temp', 'cf.cf_iter']:
+            assert_near_equal(prob.get_val(name), implicit_prob.get_val(name), 1e-12)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.functions import add_aviary_input
@@ -159,8 +160,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 "fus_lift",
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             Dynamic.Mission.MACH,
@@ -187,8 +186,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 "fus_lift",
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "reynolds",
@@ -218,8 +215,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 "fus_lift",
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
 
     def compute(self, inputs, outputs):
@@ -263,3 +258,81 @@ class CLmaxCalculation(om.ExplicitComponent):
 
         VK = mach * sos
         outputs["reynolds"] = reynolds = (avg_chord * VK / kinematic_viscosity) / 100000
+
+    def compute_partials(self, inputs, J):
+
+        VLAM1 = inputs["VLAM1"]
+        VLAM2 = inputs["VLAM2"]
+        VLAM3 = inputs["VLAM3"]
+        VLAM4 = inputs["VLAM4"]
+        VLAM5 = inputs["VLAM5"]
+        VLAM6 = inputs["VLAM6"]
+        VLAM7 = inputs["VLAM7"]
+        VLAM8 = inputs["VLAM8"]
+        VLAM9 = inputs["VLAM9"]
+        VLAM10 = inputs["VLAM10"]
+        VLAM11 = inputs["VLAM11"]
+        VLAM12 = inputs["VLAM12"]
+        VLAM13 = inputs["VLAM13"]
+        VLAM14 = inputs["VLAM14"]
+
+        sos = inputs[Dynamic.Mission.SPEED_OF_SOUND]
+        wing_loading = inputs[Aircraft.Wing.LOADING]
+        P = inputs[Dynamic.Mission.STATIC_PRESSURE]
+        avg_chord = inputs[Aircraft.Wing.AVERAGE_CHORD]
+        kinematic_viscosity = inputs["kinematic_viscosity"]
+        max_lift_reference = inputs[Aircraft.Wing.MAX_LIFT_REF]
+        leading_lift_increment = inputs[Aircraft.Wing.SLAT_LIFT_INCREMENT_OPTIMUM]
+        fus_lift = inputs["fus_lift"]
+        trailing_lift_increment = inputs[Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM]
+
+        reference_term = max_lift_reference * VLAM1 * VLAM2
+        trailing_term = \
+            trailing_lift_increment * VLAM3 * VLAM4 * VLAM5 * VLAM6 * VLAM7 * VLAM8
+        leading_term = leading_lift_increment * VLAM9 * VLAM10 * VLAM11 * VLAM12
+        clean_lift = reference_term + trailing_term + leading_term
+        lift_scale = VLAM13 * VLAM14
+
+        CL_max = clean_lift * lift_scale + fus_lift
+        mach = (wing_loading / CL_max / 0.7 / P) ** 0.5
+        VK = mach * sos
+
+        # each term of the clean lift is a product of its factors, so the partial of
+        # the term with respect to a factor is the term divided by that factor
+        dCL_max = {"fus_lift": 1.0,
+                   "VLAM13": clean_lift * VLAM14,
+                   "VLAM14": clean_lift * VLAM13}
+
+        for term, factors in (
+            (reference_term, (Aircraft.Wing.MAX_LIFT_REF, "VLAM1", "VLAM2")),
+            (trailing_term, (Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM, "VLAM3",
+                             "VLAM4", "VLAM5", "VLAM6", "VLAM7", "VLAM8")),
+            (leading_term, (Aircraft.Wing.SLAT_LIFT_INCREMENT_OPTIMUM, "VLAM9",
+                            "VLAM10", "VLAM11", "VLAM12")),
+        ):
+            for factor in factors:
+                others = [inputs[other] for other in factors if other != factor]
+                dCL_max[factor] = lift_scale * np.prod(others, axis=0)
+
+        dmach_dCL_max = -0.5 * mach / CL_max
+        dreynolds_dmach = avg_chord * sos / kinematic_viscosity / 100000
+
+        for name, deriv in dCL_max.items():
+            J["CL_max", name] = deriv
+            J[Dynamic.Mission.MACH, name] = dmach_dCL_max * deriv
+            J["reynolds", name] = dreynolds_dmach * dmach_dCL_max * deriv
+
+        dmach_dwing_loading = 0.5 * mach / wing_loading
+        dmach_dP = -0.5 * mach / P
+
+        J[Dynamic.Mission.MACH, Aircraft.Wing.LOADING] = dmach_dwing_loading
+        J[Dynamic.Mission.MACH, Dynamic.Mission.STATIC_PRESSURE] = dmach_dP
+
+        J["reynolds", Aircraft.Wing.LOADING] = dreynolds_dmach * dmach_dwing_loading
+        J["reynolds", Dynamic.Mission.STATIC_PRESSURE] = dreynolds_dmach * dmach_dP
+        J["reynolds", Dynamic.Mission.SPEED_OF_SOUND] = \
+            avg_chord * mach / kinematic_viscosity / 100000
+        J["reynolds", Aircraft.Wing.AVERAGE_CHORD] = \
+            VK / kinematic_viscosity / 100000
+        J["reynolds", "kinematic_viscosity"] = \
+            -avg_chord * VK / kinematic_viscosity**2 / 100000
@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.functions import add_aviary_input
@@ -98,8 +99,6 @@ class LiftAndDragIncrements(om.ExplicitComponent):
             [Aircraft.Wing.FLAP_DRAG_INCREMENT_OPTIMUM,
                 "VDEL1", "VDEL2", "VDEL3", "VDEL4", "VDEL5"],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "delta_CL",
@@ -115,8 +114,6 @@ class LiftAndDragIncrements(om.ExplicitComponent):
                 "VLAM14",
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
 
     def compute(self, inputs, outputs):
@@ -151,3 +148,17 @@ class LiftAndDragIncrements(om.ExplicitComponent):
             * VLAM13
             * VLAM14
         )
+
+    def compute_partials(self, inputs, J):
+
+        # both increments are products of their inputs, so the partial with respect
+        # to each factor is the product of the other factors
+        for output, factors in (
+            ("delta_CD", (Aircraft.Wing.FLAP_DRAG_INCREMENT_OPTIMUM,
+                          "VDEL1", "VDEL2", "VDEL3", "VDEL4", "VDEL5")),
+            ("delta_CL", (Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM, "VLAM3", "VLAM4",
+                          "VLAM5", "VLAM6", "VLAM7", "VLAM8", "VLAM13", "VLAM14")),
+        ):
+            for factor in factors:
+                others = [inputs[other] for other in factors if other != factor]
+                J[output, factor] = np.prod(others, axis=0)
@@ -99,9 +99,7 @@ class BasicFlapsCalculations(om.ExplicitComponent):
     def setup_partials(self):
 
         # output partials
-        self.declare_partials(
-            "VLAM8", [Aircraft.Wing.SWEEP], dependent=True, method="cs", step=1e-8
-        )
+        self.declare_partials("VLAM8", [Aircraft.Wing.SWEEP], dependent=True)
         self.declare_partials(
             "VDEL4",
             [
@@ -111,8 +109,6 @@ class BasicFlapsCalculations(om.ExplicitComponent):
                 Aircraft.Wing.TAPER_RATIO,
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "VDEL5",
@@ -123,21 +119,15 @@ class BasicFlapsCalculations(om.ExplicitComponent):
                 Aircraft.Fuselage.AVG_DIAMETER,
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
-        )
-        self.declare_partials(
-            "VLAM9", [Aircraft.Wing.SLAT_CHORD_RATIO], dependent=True, method="cs", step=1e-8
         )
+        self.declare_partials("VLAM9", [Aircraft.Wing.SLAT_CHORD_RATIO], dependent=True)
         self.declare_partials(
             "slat_defl_ratio",
             ["slat_defl", Aircraft.Wing.OPTIMUM_SLAT_DEFLECTION],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
-            "flap_defl_ratio", ["flap_defl", Aircraft.Wing.OPTIMUM_FLAP_DEFLECTION], method="cs"
+            "flap_defl_ratio", ["flap_defl", Aircraft.Wing.OPTIMUM_FLAP_DEFLECTION]
         )
         self.declare_partials(
             Aircraft.Wing.SLAT_SPAN_RATIO,
@@ -148,15 +138,11 @@ class BasicFlapsCalculations(om.ExplicitComponent):
                 Aircraft.Fuselage.AVG_DIAMETER,
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "chord_to_body_ratio",
             [Aircraft.Wing.ROOT_CHORD, Aircraft.Fuselage.LENGTH],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "body_to_span_ratio",
@@ -167,15 +153,11 @@ class BasicFlapsCalculations(om.ExplicitComponent):
                 Aircraft.Fuselage.AVG_DIAMETER,
             ],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "VLAM12",
             [Aircraft.Wing.LEADING_EDGE_SWEEP],
             dependent=True,
-            method="cs",
-            step=1e-8,
         )
 
     def compute(self, inputs, outputs):
@@ -228,3 +210,80 @@ class BasicFlapsCalculations(om.ExplicitComponent):
         outputs[Aircraft.Wing.SLAT_SPAN_RATIO] = slat_span_ratio = 0.99 - DBALE / wingspan
         outputs["chord_to_body_ratio"] = chord_to_body_ratio = root_chord / fus_len
         outputs["VLAM12"] = VLAM12 = (np.cos(SWPL12)) ** 3
+
+    def compute_partials(self, inputs, J):
+
+        sweep_c4 = inputs[Aircraft.Wing.SWEEP]
+        AR = inputs[Aircraft.Wing.ASPECT_RATIO]
+        flap_chord_ratio = inputs[Aircraft.Wing.FLAP_CHORD_RATIO]
+        taper_ratio = inputs[Aircraft.Wing.TAPER_RATIO]
+        center_chord = inputs[Aircraft.Wing.CENTER_CHORD]
+        cabin_width = inputs[Aircraft.Fuselage.AVG_DIAMETER]
+        tc_ratio_root = inputs[Aircraft.Wing.THICKNESS_TO_CHORD_ROOT]
+        wingspan = inputs[Aircraft.Wing.SPAN]
+        slat_defl = inputs["slat_defl"]
+        optimum_slat_defl = inputs[Aircraft.Wing.OPTIMUM_SLAT_DEFLECTION]
+        flap_defl = inputs["flap_defl"]
+        optimum_flap_defl = inputs[Aircraft.Wing.OPTIMUM_FLAP_DEFLECTION]
+        root_chord = inputs[Aircraft.Wing.ROOT_CHORD]
+        fus_len = inputs[Aircraft.Fuselage.LENGTH]
+        sweep_LE = inputs[Aircraft.Wing.LEADING_EDGE_SWEEP]
+
+        RLMC4 = sweep_c4 * 0.017453
+        taper_term = (1.0 - taper_ratio) / (1.0 + taper_ratio)
+        chord_term = (0.75 - flap_chord_ratio) * taper_term
+        TSWPFH = np.tan(RLMC4) - (4.0 / AR) * chord_term
+
+        # VDEL4 = cos(arctan(TSWPFH))
+        dVDEL4_dTSWPFH = -TSWPFH / (1.0 + TSWPFH**2) ** 1.5
+
+        tc_chord = tc_ratio_root * center_chord
+        DBALE_root = (tc_chord * (cabin_width - tc_chord)) ** 0.5
+        DBALE = 2.0 * DBALE_root + 0.4
+        dDBALE_dtc_chord = (cabin_width - 2.0 * tc_chord) / DBALE_root
+        dDBALE_dcabin_width = tc_chord / DBALE_root
+
+        SWPL12 = sweep_LE - 5.0 / 57.296
+
+        J["VLAM8", Aircraft.Wing.SWEEP] = \
+            -3.0 * np.cos(RLMC4) ** 2 * np.sin(RLMC4) * 0.017453
+
+        J["VDEL4", Aircraft.Wing.SWEEP] = \
+            dVDEL4_dTSWPFH * 0.017453 / np.cos(RLMC4) ** 2
+        J["VDEL4", Aircraft.Wing.ASPECT_RATIO] = \
+            dVDEL4_dTSWPFH * 4.0 * chord_term / AR**2
+        J["VDEL4", Aircraft.Wing.FLAP_CHORD_RATIO] = \
+            dVDEL4_dTSWPFH * 4.0 / AR * taper_term
+        J["VDEL4", Aircraft.Wing.TAPER_RATIO] = \
+            dVDEL4_dTSWPFH * 8.0 / AR * (0.75 - flap_chord_ratio) \
+            / (1.0 + taper_ratio) ** 2
+
+        dratio_dspan = -DBALE / wingspan**2
+        dratio_dtc = dDBALE_dtc_chord * center_chord / wingspan
+        dratio_dcenter_chord = dDBALE_dtc_chord * tc_ratio_root / wingspan
+        dratio_dcabin_width = dDBALE_dcabin_width / wingspan
+
+        for name, sign in (
+            ("body_to_span_ratio", 1.0),
+            ("VDEL5", -1.0),
+            (Aircraft.Wing.SLAT_SPAN_RATIO, -1.0),
+        ):
+            J[name, Aircraft.Wing.SPAN] = sign * dratio_dspan
+            J[name, Aircraft.Wing.THICKNESS_TO_CHORD_ROOT] = sign * dratio_dtc
+            J[name, Aircraft.Wing.CENTER_CHORD] = sign * dratio_dcenter_chord
+            J[name, Aircraft.Fuselage.AVG_DIAMETER] = sign * dratio_dcabin_width
+
+        J["VLAM9", Aircraft.Wing.SLAT_CHORD_RATIO] = 6.65
+
+        J["slat_defl_ratio", "slat_defl"] = 1.0 / optimum_slat_defl
+        J["slat_defl_ratio", Aircraft.Wing.OPTIMUM_SLAT_DEFLECTION] = \
+            -slat_defl / optimum_slat_defl**2
+        J["flap_defl_ratio", "flap_defl"] = 1.0 / optimum_flap_defl
+        J["flap_defl_ratio", Aircraft.Wing.OPTIMUM_FLAP_DEFLECTION] = \
+            -flap_defl / optimum_flap_defl**2
+
+        J["chord_to_body_ratio", Aircraft.Wing.ROOT_CHORD] = 1.0 / fus_len
+        J["chord_to_body_ratio", Aircraft.Fuselage.LENGTH] = -root_chord / fus_len**2
+
+        J["VLAM12", Aircraft.Wing.LEADING_EDGE_SWEEP] = \
+            -3.0 * np.cos(SWPL12) ** 2 * np.sin(SWPL12)
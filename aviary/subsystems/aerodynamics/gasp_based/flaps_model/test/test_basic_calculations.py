@@ -22,7 +22,7 @@ class BasicFlapsCalculationsTestCase(unittest.TestCase):
 
         self.prob.model.add_subsystem('BC', BasicFlapsCalculations(), promotes=['*'])
 
-        self.prob.setup()
+        self.prob.setup(force_alloc_complex=True)
 
         # initial conditions
         self.prob.set_val(Aircraft.Wing.SWEEP, 25.0, units="deg")
@@ -82,8 +82,8 @@ class BasicFlapsCalculationsTestCase(unittest.TestCase):
         ans = self.prob["VLAM12"]
         assert_near_equal(ans, reg_data, tol)
 
-        data = self.prob.check_partials(out_stream=None, method="fd")
-        assert_check_partials(data, atol=1e-6, rtol=4e-6)
+        data = self.prob.check_partials(out_stream=None, method="cs")
+        assert_check_partials(data, atol=1e-12, rtol=1e-12)
 
     @skipIfMissingXDSM('flaps_specs/basic.json')
     def test_basic_spec(self):
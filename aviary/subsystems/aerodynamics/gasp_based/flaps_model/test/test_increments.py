@@ -21,7 +21,7 @@ class LiftAndDragIncrementsTestCase(unittest.TestCase):
 
         self.prob.model.add_subsystem('LaDIs', LiftAndDragIncrements(), promotes=['*'])
 
-        self.prob.setup()
+        self.prob.setup(force_alloc_complex=True)
 
         # initial conditions
         self.prob.set_val(Aircraft.Wing.FLAP_DRAG_INCREMENT_OPTIMUM, 0.1)
@@ -54,8 +54,8 @@ class LiftAndDragIncrementsTestCase(unittest.TestCase):
         ans = self.prob["delta_CL"]
         assert_near_equal(ans, reg_data, tol)
 
-        data = self.prob.check_partials(out_stream=None, method="fd")
-        assert_check_partials(data, atol=1e-4, rtol=1e-4)
+        data = self.prob.check_partials(out_stream=None, method="cs")
+        assert_check_partials(data, atol=1e-12, rtol=1e-12)
 
     @skipIfMissingXDSM('flaps_specs/increments.json')
     def test_increment_spec(self):
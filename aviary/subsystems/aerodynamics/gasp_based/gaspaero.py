@@ -145,6 +145,35 @@ def cla(ar, sweep, mach):
     )
 
 
+def cla_partials(ar, sweep, mach):
+    """Partial derivatives of the lift-curve slope from the Seckel equation
+
+    Parameters
+    ----------
+    ar : float
+        Aspect ratio
+    sweep : float
+        Quarter-chord sweep angle, in radians
+    mach : float
+        Mach number.
+
+    Returns
+    -------
+    tuple
+        Partials of the lift-curve slope with respect to aspect ratio, sweep (per
+        radian) and Mach number.
+    """
+    sec2 = 1 / np.cos(sweep) ** 2
+    root = np.sqrt(1 + ar**2 / 4 * (sec2 - mach**2))
+    dcla_droot = -np.pi * ar / (1 + root) ** 2 / (2 * root)
+
+    return (
+        np.pi / (1 + root) + dcla_droot * ar / 2 * (sec2 - mach**2),
+        dcla_droot * ar**2 / 2 * sec2 * np.tan(sweep),
+        -dcla_droot * ar**2 * mach / 2,
+    )
+
+
 def sigmoid(x, x0, alpha=0.1):
     """Sigmoid used to smoothly transition between piecewise functions"""
     if alpha == 0:
@@ -152,6 +181,76 @@ def sigmoid(x, x0, alpha=0.1):
     return 1 / (1 + np.exp(-(x - x0) / alpha))
 
 
+def _chain(*terms):
+    """Combine partials of intermediate values using the chain rule
+
+    Parameters
+    ----------
+    *terms : tuple of (float or ndarray, dict)
+        Partial of a quantity with respect to an intermediate value, paired with the
+        partials of that intermediate value keyed by input name.
+
+    Returns
+    -------
+    dict
+        Partials of the quantity keyed by input name.
+    """
+    partials = {}
+    for scale, deriv in terms:
+        for name, val in deriv.items():
+            partials[name] = partials.get(name, 0.0) + scale * val
+    return partials
+
+
+def _product(*factors):
+    """Product of several factors and its partials from the product rule
+
+    Parameters
+    ----------
+    *factors : tuple of (float or ndarray, dict)
+        Value of each factor paired with its partials keyed by input name.
+
+    Returns
+    -------
+    tuple of (float or ndarray, dict)
+        Value of the product and its partials keyed by input name.
+    """
+    value = 1.0
+    for factor, _ in factors:
+        value = value * factor
+
+    terms = []
+    for i, (_, deriv) in enumerate(factors):
+        others = 1.0
+        for j, (factor, _) in enumerate(factors):
+            if j != i:
+                others = others * factor
+        terms.append((others, deriv))
+
+    return value, _chain(*terms)
+
+
+def _arctan2_partials(y, x, dy, dx):
+    """Partials of arctan2(y, x) keyed by input name"""
+    denom = x**2 + y**2
+    return _chain((x / denom, dy), (-y / denom, dx))
+
+
+def _reynolds_correction(reli, dreli, good_mask, length, length_name):
+    """Reynolds number correction factor for a component and its partials"""
+    fre = np.ones_like(reli)
+    dfre_dlog = np.zeros_like(reli)
+    dfre_dreli = np.zeros_like(reli)
+
+    log_re = np.log10(reli[good_mask] * length) / 7
+    fre[good_mask] = log_re**-2.6
+    # partial with respect to the natural log of the Reynolds number
+    dfre_dlog[good_mask] = -2.6 * log_re**-3.6 / (7 * np.log(10))
+    dfre_dreli[good_mask] = dfre_dlog[good_mask] / reli[good_mask]
+
+    return fre, _chain((dfre_dreli, dreli), (dfre_dlog / length, {length_name: 1.0}))
+
+
 class WingTailRatios(om.ExplicitComponent):
     """Static calculation of ratios between tail and wing parameters"""
 
@@ -204,18 +303,16 @@ class WingTailRatios(om.ExplicitComponent):
                 Aircraft.Wing.SPAN,
                 Aircraft.Wing.TAPER_RATIO,
             ],
-            method="cs",
         )
         self.declare_partials(
-            "bbar", [Aircraft.HorizontalTail.SPAN, Aircraft.Wing.SPAN], method="cs"
+            "bbar", [Aircraft.HorizontalTail.SPAN, Aircraft.Wing.SPAN]
         )
         self.declare_partials(
-            "sbar", [Aircraft.HorizontalTail.AREA, Aircraft.Wing.AREA], method="cs"
+            "sbar", [Aircraft.HorizontalTail.AREA, Aircraft.Wing.AREA]
         )
         self.declare_partials(
             "cbar",
             [Aircraft.HorizontalTail.AVERAGE_CHORD, Aircraft.Wing.AVERAGE_CHORD],
-            method="cs",
         )
 
     def compute(self, inputs, outputs):
@@ -243,6 +340,48 @@ class WingTailRatios(om.ExplicitComponent):
         outputs["sbar"] = htail_area / wing_area
         outputs["cbar"] = htail_chord / avg_chord
 
+    def compute_partials(self, inputs, J):
+        (
+            wing_area,
+            wingspan,
+            avg_chord,
+            taper_ratio,
+            tc_ratio_root,
+            wing_loc,
+            htail_loc,
+            span_htail,
+            span_vtail,
+            htail_area,
+            htail_chord,
+            cabin_width,
+        ) = inputs.values()
+
+        zw_rf = 2 * wing_loc - 1
+        trtw = tc_ratio_root * 2 * wing_area / wingspan / (1 + taper_ratio)
+        hgap = htail_loc * span_vtail - 0.5 * (cabin_width - trtw) * zw_rf
+        dhbar_dhgap = np.sign(hgap) / wingspan
+        dhbar_dtrtw = 0.5 * zw_rf * dhbar_dhgap
+
+        J["hbar", Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION] = \
+            dhbar_dhgap * span_vtail
+        J["hbar", Aircraft.VerticalTail.SPAN] = dhbar_dhgap * htail_loc
+        J["hbar", Aircraft.Fuselage.AVG_DIAMETER] = -0.5 * zw_rf * dhbar_dhgap
+        J["hbar", Aircraft.Wing.MOUNTING_TYPE] = -(cabin_width - trtw) * dhbar_dhgap
+        J["hbar", Aircraft.Wing.THICKNESS_TO_CHORD_ROOT] = \
+            dhbar_dtrtw * 2 * wing_area / wingspan / (1 + taper_ratio)
+        J["hbar", Aircraft.Wing.AREA] = \
+            dhbar_dtrtw * tc_ratio_root * 2 / wingspan / (1 + taper_ratio)
+        J["hbar", Aircraft.Wing.SPAN] = \
+            -dhbar_dtrtw * trtw / wingspan - np.abs(hgap) / wingspan**2
+        J["hbar", Aircraft.Wing.TAPER_RATIO] = -dhbar_dtrtw * trtw / (1 + taper_ratio)
+
+        J["bbar", Aircraft.HorizontalTail.SPAN] = 1 / wingspan
+        J["bbar", Aircraft.Wing.SPAN] = -span_htail / wingspan**2
+        J["sbar", Aircraft.HorizontalTail.AREA] = 1 / wing_area
+        J["sbar", Aircraft.Wing.AREA] = -htail_area / wing_area**2
+        J["cbar", Aircraft.HorizontalTail.AVERAGE_CHORD] = 1 / avg_chord
+        J["cbar", Aircraft.Wing.AVERAGE_CHORD] = -htail_chord / avg_chord**2
+
 
 class Xlifts(om.ExplicitComponent):
     """Compute lift ratio and lift-curve slope for given stability margin"""
@@ -292,10 +431,10 @@ class Xlifts(om.ExplicitComponent):
     def setup_partials(self):
         ar = np.arange(self.options["num_nodes"])
 
-        self.declare_partials("lift_ratio", "*", method="cs")
+        self.declare_partials("lift_ratio", "*")
         self.declare_partials("lift_ratio", Dynamic.Mission.MACH,
-                              rows=ar, cols=ar, method="cs")
-        self.declare_partials("lift_curve_slope", "*", method="cs")
+                              rows=ar, cols=ar)
+        self.declare_partials("lift_curve_slope", "*")
         self.declare_partials(
             "lift_curve_slope",
             [
@@ -309,10 +448,9 @@ class Xlifts(om.ExplicitComponent):
                 "hbar",
                 "bbar",
             ],
-            method="cs",
         )
         self.declare_partials("lift_curve_slope", Dynamic.Mission.MACH,
-                              rows=ar, cols=ar, method="cs")
+                              rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -366,6 +504,136 @@ class Xlifts(om.ExplicitComponent):
         outputs["lift_curve_slope"] = claw
         outputs["lift_ratio"] = lift_ratio
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            static_margin,
+            delta_cg,
+            AR,
+            sweep_c4,
+            htail_loc,
+            htail_sweep,
+            h_tail_moment,
+            sbar,
+            cbar,
+            hbar,
+            bbar,
+        ) = inputs.values()
+
+        delta = (static_margin + delta_cg) * h_tail_moment
+        ddelta = {
+            Aircraft.Design.STATIC_MARGIN: h_tail_moment,
+            Aircraft.Design.CG_DELTA: h_tail_moment,
+            Aircraft.HorizontalTail.MOMENT_RATIO: static_margin + delta_cg,
+        }
+
+        xt = 1 / h_tail_moment
+        dxt = {Aircraft.HorizontalTail.MOMENT_RATIO: -(xt**2)}
+        dabs_xt = _chain((np.sign(xt), dxt))
+
+        dAR = {Aircraft.Wing.ASPECT_RATIO: 1.0}
+        art = AR * bbar**2 / sbar
+        dart = {
+            Aircraft.Wing.ASPECT_RATIO: bbar**2 / sbar,
+            "bbar": 2 * AR * bbar / sbar,
+            "sbar": -art / sbar,
+        }
+        h = hbar * AR
+        dh = {"hbar": AR, Aircraft.Wing.ASPECT_RATIO: hbar}
+
+        # stability contribution from each surface
+        claw0 = cla(AR, deg2rad(sweep_c4), mach)
+        dcla_dar, dcla_dsweep, dcla_dmach = cla_partials(AR, deg2rad(sweep_c4), mach)
+        dclaw0 = {
+            Aircraft.Wing.ASPECT_RATIO: dcla_dar,
+            Aircraft.Wing.SWEEP: deg2rad(dcla_dsweep),
+            Dynamic.Mission.MACH: dcla_dmach,
+        }
+
+        tail_factor = 0.9 + 0.1 * htail_loc
+        clat_cla = cla(art, deg2rad(htail_sweep), mach)
+        clat0 = clat_cla * tail_factor
+        dcla_dar, dcla_dsweep, dcla_dmach = cla_partials(art, deg2rad(htail_sweep), mach)
+        dclat0 = _chain(
+            (tail_factor * dcla_dar, dart),
+            (1.0, {
+                Aircraft.HorizontalTail.SWEEP: tail_factor * deg2rad(dcla_dsweep),
+                Dynamic.Mission.MACH: tail_factor * dcla_dmach,
+                Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION: 0.1 * clat_cla,
+            }),
+        )
+
+        # downwash effects
+        s1 = np.sqrt(xt**2 + h**2)
+        eps1 = 1 / (4 * np.pi * s1)
+        deps1 = _chain((-eps1 / s1**2 * xt, dxt), (-eps1 / s1**2 * h, dh))
+
+        eps2 = 1 / np.pi / AR
+        deps2 = _chain((-eps2 / AR, dAR))
+
+        s3 = np.sqrt(xt**2 + h**2 + AR**2 / 4)
+        eps3 = np.abs(xt) / (np.pi * AR * s3)
+        ds3 = _chain((xt / s3, dxt), (h / s3, dh), (AR / 4 / s3, dAR))
+        deps3 = _chain(
+            (1 / (np.pi * AR * s3), dabs_xt), (-eps3 / AR, dAR), (-eps3 / s3, ds3))
+
+        eps4 = 1 / np.pi / art
+        deps4 = _chain((-eps4 / art, dart))
+
+        s5 = np.sqrt(xt**2 + h**2 + art**2 * cbar**2 / 4)
+        eps5 = np.abs(xt) / (np.pi * art * s5)
+        ds5 = _chain(
+            (xt / s5, dxt),
+            (h / s5, dh),
+            (art * cbar**2 / 4 / s5, dart),
+            (art**2 * cbar / 4 / s5, {"cbar": 1.0}),
+        )
+        deps5 = _chain(
+            (1 / (np.pi * art * s5), dabs_xt), (-eps5 / art, dart), (-eps5 / s5, ds5))
+
+        tail_eps = eps4 - eps5 - cbar * eps1
+        dtail_eps = _chain(
+            (1.0, deps4), (-1.0, deps5), (-cbar, deps1), (-eps1, {"cbar": 1.0}))
+        wing_eps = eps1 + eps2 + eps3
+        dwing_eps = _chain((1.0, deps1), (1.0, deps2), (1.0, deps3))
+
+        num = 1 - clat0 * tail_eps
+        dnum = _chain((-tail_eps, dclat0), (-clat0, dtail_eps))
+        den = 1 - clat0 * claw0 * wing_eps * tail_eps
+        dden = _chain(
+            (-claw0 * wing_eps * tail_eps, dclat0),
+            (-clat0 * wing_eps * tail_eps, dclaw0),
+            (-clat0 * claw0 * tail_eps, dwing_eps),
+            (-clat0 * claw0 * wing_eps, dtail_eps),
+        )
+        claw = claw0 * num / den
+        dclaw = _chain((num / den, dclaw0), (claw0 / den, dnum), (-claw / den, dden))
+
+        clat = clat0 * (1 - claw * wing_eps)
+        dclat = _chain(
+            (1 - claw * wing_eps, dclat0),
+            (-clat0 * wing_eps, dclaw),
+            (-clat0 * claw, dwing_eps),
+        )
+
+        abar = clat / claw
+        dabar = _chain((1 / claw, dclat), (-abar / claw, dclaw))
+
+        # c = 1 / (1 + 1 / abar / sbar)
+        area_lift = abar * sbar
+        dc = _chain((sbar / (1 + area_lift) ** 2, dabar),
+                    (abar / (1 + area_lift) ** 2, {"sbar": 1.0}))
+        c = area_lift / (1 + area_lift)
+
+        # lift_ratio = (c - delta) / (1 + delta - c)
+        dlift_ratio = _chain(
+            (1 / (1 + delta - c) ** 2, dc), (-1 / (1 + delta - c) ** 2, ddelta))
+
+        for name, val in dclaw.items():
+            J["lift_curve_slope", name] = val
+        for name, val in dlift_ratio.items():
+            J["lift_ratio", name] = val
+
 
 class AeroGeom(om.ExplicitComponent):
     """Compute drag parameters from cruise conditions and geometric parameters.
@@ -505,7 +773,6 @@ class AeroGeom(om.ExplicitComponent):
                 Aircraft.Wing.TAPER_RATIO,
                 Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
             ],
-            method="cs",
         )
         self.declare_partials(
             "SA2",
@@ -516,7 +783,6 @@ class AeroGeom(om.ExplicitComponent):
                 Aircraft.Wing.SWEEP,
                 Aircraft.Wing.TAPER_RATIO,
             ],
-            method="cs",
         )
         self.declare_partials(
             "SA3",
@@ -526,23 +792,26 @@ class AeroGeom(om.ExplicitComponent):
                 Aircraft.Wing.TAPER_RATIO,
                 Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
             ],
-            method="cs",
         )
         self.declare_partials(
-            "SA4", [Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED], method="cs"
+            "SA4", [Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED]
         )
         self.declare_partials("cf", [Dynamic.Mission.MACH],
-                              rows=ar, cols=ar, method="cs")
+                              rows=ar, cols=ar)
 
         # diag partials for SA5-SA7
         self.declare_partials(
-            "SA5", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND, "nu"], rows=ar, cols=ar, method="cs"
+            "SA5", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND, "nu"],
+            rows=ar, cols=ar
         )
         self.declare_partials(
-            "SA6", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND, "nu"], rows=ar, cols=ar, method="cs"
+            "SA6", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND, "nu"],
+            rows=ar, cols=ar
         )
         self.declare_partials(
-            "SA7", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND, "nu", "ufac"], rows=ar, cols=ar, method="cs"
+            "SA7",
+            [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND, "nu", "ufac"],
+            rows=ar, cols=ar
         )
 
         # dense partials for SA5-SA7
@@ -574,15 +843,15 @@ class AeroGeom(om.ExplicitComponent):
             Aircraft.Wing.AREA,
             Aircraft.Fuselage.AVG_DIAMETER,
             Aircraft.VerticalTail.AREA,
+            Aircraft.Strut.CHORD,
         ]
-        self.declare_partials("SA5", most_params, method="cs")
+        self.declare_partials("SA5", most_params)
         self.declare_partials(
-            "SA6", [Aircraft.Wing.FORM_FACTOR, Aircraft.Wing.AVERAGE_CHORD], method="cs"
+            "SA6", [Aircraft.Wing.FORM_FACTOR, Aircraft.Wing.AVERAGE_CHORD]
         )
         self.declare_partials(
             "SA7",
             most_params + [Aircraft.Wing.ASPECT_RATIO, Aircraft.Wing.SWEEP],
-            method="cs",
         )
 
     def compute(self, inputs, outputs):
@@ -768,6 +1037,352 @@ class AeroGeom(om.ExplicitComponent):
         outputs["SA7"] = sa7
         outputs["cf"] = cf
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            sos,
+            nu,
+            ufac,
+            ff_wing,
+            ff_fus,
+            ff_nac,
+            ff_vtail,
+            ff_htail,
+            wing_fus_intf,
+            strut_fus_intf,
+            cd0_inc,
+            fe_fus_inc,
+            wing_center_dist,
+            wing_min_pressure_loc,
+            wing_max_thickness_loc,
+            AR,
+            sweep_c4,
+            wing_loc,
+            taper_ratio,
+            strut_wing_area_ratio,
+            tc_ratio_root,
+            tc_ratio_tip,
+            wingspan,
+            avg_chord,
+            htail_chord,
+            vtail_chord,
+            fus_len,
+            nac_len,
+            htail_area,
+            fus_SA,
+            nacelle_area,
+            wing_area,
+            cabin_width,
+            vtail_area,
+            tc_ratio,
+            strut_chord,
+        ) = inputs.values()
+
+        # partials of each intermediate value are kept in dicts keyed by input name,
+        # holding one value per node (or a single value for static quantities)
+        dAR = {Aircraft.Wing.ASPECT_RATIO: 1.0}
+        dwing_area = {Aircraft.Wing.AREA: 1.0}
+        dwingspan = {Aircraft.Wing.SPAN: 1.0}
+        dtaper_ratio = {Aircraft.Wing.TAPER_RATIO: 1.0}
+        dcabin_width = {Aircraft.Fuselage.AVG_DIAMETER: 1.0}
+
+        cf = 0.455 / 7**2.58 / (1 + 0.144 * mach**2) ** 0.65
+        dcf = {Dynamic.Mission.MACH: -0.65 * 0.288 * mach / (1 + 0.144 * mach**2) * cf}
+
+        rad_sweep = deg2rad(sweep_c4)
+        tan_sweep = np.tan(rad_sweep)
+        t = np.abs(tan_sweep)
+        dt = {Aircraft.Wing.SWEEP: deg2rad(np.sign(tan_sweep) / np.cos(rad_sweep) ** 2)}
+        yale05 = (1 - taper_ratio) / (1 + taper_ratio)
+        dyale05 = _chain((-2 / (1 + taper_ratio) ** 2, dtaper_ratio))
+
+        dlmps_y = AR * t - 4 * (wing_min_pressure_loc - 0.25) * yale05
+        ddlmps = _arctan2_partials(
+            dlmps_y, AR,
+            _chain(
+                (t, dAR),
+                (AR, dt),
+                (-4 * (wing_min_pressure_loc - 0.25), dyale05),
+                (-4 * yale05, {Aircraft.Wing.MIN_PRESSURE_LOCATION: 1.0}),
+            ),
+            dAR,
+        )
+        dlmtcx_y = AR * t - 4 * (wing_max_thickness_loc - 0.25) * yale05
+        ddlmtcx = _arctan2_partials(
+            dlmtcx_y, AR,
+            _chain(
+                (t, dAR),
+                (AR, dt),
+                (-4 * (wing_max_thickness_loc - 0.25), dyale05),
+                (-4 * yale05, {Aircraft.Wing.MAX_THICKNESS_LOCATION: 1.0}),
+            ),
+            dAR,
+        )
+        rlmle = np.arctan2(AR * t + yale05, AR)
+        drlmle = _arctan2_partials(
+            AR * t + yale05, AR, _chain((t, dAR), (AR, dt), (1.0, dyale05)), dAR)
+
+        fk_den = yale05 / AR * 4 * taper_ratio**2
+        fk = 1 / (1 + fk_den)
+        dfk = _chain(
+            (-(fk**2) * 4 * taper_ratio**2 / AR, dyale05),
+            (fk**2 * fk_den / AR, dAR),
+            (-(fk**2) * 8 * yale05 * taper_ratio / AR, dtaper_ratio),
+        )
+
+        # static compressibility drag parameters, with the sweep angles in degrees
+        dlmps = rad2deg(np.arctan2(dlmps_y, AR))
+        dlmtcx = rad2deg(np.arctan2(dlmtcx_y, AR))
+        sweep_term = 1 + 0.0033 * (4 * dlmps - 3 * dlmtcx)
+        dsweep_term = _chain((rad2deg(0.0132), ddlmps), (rad2deg(-0.0099), ddlmtcx))
+        tc_term = 1 - 1.4 * tc_ratio - 0.06 * (1 - wing_min_pressure_loc)
+        dtc_term = {
+            Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED: -1.4,
+            Aircraft.Wing.MIN_PRESSURE_LOCATION: 0.06,
+        }
+
+        dsa1 = _chain((tc_term, dsweep_term), (sweep_term, dtc_term))
+        dsa2 = _chain(
+            (-0.33 * (0.65 - wing_min_pressure_loc), dsweep_term),
+            (0.33 * sweep_term, {Aircraft.Wing.MIN_PRESSURE_LOCATION: 1.0}),
+        )
+        sin_le = np.sin(rlmle)
+        tc_factor = tc_ratio ** (5 / 3.0)
+        dsa3 = _chain(
+            (-4 * fk * sin_le**2 * tc_factor, dfk),
+            (-4 * fk**2 * sin_le * np.cos(rlmle) * tc_factor, drlmle),
+            (
+                (1.5 - 2 * fk**2 * sin_le**2) * 5 / 3.0 * tc_ratio ** (2 / 3.0),
+                {Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED: 1.0},
+            ),
+        )
+        dsa4 = {Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED: 0.75}
+
+        # Reynolds number per foot
+        reli_y2 = sos * mach / nu
+        sig = sigmoid(mach, 0.1, alpha=0.005)
+        reli = (1 - sig) * 700000 + sig * reli_y2
+        dreli = {
+            Dynamic.Mission.MACH:
+                sig * (1 - sig) / 0.005 * (reli_y2 - 700000) + sig * sos / nu,
+            Dynamic.Mission.SPEED_OF_SOUND: sig * mach / nu,
+            "nu": -sig * reli_y2 / nu,
+        }
+        good_mask = reli > 1
+
+        ffre, dffre = _reynolds_correction(
+            reli, dreli, good_mask, fus_len, Aircraft.Fuselage.LENGTH)
+        fwre, dfwre = _reynolds_correction(
+            reli, dreli, good_mask, avg_chord, Aircraft.Wing.AVERAGE_CHORD)
+        fnre, dfnre = _reynolds_correction(
+            reli, dreli, good_mask, nac_len, Aircraft.Nacelle.AVG_LENGTH)
+        fvtre, dfvtre = _reynolds_correction(
+            reli, dreli, good_mask, vtail_chord, Aircraft.VerticalTail.AVERAGE_CHORD)
+        fhtre, dfhtre = _reynolds_correction(
+            reli, dreli, good_mask, htail_chord, Aircraft.HorizontalTail.AVERAGE_CHORD)
+        if self.options["include_strut"]:
+            fstrtre, dfstrtre = _reynolds_correction(
+                reli, dreli, good_mask, strut_chord, Aircraft.Strut.CHORD)
+        else:
+            fstrtre, dfstrtre = 1.0, {}
+
+        # fuselage form drag factor
+        fus_ratio = cabin_width / fus_len
+        fffus = 1 + 1.5 * fus_ratio**1.5 + 7 * fus_ratio**3
+        dfffus = {
+            Aircraft.Fuselage.AVG_DIAMETER:
+                (2.25 * fus_ratio**0.5 + 21 * fus_ratio**2) / fus_len,
+            Aircraft.Fuselage.LENGTH:
+                -(2.25 * fus_ratio**0.5 + 21 * fus_ratio**2) * fus_ratio / fus_len,
+        }
+
+        # flat plate equivalent areas
+        fef, dfef = _product(
+            (ff_fus, {Aircraft.Fuselage.FORM_FACTOR: 1.0}),
+            (fus_SA, {Aircraft.Fuselage.WETTED_AREA: 1.0}),
+            (cf, dcf),
+            (ffre, dffre),
+            (fffus, dfffus),
+        )
+        fef = fef + fe_fus_inc
+        dfef[Aircraft.Fuselage.FLAT_PLATE_AREA_INCREMENT] = 1.0
+        few, dfew = _product(
+            (ff_wing, {Aircraft.Wing.FORM_FACTOR: 1.0}),
+            (wing_area, dwing_area),
+            (cf, dcf),
+            (fwre, dfwre),
+        )
+        fen, dfen = _product(
+            (2 * ff_nac, {Aircraft.Nacelle.FORM_FACTOR: 2.0}),
+            (nacelle_area, {Aircraft.Nacelle.SURFACE_AREA: 1.0}),
+            (cf, dcf),
+            (fnre, dfnre),
+        )
+        fevt, dfevt = _product(
+            (ff_vtail, {Aircraft.VerticalTail.FORM_FACTOR: 1.0}),
+            (vtail_area, {Aircraft.VerticalTail.AREA: 1.0}),
+            (cf, dcf),
+            (fvtre, dfvtre),
+        )
+        feht, dfeht = _product(
+            (ff_htail, {Aircraft.HorizontalTail.FORM_FACTOR: 1.0}),
+            (htail_area, {Aircraft.HorizontalTail.AREA: 1.0}),
+            (cf, dcf),
+            (fhtre, dfhtre),
+        )
+        festrt, dfestrt = _product(
+            (strut_fus_intf, {Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR: 1.0}),
+            (strut_wing_area_ratio, {Aircraft.Strut.AREA_RATIO: 1.0}),
+            (wing_area, dwing_area),
+            (cf, dcf),
+            (fstrtre, dfstrtre),
+        )
+
+        # wing-fuselage interference
+        croot = 2 * wing_area / (wingspan * (1 + taper_ratio))
+        dcroot = _chain(
+            (2 / (wingspan * (1 + taper_ratio)), dwing_area),
+            (-croot / wingspan, dwingspan),
+            (-croot / (1 + taper_ratio), dtaper_ratio),
+        )
+        cdw0 = few / wing_area
+        dcdw0 = _chain((1 / wing_area, dfew), (-cdw0 / wing_area, dwing_area))
+        zw_rf = 2 * wing_loc - 1
+        dzw_rf = {Aircraft.Wing.MOUNTING_TYPE: 2.0}
+        x = tc_ratio_root * croot / cabin_width
+        dx = _chain(
+            (croot / cabin_width, {Aircraft.Wing.THICKNESS_TO_CHORD_ROOT: 1.0}),
+            (tc_ratio_root / cabin_width, dcroot),
+            (-x / cabin_width, dcabin_width),
+        )
+
+        widths = []
+        for sign in (1.0, -1.0):
+            z = zw_rf + sign * x
+            if np.abs(z) >= 1:
+                widths.append((0.0, {}))
+            else:
+                root = np.sqrt(1 - z**2)
+                dz = _chain((1.0, dzw_rf), (sign, dx))
+                widths.append((cabin_width * root, _chain(
+                    (root, dcabin_width), (-cabin_width * z / root, dz))))
+        (widthftop, dwidthftop), (widthfbot, dwidthfbot) = widths
+        wbodywf = 0.5 * (widthftop + widthfbot)
+        dwbodywf = _chain((0.5, dwidthftop), (0.5, dwidthfbot))
+
+        tc_diff = tc_ratio_root - tc_ratio_tip
+        tcbodywf = tc_ratio_root - wbodywf / wingspan * tc_diff
+        dtcbodywf = _chain(
+            (1 - wbodywf / wingspan, {Aircraft.Wing.THICKNESS_TO_CHORD_ROOT: 1.0}),
+            (wbodywf / wingspan, {Aircraft.Wing.THICKNESS_TO_CHORD_TIP: 1.0}),
+            (-tc_diff / wingspan, dwbodywf),
+            (wbodywf * tc_diff / wingspan**2, dwingspan),
+        )
+        cbodywf = croot * (1 - wbodywf / wingspan * (1 - taper_ratio))
+        dcbodywf = _chain(
+            (1 - wbodywf / wingspan * (1 - taper_ratio), dcroot),
+            (-croot * (1 - taper_ratio) / wingspan, dwbodywf),
+            (croot * wbodywf * (1 - taper_ratio) / wingspan**2, dwingspan),
+            (croot * wbodywf / wingspan, dtaper_ratio),
+        )
+
+        kvwf = ckv[0] + zw_rf * (ckv[1] + zw_rf * ckv[2])
+        dkvwf = _chain((ckv[1] + 2 * zw_rf * ckv[2], dzw_rf))
+        klwf = ckl[0] + wing_center_dist * (
+            ckl[1]
+            + wing_center_dist
+            * (ckl[2] + wing_center_dist * (ckl[3] + wing_center_dist * ckl[4]))
+        )
+        dklwf = {
+            Aircraft.Wing.CENTER_DISTANCE: ckl[1] + wing_center_dist * (
+                2 * ckl[2]
+                + wing_center_dist
+                * (3 * ckl[3] + wing_center_dist * 4 * ckl[4])
+            )
+        }
+        body_area = tcbodywf * cbodywf
+        kdtwf = ckdt[0] + ckdt[1] * cabin_width / body_area
+        dkdtwf = _chain(
+            (ckdt[1] / body_area, dcabin_width),
+            (-ckdt[1] * cabin_width / body_area**2 * cbodywf, dtcbodywf),
+            (-ckdt[1] * cabin_width / body_area**2 * tcbodywf, dcbodywf),
+        )
+
+        feintwf, dfeintwf = _product(
+            (1.5, {}),
+            (tcbodywf**3, _chain((3 * tcbodywf**2, dtcbodywf))),
+            (cbodywf**2, _chain((2 * cbodywf, dcbodywf))),
+            (kvwf, dkvwf),
+            (klwf, dklwf),
+            (kdtwf, dkdtwf),
+        )
+        areashieldwf, dareashieldwf = _product(
+            (0.5 * (croot + cbodywf), _chain((0.5, dcroot), (0.5, dcbodywf))),
+            (wbodywf, dwbodywf),
+        )
+        feshieldwf, dfeshieldwf = _product((cdw0, dcdw0), (areashieldwf, dareashieldwf))
+        _, dfeiwf = _product(
+            (wing_fus_intf, {Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR: 1.0}),
+            (feintwf - feshieldwf, _chain((1.0, dfeintwf), (-1.0, dfeshieldwf))),
+        )
+
+        # wing-free profile drag coefficient
+        cdpo = (
+            fef + fevt + feht + fen + festrt + wing_fus_intf * (feintwf - feshieldwf)
+            + cd0_inc * wing_area
+        ) / wing_area
+        dsa5 = _chain(
+            (1 / wing_area, dfef),
+            (1 / wing_area, dfevt),
+            (1 / wing_area, dfeht),
+            (1 / wing_area, dfen),
+            (1 / wing_area, dfestrt),
+            (1 / wing_area, dfeiwf),
+            (1.0, {Aircraft.Design.DRAG_COEFFICIENT_INCREMENT: 1.0}),
+            ((cd0_inc - cdpo) / wing_area, dwing_area),
+        )
+
+        dsa6 = _product(
+            (ff_wing, {Aircraft.Wing.FORM_FACTOR: 1.0}), (fwre, dfwre))[1]
+
+        # sa7 = 1 / (pi * see * AR) splits into a span efficiency term and a profile
+        # drag term
+        wfob = cabin_width / wingspan
+        dwfob = _chain((1 / wingspan, dcabin_width), (-wfob / wingspan, dwingspan))
+        siwb = (
+            1
+            - 0.0088 * wfob
+            - 1.7364 * wfob**2
+            - 2.303 * wfob**3
+            + 6.0606 * wfob**4
+        )
+        dsiwb = _chain(
+            (-0.0088 - 3.4728 * wfob - 6.909 * wfob**2 + 24.2424 * wfob**3, dwfob))
+        span_term = 1 / (np.pi * AR * ufac * siwb)
+        cos2 = np.cos(rad_sweep) ** 2
+        dsa7 = _chain(
+            (-span_term / AR, dAR),
+            (-span_term / ufac, {"ufac": 1.0}),
+            (-span_term / siwb, dsiwb),
+            (1.1938 / np.pi / cos2, dcdw0),
+            (1.1938 / np.pi * cdw0 / cos2 * 2 * tan_sweep,
+             {Aircraft.Wing.SWEEP: deg2rad(1.0)}),
+            (1.1938 / np.pi, dsa5),
+        )
+
+        for output, partials in (
+            ("SA1", dsa1),
+            ("SA2", dsa2),
+            ("SA3", dsa3),
+            ("SA4", dsa4),
+            ("SA5", dsa5),
+            ("SA6", dsa6),
+            ("SA7", dsa7),
+            ("cf", dcf),
+        ):
+            for name, val in partials.items():
+                J[output, name] = val
+
 
 class AeroSetup(om.Group):
     """Calculations for setting up aero"""
@@ -913,13 +1528,12 @@ class DragCoef(om.ExplicitComponent):
         self.declare_partials("*", "*", dependent=False)
         ar = np.arange(self.options["num_nodes"])
 
-        self.declare_partials("CD_base", ["*"], method="cs")
+        self.declare_partials("CD_base", ["*"])
         self.declare_partials(
             "CD_base",
             [Dynamic.Mission.ALTITUDE, "CL", "cf", "SA5", "SA6", "SA7"],
             rows=ar,
             cols=ar,
-            method="cs",
         )
         # self.declare_partials(
         #     "CD_base", [Mission.Design.GROSS_MASS, "dCD_flaps_model", "wing_area"], val=0
@@ -930,7 +1544,6 @@ class DragCoef(om.ExplicitComponent):
         self.declare_partials(
             "dCD_gear_full",
             [Mission.Design.GROSS_MASS, Aircraft.Wing.AREA, "flap_defl"],
-            method="cs",
         )
 
     def compute(self, inputs, outputs):
@@ -978,6 +1591,89 @@ class DragCoef(om.ExplicitComponent):
         outputs["dCD_flaps_full"] = dCD_flaps_model
         outputs["dCD_gear_full"] = dcd_gear
 
+    def compute_partials(self, inputs, J):
+        (
+            alt,
+            CL,
+            gross_mass_initial,
+            flap_defl,
+            wing_height,
+            airport_alt,
+            flap_chord_ratio,
+            dCL_flaps_model,
+            dCD_flaps_model,
+            dCL_flaps_coef,
+            CDI_factor,
+            avg_chord,
+            wingspan,
+            wing_area,
+            cf,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+        gross_wt_initial = gross_mass_initial * GRAV_ENGLISH_LBM
+
+        # induced drag
+        dCL = CL - dCL_flaps_coef * dCL_flaps_model
+        cdi = SA7 * dCL**2 / CDI_factor
+
+        # ground effects
+        hac = wing_height + alt - airport_alt
+        flap_sin = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - flap_sin * flap_chord_ratio * avg_chord
+        hspan = heff / wingspan
+        sig = np.exp(-2.48 * hspan**0.768)
+        hypot = np.sqrt(1 + hspan**2)
+        betag = hypot - hspan
+        c1 = betag * CL / (12.5664 * hac)
+
+        dCD_dsig = -cdi / (1.0 - c1)
+        dCD_dc1 = cdi * (1 - sig) / (1.0 - c1) ** 2 - SA6 * cf
+        dCD_dcdi = 1 - (sig - c1) / (1.0 - c1)
+
+        dsig_dhspan = -2.48 * 0.768 * sig * hspan**-0.232
+        dbetag_dhspan = hspan / hypot - 1
+        dCD_dhspan = (
+            dCD_dsig * dsig_dhspan
+            + dCD_dc1 * CL / (12.5664 * hac) * dbetag_dhspan
+        )
+        dCD_dheff = dCD_dhspan / wingspan
+        dCD_dhac = 2 * dCD_dheff - dCD_dc1 * c1 / hac
+        dCD_ddCL = dCD_dcdi * 2 * SA7 * dCL / CDI_factor
+
+        J["CD_base", Dynamic.Mission.ALTITUDE] = dCD_dhac
+        J["CD_base", Aircraft.Wing.HEIGHT] = dCD_dhac
+        J["CD_base", "airport_alt"] = -dCD_dhac
+        J["CD_base", "flap_defl"] = \
+            -dCD_dheff * deg2rad(np.cos(deg2rad(flap_defl))) * flap_chord_ratio \
+            * avg_chord
+        J["CD_base", Aircraft.Wing.FLAP_CHORD_RATIO] = -dCD_dheff * flap_sin * avg_chord
+        J["CD_base", Aircraft.Wing.AVERAGE_CHORD] = \
+            -dCD_dheff * flap_sin * flap_chord_ratio
+        J["CD_base", Aircraft.Wing.SPAN] = -dCD_dhspan * hspan / wingspan
+
+        J["CD_base", "CL"] = dCD_ddCL + dCD_dc1 * betag / (12.5664 * hac)
+        J["CD_base", "dCL_flaps_model"] = -dCD_ddCL * dCL_flaps_coef
+        J["CD_base", "dCL_flaps_coef"] = -dCD_ddCL * dCL_flaps_model
+        J["CD_base", "CDI_factor"] = -dCD_dcdi * cdi / CDI_factor
+
+        J["CD_base", "SA5"] = 1.0
+        J["CD_base", "SA6"] = cf * (1 - c1)
+        J["CD_base", "SA7"] = dCD_dcdi * dCL**2 / CDI_factor
+        J["CD_base", "cf"] = SA6 * (1 - c1)
+
+        # landing gear
+        grfe = 0.0033 * gross_wt_initial**0.785
+        flap_factor = 1 - 0.454545 * flap_defl / 50
+
+        J["dCD_gear_full", Mission.Design.GROSS_MASS] = (
+            0.0033 * 0.785 * gross_wt_initial**-0.215 * GRAV_ENGLISH_LBM
+            / wing_area * flap_factor
+        )
+        J["dCD_gear_full", Aircraft.Wing.AREA] = -grfe / wing_area**2 * flap_factor
+        J["dCD_gear_full", "flap_defl"] = -grfe / wing_area * 0.454545 / 50
+
 
 class DragCoefClean(om.ExplicitComponent):
     """Clean drag coefficient for high-speed flight"""
@@ -1018,10 +1714,9 @@ class DragCoefClean(om.ExplicitComponent):
             [Dynamic.Mission.MACH, "CL", "cf", "SA1", "SA2", "SA5", "SA6", "SA7"],
             rows=ar,
             cols=ar,
-            method="cs",
         )
         self.declare_partials(
-            "CD", [Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT], method="cs"
+            "CD", [Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT]
         )
 
     def compute(self, inputs, outputs):
@@ -1043,6 +1738,27 @@ class DragCoefClean(om.ExplicitComponent):
 
         outputs["CD"] = cd0 + cdi + delcdm
 
+    def compute_partials(self, inputs, J):
+        mach, CL, div_drag_supercrit, cf, SA1, SA2, SA5, SA6, SA7 = inputs.values()
+
+        mach_div = SA1 + SA2 * CL + div_drag_supercrit
+
+        sig = sigmoid(mach, mach_div, alpha=0.005)
+        ddelcdm_dmach = (
+            sig * (1 - sig) / 0.005 * 10 * (mach - mach_div) ** 3
+            + sig * 30 * (mach - mach_div) ** 2
+        )
+
+        J["CD", Dynamic.Mission.MACH] = ddelcdm_dmach
+        J["CD", "CL"] = 2 * SA7 * CL - ddelcdm_dmach * SA2
+        J["CD", "SA1"] = -ddelcdm_dmach
+        J["CD", "SA2"] = -ddelcdm_dmach * CL
+        J["CD", Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT] = -ddelcdm_dmach
+        J["CD", "cf"] = SA6
+        J["CD", "SA5"] = 1.0
+        J["CD", "SA6"] = cf
+        J["CD", "SA7"] = CL**2
+
 
 class LiftCoef(om.ExplicitComponent):
     """GASP lift coefficient calculation for low-speed near-ground flight"""
@@ -1115,20 +1831,20 @@ class LiftCoef(om.ExplicitComponent):
 
         dynvars = ["alpha", Dynamic.Mission.ALTITUDE, "lift_curve_slope", "lift_ratio"]
 
-        self.declare_partials("CL_base", ["*"], method="cs")
-        self.declare_partials("CL_base", dynvars, rows=ar, cols=ar, method="cs")
+        self.declare_partials("CL_base", ["*"])
+        self.declare_partials("CL_base", dynvars, rows=ar, cols=ar)
         self.declare_partials("CL_base", ["CL_max_flaps"], val=0)
 
-        self.declare_partials("dCL_flaps_full", ["dCL_flaps_model"], method="cs")
+        self.declare_partials("dCL_flaps_full", ["dCL_flaps_model"])
         self.declare_partials(
-            "dCL_flaps_full", ["lift_ratio"], rows=ar, cols=ar, method="cs")
+            "dCL_flaps_full", ["lift_ratio"], rows=ar, cols=ar)
 
-        self.declare_partials("alpha_stall", ["*"], method="cs")
-        self.declare_partials("alpha_stall", dynvars, rows=ar, cols=ar, method="cs")
+        self.declare_partials("alpha_stall", ["*"])
+        self.declare_partials("alpha_stall", dynvars, rows=ar, cols=ar)
         # self.declare_partials("alpha_stall", ["lift_ratio"], val=0)
 
-        self.declare_partials("CL_max", ["CL_max_flaps"], method="cs")
-        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar, method="cs")
+        self.declare_partials("CL_max", ["CL_max_flaps"])
+        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -1179,6 +1895,138 @@ class LiftCoef(om.ExplicitComponent):
         )
         outputs["CL_max"] = CL_max_flaps * (1 + lift_ratio)
 
+    def compute_partials(self, inputs, J):
+        (
+            alpha,
+            alt,
+            lift_curve_slope,
+            lift_ratio,
+            alpha0,
+            sweep_c4,
+            AR,
+            wing_height,
+            airport_alt,
+            flap_defl,
+            flap_chord_ratio,
+            taper_ratio,
+            CL_max_flaps,
+            dCL_flaps_model,
+            avg_chord,
+            wingspan,
+        ) = inputs.values()
+
+        # ground effects - factor on lift-curve slope
+        hac = wing_height + alt - airport_alt
+        flap_sin = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - flap_sin * flap_chord_ratio * avg_chord
+        hspan = heff / wingspan
+        sig = np.exp(-2.48 * hspan**0.768)
+        hypot = (1 + hspan**2) ** 0.5
+        betag = hypot - hspan
+
+        tan_sweep = np.tan(deg2rad(sweep_c4))
+        rlmc2_y = AR * tan_sweep - ((1 - taper_ratio) / (1 + taper_ratio))
+        rlmc2 = np.arctan2(rlmc2_y, AR)
+        cos_rlmc2 = np.cos(rlmc2)
+        c3_root = np.sqrt(AR**2 + (2 * cos_rlmc2) ** 2)
+        c3 = 2 * cos_rlmc2 + c3_root
+        slope_ratio = AR * cos_rlmc2 / c3
+
+        c4 = betag / (12.5664 * hac / avg_chord)
+        alpha_rad = deg2rad(alpha - alpha0)
+        cloge = lift_curve_slope * alpha_rad + dCL_flaps_model
+        cloge_net = cloge - lift_curve_slope / (16 * hac / avg_chord)
+        kclge = 1 + sig - sig * slope_ratio - c4 * cloge_net
+
+        # partials of kclge, which are zero where it is clipped
+        clipped = kclge < 1.0
+
+        dk_dhspan = (
+            (1 - slope_ratio) * -2.48 * 0.768 * sig * hspan**-0.232
+            - cloge_net * avg_chord / (12.5664 * hac) * (hspan / hypot - 1)
+        )
+        dk_dheff = dk_dhspan / wingspan
+        dk_dhac = (
+            2 * dk_dheff + cloge_net * c4 / hac
+            - c4 * lift_curve_slope * avg_chord / (16 * hac**2)
+        )
+        dk_dslope_ratio = -sig
+
+        # slope_ratio = AR * cos(rlmc2) / c3
+        dc3_drlmc2 = -2 * np.sin(rlmc2) * (1 + 2 * cos_rlmc2 / c3_root)
+        dslope_ratio_drlmc2 = (
+            -AR * np.sin(rlmc2) / c3 - slope_ratio / c3 * dc3_drlmc2
+        )
+        drlmc2_dy = AR / (AR**2 + rlmc2_y**2)
+        drlmc2_dAR = tan_sweep * drlmc2_dy - rlmc2_y / (AR**2 + rlmc2_y**2)
+        dslope_ratio_dAR = (
+            cos_rlmc2 / c3 - slope_ratio / c3 * AR / c3_root
+            + dslope_ratio_drlmc2 * drlmc2_dAR
+        )
+
+        dk = {
+            "alpha": -c4 * lift_curve_slope * deg2rad(1.0),
+            Dynamic.Mission.ALTITUDE: dk_dhac,
+            "lift_curve_slope":
+                -c4 * (alpha_rad - avg_chord / (16 * hac)),
+            Aircraft.Wing.ZERO_LIFT_ANGLE: c4 * lift_curve_slope * deg2rad(1.0),
+            Aircraft.Wing.SWEEP: dk_dslope_ratio * dslope_ratio_drlmc2 * drlmc2_dy
+            * AR * deg2rad(1.0) / np.cos(deg2rad(sweep_c4)) ** 2,
+            Aircraft.Wing.ASPECT_RATIO: dk_dslope_ratio * dslope_ratio_dAR,
+            Aircraft.Wing.HEIGHT: dk_dhac,
+            "airport_alt": -dk_dhac,
+            "flap_defl": -dk_dheff * deg2rad(np.cos(deg2rad(flap_defl)))
+            * flap_chord_ratio * avg_chord,
+            Aircraft.Wing.FLAP_CHORD_RATIO: -dk_dheff * flap_sin * avg_chord,
+            Aircraft.Wing.TAPER_RATIO: dk_dslope_ratio * dslope_ratio_drlmc2
+            * drlmc2_dy * 2 / (1 + taper_ratio) ** 2,
+            "dCL_flaps_model": -c4,
+            Aircraft.Wing.AVERAGE_CHORD: (
+                -dk_dheff * flap_sin * flap_chord_ratio
+                - cloge_net * betag / (12.5664 * hac)
+                + c4 * lift_curve_slope / (16 * hac)
+            ),
+            Aircraft.Wing.SPAN: -dk_dhspan * hspan / wingspan,
+        }
+
+        kclge = np.clip(kclge, 1.0, None)
+        for name in dk:
+            dk[name] = np.where(clipped, 0.0, dk[name])
+
+        # alpha_stall in degrees, without alpha0
+        stall = rad2deg((CL_max_flaps - dCL_flaps_model) / (kclge * lift_curve_slope))
+        CL_slope = kclge * lift_curve_slope * (1 + lift_ratio)
+
+        dCL_base = _chain(
+            (lift_curve_slope * alpha_rad * (1 + lift_ratio), dk),
+            (1.0, {
+                "alpha": CL_slope * deg2rad(1.0),
+                Aircraft.Wing.ZERO_LIFT_ANGLE: -CL_slope * deg2rad(1.0),
+                "lift_curve_slope": kclge * alpha_rad * (1 + lift_ratio),
+                "lift_ratio": kclge * lift_curve_slope * alpha_rad,
+            }),
+        )
+        dalpha_stall = _chain(
+            (-stall / kclge, dk),
+            (1.0, {
+                Aircraft.Wing.ZERO_LIFT_ANGLE: 1.0,
+                "lift_curve_slope": -stall / lift_curve_slope,
+                "CL_max_flaps": rad2deg(1.0) / (kclge * lift_curve_slope),
+                "dCL_flaps_model": -rad2deg(1.0) / (kclge * lift_curve_slope),
+            }),
+        )
+
+        for name, val in dCL_base.items():
+            J["CL_base", name] = val
+        for name, val in dalpha_stall.items():
+            J["alpha_stall", name] = val
+
+        J["dCL_flaps_full", "dCL_flaps_model"] = 1 + lift_ratio
+        J["dCL_flaps_full", "lift_ratio"] = dCL_flaps_model
+
+        J["CL_max", "CL_max_flaps"] = 1 + lift_ratio
+        J["CL_max", "lift_ratio"] = CL_max_flaps
+
 
 class LiftCoefClean(om.ExplicitComponent):
     """Clean wing lift coefficient for high-speed flight"""
@@ -1227,29 +2075,28 @@ class LiftCoefClean(om.ExplicitComponent):
 
         if self.options["output_alpha"]:
             self.declare_partials(
-                "alpha", ["CL", "lift_ratio", "lift_curve_slope"], rows=ar, cols=ar, method="cs"
+                "alpha", ["CL", "lift_ratio", "lift_curve_slope"], rows=ar, cols=ar
             )
-            self.declare_partials("alpha", [Aircraft.Wing.ZERO_LIFT_ANGLE], method="cs")
+            self.declare_partials("alpha", [Aircraft.Wing.ZERO_LIFT_ANGLE])
         else:
             self.declare_partials(
-                "CL", ["lift_curve_slope", "alpha", "lift_ratio"], rows=ar, cols=ar, method="cs"
+                "CL", ["lift_curve_slope", "alpha", "lift_ratio"], rows=ar, cols=ar
             )
-            self.declare_partials("CL", [Aircraft.Wing.ZERO_LIFT_ANGLE], method="cs")
+            self.declare_partials("CL", [Aircraft.Wing.ZERO_LIFT_ANGLE])
 
         self.declare_partials(
-            "alpha_stall", ["lift_curve_slope"], rows=ar, cols=ar, method="cs")
+            "alpha_stall", ["lift_curve_slope"], rows=ar, cols=ar)
         self.declare_partials(
             "alpha_stall",
             [
                 Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP,
                 Aircraft.Wing.ZERO_LIFT_ANGLE,
             ],
-            method="cs",
         )
 
-        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar, method="cs")
+        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar)
         self.declare_partials(
-            "CL_max", [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP], method="cs"
+            "CL_max", [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP]
         )
 
     def compute(self, inputs, outputs):
@@ -1265,6 +2112,33 @@ class LiftCoefClean(om.ExplicitComponent):
         outputs["alpha_stall"] = rad2deg(CL_max_flaps / lift_curve_slope) + alpha0
         outputs["CL_max"] = CL_max_flaps * (1 + lift_ratio)
 
+    def compute_partials(self, inputs, J):
+        _, lift_curve_slope, lift_ratio, alpha0, CL_max_flaps = inputs.values()
+        if self.options["output_alpha"]:
+            CL = inputs["CL"]
+            clw = CL / (1 + lift_ratio)
+            J["alpha", "CL"] = rad2deg(1.0) / ((1 + lift_ratio) * lift_curve_slope)
+            J["alpha", "lift_ratio"] = \
+                -rad2deg(clw / (1 + lift_ratio) / lift_curve_slope)
+            J["alpha", "lift_curve_slope"] = -rad2deg(clw / lift_curve_slope**2)
+            J["alpha", Aircraft.Wing.ZERO_LIFT_ANGLE] = 1.0
+        else:
+            alpha_rad = deg2rad(inputs["alpha"] - alpha0)
+            J["CL", "lift_curve_slope"] = alpha_rad * (1 + lift_ratio)
+            J["CL", "alpha"] = lift_curve_slope * deg2rad(1.0) * (1 + lift_ratio)
+            J["CL", "lift_ratio"] = lift_curve_slope * alpha_rad
+            J["CL", Aircraft.Wing.ZERO_LIFT_ANGLE] = \
+                -lift_curve_slope * deg2rad(1.0) * (1 + lift_ratio)
+
+        J["alpha_stall", "lift_curve_slope"] = \
+            -rad2deg(CL_max_flaps / lift_curve_slope**2)
+        J["alpha_stall", Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP] = \
+            rad2deg(1.0) / lift_curve_slope
+        J["alpha_stall", Aircraft.Wing.ZERO_LIFT_ANGLE] = 1.0
+
+        J["CL_max", "lift_ratio"] = CL_max_flaps
+        J["CL_max", Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP] = 1 + lift_ratio
+
 
 class CruiseAero(om.Group):
     """Top-level aerodynamics group for cruise (no flaps, no landing gear)"""
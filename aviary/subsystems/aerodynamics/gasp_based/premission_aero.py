@@ -5,9 +5,9 @@ the dynamic aero.
 """
 
 import openmdao.api as om
-from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
 from aviary.subsystems.aerodynamics.gasp_based.flaps_model import FlapsGroup
+from aviary.subsystems.atmosphere.atmosphere import get_atmosphere_comp
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
@@ -30,8 +30,7 @@ class PreMissionAero(om.Group):
 
         self.add_subsystem(
             "atmos",
-            USatm1976Comp(
-                num_nodes=1),
+            get_atmosphere_comp(1, aviary_options),
             promotes_inputs=[
                 ("h",
                  "alt_flaps")],
@@ -1,14 +1,17 @@
+import json
 import os
 
 import numpy as np
 import openmdao.api as om
 
+from collections import OrderedDict
 from pathlib import Path
 
 from aviary.constants import GRAV_ENGLISH_LBM
 from aviary.subsystems.aerodynamics.gasp_based.common import AeroForces, TimeRamp
 from aviary.utils.named_values import NamedValues, get_keys
-from aviary.utils.data_interpolator_builder import build_data_interpolator
+from aviary.utils.data_interpolator_builder import build_data_interpolator, \
+    format_interpolator_data
 from aviary.utils.csv_data_file import read_data_file
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import get_items
@@ -30,6 +33,27 @@ aliases = {Dynamic.Mission.ALTITUDE: ['h', 'alt', 'altitude'],
            'delta_drag_coefficient': ['delta_cd', 'dcd']
            }
 
+# version of the binary grid files written by write_aero_grid(), changed whenever their
+# content changes
+AERO_GRID_VERSION = 1
+AERO_GRID_SUFFIX = '.grid'
+_AERO_GRID_MAGIC = b'AVGRID'
+
+# maximum number of grid files remembered by read_aero_grid()
+AERO_GRID_CACHE_SIZE = 64
+
+_aero_grid_cache = OrderedDict()
+
+# dependent variables of each kind of table, as interpolated
+_aero_table_outputs = {
+    'free': {'lift_coefficient': 'unitless', 'drag_coefficient': 'unitless'},
+    'flaps': {'delta_lift_coefficient': 'unitless',
+              'delta_drag_coefficient': 'unitless',
+              'delta_lift_coefficient_max': 'unitless'},
+    'ground': {'delta_lift_coefficient': 'unitless',
+               'delta_drag_coefficient': 'unitless',
+               'delta_lift_coefficient_max': 'unitless'}}
+
 
 class CruiseAero(om.Group):
     """Free-air lift and drag using a table lookup."""
@@ -383,32 +407,7 @@ class GearDragIncrement(om.ExplicitComponent):
 def _build_free_aero_interp(num_nodes=0, aero_data=None, training_data=False,
                             method='lagrange2', structured=True, extrapolate=True):
     """creates interpolation components for cruise aero"""
-    # build_data_interpolator normally handles converting to filepath and reading
-    # data, but here we need to query the data before building the component
-    if isinstance(aero_data, str):
-        aero_data = get_path(aero_data)
-    if isinstance(aero_data, Path):
-        aero_data = read_data_file(aero_data, aliases=aliases)
-
-    # aero_data is modified in-place, deepcopy required
-    interp_data = aero_data.deepcopy()
-
-    interp_data = _structure_special_grid(interp_data)
-
-    required_inputs = {Dynamic.Mission.ALTITUDE, Dynamic.Mission.MACH,
-                       'angle_of_attack'}
-    required_outputs = {'lift_coefficient', 'drag_coefficient'}
-
-    missing_variables = []
-    if not required_inputs <= get_keys(interp_data):
-        missing_variables.append([key for key in
-                                  required_inputs.difference(get_keys(interp_data))])
-    if not training_data and not required_outputs <= get_keys(interp_data):
-        missing_variables.append([key for key in
-                                  required_outputs.difference(get_keys(interp_data))])
-    if missing_variables:
-        raise KeyError('GASP-based aerodynamics interpolation missing required '
-                       f'variables: {missing_variables}')
+    interp_data = _get_free_aero_data(aero_data, training_data)
 
     if training_data:
         method = 'lagrange2'
@@ -418,8 +417,7 @@ def _build_free_aero_interp(num_nodes=0, aero_data=None, training_data=False,
     # add the 3d metamodel to the group, promoting all variables
     interp_comp = build_data_interpolator(num_nodes=num_nodes,
                                           interpolator_data=interp_data,
-                                          interpolator_outputs={'lift_coefficient': 'unitless',
-                                                                'drag_coefficient': 'unitless'},
+                                          interpolator_outputs=_aero_table_outputs['free'],
                                           method=method,
                                           structured=structured,
                                           training_data=training_data,
@@ -454,18 +452,63 @@ def _build_flaps_aero_interp(num_nodes=0, aero_data=None, training_data=False,
     """creates interpolation components for cruise aero"""
     # TODO linear method default because standard GASP tables have only two flap
     #      deflections - may want to have option for two separate 2D tables instead?
+    interp_data = _get_flaps_aero_data(aero_data, training_data)
 
-    # build_data_interpolator normally handles converting to filepath and reading
-    # data, but here we need to query the data before building the component
-    if isinstance(aero_data, str):
-        aero_data = get_path(aero_data)
-    if isinstance(aero_data, Path):
-        aero_data = read_data_file(aero_data, aliases=aliases)
+    return build_data_interpolator(num_nodes=num_nodes,
+                                   interpolator_data=interp_data,
+                                   interpolator_outputs=_aero_table_outputs['flaps'],
+                                   method=method,
+                                   structured=structured,
+                                   training_data=training_data,
+                                   extrapolate=extrapolate)
+
+
+def _build_ground_aero_interp(num_nodes=0, aero_data=None, training_data=False,
+                              method='slinear', structured=True, extrapolate=True):
+    """creates interpolation components for cruise aero"""
+    interp_data = _get_ground_aero_data(aero_data, training_data)
+
+    # extrapolation fine especially for HOB over max
+    return build_data_interpolator(num_nodes=num_nodes,
+                                   interpolator_data=interp_data,
+                                   interpolator_outputs=_aero_table_outputs['ground'],
+                                   method=method,
+                                   structured=structured,
+                                   training_data=training_data,
+                                   extrapolate=extrapolate)
+
+
+def _get_free_aero_data(aero_data, training_data=False):
+    """returns a copy of the free-air aero data, ready for interpolation"""
+    interp_data, is_grid = _read_aero_data(aero_data, 'free')
+
+    if not is_grid:
+        interp_data = _structure_special_grid(interp_data)
+
+    required_inputs = {Dynamic.Mission.ALTITUDE, Dynamic.Mission.MACH,
+                       'angle_of_attack'}
+    required_outputs = {'lift_coefficient', 'drag_coefficient'}
+
+    missing_variables = []
+    if not required_inputs <= get_keys(interp_data):
+        missing_variables.append([key for key in
+                                  required_inputs.difference(get_keys(interp_data))])
+    if not training_data and not required_outputs <= get_keys(interp_data):
+        missing_variables.append([key for key in
+                                  required_outputs.difference(get_keys(interp_data))])
+    if missing_variables:
+        raise KeyError('GASP-based aerodynamics interpolation missing required '
+                       f'variables: {missing_variables}')
+
+    return interp_data
 
-    # aero_data is modified in-place, deepcopy required
-    interp_data = aero_data.deepcopy()
 
-    interp_data = _structure_special_grid(interp_data)
+def _get_flaps_aero_data(aero_data, training_data=False):
+    """returns a copy of the flaps aero data, ready for interpolation"""
+    interp_data, is_grid = _read_aero_data(aero_data, 'flaps')
+
+    if not is_grid:
+        interp_data = _structure_special_grid(interp_data)
 
     required_inputs = {'flap_deflection', Dynamic.Mission.MACH, 'angle_of_attack'}
     required_outputs = {'delta_lift_coefficient', 'delta_drag_coefficient'}
@@ -481,6 +524,10 @@ def _build_flaps_aero_interp(num_nodes=0, aero_data=None, training_data=False,
         raise KeyError('GASP-based aerodynamics interpolation missing required '
                        f'variables: {missing_variables}')
 
+    # grids already hold the maximum lift increment
+    if is_grid:
+        return interp_data
+
     dcl = interp_data.get_val('delta_lift_coefficient', 'unitless')
     defl = np.unique(interp_data.get_val('flap_deflection', 'deg')
                      )  # units don't matter, not using values
@@ -497,29 +544,12 @@ def _build_flaps_aero_interp(num_nodes=0, aero_data=None, training_data=False,
 
     interp_data.set_val('delta_lift_coefficient_max', dcl_max.flatten(), 'unitless')
 
-    return build_data_interpolator(num_nodes=num_nodes,
-                                   interpolator_data=interp_data,
-                                   interpolator_outputs={'delta_lift_coefficient': 'unitless',
-                                                         'delta_drag_coefficient': 'unitless',
-                                                         'delta_lift_coefficient_max': 'unitless'},
-                                   method=method,
-                                   structured=structured,
-                                   training_data=training_data,
-                                   extrapolate=extrapolate)
+    return interp_data
 
 
-def _build_ground_aero_interp(num_nodes=0, aero_data=None, training_data=False,
-                              method='slinear', structured=True, extrapolate=True):
-    """creates interpolation components for cruise aero"""
-    # build_data_interpolator normally handles converting to filepath and reading
-    # data, but here we need to query the data before building the component
-    if isinstance(aero_data, str):
-        aero_data = get_path(aero_data)
-    if isinstance(aero_data, Path):
-        aero_data = read_data_file(aero_data, aliases=aliases)
-
-    # aero_data is modified in-place, deepcopy required
-    interp_data = aero_data.deepcopy()
+def _get_ground_aero_data(aero_data, training_data=False):
+    """returns a copy of the ground effect aero data, ready for interpolation"""
+    interp_data, is_grid = _read_aero_data(aero_data, 'ground')
 
     required_inputs = {'hob', Dynamic.Mission.MACH, 'angle_of_attack'}
     required_outputs = {'delta_lift_coefficient', 'delta_drag_coefficient'}
@@ -535,6 +565,10 @@ def _build_ground_aero_interp(num_nodes=0, aero_data=None, training_data=False,
         raise KeyError('GASP-based aerodynamics interpolation missing required '
                        f'variables: {missing_variables}')
 
+    # grids already hold the maximum lift increment
+    if is_grid:
+        return interp_data
+
     dcl = interp_data.get_val('delta_lift_coefficient', 'unitless')
     alpha = np.unique(interp_data.get_val('angle_of_attack', 'deg')
                       )  # units don't matter, not using values
@@ -550,16 +584,174 @@ def _build_ground_aero_interp(num_nodes=0, aero_data=None, training_data=False,
 
     interp_data.set_val('delta_lift_coefficient_max', dcl_max.flatten(), 'unitless')
 
-    # extrapolation fine especially for HOB over max
-    return build_data_interpolator(num_nodes=num_nodes,
-                                   interpolator_data=interp_data,
-                                   interpolator_outputs={'delta_lift_coefficient': 'unitless',
-                                                         'delta_drag_coefficient': 'unitless',
-                                                         'delta_lift_coefficient_max': 'unitless'},
-                                   method=method,
-                                   structured=structured,
-                                   training_data=training_data,
-                                   extrapolate=extrapolate)
+    return interp_data
+
+
+def _read_aero_data(aero_data, table_type):
+    """
+    Return a copy of aero data given as a file or NamedValues, and whether it is
+    already a structured grid
+    """
+    # build_data_interpolator normally handles converting to filepath and reading
+    # data, but here we need to query the data before building the component
+    if isinstance(aero_data, str):
+        aero_data = get_path(aero_data)
+    if isinstance(aero_data, Path):
+        if aero_data.suffix == AERO_GRID_SUFFIX:
+            return read_aero_grid(aero_data, table_type), True
+
+        aero_data = read_data_file(aero_data, aliases=aliases)
+
+    # aero_data is modified in-place, deepcopy required
+    interp_data = aero_data.deepcopy()
+
+    # outputs of structured grids are arrays with one dimension per input
+    is_grid = any(np.ndim(val) > 1 for (key, (val, units)) in get_items(interp_data))
+
+    return interp_data, is_grid
+
+
+def structure_aero_table(aero_data, table_type):
+    """
+    Restructure a GASP-based aero table into the structured grid used for interpolation.
+
+    Parameters
+    ----------
+    aero_data : str, Path, or NamedValues
+        Aviary data file or NamedValues object containing the aero table.
+    table_type : str
+        Kind of table: 'free' (free-air lift and drag), 'flaps' (increments due to
+        flaps), or 'ground' (increments due to ground effects).
+
+    Returns
+    -------
+    NamedValues
+        Independent variables as vectors of unique values, followed by dependent
+        variables as arrays with one dimension per independent variable.
+    """
+    if table_type not in _aero_table_outputs:
+        raise ValueError(f'Unknown aero table type <{table_type}>, must be one of '
+                         f'{list(_aero_table_outputs)}.')
+
+    if table_type == 'free':
+        interp_data = _get_free_aero_data(aero_data)
+    elif table_type == 'flaps':
+        interp_data = _get_flaps_aero_data(aero_data)
+    else:
+        interp_data = _get_ground_aero_data(aero_data)
+
+    format_interpolator_data(interp_data, _aero_table_outputs[table_type],
+                             structured=True)
+
+    return interp_data
+
+
+def write_aero_grid(filename, aero_data, table_type):
+    """
+    Restructure a GASP-based aero table and save it as a binary structured grid, that
+    CruiseAero and LowSpeedAero load without restructuring it again.
+
+    The file holds a short header describing the grid, followed by the values of all
+    variables as a single block of little-endian doubles.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Path of the grid file to be written, normally with the '.grid' suffix.
+    aero_data : str, Path, or NamedValues
+        Aviary data file or NamedValues object containing the aero table.
+    table_type : str
+        Kind of table: 'free', 'flaps', or 'ground'.
+    """
+    grid = structure_aero_table(aero_data, table_type)
+
+    names = list(get_keys(grid))
+    values = [np.asarray(val, dtype='<f8') for (key, (val, units)) in get_items(grid)]
+
+    header = json.dumps({
+        'version': AERO_GRID_VERSION,
+        'table_type': table_type,
+        'names': names,
+        'units': [units for (key, (val, units)) in get_items(grid)],
+        # independent variables are the vectors that come first
+        'shape': values[-1].shape}).encode()
+
+    with open(filename, 'wb') as file:
+        file.write(_AERO_GRID_MAGIC)
+        file.write(len(header).to_bytes(4, 'little'))
+        file.write(header)
+        for val in values:
+            file.write(val.tobytes())
+
+
+def read_aero_grid(filename, table_type=None):
+    """
+    Load a structured grid written by write_aero_grid.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Path of the grid file.
+    table_type : str, optional
+        Kind of table expected in the file. If given, a grid of another kind raises a
+        ValueError.
+
+    Returns
+    -------
+    NamedValues
+        The structured grid.
+
+    Notes
+    -----
+    Like read_data_file(), the contents of each file are remembered for the rest of the
+    session as read-only arrays. Every call returns a new NamedValues with its own
+    copies, which the caller is free to modify in place.
+    """
+    filepath = Path(get_path(filename))
+    file_stat = filepath.stat()
+    cache_key = (str(filepath.resolve()), file_stat.st_mtime_ns, file_stat.st_size)
+
+    if cache_key in _aero_grid_cache:
+        _aero_grid_cache.move_to_end(cache_key)
+        grid_type, grid = _aero_grid_cache[cache_key]
+
+    else:
+        contents = filepath.read_bytes()
+        start = len(_AERO_GRID_MAGIC) + 4
+
+        if not contents.startswith(_AERO_GRID_MAGIC):
+            raise ValueError(f'<{filepath.name}> is not an aero grid file.')
+
+        header_size = int.from_bytes(contents[len(_AERO_GRID_MAGIC):start], 'little')
+        header = json.loads(contents[start:start + header_size])
+
+        if header['version'] != AERO_GRID_VERSION:
+            raise ValueError(f'Aero grid file <{filepath.name}> was written by another '
+                             'version of Aviary, it must be converted again.')
+
+        grid_type = header['table_type']
+        shape = tuple(header['shape'])
+
+        # read-only views into the contents of the file
+        values = np.frombuffer(contents, dtype='<f8', offset=start + header_size)
+
+        grid = NamedValues()
+        offset = 0
+        for idx, (key, units) in enumerate(zip(header['names'], header['units'])):
+            var_shape = (shape[idx],) if idx < len(shape) else shape
+            size = int(np.prod(var_shape))
+            grid.set_val(key, values[offset:offset + size].reshape(var_shape), units)
+            offset += size
+
+        _aero_grid_cache[cache_key] = (grid_type, grid)
+        if len(_aero_grid_cache) > AERO_GRID_CACHE_SIZE:
+            _aero_grid_cache.popitem(last=False)
+
+    if table_type is not None and grid_type != table_type:
+        raise ValueError(f'Aero grid file <{filepath.name}> contains a <{grid_type}> '
+                         f'table, but a <{table_type}> table is required.')
+
+    return grid.deepcopy()
 
 
 def _structure_special_grid(aero_data):
@@ -4,9 +4,10 @@ import unittest
 
 import openmdao.api as om
 import pandas as pd
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
-from aviary.subsystems.aerodynamics.gasp_based.gaspaero import CruiseAero, LowSpeedAero
+from aviary.subsystems.aerodynamics.gasp_based.gaspaero import (AeroGeom, CruiseAero,
+                                                                LowSpeedAero)
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
 here = os.path.abspath(os.path.dirname(__file__))
@@ -140,6 +141,117 @@ class GASPAeroTest(unittest.TestCase):
         assert_near_equal(prob["alpha_in.drag"], prob["alpha_out.drag"], tolerance=1e-6)
 
 
+class GASPAeroPartialsTest(unittest.TestCase):
+    """Check analytic partials of the aero components against complex step"""
+
+    def test_cruise(self):
+        for output_alpha in (False, True):
+            with self.subTest(output_alpha=output_alpha):
+                prob = om.Problem()
+                prob.model.add_subsystem(
+                    "aero",
+                    CruiseAero(num_nodes=3, input_atmos=True, output_alpha=output_alpha),
+                    promotes=["*"],
+                )
+                prob.setup(check=False, force_alloc_complex=True)
+
+                _init_geom(prob)
+
+                prob.set_val(
+                    Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP, setup_data["clmwfu"])
+                prob.set_val(
+                    Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT, setup_data["scfac"]
+                )
+                prob.set_val(Dynamic.Mission.MACH, [0.5, 0.78, 0.8])
+                prob.set_val(Dynamic.Mission.SPEED_OF_SOUND, [1116.4, 1036.4, 968.1])
+                prob.set_val("nu", [1.57e-4, 2.87e-4, 4.82e-4])
+                if output_alpha:
+                    prob.set_val("lift_req", [1.2e5, 1.4e5, 1.5e5], units="lbf")
+                else:
+                    prob.set_val("alpha", [1.0, 2.0, 3.0])
+
+                prob.run_model()
+
+                partial_data = prob.check_partials(
+                    method="cs", out_stream=None, excludes=["*forces"])
+                assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+    def test_ground(self):
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            "aero", LowSpeedAero(num_nodes=3, input_atmos=True), promotes=["*"]
+        )
+        prob.setup(check=False, force_alloc_complex=True)
+
+        _init_geom(prob)
+
+        prob.set_val(Aircraft.Wing.HEIGHT, 8.0)
+        prob.set_val("airport_alt", 0.0)
+        prob.set_val(Aircraft.Wing.FLAP_CHORD_RATIO, setup_data["cfoc"])
+        prob.set_val(Mission.Design.GROSS_MASS, setup_data["wgto"])
+        prob.set_val("flap_defl", setup_data["delfto"])
+        prob.set_val("CL_max_flaps", setup_data["clmwto"])
+        prob.set_val("dCL_flaps_model", setup_data["dclto"])
+        prob.set_val("dCD_flaps_model", setup_data["dcdto"])
+
+        # the last node is high enough for the ground effect factor to be clipped
+        prob.set_val(Dynamic.Mission.MACH, [0.15, 0.2, 0.25])
+        prob.set_val(Dynamic.Mission.ALTITUDE, [0.0, 20.0, 500.0])
+        prob.set_val("alpha", [2.0, 5.0, 8.0])
+        prob.set_val(Dynamic.Mission.SPEED_OF_SOUND, [1116.4, 1116.3, 1114.6])
+        prob.set_val("nu", [1.57e-4, 1.57e-4, 1.59e-4])
+
+        prob.run_model()
+
+        partial_data = prob.check_partials(
+            method="cs", out_stream=None, excludes=["*forces", "*aero_ramps"])
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+    def test_strut(self):
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            "geom", AeroGeom(num_nodes=2, include_strut=True), promotes=["*"])
+        prob.setup(check=False, force_alloc_complex=True)
+
+        for name, key in (
+            (Aircraft.Wing.AREA, "sw"),
+            (Aircraft.Wing.SPAN, "b"),
+            (Aircraft.Wing.AVERAGE_CHORD, "cbarw"),
+            (Aircraft.Wing.TAPER_RATIO, "slm"),
+            (Aircraft.Wing.THICKNESS_TO_CHORD_ROOT, "tcr"),
+            (Aircraft.Wing.THICKNESS_TO_CHORD_TIP, "tct"),
+            (Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED, "tc"),
+            (Aircraft.Wing.MOUNTING_TYPE, "hwing"),
+            (Aircraft.Wing.ASPECT_RATIO, "ar"),
+            (Aircraft.Wing.SWEEP, "dlmc4"),
+            (Aircraft.Wing.CENTER_DISTANCE, "xwqlf"),
+            (Aircraft.Wing.MIN_PRESSURE_LOCATION, "xcps"),
+            (Aircraft.HorizontalTail.AREA, "sht"),
+            (Aircraft.HorizontalTail.AVERAGE_CHORD, "cbarht"),
+            (Aircraft.VerticalTail.AREA, "svt"),
+            (Aircraft.VerticalTail.AVERAGE_CHORD, "cbarvt"),
+            (Aircraft.Fuselage.AVG_DIAMETER, "swf"),
+            (Aircraft.Fuselage.LENGTH, "elf"),
+            (Aircraft.Fuselage.WETTED_AREA, "sf"),
+            (Aircraft.Nacelle.AVG_LENGTH, "eln"),
+        ):
+            prob.set_val(name, setup_data[key])
+
+        prob.set_val(Aircraft.Nacelle.SURFACE_AREA, setup_data["sn"] / setup_data["enp"])
+        prob.set_val(Aircraft.Strut.CHORD, 2.0)
+        prob.set_val(Aircraft.Strut.AREA_RATIO, 0.1)
+        prob.set_val(Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR, 1.1)
+        prob.set_val(Dynamic.Mission.MACH, [0.3, 0.8])
+        prob.set_val(Dynamic.Mission.SPEED_OF_SOUND, [1116.4, 968.1])
+        prob.set_val("nu", [1.57e-4, 4.82e-4])
+        prob.set_val("ufac", [0.98, 1.02])
+
+        prob.run_model()
+
+        partial_data = prob.check_partials(method="cs", out_stream=None)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+
 def _init_geom(prob):
     """Initialize user inputs and geometry/sizing data"""
     # i.e. common auto IVC vars for the setup + cruise and ground aero models
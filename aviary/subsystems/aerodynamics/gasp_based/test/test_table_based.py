@@ -6,10 +6,11 @@ import openmdao
 import openmdao.api as om
 import pkg_resources
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 from packaging import version
 
 from aviary.subsystems.aerodynamics.gasp_based.table_based import (
-    CruiseAero, LowSpeedAero)
+    CruiseAero, LowSpeedAero, read_aero_grid, write_aero_grid)
 from aviary.utils.test_utils.IO_test_util import assert_match_spec, skipIfMissingXDSM
 from aviary.variable_info.variables import Aircraft, Dynamic
 
@@ -185,5 +186,66 @@ class TestLowSpeedAero(unittest.TestCase):
         # size you can see that the derivatives are right wrt these values
 
 
+@use_tempdirs
+class TestAeroGrid(unittest.TestCase):
+
+    def setUp(self):
+        self.text_data = {}
+        self.grid_data = {}
+
+        for table_type in ('free', 'flaps', 'ground'):
+            text_file = pkg_resources.resource_filename(
+                "aviary", "subsystems/aerodynamics/gasp_based/data/"
+                f"large_single_aisle_1_aero_{table_type}.txt")
+            grid_file = f'{table_type}.grid'
+
+            write_aero_grid(grid_file, text_file, table_type)
+
+            self.text_data[f'{table_type}_aero_data'] = text_file
+            self.grid_data[f'{table_type}_aero_data'] = grid_file
+
+    def run_low_speed_aero(self, aero_data):
+        prob = om.Problem()
+        prob.model = LowSpeedAero(num_nodes=4, extrapolate=True, **aero_data)
+        prob.setup()
+
+        prob.set_val("t_curr", [37.0, 40.0, 47.0, 50.0])
+        prob.set_val(Dynamic.Mission.ALTITUDE, [44.2, 109.7, 373.0, 507.8])
+        prob.set_val(Dynamic.Mission.MACH, [0.257, 0.265, 0.276, 0.280])
+        prob.set_val("alpha", [8.94, 8.24, 6.45, 7.59])
+        prob.set_val("flap_defl", 10)
+        prob.set_val("t_init_gear", 37.3)
+        prob.set_val("t_init_flaps", 47.6)
+        prob.run_model()
+
+        return prob
+
+    def test_grid(self):
+        grid = read_aero_grid('free.grid', 'free')
+
+        self.assertEqual(grid.get_val('lift_coefficient').shape, (15, 10, 12))
+        assert_near_equal(grid.get_val(Dynamic.Mission.MACH)[[0, -1]], [0.0, 0.9])
+
+        # each read returns arrays of its own
+        grid.get_val('lift_coefficient')[0, 0, 0] = -1.
+        self.assertNotEqual(
+            read_aero_grid('free.grid').get_val('lift_coefficient')[0, 0, 0], -1.)
+
+        # grids give the same results as the tables they were converted from
+        prob = self.run_low_speed_aero(self.text_data)
+        grid_prob = self.run_low_speed_aero(self.grid_data)
+
+        for name in ("CL", "CD", "CL_max"):
+            assert_near_equal(grid_prob[name], prob[name], 1e-15)
+
+    def test_table_type(self):
+        with self.assertRaises(ValueError) as cm:
+            CruiseAero(num_nodes=2, aero_data='flaps.grid').setup()
+
+        self.assertEqual(
+            str(cm.exception), 'Aero grid file <flaps.grid> contains a <flaps> table, '
+            'but a <free> table is required.')
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,279 @@
+"""
+Atmosphere models used by the mission ODEs.
+
+Classes
+-------
+StandardAtmosphere : 1976 U.S. Standard Atmosphere computed with closed-form layer
+    formulas.
+
+Functions
+---------
+get_atmosphere_comp : return the atmosphere component selected in the aviary options.
+
+standard_atmosphere : temperature, pressure and density of the 1976 U.S. Standard
+    Atmosphere at the given altitudes.
+"""
+import numpy as np
+import openmdao.api as om
+from dymos.models.atmosphere import USatm1976Comp
+from openmdao.utils.units import convert_units
+
+from aviary.utils.aviary_values import AviaryValues
+from aviary.variable_info.enums import AtmosphereModel
+from aviary.variable_info.variable_meta_data import _MetaData
+from aviary.variable_info.variables import Mission
+
+# geopotential altitude (m) at the base of each layer, and its temperature lapse rate
+# (K/m), up to the mesopause
+_LAYER_BASE_ALTITUDES = np.array([0., 11000., 20000., 32000., 47000., 51000., 71000.])
+_LAYER_LAPSE_RATES = np.array([-0.0065, 0., 0.001, 0.0028, 0., -0.0028, -0.002])
+
+_TEMPERATURE_SEA_LEVEL = 288.15  # K
+_PRESSURE_SEA_LEVEL = 101325.  # Pa
+_GRAV_SEA_LEVEL = 9.80665  # m/s**2
+_GAS_CONSTANT = 8.31432 / 0.0289644  # J/(kg*K), universal constant over molar mass
+_SUTHERLAND_BETA = 1.458e-6  # kg/(s*m*K**0.5)
+_SUTHERLAND_TEMPERATURE = 110.4  # K
+
+# constant of the speed of sound, as used by USatm1976Comp
+_SOS_CONSTANT = 1.4 * 1716.49  # ft**2/(s**2*degR)
+
+
+def _layer_properties():
+    """
+    Return base altitude (ft), lapse rate (degR/ft), base temperature (degR) and base
+    pressure (psi) of each layer, in the units of the component.
+    """
+    ft = convert_units(1., 'ft', 'm')
+    degR = convert_units(1., 'degR', 'degK')
+
+    heights = np.diff(_LAYER_BASE_ALTITUDES)
+    temperatures = _TEMPERATURE_SEA_LEVEL + np.concatenate(
+        ([0.], np.cumsum(_LAYER_LAPSE_RATES[:-1] * heights)))
+
+    pressures = np.empty_like(temperatures)
+    pressures[0] = _PRESSURE_SEA_LEVEL
+
+    for i, (height, lapse_rate) in enumerate(zip(heights, _LAYER_LAPSE_RATES)):
+        if lapse_rate == 0.:
+            pressures[i + 1] = pressures[i] * np.exp(
+                -_GRAV_SEA_LEVEL * height / (_GAS_CONSTANT * temperatures[i]))
+        else:
+            pressures[i + 1] = pressures[i] * (temperatures[i + 1] / temperatures[i]) \
+                ** (-_GRAV_SEA_LEVEL / (_GAS_CONSTANT * lapse_rate))
+
+    return (_LAYER_BASE_ALTITUDES / ft, _LAYER_LAPSE_RATES * ft / degR,
+            temperatures / degR, convert_units(pressures, 'Pa', 'psi'))
+
+
+_BASE_ALTITUDES, _LAPSE_RATES, _BASE_TEMPERATURES, _BASE_PRESSURES = _layer_properties()
+
+# constants in English units: ft/s**2, ft*lbf/(slug*degR), and Sutherland's law in degR
+_GRAV = convert_units(_GRAV_SEA_LEVEL, 'm/s**2', 'ft/s**2')
+_R = _GAS_CONSTANT * convert_units(1., 'J/(kg*degK)', 'ft*lbf/(slug*degR)')
+_S = _SUTHERLAND_TEMPERATURE * 1.8
+_BETA = convert_units(_SUTHERLAND_BETA / np.sqrt(1.8), 'Pa*s', 'lbf*s/ft**2')
+_PSI = 144.  # psf per psi
+
+# exponent of the pressure ratio in each layer with a lapse rate
+_EXPONENTS = np.divide(-_GRAV, _R * _LAPSE_RATES, out=np.zeros_like(_LAPSE_RATES),
+                       where=_LAPSE_RATES != 0.)
+_ISOTHERMAL = _LAPSE_RATES == 0.
+
+
+class StandardAtmosphere(om.ExplicitComponent):
+    """
+    1976 U.S. Standard Atmosphere, computed with the closed-form formulas of each layer.
+
+    The inputs and outputs are the same as those of USatm1976Comp, which interpolates
+    tables of the same atmosphere, so either component can be used in a model. The
+    altitude is geopotential. Every layer up to 84852 m is modeled; the last layer
+    extends above it, and the first one below sea level.
+
+    The altitudes of the last evaluation and their results are kept, so nodes whose
+    altitude does not change between runs (such as in phases at a fixed altitude) are
+    looked up instead of computed again.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int,
+                             desc='Number of nodes to be evaluated in the RHS')
+
+        self.options.declare('output_dsos_dh', types=bool, default=False,
+                             desc='If true, the derivative of the speed of sound will '
+                             'be added as an output')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        output_dsos_dh = self.options['output_dsos_dh']
+
+        self.add_input('h', val=1. * np.ones(nn), units='ft')
+
+        self.add_output('temp', val=1. * np.ones(nn), units='degR')
+        self.add_output('pres', val=1. * np.ones(nn), units='psi')
+        self.add_output('rho', val=1. * np.ones(nn), units='slug/ft**3')
+        self.add_output('viscosity', val=1. * np.ones(nn), units='lbf*s/ft**2')
+        self.add_output('drhos_dh', val=1. * np.ones(nn), units='slug/ft**4')
+        self.add_output('sos', val=1 * np.ones(nn), units='ft/s')
+
+        self._output_names = ['temp', 'pres', 'rho', 'viscosity', 'drhos_dh', 'sos']
+
+        if output_dsos_dh:
+            self.add_output('dsos_dh', val=1 * np.ones(nn), units='1/s')
+            self._output_names.append('dsos_dh')
+
+        arange = np.arange(nn, dtype=int)
+        self.declare_partials(self._output_names, 'h', rows=arange, cols=arange)
+
+        self._outputs_cache = None
+        self._partials_cache = None
+
+    def compute(self, inputs, outputs):
+        h = inputs['h']
+
+        if _cache_matches(self._outputs_cache, h, self.under_complex_step):
+            for name, val in self._outputs_cache[1].items():
+                outputs[name] = val
+
+            return
+
+        T, P, rho, lapse_rate = _evaluate(h)
+
+        outputs['temp'] = T
+        outputs['pres'] = P
+        outputs['rho'] = rho
+        outputs['viscosity'] = _BETA * T**1.5 / (T + _S)
+        outputs['drhos_dh'] = -rho * (_GRAV / _R + lapse_rate) / T
+
+        sos = np.sqrt(_SOS_CONSTANT * T)
+        outputs['sos'] = sos
+
+        if self.options['output_dsos_dh']:
+            outputs['dsos_dh'] = 0.5 * sos / T * lapse_rate
+
+        if not self.under_complex_step:
+            self._outputs_cache = (
+                h.copy(), {name: outputs[name].copy() for name in self._output_names})
+
+    def compute_partials(self, inputs, partials):
+        h = inputs['h']
+
+        if _cache_matches(self._partials_cache, h, self.under_complex_step):
+            for name, val in self._partials_cache[1].items():
+                partials[name, 'h'] = val
+
+            return
+
+        T, P, rho, lapse_rate = _evaluate(h)
+
+        mu = _BETA * T**1.5 / (T + _S)
+        sos = np.sqrt(_SOS_CONSTANT * T)
+
+        # hydrostatic equilibrium
+        dP_dh = -_GRAV * rho / _PSI
+
+        c = _GRAV / _R + lapse_rate
+        drho_dh = -rho * c / T
+
+        partials['temp', 'h'] = lapse_rate
+        partials['pres', 'h'] = dP_dh
+        partials['rho', 'h'] = drho_dh
+        partials['viscosity', 'h'] = mu * (1.5 / T - 1. / (T + _S)) * lapse_rate
+        partials['drhos_dh', 'h'] = rho * (c**2 + c * lapse_rate) / T**2
+        partials['sos', 'h'] = 0.5 * sos / T * lapse_rate
+
+        if self.options['output_dsos_dh']:
+            partials['dsos_dh', 'h'] = -0.25 * sos / T**2 * lapse_rate**2
+
+        if not self.under_complex_step:
+            self._partials_cache = (
+                h.copy(), {name: partials[name, 'h'].copy()
+                           for name in self._output_names})
+
+
+def _cache_matches(cache, h, under_complex_step):
+    """
+    Return True if cached results were computed at these altitudes.
+    """
+    return cache is not None and not under_complex_step and np.array_equal(cache[0], h)
+
+
+def _evaluate(h):
+    """
+    Return temperature (degR), pressure (psi), density (slug/ft**3) and lapse rate
+    (degR/ft) at geopotential altitudes h (ft).
+    """
+    layer = np.clip(np.searchsorted(_BASE_ALTITUDES, h, side='right') - 1,
+                    0, _BASE_ALTITUDES.size - 1)
+
+    dh = h - _BASE_ALTITUDES[layer]
+    lapse_rate = _LAPSE_RATES[layer]
+    base_temperature = _BASE_TEMPERATURES[layer]
+
+    T = base_temperature + lapse_rate * dh
+
+    isothermal = _ISOTHERMAL[layer]
+
+    P = _BASE_PRESSURES[layer] * np.where(
+        isothermal,
+        np.exp(-_GRAV * dh / (_R * base_temperature)),
+        (T / base_temperature) ** _EXPONENTS[layer])
+
+    rho = P * _PSI / (_R * T)
+
+    return T, P, rho, lapse_rate
+
+
+def standard_atmosphere(altitude):
+    """
+    Return the properties of the 1976 U.S. Standard Atmosphere at the given altitudes,
+    computed with the same formulas as StandardAtmosphere.
+
+    Parameters
+    ----------
+    altitude : float or ndarray
+        Geopotential altitude, in ft.
+
+    Returns
+    -------
+    temperature : ndarray
+        Static temperature, in degR.
+    pressure : ndarray
+        Static pressure, in psi.
+    density : ndarray
+        Density, in slug/ft**3.
+    """
+    T, P, rho, _ = _evaluate(np.asarray(altitude, dtype=float))
+
+    return T, P, rho
+
+
+def get_atmosphere_comp(num_nodes, aviary_options=None, **kwargs):
+    """
+    Return the atmosphere component selected by Mission.Design.ATMOSPHERE_MODEL.
+
+    Parameters
+    ----------
+    num_nodes : int
+        Number of nodes of the component.
+    aviary_options : AviaryValues or None
+        Options of the model. The model in the metadata is used if it is not given.
+    **kwargs
+        Other options of the component, such as output_dsos_dh.
+
+    Returns
+    -------
+    ExplicitComponent
+        StandardAtmosphere or USatm1976Comp, with the same inputs and outputs.
+    """
+    key = Mission.Design.ATMOSPHERE_MODEL
+
+    if isinstance(aviary_options, AviaryValues) and key in aviary_options:
+        model = aviary_options.get_val(key)
+    else:
+        model = _MetaData[key]['default_value']
+
+    if model is AtmosphereModel.STANDARD:
+        return StandardAtmosphere(num_nodes=num_nodes, **kwargs)
+
+    return USatm1976Comp(num_nodes=num_nodes, **kwargs)
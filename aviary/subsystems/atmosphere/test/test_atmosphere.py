@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.models.atmosphere import USatm1976Comp
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+from aviary.subsystems.atmosphere.atmosphere import StandardAtmosphere, \
+    get_atmosphere_comp
+from aviary.utils.aviary_values import AviaryValues
+from aviary.variable_info.enums import AtmosphereModel
+from aviary.variable_info.variables import Mission
+
+
+def run_atmosphere(comp, h):
+    prob = om.Problem()
+    prob.model.add_subsystem('atmos', comp, promotes=['*'])
+    prob.setup(force_alloc_complex=True)
+    prob.set_val('h', h, 'ft')
+    prob.run_model()
+
+    return prob
+
+
+class StandardAtmosphereTest(unittest.TestCase):
+
+    def setUp(self):
+        # inside each layer, away from the smoothed corners of the tables
+        self.h = np.array([-1000., 0., 5000., 20000., 35000., 40000., 50000., 65000.,
+                           80000., 100000., 120000., 140000., 160000., 180000.,
+                           200000., 220000., 250000.])
+
+    def test_tables(self):
+        nn = self.h.size
+        prob = run_atmosphere(
+            StandardAtmosphere(num_nodes=nn, output_dsos_dh=True), self.h)
+        expected = run_atmosphere(
+            USatm1976Comp(num_nodes=nn, output_dsos_dh=True), self.h)
+
+        for name, tol in (('temp', 1e-5), ('pres', 1e-5), ('rho', 1e-3), ('sos', 1e-5),
+                          ('viscosity', 2e-2)):
+            assert_near_equal(prob.get_val(name), expected.get_val(name), tol)
+
+        assert_near_equal(prob.get_val('temp', 'degK')[1], 288.15, 1e-12)
+        assert_near_equal(prob.get_val('pres', 'Pa')[1], 101325., 1e-12)
+        assert_near_equal(prob.get_val('rho', 'kg/m**3')[1], 1.2250, 1e-4)
+
+    def test_partials(self):
+        prob = run_atmosphere(
+            StandardAtmosphere(num_nodes=self.h.size, output_dsos_dh=True), self.h)
+
+        partial_data = prob.check_partials(method='cs', out_stream=None)
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-8)
+
+    def test_cache(self):
+        prob = run_atmosphere(StandardAtmosphere(num_nodes=self.h.size), self.h)
+        temp = prob.get_val('temp').copy()
+
+        prob.run_model()
+        assert_near_equal(prob.get_val('temp'), temp, 1e-15)
+
+        # the cache is only used at the same altitudes
+        h = self.h + 1000.
+        prob.set_val('h', h, 'ft')
+        prob.run_model()
+
+        expected = run_atmosphere(StandardAtmosphere(num_nodes=h.size), h)
+        assert_near_equal(prob.get_val('temp'), expected.get_val('temp'), 1e-15)
+
+        prob.compute_totals('rho', 'h')
+        totals = prob.compute_totals('rho', 'h')
+        expected_totals = expected.compute_totals('rho', 'h')
+        assert_near_equal(totals['rho', 'h'], expected_totals['rho', 'h'], 1e-15)
+
+    def test_get_atmosphere_comp(self):
+        self.assertIsInstance(get_atmosphere_comp(3), USatm1976Comp)
+
+        aviary_options = AviaryValues()
+        aviary_options.set_val(Mission.Design.ATMOSPHERE_MODEL, 'STANDARD')
+
+        comp = get_atmosphere_comp(3, aviary_options, output_dsos_dh=True)
+        self.assertIsInstance(comp, StandardAtmosphere)
+        self.assertTrue(comp.options['output_dsos_dh'])
+
+        aviary_options.set_val(Mission.Design.ATMOSPHERE_MODEL, AtmosphereModel.TABLES)
+        self.assertIsInstance(get_atmosphere_comp(3, aviary_options), USatm1976Comp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,10 @@ class CorePreMission(om.Group):
         self.options.declare(
             'meta_data', desc='problem metadata', default=_MetaData
         )
+        self.options.declare(
+            'subsystem_options', types=dict, default={},
+            desc='pre-mission options of each core subsystem, keyed by subsystem name'
+        )
         # NOTE this flag is only needed for tests - in AviaryProblem it should always be False
         self.options.declare('process_overrides', types=bool, default=True,
                              desc='When True, overrides are handled here, otherwise, '
@@ -38,11 +42,14 @@ class CorePreMission(om.Group):
 
         aviary_options = self.options['aviary_options']
         core_subsystems = self.options['subsystems']
+        subsystem_options = self.options['subsystem_options']
 
         for subsystem in core_subsystems:
+            kwargs = subsystem_options.get(subsystem.name, {})
+
             self.add_subsystem(
                 subsystem.name,
-                subsystem.build_pre_mission(aviary_options),
+                subsystem.build_pre_mission(aviary_options, **kwargs),
                 promotes_inputs=['*'],
                 promotes_outputs=['*']
             )
@@ -20,22 +20,34 @@ required_options : tuple
 dependent_options : dict
     Options that may or may not be required based on the presence or value of other
     provided options.
+
+compiled_data_options : tuple
+    Options that affect how engine data is processed. Compiled (cached) engine data is
+    only reused if these options match the ones used when it was created.
 """
 
+import hashlib
 import math
+import os
+import tempfile
 import warnings
 
+from pathlib import Path
+
 import numpy as np
 import openmdao.api as om
 
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
 from openmdao.utils.units import convert_units
 
 from aviary.subsystems.propulsion.engine_model import EngineModel
 from aviary.subsystems.propulsion.engine_scaling import EngineScaling
 from aviary.subsystems.propulsion.engine_sizing import SizeEngine
+from aviary.subsystems.propulsion.engine_table import EngineTable, EngineTableComp
 from aviary.subsystems.propulsion.utils import (EngineModelVariables,
                                                 convert_geopotential_altitude,
                                                 default_units)
+from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues, get_keys, get_items
 from aviary.variable_info.variable_meta_data import _MetaData
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
@@ -100,6 +112,19 @@ dependent_options = {
                                            Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION,)
 }
 
+# options that change the processed engine data, and therefore invalidate compiled data
+compiled_data_options = (
+    Aircraft.Engine.IGNORE_NEGATIVE_THRUST,
+    Aircraft.Engine.GEOPOTENTIAL_ALT,
+    Aircraft.Engine.GENERATE_FLIGHT_IDLE,
+    Aircraft.Engine.FLIGHT_IDLE_THRUST_FRACTION,
+    Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION,
+    Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION,
+)
+
+# version of the compiled engine data format, increment when the contents change
+COMPILED_DATA_VERSION = 1
+
 
 class EngineDeck(EngineModel):
     """
@@ -282,7 +307,25 @@ class EngineDeck(EngineModel):
             Normalize throttles/hybrid throttles.
 
             Fill flight idle points.
+
+        If Aircraft.Engine.DATA_CACHE_DIR is provided, processed data is loaded from a
+        compiled data file when one matching the data file and engine options exists,
+        skipping all of the above. Otherwise, a compiled data file is written once
+        processing is complete.
         """
+        # interpolation tables are built from processed data when first needed
+        self._engine_table = None
+        self._max_thrust_tables = {}
+
+        compiled_data_path = self._get_compiled_data_path()
+
+        if compiled_data_path is not None and compiled_data_path.exists():
+            if self._read_compiled_data(compiled_data_path):
+                # reference thrust is stored in options, not data, and must always be
+                # set
+                self._set_reference_thrust()
+                return
+
         self._read_data(data)
 
         # perform consistency checks on data
@@ -306,6 +349,150 @@ class EngineDeck(EngineModel):
         if self.get_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE):
             self._generate_flight_idle()
 
+        if compiled_data_path is not None:
+            self._write_compiled_data(compiled_data_path)
+
+    def _get_compiled_data_path(self):
+        """
+        Determine the location of the compiled data file for this EngineDeck.
+
+        The filename contains a hash of the contents of the data file and of all options
+        in compiled_data_options, so any change to either results in a different
+        compiled data file.
+
+        Returns
+        -------
+        compiled_data_path : Path
+            Path to compiled data file. None if data is not read from a file or if
+            Aircraft.Engine.DATA_CACHE_DIR is not provided.
+        """
+        if not self.read_from_file:
+            return None
+
+        if Aircraft.Engine.DATA_CACHE_DIR not in self.options:
+            return None
+
+        cache_dir = self.get_val(Aircraft.Engine.DATA_CACHE_DIR)
+        if cache_dir is None:
+            return None
+
+        data_file = get_path(self.get_val(Aircraft.Engine.DATA_FILE))
+
+        file_hash = hashlib.sha256()
+        file_hash.update(str(COMPILED_DATA_VERSION).encode())
+        file_hash.update(data_file.read_bytes())
+        for key in compiled_data_options:
+            if key in self.options:
+                file_hash.update(f'{key}={self.get_val(key)!r};'.encode())
+
+        return Path(cache_dir) / f'{data_file.stem}_{file_hash.hexdigest()[:16]}.npz'
+
+    def _read_compiled_data(self, filepath):
+        """
+        Load processed engine data from a compiled data file.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path to compiled data file.
+
+        Returns
+        -------
+        success : bool
+            True if data was loaded, False if the compiled data file could not be used.
+        """
+        try:
+            with np.load(filepath) as compiled_data:
+                if compiled_data['version'] != COMPILED_DATA_VERSION:
+                    return False
+
+                arrays = {key: np.array(compiled_data[key])
+                          for key in compiled_data.files}
+
+        except (OSError, ValueError, KeyError):
+            warnings.warn(f'EngineDeck <{self.name}>: compiled data file <{filepath}> '
+                          'could not be read and will be regenerated.')
+            return False
+
+        self.engine_variables = {
+            EngineModelVariables[name]: str(units) for name, units in
+            zip(arrays['engine_variable_names'], arrays['engine_variable_units'])}
+
+        for key in self._original_data:
+            if f'original:{key.name}' in arrays:
+                self._original_data[key] = arrays[f'original:{key.name}']
+
+        self.packed_data = {}
+        for key in self.data:
+            self.data[key] = arrays[f'data:{key.name}']
+            self.packed_data[key] = arrays[f'packed:{key.name}']
+
+        if f'idle:{MACH.name}' in arrays:
+            self.idle_points = {key: arrays[f'idle:{key.name}'] for key in self.data}
+
+        (self.mach_max_count, self.alt_max_count, self.data_max_count,
+         self.model_length) = (int(count) for count in arrays['counts'])
+        self.data_indices = arrays['data_indices']
+
+        # throttle ranges are scalars for global throttles, arrays for local throttles
+        for attr in ('throttle_min', 'throttle_max',
+                     'hybrid_throttle_min', 'hybrid_throttle_max'):
+            val = arrays[attr]
+            setattr(self, attr, val.item() if val.ndim == 0 else val)
+
+        self._set_variable_flags()
+
+        return True
+
+    def _write_compiled_data(self, filepath):
+        """
+        Save processed engine data to a compiled data file. The file is written to a
+        temporary location first and then moved into place, so multiple processes
+        sharing a cache directory never read a partially written file.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path to compiled data file.
+        """
+        arrays = {
+            'version': np.array(COMPILED_DATA_VERSION),
+            'engine_variable_names': np.array(
+                [key.name for key in self.engine_variables], dtype=str),
+            'engine_variable_units': np.array(
+                list(self.engine_variables.values()), dtype=str),
+            'counts': np.array([self.mach_max_count, self.alt_max_count,
+                                self.data_max_count, self.model_length]),
+            'data_indices': self.data_indices,
+            'throttle_min': np.array(self.throttle_min),
+            'throttle_max': np.array(self.throttle_max),
+            'hybrid_throttle_min': np.array(self.hybrid_throttle_min),
+            'hybrid_throttle_max': np.array(self.hybrid_throttle_max),
+        }
+
+        for key in self._original_data:
+            if isinstance(key, EngineModelVariables):
+                arrays[f'original:{key.name}'] = np.asarray(self._original_data[key])
+
+        for key in self.data:
+            arrays[f'data:{key.name}'] = self.data[key]
+            arrays[f'packed:{key.name}'] = self.packed_data[key]
+
+        if hasattr(self, 'idle_points'):
+            for key in self.data:
+                arrays[f'idle:{key.name}'] = self.idle_points[key]
+
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=filepath.parent, suffix='.tmp',
+                                             delete=False) as file:
+                np.savez(file, **arrays)
+            os.replace(file.name, filepath)
+
+        except OSError:
+            warnings.warn(f'EngineDeck <{self.name}>: compiled data file <{filepath}> '
+                          'could not be written.')
+
     def _read_data(self, raw_data: NamedValues):
         """
         Import tabular engine data; either from memory or from a data file.
@@ -362,8 +549,8 @@ class EngineDeck(EngineModel):
                 # Convert data to expected units. Required so settings like tolerances
                 # that assume units work as expected
                 try:
-                    val = np.array([convert_units(i, units, default_units[key])
-                                   for i in val])
+                    val = convert_units(np.array(val, dtype=float), units,
+                                        default_units[key])
                 except TypeError:
                     raise TypeError(f"{message}: units of '{units}' provided for "
                                     f'<{key.name}> are not compatible with expected units '
@@ -684,8 +871,9 @@ class EngineDeck(EngineModel):
     def build_mission(self, num_nodes, aviary_inputs):
         """
         Creates interpolator objects to be added to mission-level propulsion subsystem.
-        Interpolators must be re-generated for each ODE due to potentialy different
-        num_nodes in each mission segment.
+        Interpolator components must be re-generated for each ODE due to potentialy
+        different num_nodes in each mission segment, but all of them evaluate the same
+        interpolation tables, which are only built once per EngineDeck.
 
         Parameters
         ----------
@@ -695,17 +883,19 @@ class EngineDeck(EngineModel):
         Returns
         -------
         engine_group : openmdao.core.Group
-            An OpenMDAO group containing engine data interpolators, an EngineScaling
-            component, and max throttle/max hybrid_throttle generating components as
-            needed for this EngineDeck.
+            An OpenMDAO group containing engine data interpolators (including a max
+            thrust interpolator if needed) and an EngineScaling component for this
+            EngineDeck.
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
 
+        engine_table = self._get_engine_table()
+
         engine_group = om.Group()
 
         # interpolator object for engine data
-        engine = om.MetaModelSemiStructuredComp(
-            method=interp_method, extrapolate=True, vec_size=num_nodes)
+        engine = EngineTableComp(method=interp_method, extrapolate=True,
+                                 vec_size=num_nodes, engine_table=engine_table)
 
         units = default_units
         for key in self.engine_variables:
@@ -713,139 +903,112 @@ class EngineDeck(EngineModel):
 
         # add inputs and outputs to interpolator
         engine.add_input(Dynamic.Mission.MACH,
-                         self.data[MACH],
                          units='unitless',
                          desc='Current flight Mach number')
         engine.add_input(Dynamic.Mission.ALTITUDE,
-                         self.data[ALTITUDE],
                          units=units[ALTITUDE],
                          desc='Current flight altitude')
         engine.add_input(Dynamic.Mission.THROTTLE,
-                         self.data[THROTTLE],
                          units='unitless',
                          desc='Current engine throttle')
         if self.use_hybrid_throttle:
             engine.add_input(Dynamic.Mission.HYBRID_THROTTLE,
-                             self.data[HYBRID_THROTTLE],
                              units='unitless',
                              desc='Current engine hybrid throttle')
         engine.add_output('thrust_net_unscaled',
-                          self.data[THRUST],
+                          THRUST,
                           units=units[THRUST],
                           desc='Current net thrust produced (unscaled)')
         engine.add_output('fuel_flow_rate_unscaled',
-                          self.data[FUEL_FLOW],
+                          FUEL_FLOW,
                           units=units[FUEL_FLOW],
                           desc='Current fuel flow rate (unscaled)')
         engine.add_output('electric_power_unscaled',
-                          self.data[ELECTRIC_POWER],
+                          ELECTRIC_POWER,
                           units=units[ELECTRIC_POWER],
                           desc='Current electric energy rate (unscaled)')
         engine.add_output('nox_rate_unscaled',
-                          self.data[NOX_RATE],
+                          NOX_RATE,
                           units=units[NOX_RATE],
                           desc='Current NOx emission rate (unscaled)')
         # if self.use_exit_area:
         # engine.add_output('exit_area_unscaled',
-        #                   self.data[EXIT_AREA],
+        #                   EXIT_AREA,
         #                   units='ft**2',
         #                   desc='Current exit area (unscaled)')
         engine.add_output(Dynamic.Mission.TEMPERATURE_ENGINE_T4,
-                          self.data[TEMPERATURE],
+                          TEMPERATURE,
                           units=units[TEMPERATURE],
                           desc='Current turbine exit temperature')
 
-        # Create copy of interpolation component that computes max thrust for current
-        # flight condition
+        # Max thrust for current flight condition is interpolated from a reduced table
+        # that only depends on Mach number and altitude
         # NOTE max thrust is assumed to occur at maximum throttle and hybrid throttle
         #      for each flight condition
         # TODO Use solver to find throttle/hybrid throttle for maximum thrust at given flight condition?
-        #      Pre-solve max throttle/hybrid throttle for each flight condition, interpolate on
-        #      reduced data set?
         if self.use_thrust:
-            if self.global_throttle or (self.global_hybrid_throttle
-                                        and self.use_hybrid_throttle):
-                # create IndepVarComp to pass maximum throttle is to max thrust interpolator
-                fixed_throttles = om.IndepVarComp()
-                if self.global_throttle:
-                    fixed_throttles.add_output('throttle_max',
-                                               val=np.ones(num_nodes) *
-                                               self.throttle_max,
-                                               units='unitless',
-                                               desc='Engine maximum throttle')
-                if self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    fixed_throttles.add_output('hybrid_throttle_max',
-                                               val=np.ones(num_nodes) *
-                                               self.hybrid_throttle_max,
-                                               units='unitless',
-                                               desc='Engine maximum hybrid throttle')
-            if not (self.global_throttle or (self.global_hybrid_throttle
-                                             and self.use_hybrid_throttle)):
-                interp_throttles = om.MetaModelSemiStructuredComp(method=interp_method,
-                                                                  extrapolate=False,
-                                                                  vec_size=num_nodes)
-
-                packed_data = self.packed_data
-                mach_table = np.array([])
-                alt_table = np.array([])
-
-                for M in range(self.mach_max_count):
-                    for A in range(self.alt_max_count):
-                        if self.data_indices[M, A] != 0:
-                            mach_table = np.append(
-                                mach_table, packed_data[MACH][M, A, 0])
-                            alt_table = np.append(
-                                alt_table, packed_data[ALTITUDE][M, A, 0])
-
-                # add inputs and outputs to interpolator
-                interp_throttles.add_input(Dynamic.MACH,
+            max_throttles = [self.throttle_max]
+            if self.use_hybrid_throttle:
+                max_throttles.append(self.hybrid_throttle_max)
+
+            # the reduced table only matches the full table if max throttles are the
+            # same at every flight condition, otherwise max throttles are interpolated
+            # and the full table is evaluated at them
+            reduced_table = all(np.ptp(val) == 0. for val in max_throttles)
+
+            if reduced_table:
+                max_thrust_engine = EngineTableComp(
+                    method=interp_method, extrapolate=False, vec_size=num_nodes,
+                    engine_table=self._get_max_thrust_table(interp_method))
+            else:
+                mach_table, alt_table = self._get_flight_conditions()
+
+                interp_throttles = om.MetaModelSemiStructuredComp(
+                    method=interp_method, extrapolate=False, vec_size=num_nodes)
+                interp_throttles.add_input(Dynamic.Mission.MACH,
                                            mach_table,
                                            units='unitless',
                                            desc='Current flight Mach number')
-                interp_throttles.add_input(Dynamic.ALTITUDE,
+                interp_throttles.add_input(Dynamic.Mission.ALTITUDE,
                                            alt_table,
                                            units=units[ALTITUDE],
                                            desc='Current flight altitude')
-                if not self.global_throttle:
-                    interp_throttles.add_output('throttle_max',
-                                                self.throttle_max,
-                                                units='unitless',
-                                                desc='max throttle avaliable at current '
-                                                'flight condition')
-                if not self.global_hybrid_throttle and self.use_hybrid_throttle:
+                interp_throttles.add_output('throttle_max',
+                                            np.broadcast_to(self.throttle_max,
+                                                            mach_table.shape),
+                                            units='unitless',
+                                            desc='max throttle avaliable at current '
+                                                 'flight condition')
+                if self.use_hybrid_throttle:
                     interp_throttles.add_output('hybrid_throttle_max',
-                                                self.hybrid_throttle_max,
+                                                np.broadcast_to(self.hybrid_throttle_max,
+                                                                mach_table.shape),
                                                 units='unitless',
                                                 desc='max hybrid throttle avaliable at '
                                                      'current flight condition')
 
-            # Calculation of max thrust currently done with a duplicate of the engine
-            # model and scaling components
-            max_thrust_engine = om.MetaModelSemiStructuredComp(
-                method=interp_method, extrapolate=False, vec_size=num_nodes)
+                max_thrust_engine = EngineTableComp(
+                    method=interp_method, extrapolate=False, vec_size=num_nodes,
+                    engine_table=engine_table)
 
             max_thrust_engine.add_input(Dynamic.Mission.MACH,
-                                        self.data[MACH],
                                         units='unitless',
                                         desc='Current flight Mach number')
             max_thrust_engine.add_input(Dynamic.Mission.ALTITUDE,
-                                        self.data[ALTITUDE],
                                         units=units[ALTITUDE],
                                         desc='Current flight altitude')
-            # replace throttle coming from mission with max value based on flight condition
-            max_thrust_engine.add_input('throttle_max',
-                                        self.data[THROTTLE],
-                                        units='unitless',
-                                        desc='Current engine throttle')
-            if self.use_hybrid_throttle:
-                # replace hybrid throttle coming from mission with max value based on
-                # flight condition
-                max_thrust_engine.add_input('hybrid_throttle_max',
-                                            self.data[HYBRID_THROTTLE],
+            if not reduced_table:
+                # replace throttles coming from mission with max values based on flight
+                # condition
+                max_thrust_engine.add_input('throttle_max',
                                             units='unitless',
-                                            desc='Current engine hybrid throttle')
+                                            desc='Current engine throttle')
+                if self.use_hybrid_throttle:
+                    max_thrust_engine.add_input('hybrid_throttle_max',
+                                                units='unitless',
+                                                desc='Current engine hybrid throttle')
             max_thrust_engine.add_output('thrust_net_max_unscaled',
-                                         self.data[THRUST],
+                                         THRUST,
                                          units=units[THRUST],
                                          desc='Current thrust produced')
         else:
@@ -854,7 +1017,7 @@ class EngineDeck(EngineModel):
             # Add unscaled max thrust as output of interpolator, which will have a
             # default value of zero at every flight condition
             engine.add_output('thrust_net_max_unscaled',
-                              self.data[THRUST],
+                              THRUST,
                               units=units[THRUST],
                               desc='Current max net thrust produced (unscaled)')
 
@@ -864,14 +1027,7 @@ class EngineDeck(EngineModel):
                                    promotes_inputs=['*'],
                                    promotes_outputs=['*'])
         if self.use_thrust:
-            if self.global_throttle or (self.global_hybrid_throttle
-                                        and self.use_hybrid_throttle):
-                engine_group.add_subsystem('fixed_max_throttles',
-                                           fixed_throttles,
-                                           promotes_outputs=['*'])
-
-            if not (self.global_throttle or (self.global_hybrid_throttle
-                                             and self.use_hybrid_throttle)):
+            if not reduced_table:
                 engine_group.add_subsystem('interp_max_throttles',
                                            interp_throttles,
                                            promotes_inputs=['*'],
@@ -891,6 +1047,86 @@ class EngineDeck(EngineModel):
 
         return engine_group
 
+    def _get_engine_table(self):
+        """
+        Return the interpolation tables for the processed engine data, shared by all
+        interpolator components built by this EngineDeck.
+
+        Returns
+        -------
+        engine_table : EngineTable
+            Tables of each dependent engine variable, on a grid of Mach number, altitude,
+            throttle, and hybrid throttle (if used).
+        """
+        if self._engine_table is None:
+            inputs = [self.data[MACH], self.data[ALTITUDE], self.data[THROTTLE]]
+            if self.use_hybrid_throttle:
+                inputs.append(self.data[HYBRID_THROTTLE])
+
+            values = {key: self.data[key] for key in
+                      (THRUST, FUEL_FLOW, ELECTRIC_POWER, NOX_RATE, TEMPERATURE)}
+
+            self._engine_table = EngineTable(inputs, values)
+
+        return self._engine_table
+
+    def _get_flight_conditions(self):
+        """
+        Return the flight conditions present in the engine data, in sorted order.
+
+        Returns
+        -------
+        mach : numpy.ndarray
+            Mach number of each flight condition.
+        altitude : numpy.ndarray
+            Altitude of each flight condition.
+        """
+        has_data = self.data_indices != 0
+
+        return (self.packed_data[MACH][:, :, 0][has_data],
+                self.packed_data[ALTITUDE][:, :, 0][has_data])
+
+    def _get_max_thrust_table(self, interp_method):
+        """
+        Return an interpolation table of maximum thrust for each flight condition (Mach
+        number and altitude) in the engine data, shared by all max thrust interpolator
+        components built by this EngineDeck.
+
+        The table is created by evaluating the full engine data table at maximum throttle
+        (and maximum hybrid throttle) at every flight condition in the data. Because the
+        interpolation is separable by dimension, interpolating this reduced table gives
+        the same result as interpolating the full table at maximum throttle, at a
+        fraction of the cost, as long as maximum throttles are the same at every flight
+        condition.
+
+        Parameters
+        ----------
+        interp_method : str
+            Interpolation method used for the full engine data table.
+
+        Returns
+        -------
+        max_thrust_table : EngineTable
+            Table of maximum thrust on a grid of Mach number and altitude.
+        """
+        if interp_method not in self._max_thrust_tables:
+            mach, altitude = self._get_flight_conditions()
+
+            # max throttles are either global or given for each flight condition
+            points = [mach, altitude, np.broadcast_to(self.throttle_max, mach.shape)]
+            if self.use_hybrid_throttle:
+                points.append(np.broadcast_to(self.hybrid_throttle_max, mach.shape))
+
+            table = self._get_engine_table()
+            interp = InterpNDSemi(np.array(table.inputs).T, table.values[THRUST],
+                                  method=interp_method, extrapolate=False)
+            max_thrust = interp.interpolate(np.array(points).T)
+
+            self._max_thrust_tables[interp_method] = EngineTable(
+                [mach, altitude], {THRUST: max_thrust})
+
+        return self._max_thrust_tables[interp_method]
+
     def _set_reference_thrust(self):
         """
         Determine maximum sea-level static thrust produced by the engine (unscaled).
@@ -1135,121 +1371,90 @@ class EngineDeck(EngineModel):
         """
         # method requires sorted data
         self._sort_data()
-        # get updated data count
-        self._count_data()
+        # get updated data count, and location of each data point in packed data
+        mach_idx, alt_idx, point_idx = self._count_data()
 
-        mach_max_count = self.mach_max_count
-        alt_max_count = self.alt_max_count
-        data_max_count = self.data_max_count
-        data_indices = self.data_indices
+        shape = (self.mach_max_count, self.alt_max_count, self.data_max_count)
 
         packed_data = self.packed_data = {}
-        idx = 0
 
         for key in self.data:
-            packed_data[key] = np.zeros((mach_max_count, alt_max_count, data_max_count))
-
-        for M in range(mach_max_count):
-
-            for A in range(alt_max_count):
-                if data_indices[M, A] == 0:
-                    # skip point if there is no data
-                    continue
-
-                # number of data points is index+1
-                for D in range(data_indices[M, A] + 1):
-                    for key in self.data:
-                        unpacked_data = self.data[key]
-                        if idx < len(unpacked_data):
-                            packed_data[key][M, A, D] = unpacked_data[idx]
-                    idx += 1
+            packed_data[key] = np.zeros(shape)
+            packed_data[key][mach_idx, alt_idx, point_idx] = self.data[key]
 
     def _count_data(self):
         """
         Count unique data entries in the engine data for each Mach, altitude combination.
         Requires that data is sorted.
 
+        Mach numbers (and altitudes for a given Mach number) are considered unique when
+        they differ from the previous sorted value by more than mach_tol (alt_tol).
+
+        Returns
+        -------
+        mach_idx : numpy.ndarray
+            Index of the Mach number of each data point in packed data.
+        alt_idx : numpy.ndarray
+            Index of the altitude of each data point in packed data.
+        point_idx : numpy.ndarray
+            Index of each data point within its Mach, altitude combination in packed
+            data.
+
         Raises
         ------
         UserWarning
             If insufficient number of altitude points (<2) provided for a given Mach
             number.
         """
-        mach_count = 0
-        # First mach number must have at least one altitude associated with it
-        alt_count = 1
-        max_alt_count = 0
-        # First mach number must have at least one data point associated with it
-        data_count = 1
-        max_data_count = 0
-
-        # data_indices stores how many data points there are for a given Mach/alt combo
-        data_indices = np.array([[]])
-
-        curr_mach = curr_alt = np.inf
-
         mach_numbers = self.data[MACH]
         altitudes = self.data[ALTITUDE]
+        num_points = len(mach_numbers)
+
+        # flag data points that start a new Mach number, and points that start a new
+        # Mach, altitude combination
+        new_mach = np.ones(num_points, dtype=bool)
+        new_mach[1:] = np.abs(np.diff(mach_numbers)) > self.mach_tol
+        new_alt = new_mach.copy()
+        new_alt[1:] |= np.abs(np.diff(altitudes)) > self.alt_tol
+
+        mach_idx = np.cumsum(new_mach) - 1
+        mach_count = mach_idx[-1] + 1
+
+        # index of first data point for each Mach, altitude combination
+        group_start = np.flatnonzero(new_alt)
+        group_idx = np.cumsum(new_alt) - 1
+        group_mach_idx = mach_idx[group_start]
+        # altitude index of each combination, counted from the first altitude at its
+        # Mach number
+        first_group = np.searchsorted(group_mach_idx, np.arange(mach_count))
+        group_alt_idx = np.arange(len(group_start)) - first_group[group_mach_idx]
+
+        alt_counts = np.bincount(group_mach_idx)
+        if np.any(alt_counts < 2):
+            # custom error messages depending on data type
+            if self.read_from_file:
+                message = f'engine data file <{self.get_val(Aircraft.Engine.DATA_FILE)}>'
+            else:
+                message = f'EngineDeck <{self.name}>'
+            mach_num = mach_numbers[np.flatnonzero(new_mach)[np.argmax(alt_counts < 2)]]
+            raise UserWarning('Only one altitude provided for Mach number '
+                              f'{mach_num:6.3f} in {message}')
 
-        # Loop through data. Keep track of last unique value (curr_*) to compare each new
-        #   value with
-        # Count number of altitudes per mach, number of data points per
-        #   mach/altitude combination, compare with max_count
-        for idx in range(self.model_length):
-            mach_num = mach_numbers[idx]
-            alt = altitudes[idx]
+        data_counts = np.diff(group_start, append=num_points)
 
-            if math.isclose(mach_num, curr_mach, abs_tol=self.mach_tol):
+        # data_indices stores how many data points there are for a given Mach/alt combo
+        data_indices = np.zeros((mach_count, max(alt_counts)), dtype=int)
+        data_indices[group_mach_idx, group_alt_idx] = np.maximum(data_counts - 1, 1)
 
-                if math.isclose(alt, curr_alt, abs_tol=self.alt_tol):
-                    data_indices[mach_count - 1, alt_count - 1] = data_count
-                    data_count += 1
+        self.mach_max_count = mach_count
+        self.alt_max_count = max(alt_counts)
+        self.data_max_count = max(data_counts)
+        self.data_indices = data_indices
 
-                else:
-                    # new altitude for this mach number, count it
-                    curr_alt = alt
-                    alt_count += 1
-                    data_indices = extend_array(data_indices, [mach_count, alt_count])
-
-                    if data_count > max_data_count:
-                        max_data_count = data_count
-                    # new altitude means reset data counter
-                    data_count = 1
-                    # count data associated with new altitude
-                    data_indices[mach_count - 1, alt_count - 1] = 1
+        alt_idx = group_alt_idx[group_idx]
+        point_idx = np.arange(num_points) - group_start[group_idx]
 
-            else:
-                # new Mach number
-                # if there are less than two altitudes for this Mach number, quit
-                if alt_count < 2 and mach_count > 0:
-                    raise UserWarning('Only one altitude provided for Mach number '
-                                      f'{mach_numbers[mach_count]:6.3f} in engine data file '
-                                      f'<{self.get_val(Aircraft.Engine.DATA_FILE).name}>'
-                                      )
-
-                # record and count mach numbers
-                curr_mach = mach_num
-                mach_count += 1
-
-                # new mach comes with new altitude, record and count it
-                if alt_count > max_alt_count:
-                    max_alt_count = alt_count
-                # new mach means reset altitude counter
-                curr_alt = alt
-                alt_count = 1
-                data_indices = extend_array(data_indices, [mach_count, alt_count])
-
-                if data_count > max_data_count:
-                    max_data_count = data_count
-                # new mach means reset data counter
-                data_count = 1
-                # count data associated with new altitude
-                data_indices[mach_count - 1, alt_count - 1] = 1
-
-        self.mach_max_count = mach_count
-        self.alt_max_count = max_alt_count
-        self.data_max_count = max_data_count
-        self.data_indices = data_indices.astype(int)
+        return mach_idx, alt_idx, point_idx
 
 
 #####################
@@ -1288,47 +1493,6 @@ def normalize(base_list, maximum=None, minimum=None):
     if minimum is None:
         minimum = min(base_list)
 
-    norm_list = np.array([(x - minimum) / (maximum - minimum) for x in base_list])
+    norm_list = (np.array(base_list, dtype=float) - minimum) / (maximum - minimum)
 
     return norm_list
-
-
-def extend_array(inp_array, size):
-    """
-    Extends input array such that it is at least as large as the target size in
-    all dimensions. If input array is smaller in any dimension, extends input
-    array to match target size in that dimension. Works on arrays up to 3
-    dimensions. Returns copy of input array extended in required dimensions with newly
-    created points set to 0.
-
-    Parameters
-    ----------
-    inp_array : (list, numpy.ndarray)
-        Array that needs to be checked for expansion.
-    size : list
-        List containing desired minimum length of inp_array along each dimension.
-
-    Returns
-    -------
-    inp_array : numpy.ndarray
-        The provided array extended in the desired dimensions with with newly created
-        points set to 0.
-    """
-    # TODO may be built-in numpy functions that can replace this and support n dimensions
-    dims = np.array(np.shape(inp_array))
-    while size[0] > dims[0]:
-        inp_array = np.concatenate(
-            (inp_array, np.zeros((1, *dims[1:]))), 0)
-        dims[0] += 1
-    if len(dims) > 1:
-        while size[1] > dims[1]:
-            inp_array = np.concatenate(
-                (inp_array, np.zeros((dims[0], 1, *dims[2:]))), 1)
-            dims[1] += 1
-        if len(dims) > 2:
-            while size[2] > dims[2]:
-                inp_array = np.concatenate(
-                    (inp_array, np.zeros((*dims[:2], 1))), 2)
-                dims[2] += 1
-
-    return inp_array
@@ -0,0 +1,96 @@
+"""
+Define utilities for sharing engine performance training data between components.
+
+Classes
+-------
+EngineTable : training data of interpolation tables, shared by reference.
+
+EngineTableComp : metamodel component that interpolates the tables of an EngineTable.
+"""
+import openmdao.api as om
+
+
+class EngineTable:
+    """
+    Collection of training data for interpolation tables on a single semi-structured
+    grid.
+
+    Every component using the same EngineTable is given the same training data arrays,
+    so adding components (e.g. one per mission phase) does not copy or re-process the
+    engine data. Each component still builds its own interpolants during setup.
+
+    Attributes
+    ----------
+    inputs : list of numpy.ndarray
+        Training data for each independent variable, in the order they are
+        interpolated.
+    values : dict
+        Training data for each output table, keyed by table name (any hashable).
+    """
+
+    def __init__(self, inputs, values):
+        """
+        Parameters
+        ----------
+        inputs : list of numpy.ndarray
+            Training data for each independent variable, in the order they are
+            interpolated.
+        values : dict
+            Training data for each output table.
+        """
+        self.inputs = inputs
+        self.values = values
+
+
+class EngineTableComp(om.MetaModelSemiStructuredComp):
+    """
+    MetaModelSemiStructuredComp that takes its training data from an EngineTable.
+
+    Inputs must be added in the same order as the inputs of the EngineTable.
+    """
+
+    def initialize(self):
+        super().initialize()
+
+        self.options.declare(
+            'engine_table', types=EngineTable,
+            desc='EngineTable containing the training data used by this component')
+
+    def add_input(self, name, val=1.0, **kwargs):
+        """
+        Add an input to this component. Training data is taken from the EngineTable.
+
+        Parameters
+        ----------
+        name : str
+            Name of the input.
+        val : float or ndarray
+            Initial value for the input.
+        **kwargs : dict
+            Additional arguments for add_input.
+        """
+        inputs = self.options['engine_table'].inputs
+        idx = len(self.pnames)
+
+        if idx >= len(inputs):
+            raise ValueError(f'{self.msginfo}: the engine table has only {len(inputs)} '
+                             'inputs.')
+
+        super().add_input(name, inputs[idx], val=val, **kwargs)
+
+    def add_output(self, name, table_name, **kwargs):
+        """
+        Add an output to this component, interpolated from a table of the EngineTable.
+
+        Parameters
+        ----------
+        name : str
+            Name of the output.
+        table_name : hashable
+            Name of the table in the EngineTable that provides this output.
+        **kwargs : dict
+            Additional arguments for add_output.
+        """
+        values = self.options['engine_table'].values
+
+        super().add_output(name, values[table_name], **kwargs)
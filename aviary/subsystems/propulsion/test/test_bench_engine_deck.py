@@ -0,0 +1,58 @@
+import time
+import unittest
+from pathlib import Path
+
+from aviary.subsystems.propulsion.engine_deck import EngineDeck
+from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.functions import get_path
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+class EngineDeckLoadBenchmark(unittest.TestCase):
+    """
+    Time construction of an EngineDeck (reading, sorting, packing, and generating flight
+    idle data) for every engine deck shipped with Aviary.
+    """
+
+    def setUp(self):
+        options = AviaryValues()
+        options.set_val(Aircraft.Engine.SCALE_PERFORMANCE, True)
+        options.set_val(Aircraft.Engine.IGNORE_NEGATIVE_THRUST, False)
+        options.set_val(Aircraft.Engine.GEOPOTENTIAL_ALT, False)
+        options.set_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE, True)
+        options.set_val(Aircraft.Engine.FLIGHT_IDLE_THRUST_FRACTION, 0.0)
+        options.set_val(Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION, 1.0)
+        options.set_val(Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION, 0.08)
+        options.set_val(Mission.Summary.FUEL_FLOW_SCALER, 1.0)
+
+        self.options = options
+
+    def bench_test_load_engine_decks(self):
+        num_runs = 5
+
+        deck_dir = get_path('models/engines')
+
+        print(f'\n{"engine deck":<24}{"points":>10}{"load time (ms)":>18}')
+
+        for filename in sorted(Path(deck_dir).glob('*.deck')):
+            with self.subTest(deck=filename.name):
+                options = self.options.deepcopy()
+                options.set_val(Aircraft.Engine.DATA_FILE, filename)
+
+                run_times = []
+                for _ in range(num_runs):
+                    start_time = time.perf_counter()
+                    engine = EngineDeck(filename.stem, options)
+                    run_times.append(time.perf_counter() - start_time)
+
+                print(f'{filename.name:<24}{engine.model_length:>10}'
+                      f'{1000 * min(run_times):>18.2f}')
+
+                self.assertEqual(engine.packed_data[keys.THRUST].shape,
+                                 (engine.mach_max_count, engine.alt_max_count,
+                                  engine.data_max_count))
+
+
+if __name__ == '__main__':
+    unittest.main()
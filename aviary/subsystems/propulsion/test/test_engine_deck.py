@@ -1,7 +1,10 @@
 import csv
+import tempfile
 import unittest
 from pathlib import Path
 
+import numpy as np
+import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal
 
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
@@ -9,6 +12,7 @@ from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
 from aviary.utils.named_values import NamedValues
 from aviary.validation_cases.validation_data.flops_data.FLOPS_Test_Data import \
     FLOPS_Test_Data
+from aviary.variable_info.variables import Aircraft, Dynamic
 
 
 class EngineDeckTest(unittest.TestCase):
@@ -130,6 +134,158 @@ class EngineDeckTest(unittest.TestCase):
         assert_near_equal(thrust, expected_thrust, tolerance=tol)
         assert_near_equal(fuel_flow_rate, expected_fuel_flow_rate, tolerance=tol)
 
+    def test_compiled_data(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs'].deepcopy()
+
+        model = EngineDeck('engine', aviary_values)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            aviary_values.set_val(Aircraft.Engine.DATA_CACHE_DIR, cache_dir)
+
+            # first deck processes data and writes compiled data file
+            EngineDeck('engine', aviary_values)
+            self.assertEqual(len(list(Path(cache_dir).glob('*.npz'))), 1)
+
+            # second deck loads compiled data file
+            cached_model = EngineDeck('engine', aviary_values)
+            self.assertEqual(len(list(Path(cache_dir).glob('*.npz'))), 1)
+
+            for key in model.data:
+                assert_near_equal(cached_model.data[key], model.data[key])
+                assert_near_equal(cached_model.packed_data[key], model.packed_data[key])
+            np.testing.assert_array_equal(cached_model.data_indices, model.data_indices)
+            self.assertEqual(cached_model.engine_variables, model.engine_variables)
+            self.assertEqual(cached_model.throttle_max, model.throttle_max)
+            assert_near_equal(
+                cached_model.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf'),
+                model.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf'))
+
+            # changing an option that affects data processing invalidates compiled data
+            aviary_values.set_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE, False)
+            EngineDeck('engine', aviary_values)
+            self.assertEqual(len(list(Path(cache_dir).glob('*.npz'))), 2)
+
+    def test_shared_tables(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs']
+
+        model = aviary_values.get_val('engine_models')[0]
+
+        # interpolators for two "phases" with different numbers of nodes
+        prob = om.Problem()
+        groups = []
+        for phase, num_nodes in (('phase1', 3), ('phase2', 5)):
+            engine_group = model.build_mission(num_nodes, aviary_values)
+            engine_group.set_input_defaults(Dynamic.Mission.MACH, np.zeros(num_nodes))
+            groups.append(prob.model.add_subsystem(phase, engine_group))
+        prob.setup()
+
+        # the phases share the training data, but not the interpolants
+        for name in ('interpolation', 'max_thrust_interpolation'):
+            comp1, comp2 = (getattr(group, name) for group in groups)
+            for output, data in comp1.training_outputs.items():
+                self.assertIs(data, comp2.training_outputs[output])
+                self.assertIsNot(comp1.interps[output], comp2.interps[output])
+
+    def test_max_thrust(self):
+        nn = 20
+
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs']
+
+        model = aviary_values.get_val('engine_models')[0]
+
+        prob = om.Problem()
+        engine_group = model.build_mission(nn, aviary_values)
+        engine_group.set_input_defaults(Dynamic.Mission.MACH, np.zeros(nn))
+        prob.model.add_subsystem('engine', engine_group, promotes=['*'])
+        prob.setup()
+
+        # max thrust from reduced table must match full table at max throttle
+        prob.set_val(Dynamic.Mission.MACH, np.linspace(0, 0.85, nn))
+        prob.set_val(Dynamic.Mission.ALTITUDE, np.linspace(0, 40000, nn), 'ft')
+        prob.set_val(Dynamic.Mission.THROTTLE, np.ones(nn) * model.throttle_max)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('thrust_net_max_unscaled', 'lbf'),
+                          prob.get_val('thrust_net_unscaled', 'lbf'), 1e-10)
+
+    def test_max_thrust_local_throttle(self):
+        nn = 20
+
+        class LocalThrottleDeck(EngineDeck):
+            def _set_variable_flags(self):
+                super()._set_variable_flags()
+                self.global_throttle = False
+
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs']
+
+        model = LocalThrottleDeck('engine', aviary_values)
+
+        # throttles normalized per flight condition have the same max everywhere, so
+        # the reduced table is used
+        engine_group = model.build_mission(nn, aviary_values)
+        self.assertFalse(hasattr(engine_group, 'interp_max_throttles'))
+
+        prob = om.Problem()
+        engine_group.set_input_defaults(Dynamic.Mission.MACH, np.zeros(nn))
+        prob.model.add_subsystem('engine', engine_group, promotes=['*'])
+        prob.setup()
+
+        prob.set_val(Dynamic.Mission.MACH, np.linspace(0, 0.85, nn))
+        prob.set_val(Dynamic.Mission.ALTITUDE, np.linspace(0, 40000, nn), 'ft')
+        prob.set_val(Dynamic.Mission.THROTTLE, np.ones(nn))
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('thrust_net_max_unscaled', 'lbf'),
+                          prob.get_val('thrust_net_unscaled', 'lbf'), 1e-10)
+
+        # max throttles that vary with flight condition are interpolated and the full
+        # table is evaluated at them
+        mach, altitude = model._get_flight_conditions()
+        model.throttle_max = np.linspace(0.9, 1., mach.size)
+        nn = mach.size
+
+        engine_group = model.build_mission(nn, aviary_values)
+        self.assertTrue(hasattr(engine_group, 'interp_max_throttles'))
+
+        prob = om.Problem()
+        engine_group.set_input_defaults(Dynamic.Mission.MACH, np.zeros(nn))
+        prob.model.add_subsystem('engine', engine_group, promotes=['*'])
+        prob.setup()
+
+        prob.set_val(Dynamic.Mission.MACH, mach)
+        prob.set_val(Dynamic.Mission.ALTITUDE, altitude, 'ft')
+        prob.set_val(Dynamic.Mission.THROTTLE, model.throttle_max)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('thrust_net_max_unscaled', 'lbf'),
+                          prob.get_val('thrust_net_unscaled', 'lbf'), 1e-10)
+
+    def test_pack_data(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs']
+
+        model = EngineDeck('engine', aviary_values)
+
+        # Mach 0 has a single data point at 10000 ft, and the last Mach, altitude
+        # combination has the most data points
+        model.data = {
+            keys.MACH: np.array([0., 0., 0., 0.5, 0.5, 0.5, 0.5, 0.5]),
+            keys.ALTITUDE: np.array([0., 0., 1e4, 0., 0., 1e4, 1e4, 1e4]),
+            keys.THROTTLE: np.array([0.5, 1., 1., 0.5, 1., 0., 0.5, 1.]),
+            keys.HYBRID_THROTTLE: np.zeros(8),
+            keys.THRUST: np.arange(1., 9.)}
+        model._pack_data()
+
+        self.assertEqual(model.mach_max_count, 2)
+        self.assertEqual(model.alt_max_count, 2)
+        # the last combination is included in the max count
+        self.assertEqual(model.data_max_count, 3)
+        # a single data point is counted like two points, but only its own point is
+        # packed
+        np.testing.assert_array_equal(model.data_indices, [[1, 1], [1, 2]])
+        np.testing.assert_array_equal(model.packed_data[keys.THRUST],
+                                      [[[1., 2., 0.], [3., 0., 0.]],
+                                       [[4., 5., 0.], [6., 7., 8.]]])
+
 
 if __name__ == "__main__":
     # unittest.main()
@@ -260,7 +260,7 @@ class SubsystemBuilderBase(ABC):
         """
         return []
 
-    def preprocess_inputs(self, aviary_inputs):
+    def preprocess_inputs(self, aviary_inputs, **kwargs):
         """
         Preprocess the inputs to the subsystem, returning a modified AviaryValues object.
 
@@ -271,6 +271,8 @@ class SubsystemBuilderBase(ABC):
         ----------
         aviary_inputs : dict
             A dictionary containing the inputs to the subsystem.
+        **kwargs
+            Pre-mission options of the subsystem, for core subsystems.
         """
         return aviary_inputs
 
@@ -9,6 +9,8 @@ from enum import Enum
 from pathlib import Path
 
 from aviary.api import NamedValues
+from aviary.subsystems.aerodynamics.gasp_based.table_based import AERO_GRID_SUFFIX, \
+    write_aero_grid
 from aviary.utils.csv_data_file import write_data_file
 from aviary.utils.functions import get_path
 
@@ -86,6 +88,39 @@ def AeroDataConverter(input_file=None, output_file=None, data_format=None):
                         zero_lift_drag_comments, include_timestamp=True)
 
 
+def AeroGridConverter(input_file, output_file=None, table_type='free'):
+    """
+    Convert a GASP-based aero table in Aviary format into the binary structured grid
+    used by the table-based aerodynamics, so it is not restructured every time a phase
+    is set up.
+
+    Parameters
+    ----------
+    input_file : str or Path
+        Aviary data file containing the aero table.
+    output_file : str or Path, optional
+        Path of the grid file to be written. Defaults to the input file with the '.grid'
+        suffix.
+    table_type : str
+        Kind of table: 'free' (free-air lift and drag), 'flaps' (increments due to
+        flaps), or 'ground' (increments due to ground effects).
+
+    Returns
+    -------
+    Path
+        Path of the grid file.
+    """
+    data_file = get_path(input_file)
+
+    if not output_file:
+        output_file = data_file.with_suffix(AERO_GRID_SUFFIX)
+
+    output_file = Path(output_file)
+    write_aero_grid(output_file, data_file, table_type)
+
+    return output_file
+
+
 def _load_flops_aero_table(filepath: Path):
     """Load an aero table in FLOPS format"""
 
@@ -236,6 +271,49 @@ def _load_gasp_aero_table(filepath: Path):
     return data, comments
 
 
+def _setup_aero_grid_parser(parser):
+    """
+    Set up the command line options for the aero grid converter.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument(
+        'input_file',
+        type=str,
+        help='Aviary aero table to be converted, including partial or complete path.')
+    parser.add_argument(
+        '-o',
+        '--output_file',
+        default=None,
+        help='Filename of the grid file. Defaults to the input file with the '
+             f'{AERO_GRID_SUFFIX} suffix.')
+    parser.add_argument(
+        '-t',
+        '--table_type',
+        choices=['free', 'flaps', 'ground'],
+        required=True,
+        help='Kind of table: free-air lift and drag, or increments due to flaps or '
+             'ground effects.')
+
+
+def _exec_aero_grid(args, user_args):
+    """
+    Run the aero grid converter.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    output_file = AeroGridConverter(args.input_file, args.output_file, args.table_type)
+    print(f'Aero grid written to {output_file}')
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Converts FLOPS- or GASP-formatted '
                                      'aero data files into Aviary csv format.\n')
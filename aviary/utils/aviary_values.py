@@ -19,6 +19,7 @@ class AviaryValues
 from enum import EnumMeta
 
 import numpy as np
+from openmdao.core.constants import _UNDEFINED
 from openmdao.utils.units import convert_units as _convert_units
 
 from aviary.utils.named_values import (NamedValues, get_items, get_keys,
@@ -31,6 +32,98 @@ class AviaryValues(NamedValues):
     Define a collection of aviary values with associated units and aviary tests.
     '''
 
+    _access_hook = None
+
+    def set_access_hook(self, hook):
+        '''
+        Set a function that is called each time an item is read, checked, or set.
+
+        The hook is kept by shallow copies, which share the items of this collection,
+        but not by deep copies or pickles.
+
+        Parameters
+        ----------
+        hook : callable or None
+            called as `hook(access, key, item)`, where access is 'read', 'check' or
+            'set', and item is the `(val, units)` of the item, or `_UNDEFINED` if it
+            does not exist; None removes the hook
+        '''
+        self._access_hook = hook
+
+    def get_item(self, key, default=(None, None)):
+        '''
+        Return the named value and its associated units.
+
+        Note, this method never raises `KeyError` or `TypeError`.
+
+        Parameters
+        ----------
+        key : str
+            the name of the item
+
+        default : OptionalValueAndUnits (None, None)
+            if the item does not exist, return this object
+
+        Returns
+        -------
+        OptionalValueAndUnits
+        '''
+        item = super().get_item(key, _UNDEFINED)
+
+        if self._access_hook is not None:
+            self._access_hook('read', key, item)
+
+        if item is _UNDEFINED:
+            return default
+
+        return item
+
+    def get_val(self, key, units='unitless'):
+        '''
+        Return the named value in the specified units.
+
+        Parameters
+        ----------
+        key : str
+            the name of the item
+
+        units : str ('unitless')
+            the units of the returned value
+
+        Returns
+        -------
+        val
+        '''
+        if self._access_hook is not None:
+            self._access_hook('read', key, super().get_item(key, _UNDEFINED))
+
+        return super().get_val(key, units)
+
+    def __contains__(self, key):
+        '''
+        Return whether or not the named value exists.
+        '''
+        if self._access_hook is not None:
+            self._access_hook('check', key, super().get_item(key, _UNDEFINED))
+
+        return super().__contains__(key)
+
+    def __copy__(self):
+        new = type(self).__new__(type(self))
+        new._mapping = self._mapping
+
+        if self._access_hook is not None:
+            new._access_hook = self._access_hook
+
+        return new
+
+    def __getstate__(self):
+        # the hook is not part of the values
+        return self._mapping
+
+    def __setstate__(self, state):
+        self._mapping = state
+
     def set_val(self, key, val, units='unitless', meta_data=_MetaData):
         '''
         Update the named value and its associated units.
@@ -71,6 +164,9 @@ class AviaryValues(NamedValues):
 
         super().set_val(key=key, val=my_val, units=units)
 
+        if self._access_hook is not None:
+            self._access_hook('set', key, (my_val, units))
+
     def _check_type(self, key, val, meta_data=_MetaData):
         if key in meta_data.keys():
             expected_types = meta_data[key]['types']
@@ -3,6 +3,7 @@ import numpy as np
 import re
 import warnings
 
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +13,19 @@ from aviary.utils.named_values import get_items, get_keys
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 
+# maximum number of data files remembered by read_data_file()
+DATA_FILE_CACHE_SIZE = 64
+
+_data_file_cache = OrderedDict()
+
+
+def clear_data_file_cache():
+    """
+    Forget all data files remembered by read_data_file(), so they are read again the
+    next time they are requested.
+    """
+    _data_file_cache.clear()
+
 
 def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                    save_comments=False):
@@ -45,12 +59,17 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
     comments : list of str
         any comments from file, with comment characters ('#') stripped out (only if 
         save_comments=True)
+
+    Notes
+    -----
+    When metadata is not provided, the contents of each file are remembered for the rest
+    of the session, so reading the same unchanged file again with the same aliases does
+    not parse it a second time. The remembered arrays are read-only and never handed
+    out: every call returns a new NamedValues with its own copies, which the caller is
+    free to modify in place.
     """
     filepath = get_path(filename)
 
-    data = NamedValues()
-    comments = []
-
     # prep aliases for case-insensitive matching, with spaces == underscores
     if aliases:
         for key in aliases:
@@ -58,12 +77,56 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                 aliases[key] = [aliases[key]]
             aliases[key] = [re.sub('\s', '_', item).lower() for item in aliases[key]]
 
+    # metadata can be modified between reads, so only files read without it are cached
+    cache_key = None
+    if metadata is None:
+        file_stat = Path(filepath).stat()
+        cache_key = (str(Path(filepath).resolve()), file_stat.st_mtime_ns,
+                     file_stat.st_size,
+                     None if not aliases else
+                     tuple((key, tuple(aliases[key])) for key in aliases))
+
+    if cache_key in _data_file_cache:
+        _data_file_cache.move_to_end(cache_key)
+        data, comments = _data_file_cache[cache_key]
+        data = data.deepcopy()
+        comments = comments.copy()
+
+    else:
+        data, comments = _read_data_file(filepath, metadata, aliases)
+
+        if cache_key is not None:
+            cached_data = data.deepcopy()
+            for (key, (val, units)) in cached_data:
+                val.flags.writeable = False
+            _data_file_cache[cache_key] = (cached_data, comments.copy())
+            if len(_data_file_cache) > DATA_FILE_CACHE_SIZE:
+                _data_file_cache.popitem(last=False)
+
+    if save_comments:
+        return data, comments
+    else:
+        return data
+
+
+def _read_data_file(filepath, metadata, aliases, bulk=True):
+    """
+    Parse a data file in Aviary format, returning its data and comments.
+
+    If bulk is True, the numerical data after the first data line is read in bulk when
+    possible, instead of line by line.
+    """
+    data = NamedValues()
+    comments = []
+    bulk_data = None
+
     with open(filepath, newline=None, encoding='utf-8-sig') as file:
+        lines = file.readlines()
         # csv.reader() and other avaliable packages that can read csv files are not used
         # Manual control of file reading ensures that comments are kept intact and other
         # checks can be performed
         check_for_header = True
-        for line_count, line_data in enumerate(file):
+        for line_count, line_data in enumerate(lines):
             # if comments are present in line, strip them out
             if '#' in line_data:
                 index = line_data.index('#')
@@ -163,14 +226,58 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
                 # valid_indices matches dictionary order, pull data from correct column
                 raw_data[variable].append(line_data[valid_indices[idx]])
 
+            # the rest of the file is usually only rows of numbers like this one, which
+            # are read all at once
+            if bulk:
+                bulk = False
+                bulk_data = _read_numerical_lines(lines[line_count + 1:], len(line_data))
+
+                if bulk_data is not None:
+                    comments.extend(bulk_data[1])
+                    break
+
     # store data in NamedValues object
-    for variable in header.keys():
-        data.set_val(variable, val=np.array(raw_data[variable]), units=header[variable])
+    for idx, variable in enumerate(header.keys()):
+        if bulk_data is None:
+            val = np.array(raw_data[variable])
+        else:
+            val = np.concatenate((raw_data[variable],
+                                  bulk_data[0][:, valid_indices[idx]]))
 
-    if save_comments:
-        return data, comments
-    else:
-        return data
+        data.set_val(variable, val=val, units=header[variable])
+
+    return data, comments
+
+
+def _read_numerical_lines(lines, num_columns):
+    """
+    Read lines of numerical data in bulk, returning a 2D array of their values and any
+    comments found in them.
+
+    Returns None if any line is not num_columns numbers separated by delimiters, so the
+    lines have to be read one at a time instead.
+    """
+    text = ''.join(lines)
+    comments = []
+
+    if '#' in text:
+        comments = [comment.strip() for comment in re.findall('#(.*)', text)]
+        text = re.sub('#.*', '', text)
+
+    rows = [row for row in text.replace(';', ',').splitlines() if row.strip()]
+
+    if not rows:
+        return np.empty((0, num_columns)), comments
+
+    try:
+        values = np.loadtxt(rows, delimiter=',', ndmin=2)
+    except ValueError:
+        return None
+
+    if values.shape[1] != num_columns:
+        return None
+
+    return values, comments
 
 
 def write_data_file(filename: (str, Path) = None, data: NamedValues = None,
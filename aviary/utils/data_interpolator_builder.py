@@ -2,6 +2,7 @@ import warnings
 import numpy as np
 import openmdao.api as om
 
+from collections import OrderedDict
 from pathlib import Path
 
 from aviary.utils.named_values import get_keys, get_items
@@ -9,6 +10,20 @@ from aviary.utils.csv_data_file import read_data_file
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 
+# maximum number of formatted data sets remembered by build_data_interpolator()
+INTERPOLATOR_DATA_CACHE_SIZE = 64
+
+# formatted data, stored as read-only arrays that are only ever handed out as copies, so
+# the data of a caller never shares memory with the cache or with other callers
+_interpolator_data_cache = OrderedDict()
+
+
+def clear_interpolator_data_cache():
+    """
+    Forget all formatted data remembered by build_data_interpolator().
+    """
+    _interpolator_data_cache.clear()
+
 
 def build_data_interpolator(num_nodes, interpolator_data=None, interpolator_outputs=None,
                             method='slinear', extrapolate=True, structured=None,
@@ -68,6 +83,98 @@ def build_data_interpolator(num_nodes, interpolator_data=None, interpolator_outp
     if isinstance(interpolator_data, Path):
         interpolator_data = read_data_file(interpolator_data)
 
+    # Sorting and structuring the same data again gives the same result, so it is only
+    # done the first time each data set is seen
+    cache_key = _get_cache_key(interpolator_data, interpolator_outputs, structured,
+                               training_data)
+
+    if cache_key is not None and cache_key in _interpolator_data_cache:
+        _interpolator_data_cache.move_to_end(cache_key)
+        formatted_data, indep_keys, structured = _interpolator_data_cache[cache_key]
+        interpolator_data.clear()
+        interpolator_data.update(formatted_data.deepcopy())
+
+    else:
+        indep_keys, structured = format_interpolator_data(
+            interpolator_data, interpolator_outputs, structured, training_data)
+
+        if cache_key is not None:
+            formatted_data = NamedValues()
+            for (key, (val, units)) in get_items(interpolator_data):
+                val = np.array(val)
+                val.flags.writeable = False
+                formatted_data.set_val(key, val, units)
+
+            _interpolator_data_cache[cache_key] = (formatted_data, indep_keys,
+                                                   structured)
+            if len(_interpolator_data_cache) > INTERPOLATOR_DATA_CACHE_SIZE:
+                _interpolator_data_cache.popitem(last=False)
+
+    # create interpolation component
+    if structured:
+        interp_comp = om.MetaModelStructuredComp(method=method,
+                                                 extrapolate=extrapolate,
+                                                 vec_size=num_nodes,
+                                                 training_data_gradients=training_data)
+    else:
+        interp_comp = om.MetaModelSemiStructuredComp(
+            method=method, extrapolate=extrapolate, vec_size=num_nodes,
+            training_data_gradients=training_data)
+
+    # add interpolator inputs
+    for key in indep_keys:
+        values, units = interpolator_data.get_item(key)
+        interp_comp.add_input(key,
+                              training_data=values,
+                              units=units)
+    # add interpolator outputs
+    for key in interpolator_outputs:
+        if key in interpolator_data:
+            values, units = interpolator_data.get_item(key)
+        if training_data:
+            units = interpolator_outputs[key]
+            interp_comp.add_output(key,
+                                   units=units)
+        else:
+            interp_comp.add_output(key,
+                                   training_data=values,
+                                   units=units)
+
+    return interp_comp
+
+
+def format_interpolator_data(interpolator_data, interpolator_outputs, structured=None,
+                             training_data=False):
+    """
+    Sort and structure interpolator_data in place as needed for the requested type of
+    metamodel component, as done by build_data_interpolator().
+
+    Parameters
+    ----------
+
+    interpolator_data : NamedValues
+        Data required for interpolation, modified in place.
+
+    interpolator_outputs : dict
+        Dictionary describing the names of dependent variables (keys) and their
+        units (values).
+
+    structured : bool, optional
+        Flag to set if interpolation data must be a structured grid. If None, the
+        structure of the provided data is kept.
+
+    training_data : bool, optional
+        Flag that sets if dependent data for interpolation will be passed via openMDAO
+        connections, in which case only independent variables are formatted.
+
+    Returns
+    -------
+    indep_keys : list of str
+        Names of the independent variables, in interpolation order.
+
+    structured : bool
+        Flag that is True if the structured metamodel component must be used.
+    """
     # Pre-format data: Independent variables placed before dependent variables - position
     #                  of these variables relative to others of their type is preserved
     #                  All data converted to numpy arrays
@@ -205,35 +312,21 @@ def build_data_interpolator(num_nodes, interpolator_data=None, interpolator_outp
             val = np.unique(val)
             interpolator_data.set_val(key, val, units)
 
-    # create interpolation component
-    if structured:
-        interp_comp = om.MetaModelStructuredComp(method=method,
-                                                 extrapolate=extrapolate,
-                                                 vec_size=num_nodes,
-                                                 training_data_gradients=training_data)
-    else:
-        interp_comp = om.MetaModelSemiStructuredComp(method=method,
-                                                     extrapolate=extrapolate,
-                                                     vec_size=num_nodes,
-                                                     training_data_gradients=training_data)
+    return list(get_keys(indep_vars)), structured
 
-    # add interpolator inputs
-    for key in get_keys(indep_vars):
-        values, units = interpolator_data.get_item(key)
-        interp_comp.add_input(key,
-                              training_data=values,
-                              units=units)
-    # add interpolator outputs
-    for key in interpolator_outputs:
-        if key in interpolator_data:
-            values, units = interpolator_data.get_item(key)
-        if training_data:
-            units = interpolator_outputs[key]
-            interp_comp.add_output(key,
-                                   units=units)
-        else:
-            interp_comp.add_output(key,
-                                   training_data=values,
-                                   units=units)
 
-    return interp_comp
+def _get_cache_key(interpolator_data, interpolator_outputs, structured, training_data):
+    """
+    Return a hashable key identifying the contents of interpolator_data and all
+    arguments of build_data_interpolator() that affect how the data is formatted, or
+    None if the data cannot be identified by its contents.
+    """
+    data_key = []
+    for (key, (val, units)) in get_items(interpolator_data):
+        val = np.asarray(val)
+        if val.dtype.hasobject:
+            return None
+        data_key.append((key, units, val.dtype.str, val.shape, val.tobytes()))
+
+    return (tuple(data_key), tuple(interpolator_outputs.items()), structured,
+            training_data)
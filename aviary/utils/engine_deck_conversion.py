@@ -3,15 +3,17 @@
 import argparse
 import getpass
 import itertools
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
-from dymos.models.atmosphere import USatm1976Comp
 from openmdao.components.interp_util.interp import InterpND
+from openmdao.utils.om_warnings import warn_deprecation
 
+from aviary.subsystems.atmosphere.atmosphere import standard_atmosphere
 from aviary.subsystems.propulsion.engine_deck import normalize
 from aviary.subsystems.propulsion.utils import EngineModelVariables, default_units
 from aviary.variable_info.variables import Dynamic
@@ -69,7 +71,9 @@ def EngineDeckConverter(input_file=None, output_file=None, data_format=None):
     Converts FLOPS- or GASP-formatted engine decks into Aviary csv format.
     FLOPS decks are changed from column-delimited to csv format with added headers.
     GASP decks are reorganized into csv. T4 is recovered using assumptions used in GASPy.
-    Data points whose T4 exceeds T4max are removed.
+    Data points whose T4 exceeds T4max are removed. Converted data is sorted by Mach
+    number, then altitude, then throttle.
+    To convert a whole directory of engine decks, use convert_engine_decks.
 
     Parameters
     ----------
@@ -97,31 +101,16 @@ def EngineDeckConverter(input_file=None, output_file=None, data_format=None):
         f'# {data_format.value}-derived engine deck converted from {data_file.name}')
     if data_format == EngineDeckType.FLOPS:
         header = {key: default_units[key] for key in flops_keys}
-        data = {key: np.array([]) for key in flops_keys}
 
         with open(data_file, newline='', encoding='utf-8-sig') as file:
-            reader = _read_flops_engine(file)
-            data_starts = False
-
-            for line in reader:
-                if not data_starts:
-                    # pull out comments before data starts
-                    if line[0][0] == '#':
-                        comments.append(line)
-                        continue
-                    data_starts = True
-
-                data[MACH] = np.append(data[MACH], line[0])
-                data[ALTITUDE] = np.append(data[ALTITUDE], line[1])
-                data[THROTTLE] = np.append(data[THROTTLE], line[2])
-                data[GROSS_THRUST] = np.append(data[GROSS_THRUST], line[3])
-                data[RAM_DRAG] = np.append(data[RAM_DRAG], line[4])
-                data[FUEL_FLOW] = np.append(data[FUEL_FLOW], line[5])
-                data[NOX_RATE] = np.append(data[NOX_RATE], line[6])
-                # data[EXIT_AREA].append(line[7])
+            file_comments, values = _read_flops_engine(file)
+
+        comments.extend(file_comments)
+        data = {key: values[:, idx] for idx, key in enumerate(flops_keys)}
 
     elif data_format == EngineDeckType.GASP:
-        data = {key: [] for key in gasp_keys}
+        keys = list(gasp_keys)
+        data = {}
 
         scalars, tables = _read_gasp_engine(data_file)
         # save scalars as comments
@@ -157,58 +146,17 @@ def EngineDeckConverter(input_file=None, output_file=None, data_format=None):
         # if t4max 100 or less, it is actually throttle. Remove temperature as variable
         if t4max <= 100:
             compute_T4 = False
-            data.pop(TEMPERATURE)
             # temperature is assumed last in keys
-            gasp_keys.pop(-1)
+            keys.pop(-1)
         else:
             compute_T4 = True
 
         # define header now that we know what is in the engine deck
-        header = {key: default_units[key] for key in gasp_keys}
+        header = {key: default_units[key] for key in keys}
 
         if compute_T4:
             # compute T4 using atmospheric model
-            prob = om.Problem()
-
-            prob.model.add_subsystem('T4T2', om.IndepVarComp('T4:T2',
-                                                             T4T2,
-                                                             units='unitless'),
-                                     promotes=['*'])
-
-            prob.model.add_subsystem(
-                Dynamic.Mission.MACH,
-                om.IndepVarComp(
-                    Dynamic.Mission.MACH,
-                    data[MACH],
-                    units='unitless'),
-                promotes=['*'])
-
-            prob.model.add_subsystem(
-                Dynamic.Mission.ALTITUDE,
-                om.IndepVarComp(
-                    Dynamic.Mission.ALTITUDE,
-                    data[ALTITUDE],
-                    units='ft'),
-                promotes=['*'])
-
-            prob.model.add_subsystem(
-                name='atmosphere',
-                subsys=USatm1976Comp(num_nodes=len(data[MACH])),
-                promotes_inputs=[('h', Dynamic.Mission.ALTITUDE)],
-                promotes_outputs=[('temp', Dynamic.Mission.TEMPERATURE)])
-
-            prob.model.add_subsystem(
-                name='conversion',
-                subsys=AtmosCalc(num_nodes=len(data[MACH])),
-                promotes_inputs=[Dynamic.Mission.MACH,
-                                 Dynamic.Mission.TEMPERATURE],
-                promotes_outputs=['t2']
-            )
-
-            prob.setup()
-            prob.run_model()
-
-            T2 = prob.get_val('t2')
+            T2, _ = _inlet_conditions(data[MACH], data[ALTITUDE])
             T4 = T2 * T4T2
             data[TEMPERATURE] = T4
             # Throttle is T4 normalized from 0 to 1 (T4max)
@@ -224,48 +172,21 @@ def EngineDeckConverter(input_file=None, output_file=None, data_format=None):
             # remove all points above T4max
             # TODO save these points as commented out?
             valid_idx = np.where(data[THROTTLE] <= 1.0)
-            data[MACH] = data[MACH][valid_idx]
-            data[ALTITUDE] = data[ALTITUDE][valid_idx]
-            data[THROTTLE] = data[THROTTLE][valid_idx]
-            data[THRUST] = data[THRUST][valid_idx]
-            data[FUEL_FLOW] = data[FUEL_FLOW][valid_idx]
-            data[TEMPERATURE] = data[TEMPERATURE][valid_idx]
+            data = {key: data[key][valid_idx] for key in data}
 
         else:
             data[THROTTLE] = T4T2
 
-        # data needs to be string so column length can be easily found later
-        for var in data:
-            data[var] = np.array([str(item) for item in data[var]])
-
     else:
         quit("Invalid engine deck format provided")
 
-    # sort data
-    # create parallel dict to data that stores floats
-    formatted_data = {}
-    for key in data:
-        formatted_data[key] = data[key].astype(float)
-
-    # convert engine_data from dict to list so it can be sorted
-    sorted_values = np.array([formatted_data[key] for key in formatted_data]).transpose()
-
-    # Sort by mach, then altitude, then throttle, then hybrid throttle
-    sorted_values = sorted_values[np.lexsort(
-        [formatted_data[THROTTLE],
-         formatted_data[ALTITUDE],
-         formatted_data[MACH]])]
-    for idx, key in enumerate(formatted_data):
-        formatted_data[key] = sorted_values[:, idx]
-
-    # rework formatted_data into 2d array
-    formatted_data = np.array([formatted_data[key]
-                              for key in header.keys()]).transpose().astype(float)
+    # sort by mach, then altitude, then throttle
+    sorted_idx = np.lexsort([data[THROTTLE], data[ALTITUDE], data[MACH]])
 
-    # store formatted data into NamedValues object
+    # store sorted data into NamedValues object
     write_data = NamedValues()
-    for idx, key in enumerate(data):
-        write_data.set_val(header_names[key], data[key], default_units[key])
+    for key in header:
+        write_data.set_val(header_names[key], data[key][sorted_idx], default_units[key])
 
     write_data_file(output_file, write_data, comments, include_timestamp=False)
 
@@ -273,43 +194,60 @@ def EngineDeckConverter(input_file=None, output_file=None, data_format=None):
 def _read_flops_engine(input_file):
     '''
     Read engine data file using FLOPS standard, which is column delimited data
-    always assumed to be in the order defined in the FLOPS manual
+    always assumed to be in the order defined in the FLOPS manual.
+    Returns the comment lines and an array with a column for each field in flops_keys.
+    The file is read one line at a time into a preallocated array, which doubles in size
+    when it is full.
     '''
-    for line in input_file:
-        sz = len(line)
+    comments = []
+    data = np.empty((_FLOPS_INITIAL_ROWS, len(_flops_fields)))
+    num_rows = 0
 
-        if sz < 80:
-            line = line + (80 - sz) * ' '
+    for line in input_file:
+        if not line.strip():
+            continue
 
         if line[0] == '#':
-            data = line.strip()
-        else:
-            data = [
-                _flops_field_convert(line[0:5]),
-                _flops_field_convert(line[5:15]),
-                _flops_field_convert(line[15:20]),
-                _flops_field_convert(line[20:30]),
-                _flops_field_convert(line[30:40]),
-                _flops_field_convert(line[40:50]),
-                # intenional gap from 50:60 - column is left blank in FLOPS standard
-                _flops_field_convert(line[60:70]),
-                _flops_field_convert(line[70:80]),
-            ]
+            comments.append(line.strip())
+            continue
 
-        yield data
+        if num_rows == data.shape[0]:
+            data = np.concatenate((data, np.empty_like(data)))
+
+        data[num_rows] = [_flops_field_convert(line[start:end])
+                          for start, end in _flops_fields]
+        num_rows += 1
+
+    return comments, data[:num_rows]
 
 
 def _flops_field_convert(arg: str):
     rvalue = arg.strip()
 
     if not rvalue:
-        rvalue = _flops_empty_field
+        return _flops_empty_field
 
-    return rvalue
+    return float(rvalue)
 
 
 # in FLOPS, empty fields are converted to zero
-_flops_empty_field = '0'
+_flops_empty_field = 0.0
+
+# column limits of the fields in flops_keys
+_flops_fields = (
+    (0, 5),
+    (5, 15),
+    (15, 20),
+    (20, 30),
+    (30, 40),
+    (40, 50),
+    # intenional gap from 50:60 - column is left blank in FLOPS standard
+    (60, 70),
+    # (70, 80),  # exit area
+)
+
+# number of rows first allocated for FLOPS engine data
+_FLOPS_INITIAL_ROWS = 1024
 
 
 def _read_gasp_engine(fp):
@@ -355,7 +293,7 @@ def _read_table(f):
     independent variables (altitude, T4/T2, and Mach number) and the final column for
     the table field (one of thrust, fuelflow, or airflow).
     """
-    tab_data = None
+    maps = []
 
     # table title
     title = f.readline().strip()
@@ -371,12 +309,9 @@ def _read_table(f):
         if i < nmaps - 1:
             f.readline()
 
-        if tab_data is None:
-            tab_data = map_data
-        else:
-            tab_data = np.r_[tab_data, map_data]
+        maps.append(map_data)
 
-    return tab_data
+    return np.concatenate(maps)
 
 
 def _rep(n, t):
@@ -460,44 +395,58 @@ def _make_structured_grid(data, method="lagrange3"):
     pts = np.dstack(np.meshgrid(t4t2s, machs, indexing="ij")).reshape(-1, 2)
     npts = pts.shape[0]
 
+    # interpolation weights for each grid in the deck, shared by all maps on that grid
+    weights = {}
+
     for field in ["thrust", "fuelflow", "airflow"]:
         map_data = data[field]
-        all_alts = map_data[:, 0]
-        alts = np.unique(all_alts)
+        alts, alt_idx = np.unique(map_data[:, 0], return_inverse=True)
+        vals = np.empty((alts.size, t4t2s.size, machs.size))
 
-        sizes = (alts.size, t4t2s.size, machs.size)
-        vals = np.zeros(np.prod(sizes), dtype=float)
-        alt_vec = np.zeros(np.prod(sizes), dtype=float)
-        mach_vec = np.zeros(np.prod(sizes), dtype=float)
-        t4t2_vec = np.zeros(np.prod(sizes), dtype=float)
-
-        for i, alt in enumerate(alts):
-            d = map_data[all_alts == alt]
+        for i in range(alts.size):
+            d = map_data[alt_idx == i]
             t4t2 = np.unique(d[:, 1])
             mach = np.unique(d[:, 2])
             f = d[:, 3].reshape(t4t2.size, mach.size)
 
             # would explicitly use lagrange3 here to mimic GASP, but some engine
             # decks may not have enough points per dimension
-            interp = InterpND(
-                method="2D-" + method, points=(t4t2, mach), values=f, extrapolate=True
-            )
-            sl = slice(i * npts, (i + 1) * npts)
-            vals[sl] = interp.interpolate(pts)
-            alt_vec[sl] = [alt] * len(pts)
-            t4t2_vec[sl] = pts[:, 0]
-            mach_vec[sl] = pts[:, 1]
+            t4t2_weights = _get_interp_weights(weights, t4t2, t4t2s, method)
+            mach_weights = _get_interp_weights(weights, mach, machs, method)
+
+            vals[i] = t4t2_weights @ f @ mach_weights.T
 
         structured_data[field] = {
-            "vals": vals,
-            "alts": alt_vec,
-            "t4t2s": t4t2_vec,
-            "machs": mach_vec,
+            "vals": vals.ravel(),
+            "alts": np.repeat(alts, npts),
+            "t4t2s": np.tile(pts[:, 0], alts.size),
+            "machs": np.tile(pts[:, 1], alts.size),
         }
 
     return structured_data
 
 
+def _get_interp_weights(weights, points, x, method):
+    """
+    Return the matrix that interpolates values on 1D grid ``points`` at ``x``.
+    Lagrange and spline interpolation on a 2D grid is the same as interpolating
+    along each axis in turn, so a map is interpolated with one matrix per axis. Matrices
+    are cached in ``weights``.
+    """
+    key = (method, points.tobytes(), x.tobytes())
+
+    if key not in weights:
+        # column k holds the interpolant of the k-th unit vector
+        unit_vals = np.eye(points.size)
+
+        weights[key] = np.stack(
+            [InterpND(method=method, points=points, values=unit_vals[k],
+                      extrapolate=True).interpolate(x)
+             for k in range(points.size)], axis=1)
+
+    return weights[key]
+
+
 def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
     machs = np.unique(data[MACH])
     alts = np.unique(data[ALTITUDE])
@@ -508,63 +457,10 @@ def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
 
     nn = len(mach_list)
 
-    prob = om.Problem()
-
-    prob.model.add_subsystem(
-        Dynamic.Mission.MACH,
-        om.IndepVarComp(
-            Dynamic.Mission.MACH,
-            mach_list,
-            units='unitless'),
-        promotes=['*'])
-
-    prob.model.add_subsystem(
-        Dynamic.Mission.ALTITUDE,
-        om.IndepVarComp(
-            Dynamic.Mission.ALTITUDE,
-            alt_list,
-            units='ft'),
-        promotes=['*'])
-
-    prob.model.add_subsystem(
-        name='atmosphere', subsys=USatm1976Comp(
-            num_nodes=nn), promotes_inputs=[
-            ('h', Dynamic.Mission.ALTITUDE)], promotes_outputs=[
-                ('temp', Dynamic.Mission.TEMPERATURE), ('pres', Dynamic.Mission.STATIC_PRESSURE)])
-
-    prob.model.add_subsystem(
-        name='conversion',
-        subsys=AtmosCalc(
-            num_nodes=nn),
-        promotes_inputs=[
-            Dynamic.Mission.MACH,
-            Dynamic.Mission.TEMPERATURE,
-            Dynamic.Mission.STATIC_PRESSURE],
-        promotes_outputs=[
-            't2',
-            'p2'])
-
-    prob.model.add_subsystem(
-        name='flight_idle',
-        subsys=CalculateIdle(
-            num_nodes=nn,
-            ref_sfn_idle=ref_sfn_idle,
-            ref_sls_airflow=ref_sls_airflow),
-        promotes_inputs=[
-            't2',
-            'p2',
-            'pct_corr_airflow_idle',
-            'sfc_idle'],
-        promotes_outputs=[
-            'idle_thrust',
-            'idle_fuelflow'])
-
-    prob.setup()
-
-    prob.run_model()
-
-    idle_thrust = prob.get_val('idle_thrust')
-    idle_fuelflow = prob.get_val('idle_fuelflow')
+    t2, p2 = _inlet_conditions(mach_list, alt_list)
+
+    idle_thrust, idle_fuelflow = _idle_conditions(
+        t2, p2, ref_sfn_idle=ref_sfn_idle, ref_sls_airflow=ref_sls_airflow)
 
     data[MACH] = np.append(data[MACH], mach_list)
     data[ALTITUDE] = np.append(data[ALTITUDE], alt_list)
@@ -577,14 +473,125 @@ def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
 
 _PSLS_PSF = 2116.22  # SLS pressure in psf
 _TSLS_DEGR = 518.67  # SLS temperature in deg R
+_PSI_TO_PSF = 144.0
+
+
+def _inlet_conditions(mach, altitude):
+    '''
+    Return engine inlet total temperature (degR) and pressure (psf) at the given Mach
+    numbers and altitudes (ft), in the 1976 standard atmosphere
+    '''
+    T, P, _ = standard_atmosphere(altitude)
+
+    return _total_conditions(mach, T, P * _PSI_TO_PSF)
+
+
+def _total_conditions(mach, T, P):
+    '''
+    Return total temperature and pressure at the given Mach numbers, static
+    temperatures and static pressures, in the units of T and P
+    '''
+    gamma = 1.4
+    t2 = T * (1 + 0.5 * (gamma - 1) * mach**2)
+    p2 = P * (t2 / T) ** (gamma / (gamma - 1))
+
+    return t2, p2
+
+
+def _idle_conditions(t2, p2, ref_sfn_idle=1.0, ref_sls_airflow=1.0,
+                     pct_corr_airflow_idle=0.5, sfc_idle=1.0):
+    '''
+    Return idle thrust (lbf) and fuel flow (lbm/h) of a GASP engine for the given engine
+    inlet total temperatures (degR) and pressures (psf)
+
+    Parameters
+    ----------
+    t2 : ndarray
+        engine inlet total temperature, in degR
+    p2 : ndarray
+        engine inlet total pressure, in psf
+    ref_sfn_idle : float
+        idle thrust-specific fuel consumption, from engine deck
+    ref_sls_airflow : float
+        sea-level static airflow of the reference engine
+    pct_corr_airflow_idle : float
+        percent corrected airflow at idle
+    sfc_idle : float
+        thrust-specific fuel consumption at idle, in lbm/h/lbf
+    '''
+    rthet2 = np.sqrt(t2 / _TSLS_DEGR)
+    delta2 = p2 / _PSLS_PSF
+
+    airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
+    thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
+    fuelflow_ref = thrust_ref * sfc_idle
+
+    return thrust_ref, fuelflow_ref
+
+
+def convert_engine_decks(input_dir, output_dir, data_format, pattern='*',
+                         num_procs=None):
+    '''
+    Converts every FLOPS- or GASP-formatted engine deck in a directory into Aviary csv
+    format, converting several decks at the same time in separate processes.
+    Each converted deck is written to output_dir with the name of its engine deck and
+    the ".deck" extension.
+
+    Parameters
+    ----------
+    input_dir : (str, Path)
+        path to directory containing engine deck files to be converted
+    output_dir : (str, Path)
+        path to directory where converted data will be written, created if needed
+    data_format : (EngineDeckType)
+        data format used by all files in input_dir (FLOPS or GASP)
+    pattern : str
+        glob pattern that selects the engine deck files in input_dir
+    num_procs : int
+        number of decks converted at the same time, defaults to the number of
+        processors. With one process, decks are converted one after the other in the
+        current process.
+
+    Returns
+    -------
+    list of Path
+        paths to converted files, in the order of the sorted engine deck files
+    '''
+    input_dir = get_path(input_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    input_files = sorted(path for path in input_dir.glob(pattern) if path.is_file())
+    output_files = [output_dir / (path.stem + '.deck') for path in input_files]
+    data_formats = [EngineDeckType(data_format)] * len(input_files)
+
+    if num_procs == 1:
+        for args in zip(input_files, output_files, data_formats):
+            EngineDeckConverter(*args)
+
+    else:
+        with ProcessPoolExecutor(max_workers=num_procs) as executor:
+            # raises the first error found by a process, if any
+            list(executor.map(EngineDeckConverter,
+                              input_files, output_files, data_formats))
+
+    return output_files
 
 
 class CalculateIdle(om.ExplicitComponent):
     '''
     Calculates idle conditions of a GASP engine at a specified flight condition
     Vectorized to calculate values for entire flight regime
+
+    Deprecated, GASP engine decks are converted without an OpenMDAO problem.
     '''
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        warn_deprecation('CalculateIdle is deprecated and will be removed in a future '
+                         'version of Aviary.')
+
     def initialize(self):
         self.options.declare('num_nodes', types=int)
 
@@ -617,39 +624,30 @@ class CalculateIdle(om.ExplicitComponent):
         )
 
         self.add_output("idle_thrust", units="lbf", shape=nn, desc="Idle thrust")
-        # self.add_output(
-        #     "idle_airflow", units="lbf/s", shape=nn, desc="Idle corrected airflow"
-        # )
         self.add_output("idle_fuelflow", units="lbm/h", shape=nn, desc="Idle fuel flow")
 
     def compute(self, inputs, outputs):
-        (
-            t2,
-            p2,
-            pct_corr_airflow_idle,
-            sfc_idle,
-        ) = inputs.values()
+        t2, p2, pct_corr_airflow_idle, sfc_idle = inputs.values()
 
-        ref_sls_airflow = self.options['ref_sls_airflow']
-        ref_sfn_idle = self.options['ref_sfn_idle']
-
-        rthet2 = np.sqrt(t2 / _TSLS_DEGR)
-        delta2 = p2 / _PSLS_PSF
-
-        airflow_ref = pct_corr_airflow_idle * ref_sls_airflow  # don't un-correct
-        thrust_ref = airflow_ref * delta2 / rthet2 * ref_sfn_idle
-        fuelflow_ref = thrust_ref * sfc_idle
-
-        outputs["idle_thrust"] = thrust_ref
-        # outputs["idle_airflow"] = airflow_ref
-        outputs["idle_fuelflow"] = fuelflow_ref
+        outputs["idle_thrust"], outputs["idle_fuelflow"] = _idle_conditions(
+            t2, p2, ref_sfn_idle=self.options['ref_sfn_idle'],
+            ref_sls_airflow=self.options['ref_sls_airflow'],
+            pct_corr_airflow_idle=pct_corr_airflow_idle, sfc_idle=sfc_idle)
 
 
 class AtmosCalc(om.ExplicitComponent):
     '''
     Calculates T2 and P2 given static temperature and pressure
+
+    Deprecated, GASP engine decks are converted without an OpenMDAO problem.
     '''
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        warn_deprecation('AtmosCalc is deprecated and will be removed in a future '
+                         'version of Aviary.')
+
     def initialize(self):
         self.options.declare('num_nodes', types=int)
 
@@ -676,12 +674,7 @@ class AtmosCalc(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         mach, T, P = inputs.values()
 
-        gamma = 1.4
-        t2 = T * (1 + 0.5 * (gamma - 1) * mach**2)
-        p2 = P * (t2 / T) ** (gamma / (gamma - 1))
-
-        outputs["t2"] = t2
-        outputs["p2"] = p2
+        outputs["t2"], outputs["p2"] = _total_conditions(mach, T, P)
 
 
 if __name__ == '__main__':
@@ -693,12 +686,25 @@ if __name__ == '__main__':
                                      'calculation. Data points whose T4 exceeds T4max '
                                      'are removed.')
     parser.add_argument('input_file', type=str,
-                        help='path to engine deck file to be converted')
+                        help='path to engine deck file to be converted, or to a '
+                        'directory of engine deck files that are all converted')
     parser.add_argument('output_file', type=str,
-                        help='path to file where new converted data will be written')
+                        help='path to file where new converted data will be written, '
+                        'or to a directory when input_file is a directory')
     parser.add_argument('data_format', type=EngineDeckType, choices=list(EngineDeckType),
                         help='data format used by input_file')
+    parser.add_argument('--pattern', type=str, default='*',
+                        help='glob pattern that selects the engine deck files when '
+                        'input_file is a directory')
+    parser.add_argument('-n', '--num_procs', type=int, default=None,
+                        help='number of engine decks converted at the same time when '
+                        'input_file is a directory, defaults to the number of '
+                        'processors')
 
     args = parser.parse_args()
 
-    EngineDeckConverter(**vars(args))
+    if Path(args.input_file).is_dir():
+        convert_engine_decks(args.input_file, args.output_file, args.data_format,
+                             pattern=args.pattern, num_procs=args.num_procs)
+    else:
+        EngineDeckConverter(args.input_file, args.output_file, args.data_format)
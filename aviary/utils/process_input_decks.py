@@ -11,8 +11,11 @@ pyc_phases = taxi, groundroll, rotation, landing
 debug_mode = True
 """
 
+import hashlib
 import os
+import threading
 import warnings
+from collections import OrderedDict
 from operator import eq, ge, gt, le, lt, ne
 
 import numpy as np
@@ -33,8 +36,69 @@ operation_dict = {"<": lt, "<=": le, "==": eq, "!=": ne,
 problem_types = {'sizing': ProblemType.SIZING,
                  'alternate': ProblemType.ALTERNATE, 'fallout': ProblemType.FALLOUT}
 
+# maximum number of vehicle decks remembered by create_vehicle()
+VEHICLE_CACHE_SIZE = 64
+
+_vehicle_cache = OrderedDict()
+_vehicle_cache_lock = threading.Lock()
+
+
+def clear_vehicle_cache():
+    """
+    Forget all vehicle decks remembered by create_vehicle(), so they are parsed again the
+    next time they are requested.
+    """
+    with _vehicle_cache_lock:
+        _vehicle_cache.clear()
+
+
+def _new_initial_guesses():
+    """
+    Return a new copy of the default initial guesses.
+    """
+    return initial_guesses.copy()
+
 
 def create_vehicle(vehicle_deck=''):
+    """
+    Read a vehicle deck and return the options and initial guesses it defines.
+
+    The parsed and validated results are remembered for the rest of the session, keyed
+    by the directory and contents of the file, so creating the same vehicle again does
+    not parse it a second time. Decks with the same contents in different directories
+    are parsed separately, as relative paths in them may point to different files.
+    Every call returns new objects that can be modified freely, and the function can be
+    called from several threads at once.
+
+    Parameters
+    ----------
+    vehicle_deck : (str, Path)
+        filename or filepath of the vehicle deck
+
+    Returns
+    -------
+    aircraft_values : AviaryValues
+        options and inputs defined by the vehicle deck
+    initial_guesses : dict
+        initial guesses used to initialize the trajectory
+    """
+    vehicle_deck = get_path(vehicle_deck)
+
+    with open(vehicle_deck, newline='') as f_in:
+        lines = f_in.readlines()
+
+    cache_key = (str(vehicle_deck.resolve().parent),
+                 hashlib.sha256(''.join(lines).encode()).hexdigest())
+
+    with _vehicle_cache_lock:
+        cached = _vehicle_cache.get(cache_key)
+        if cached is not None:
+            _vehicle_cache.move_to_end(cache_key)
+
+    if cached is not None:
+        aircraft_values, guesses = cached
+        return aircraft_values.deepcopy(), guesses.copy()
+
     aircraft_values = get_option_defaults(engine=False)
 
     # TODO remove all hardcoded GASP values here, find appropriate place for them
@@ -47,61 +111,101 @@ def create_vehicle(vehicle_deck=''):
     aircraft_values.set_val(Aircraft.Electrical.HAS_HYBRID_SYSTEM, val=False)
     aircraft_values.set_val(Aircraft.Design.RESERVES, val=4998)
 
-    vehicle_deck = get_path(vehicle_deck)
+    guesses = _new_initial_guesses()
 
-    parse_inputs(vehicle_deck, aircraft_values)
+    _parse_lines(lines, aircraft_values, guesses, _MetaData)
     # update the dependent options with the current values
-    update_options(aircraft_values, initial_guesses)
+    update_options(aircraft_values, guesses)
+
+    with _vehicle_cache_lock:
+        _vehicle_cache[cache_key] = (aircraft_values.deepcopy(), guesses.copy())
+        if len(_vehicle_cache) > VEHICLE_CACHE_SIZE:
+            _vehicle_cache.popitem(last=False)
+
+    return aircraft_values, guesses
+
+
+def parse_inputs(vehicle_deck, aircraft_values: AviaryValues(), meta_data=_MetaData,
+                 initial_guesses=None):
+    """
+    Read a vehicle deck into aircraft_values and a dictionary of initial guesses.
+
+    Parameters
+    ----------
+    vehicle_deck : (str, Path)
+        filepath of the vehicle deck
+    aircraft_values : AviaryValues
+        collection that the options and inputs of the vehicle deck are added to
+    meta_data : dict, optional
+        variable metadata used to validate the options and inputs
+    initial_guesses : dict, optional
+        initial guesses that are updated by the vehicle deck. If not provided, a new
+        dictionary of the default initial guesses is used.
+
+    Returns
+    -------
+    aircraft_values : AviaryValues
+        options and inputs defined by the vehicle deck
+    initial_guesses : dict
+        initial guesses defined by the vehicle deck
+    """
+    if initial_guesses is None:
+        initial_guesses = _new_initial_guesses()
+
+    with open(vehicle_deck, newline='') as f_in:
+        _parse_lines(f_in, aircraft_values, initial_guesses, meta_data)
 
     return aircraft_values, initial_guesses
 
 
-def parse_inputs(vehicle_deck, aircraft_values: AviaryValues(), meta_data=_MetaData):
+def _parse_lines(lines, aircraft_values, initial_guesses, meta_data):
+    """
+    Add the options, inputs, and initial guesses from the lines of a vehicle deck.
+    """
     guess_names = list(initial_guesses.keys())
 
-    with open(vehicle_deck, newline='') as f_in:
-        for line in f_in:
-            used, data_units = False, None
+    for line in lines:
+        used, data_units = False, None
 
-            tmp = [*line.split('#', 1), '']
-            line, comment = tmp[0], tmp[1]  # anything after the first # is a comment
+        tmp = [*line.split('#', 1), '']
+        line, comment = tmp[0], tmp[1]  # anything after the first # is a comment
 
-            data = ''.join(line.rstrip(',').split())  # remove all white space
+        data = ''.join(line.rstrip(',').split())  # remove all white space
 
-            if len(data) == 0:
-                continue  # skip line if it contains only white space
+        if len(data) == 0:
+            continue  # skip line if it contains only white space
 
-            # remove any elements that are empty (caused by trailing commas or extra commas)
-            data_list = [dat for dat in data.split(',') if dat != '']
-            var_name = data_list.pop(0)
-            if valid_units(data_list[-1]):
-                # if the last element is a unit, remove it from the list and update the variable's units
-                data_units = data_list.pop()
+        # remove any elements that are empty (caused by trailing commas or extra commas)
+        data_list = [dat for dat in data.split(',') if dat != '']
+        var_name = data_list.pop(0)
+        if valid_units(data_list[-1]):
+            # if the last element is a unit, remove it from the list and update the
+            # variable's units
+            data_units = data_list.pop()
 
-            is_array = False
-            if '[' in data_list[0]:
-                is_array = True
+        is_array = False
+        if '[' in data_list[0]:
+            is_array = True
 
-            var_values = convert_strings_to_data(data_list)
+        var_values = convert_strings_to_data(data_list)
 
-            if var_name == 'debug_mode':
-                aircraft_values = set_value(var_name, var_values, aircraft_values)
-                continue
+        if var_name == 'debug_mode':
+            aircraft_values = set_value(var_name, var_values, aircraft_values)
+            continue
 
-            elif var_name in meta_data.keys():
-                aircraft_values = set_value(
-                    var_name, var_values, aircraft_values, units=data_units, is_array=is_array, meta_data=meta_data)
-                continue
+        elif var_name in meta_data.keys():
+            aircraft_values = set_value(
+                var_name, var_values, aircraft_values, units=data_units,
+                is_array=is_array, meta_data=meta_data)
+            continue
 
-            elif var_name in guess_names:
-                # all initial guesses take only a single value
-                initial_guesses[var_name] = float(var_values[0])
-                continue
+        elif var_name in guess_names:
+            # all initial guesses take only a single value
+            initial_guesses[var_name] = float(var_values[0])
+            continue
 
-            if 'debug_mode' in aircraft_values and aircraft_values.get_val('debug_mode'):
-                print('Unused:', var_name, var_values, comment)
-
-    return aircraft_values, initial_guesses
+        if 'debug_mode' in aircraft_values and aircraft_values.get_val('debug_mode'):
+            print('Unused:', var_name, var_values, comment)
 
 
 def update_options(aircraft_values: AviaryValues(), initial_guesses):
@@ -129,7 +233,7 @@ def update_options(aircraft_values: AviaryValues(), initial_guesses):
         aircraft_values.set_val(
             Aircraft.Wing.FOLD_DIMENSIONAL_LOCATION_SPECIFIED, val=False)
 
-    initial_guessing(aircraft_values)
+    initial_guessing(aircraft_values, initial_guesses)
 
     if aircraft_values.get_val('debug_mode'):
         print('\nOptions')
@@ -162,7 +266,10 @@ def update_dependent_options(aircraft_values: AviaryValues(), dependent_options)
     return aircraft_values
 
 
-def initial_guessing(aircraft_values: AviaryValues()):
+def initial_guessing(aircraft_values: AviaryValues(), initial_guesses=None):
+    if initial_guesses is None:
+        initial_guesses = _new_initial_guesses()
+
     problem_type = aircraft_values.get_val('problem_type')
     reserves = aircraft_values.get_val(
         Aircraft.Design.RESERVES) if initial_guesses['reserves'] == 0 else initial_guesses['reserves']
@@ -292,7 +399,10 @@ dependent_options = [
 ]
 
 initial_guesses = {
-    # initial_guesses is a dictionary that contains values used to initialize the trajectory
+    # initial_guesses is a dictionary that contains values used to initialize the
+    # trajectory
+    # these are the defaults, which are copied (never modified) each time a deck is
+    # parsed
     'actual_takeoff_mass': 0,
     'rotation_mass': .99,
     'operating_empty_mass': 0,
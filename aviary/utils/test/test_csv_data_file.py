@@ -1,15 +1,29 @@
+import os
+import shutil
+import time
 import unittest
 import warnings
 
+import numpy as np
+from pathlib import Path
+
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.utils.csv_data_file import write_data_file, read_data_file
+from aviary.utils.csv_data_file import write_data_file, read_data_file, \
+    clear_data_file_cache, _read_data_file
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues, get_items, get_keys
 from aviary.variable_info.variable_meta_data import CoreMetaData, add_meta_data
 
 
+# largest data files shipped with Aviary
+data_files = [
+    'models/engines/turbofan_24k_2.deck',
+    'models/engines/turbofan_23k_1.deck',
+    'subsystems/aerodynamics/gasp_based/data/large_single_aisle_1_aero_free.txt']
+
+
 @use_tempdirs
 class TestAviaryCSV(unittest.TestCase):
     def setUp(self):
@@ -80,6 +94,56 @@ class TestAviaryCSV(unittest.TestCase):
         if 'Real Var' not in get_keys(data):
             raise RuntimeError("'Real Var' is not in data read from csv")
 
+    def test_read_cached(self):
+        shutil.copy(self.filename, 'cached.csv')
+        clear_data_file_cache()
+
+        data = read_data_file('cached.csv')
+        data.set_val('fake_var', [0., 0., 0., 0.], 'lbm')
+
+        # the cached contents are returned in a new object with arrays of its own
+        data.get_item('aircraft:wing:span')[0][0] = 0.
+
+        cached_data, comments = read_data_file('cached.csv', save_comments=True)
+        self._compare_csv_results(cached_data, comments)
+        self.assertIsNot(cached_data.get_item('aircraft:wing:span')[0],
+                         data.get_item('aircraft:wing:span')[0])
+        cached_data.get_item('aircraft:wing:span')[0][0] = 0.
+
+        # modified files are read again
+        write_data_file('cached.csv', NamedValues({'fake_var': ([1., 2.], 'lbm')}))
+        stat = os.stat('cached.csv')
+        os.utime('cached.csv', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert_near_equal(read_data_file('cached.csv').get_val('fake_var', 'lbm'),
+                          np.array([1., 2.]))
+
+    def test_read_bulk(self):
+        # the data is read in bulk, except where the lines do not allow it
+        for filename in data_files + ['utils/test/csv_test.csv']:
+            with self.subTest(filename=filename):
+                filepath = get_path(filename)
+                data, comments = _read_data_file(filepath, None, None)
+                expected_data, expected_comments = _read_data_file(filepath, None, None,
+                                                                   bulk=False)
+
+                self.assertEqual(comments, expected_comments)
+                self.assertEqual(list(get_keys(data)), list(get_keys(expected_data)))
+
+                for key, (val, units) in get_items(expected_data):
+                    self.assertEqual(data.get_item(key)[1], units)
+                    assert_near_equal(data.get_item(key)[0], val, 1e-15)
+
+        with open('bad_row.csv', 'w') as file:
+            file.write('x, y\n1, 2\n3, 4\n5, b\n')
+
+        with self.assertRaises(ValueError) as cm:
+            read_data_file('bad_row.csv')
+
+        self.assertEqual(str(cm.exception),
+                         'Non-numerical value found in data file '
+                         f'<{get_path("bad_row.csv")}> on line 3')
+
     def _compare_csv_results(self, data, comments):
         expected_data = self.data
 
@@ -99,5 +163,26 @@ class TestAviaryCSV(unittest.TestCase):
                                  f'match expected units of {expected_units}')
 
 
+class DataFileBenchmark(unittest.TestCase):
+    def bench_test_read_data_file(self):
+        num_runs = 5
+
+        print(f'\n{"data file":<40}{"line by line (ms)":>20}{"bulk (ms)":>12}')
+
+        for filename in data_files:
+            filepath = get_path(filename)
+            run_times = []
+
+            for bulk in (False, True):
+                start_time = time.perf_counter()
+
+                for _ in range(num_runs):
+                    _read_data_file(filepath, None, None, bulk=bulk)
+
+                run_times.append(1000 * (time.perf_counter() - start_time) / num_runs)
+
+            print(f'{Path(filename).name:<40}{run_times[0]:>20.1f}{run_times[1]:>12.1f}')
+
+
 if __name__ == "__main__":
     unittest.main()
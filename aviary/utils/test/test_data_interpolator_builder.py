@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.utils.data_interpolator_builder import build_data_interpolator, \
+    clear_interpolator_data_cache, _interpolator_data_cache
+from aviary.utils.named_values import NamedValues
+
+
+class DataInterpolatorCacheTest(unittest.TestCase):
+    def setUp(self):
+        clear_interpolator_data_cache()
+
+        # unsorted semistructured data
+        x, y = np.meshgrid([1., 0., 2.], [3., 4.], indexing='ij')
+        self.data = NamedValues({'x': (x.flatten(), 'm'),
+                                 'y': (y.flatten(), 's'),
+                                 'f': ((x + 10 * y).flatten(), 'unitless')})
+
+    def test_structured_grid(self):
+        data = self.data.deepcopy()
+        build_data_interpolator(3, data, {'f': 'unitless'}, structured=True)
+        self.assertEqual(len(_interpolator_data_cache), 1)
+
+        cached_data = self.data.deepcopy()
+        build_data_interpolator(3, cached_data, {'f': 'unitless'}, structured=True)
+        self.assertEqual(len(_interpolator_data_cache), 1)
+
+        # data is formatted in place, the same as the first time
+        assert_near_equal(cached_data.get_val('x', 'm'), [0., 1., 2.])
+        assert_near_equal(cached_data.get_val('f'), data.get_val('f'))
+        self.assertEqual(cached_data.get_val('f').shape, (3, 2))
+
+        # different options are cached separately
+        build_data_interpolator(3, self.data.deepcopy(), {'f': 'unitless'},
+                                structured=False)
+        self.assertEqual(len(_interpolator_data_cache), 2)
+
+    def test_modify_cached_data(self):
+        data = self.data.deepcopy()
+        build_data_interpolator(3, data, {'f': 'unitless'}, structured=True)
+
+        cached_data = self.data.deepcopy()
+        build_data_interpolator(3, cached_data, {'f': 'unitless'}, structured=True)
+
+        # data formatted from the cache belongs to the caller, and can be modified in
+        # place without changing the data of other callers or later builds
+        cached_data.get_val('f')[0, 0] = -1.
+        cached_data.get_val('x', 'm')[0] = -1.
+
+        assert_near_equal(data.get_val('f')[0, 0], 30.)
+        assert_near_equal(data.get_val('x', 'm'), [0., 1., 2.])
+
+        new_data = self.data.deepcopy()
+        build_data_interpolator(3, new_data, {'f': 'unitless'}, structured=True)
+        assert_near_equal(new_data.get_val('f'), data.get_val('f'))
+        assert_near_equal(new_data.get_val('x', 'm'), [0., 1., 2.])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.om_warnings import OMDeprecationWarning
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.subsystems.atmosphere.atmosphere import StandardAtmosphere
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.engine_deck_conversion import AtmosCalc, CalculateIdle, \
+    EngineDeckConverter, EngineDeckType, convert_engine_decks, _idle_conditions, \
+    _inlet_conditions
+from aviary.utils.named_values import get_items
+from aviary.variable_info.variables import Dynamic
+
+
+def thrust(t4t2, mach, alt):
+    # cubic in T4/T2 and Mach number, so lagrange3 interpolation is exact
+    return (1. - alt / 60000.) * (5000. * t4t2**2 - 300. * t4t2**3 - 8000. * mach +
+                                  2000. * mach**2 * t4t2 - 500. * mach**3)
+
+
+def write_gasp_deck(filename, t4max):
+    """Write a GASP engine deck with thrust from thrust(), wrapping lines of Mach."""
+    t4t2 = np.array([2.0, 2.5, 3.0, 3.5, 4.0, 4.5])
+    mach = np.array([0., 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7])
+    alts = [0., 10000., 20000., 30000.]
+
+    lines = [f'{1:5d}{0:5d}{"":10}{900.:10.4f}{t4max:10.4f}{t4max:10.4f}'
+             f'{t4max:10.4f}{1.25:10.4f}']
+
+    fields = {'THRUST': thrust,
+              'FUEL FLOW': lambda t, m, a: 0.3 * thrust(t, m, a) + 100.,
+              'AIRFLOW': lambda t, m, a: 200. * t + 50. * m - a / 1000.}
+
+    for title, func in fields.items():
+        lines.extend([title, f'{len(alts):5d}', ''])
+
+        for i, alt in enumerate(alts):
+            lines.append(f'{mach.size:5d}{t4t2.size:5d}{alt:10.1f}')
+            lines.append(' ' * 10 + ''.join(f'{m:10.4f}' for m in mach[:6]))
+            lines.append(' ' * 10 + ''.join(f'{m:10.4f}' for m in mach[6:]))
+
+            for t in t4t2:
+                vals = func(t, mach, alt)
+                lines.append(f'{t:10.4f}' + ''.join(f'{v:10.1f}' for v in vals[:6]))
+                lines.append(''.join(f'{v:10.1f}' for v in vals[6:]))
+
+            if i < len(alts) - 1:
+                lines.append('')
+
+    with open(filename, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+def read_deck(filename):
+    data = read_data_file(filename)
+    return {key: val for key, (val, units) in get_items(data)}
+
+
+@use_tempdirs
+class EngineDeckConverterTest(unittest.TestCase):
+    def test_flops(self):
+        EngineDeckConverter('models/engines/turbofan_22k.txt', 'turbofan_22k.deck',
+                            EngineDeckType.FLOPS)
+
+        data = read_deck('turbofan_22k.deck')
+        expected_data = read_deck('models/engines/turbofan_22k.deck')
+
+        self.assertEqual(list(data), list(expected_data))
+
+        for key in data:
+            assert_near_equal(data[key], expected_data[key], 1e-12)
+
+    def test_gasp(self):
+        write_gasp_deck('engine.eng', t4max=2200.)
+        EngineDeckConverter('engine.eng', 'engine.deck', EngineDeckType.GASP)
+
+        data = read_deck('engine.deck')
+        self.assertEqual(list(data), ['Mach_Number', 'Altitude', 'Throttle', 'Thrust',
+                                      'Fuel_Flow', 'T4'])
+
+        mach = data['Mach_Number']
+        alt = data['Altitude']
+        T4 = data['T4']
+        idle = data['Throttle'] == 0.
+
+        # sorted by Mach number, then altitude, then throttle
+        order = np.lexsort([data['Throttle'], alt, mach])
+        assert_near_equal(order, np.arange(mach.size))
+
+        assert_near_equal(data['Throttle'], T4 / 2200.)
+        self.assertTrue(np.all(T4 <= 2200.))
+        self.assertEqual(np.count_nonzero(idle), np.unique(mach).size * 4)
+
+        # T4 is recovered from the engine inlet temperature
+        prob = om.Problem()
+        prob.model.add_subsystem('atmos', StandardAtmosphere(num_nodes=mach.size))
+        prob.setup()
+        prob.set_val('atmos.h', alt, 'ft')
+        prob.run_model()
+
+        T = prob.get_val('atmos.temp', 'degR')
+        T2 = T * (1. + 0.2 * mach**2)
+        assert_near_equal(_inlet_conditions(mach, alt)[0], T2, 1e-12)
+
+        t4t2 = T4[~idle] / T2[~idle]
+        assert_near_equal(t4t2, np.round(t4t2 * 2.) / 2., 1e-12)
+        assert_near_equal(data['Thrust'][~idle],
+                          thrust(t4t2, mach[~idle], alt[~idle]), 1e-6)
+
+        # idle thrust scales with inlet pressure
+        P = prob.get_val('atmos.pres', 'psf')
+        delta2 = P * (1. + 0.2 * mach**2) ** 3.5 / 2116.22
+        assert_near_equal(data['Thrust'][idle],
+                          0.5 * 900. * 1.25 * delta2[idle] /
+                          np.sqrt(T2[idle] / 518.67), 1e-8)
+
+    def test_gasp_throttle(self):
+        # T4max of 100 or less is a throttle setting, and T4 is not recovered
+        write_gasp_deck('engine.eng', t4max=50.)
+        EngineDeckConverter('engine.eng', 'engine.deck', EngineDeckType.GASP)
+
+        data = read_deck('engine.deck')
+        self.assertEqual(list(data), ['Mach_Number', 'Altitude', 'Throttle', 'Thrust',
+                                      'Fuel_Flow'])
+        self.assertEqual(set(data['Throttle']),
+                         {0., 2., 2.5, 3., 3.5, 4., 4.5})
+
+    def test_convert_engine_decks(self):
+        input_dir = Path('engines')
+        input_dir.mkdir()
+
+        for t4max in (2200., 2400., 50.):
+            write_gasp_deck(input_dir / f'engine_{t4max:.0f}.eng', t4max)
+
+        output_files = convert_engine_decks(input_dir, 'decks', 'GASP', num_procs=2)
+
+        self.assertEqual([path.name for path in output_files],
+                         ['engine_2200.deck', 'engine_2400.deck', 'engine_50.deck'])
+
+        for output_file in output_files:
+            EngineDeckConverter(input_dir / (output_file.stem + '.eng'), 'engine.deck',
+                                EngineDeckType.GASP)
+
+            data = read_deck(output_file)
+            expected_data = read_deck('engine.deck')
+
+            self.assertEqual(list(data), list(expected_data))
+
+            for key in data:
+                assert_near_equal(data[key], expected_data[key], 1e-12)
+
+    def test_deprecated_components(self):
+        mach = np.array([0., 0.4, 0.8])
+        alt = np.array([0., 20000., 40000.])
+        t2, p2 = _inlet_conditions(mach, alt)
+
+        prob = om.Problem()
+
+        with self.assertWarns(OMDeprecationWarning):
+            prob.model.add_subsystem('atmos', AtmosCalc(num_nodes=3), promotes=['*'])
+        with self.assertWarns(OMDeprecationWarning):
+            prob.model.add_subsystem(
+                'idle', CalculateIdle(num_nodes=3, ref_sfn_idle=1.25,
+                                      ref_sls_airflow=900.), promotes=['*'])
+
+        prob.setup()
+        prob.set_val(Dynamic.Mission.MACH, mach)
+        prob.set_val(Dynamic.Mission.TEMPERATURE, t2 / (1. + 0.2 * mach**2), 'degR')
+        prob.set_val(Dynamic.Mission.STATIC_PRESSURE,
+                     p2 / (1. + 0.2 * mach**2) ** 3.5, 'psf')
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('t2', 'degR'), t2, 1e-12)
+        assert_near_equal(prob.get_val('p2', 'psf'), p2, 1e-12)
+
+        thrust, fuel_flow = _idle_conditions(t2, p2, ref_sfn_idle=1.25,
+                                             ref_sls_airflow=900.)
+        assert_near_equal(prob.get_val('idle_thrust', 'lbf'), thrust, 1e-12)
+        assert_near_equal(prob.get_val('idle_fuelflow', 'lbm/h'), fuel_flow, 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.functions import get_path
+from aviary.utils.process_input_decks import create_vehicle, clear_vehicle_cache, \
+    parse_inputs, initial_guesses, _vehicle_cache
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+deck = 'models/test_aircraft/aircraft_for_bench_GwGm.csv'
+
+
+class CreateVehicleTest(unittest.TestCase):
+    def setUp(self):
+        clear_vehicle_cache()
+        self.default_guesses = initial_guesses.copy()
+
+    def test_cache(self):
+        aircraft_values, guesses = create_vehicle(deck)
+        self.assertEqual(len(_vehicle_cache), 1)
+
+        # defaults are not modified by parsing a deck
+        self.assertEqual(initial_guesses, self.default_guesses)
+
+        # returned objects can be modified without affecting later calls
+        gross_mass = aircraft_values.get_val(Mission.Design.GROSS_MASS, 'lbm')
+        aircraft_values.set_val(Mission.Design.GROSS_MASS, 1., 'lbm')
+        guesses['rotation_mass'] = 1.
+
+        cached_values, cached_guesses = create_vehicle(deck)
+        self.assertEqual(len(_vehicle_cache), 1)
+        assert_near_equal(cached_values.get_val(Mission.Design.GROSS_MASS, 'lbm'),
+                          gross_mass)
+        self.assertNotEqual(cached_guesses['rotation_mass'], 1.)
+
+        clear_vehicle_cache()
+        parsed_values, parsed_guesses = create_vehicle(deck)
+        self.assertEqual(parsed_guesses, cached_guesses)
+        self.assertEqual(parsed_values.get_val(Aircraft.Engine.TYPE),
+                         cached_values.get_val(Aircraft.Engine.TYPE))
+
+    def test_cache_directory(self):
+        # decks with the same contents in different directories are cached separately
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ('a', 'b'):
+                Path(tmp_dir, name).mkdir()
+                shutil.copy(get_path(deck), Path(tmp_dir, name, 'deck.csv'))
+
+            create_vehicle(Path(tmp_dir, 'a', 'deck.csv'))
+            create_vehicle(Path(tmp_dir, 'b', 'deck.csv'))
+            self.assertEqual(len(_vehicle_cache), 2)
+
+            create_vehicle(Path(tmp_dir, 'a', 'deck.csv'))
+            self.assertEqual(len(_vehicle_cache), 2)
+
+    def test_threads(self):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda _: create_vehicle(deck), range(8)))
+
+        for aircraft_values, guesses in results:
+            assert_near_equal(aircraft_values.get_val(Mission.Design.GROSS_MASS, 'lbm'),
+                              results[0][0].get_val(Mission.Design.GROSS_MASS, 'lbm'))
+            self.assertEqual(guesses, results[0][1])
+
+    def test_parse_inputs(self):
+        aircraft_values = AviaryValues()
+        aircraft_values.set_val('debug_mode', False)
+
+        # each call fills a new dictionary of initial guesses
+        _, guesses = parse_inputs(get_path(deck), aircraft_values.deepcopy())
+        guesses['reserves'] = -1.
+
+        _, guesses = parse_inputs(get_path(deck), aircraft_values.deepcopy())
+        self.assertEqual(guesses['reserves'], self.default_guesses['reserves'])
+        self.assertEqual(initial_guesses, self.default_guesses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -181,3 +181,19 @@ class Flap_Type(Enum):
     """
     Double-slotted Fowler flaps
     """
+
+
+@unique
+class AtmosphereModel(Enum):
+    """
+    Defines the model used to compute atmospheric properties in the mission ODEs.
+    """
+
+    TABLES = 1
+    """
+    1976 U.S. Standard Atmosphere interpolated from tables (USatm1976Comp from dymos)
+    """
+    STANDARD = 2
+    """
+    1976 U.S. Standard Atmosphere computed with the closed-form formulas of each layer
+    """
@@ -4,10 +4,8 @@ Define meta data associated with variables in the Aviary data hierarchy.
 from copy import deepcopy
 from pathlib import Path
 
-import numpy as np
-
 from aviary.utils.develop_metadata import add_meta_data
-from aviary.variable_info.enums import Flap_Type, GASP_Engine_Type
+from aviary.variable_info.enums import AtmosphereModel, Flap_Type, GASP_Engine_Type
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
 # ---------------------------
@@ -1131,6 +1129,18 @@ add_meta_data(
     desc='Scaling factor for lift-dependent drag coefficient'
 )
 
+add_meta_data(
+    Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units='unitless',
+    desc='Lift-dependent drag coefficient table, as a function of Mach number and '
+         'lift coefficient, computed during Aviary pre-mission.',
+)
+
 add_meta_data(
     Aircraft.Design.LIFT_POLAR,
     meta_data=_MetaData,
@@ -1438,6 +1448,18 @@ add_meta_data(
     desc='Scaling factor for zero-lift drag coefficient'
 )
 
+add_meta_data(
+    Aircraft.Design.ZERO_LIFT_DRAG_POLAR,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units='unitless',
+    desc='Zero-lift drag coefficient table, as a function of altitude and Mach '
+         'number, computed during Aviary pre-mission.',
+)
+
 #
 #  ______   _                 _            _                  _
 # |  ____| | |               | |          (_)                | |
@@ -1566,6 +1588,23 @@ add_meta_data(
     default_value=0.0
 )
 
+add_meta_data(
+    Aircraft.Engine.DATA_CACHE_DIR,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units='unitless',
+    types=(str, Path, None),
+    default_value=None,
+    option=True,
+    desc='directory where processed (sorted, packed, and flight idle filled) engine '
+         'deck data is stored in binary form, so it can be loaded directly the next '
+         'time the same data file is used with the same engine options. If None, '
+         'processed engine data is not cached'
+)
+
 # TODO there should be a GASP name that pairs here
 add_meta_data(
     Aircraft.Engine.DATA_FILE,
@@ -6332,6 +6371,22 @@ add_meta_data(
 #                            |___/
 # =========================================
 
+add_meta_data(
+    Mission.Design.ATMOSPHERE_MODEL,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    option=True,
+    units='unitless',
+    default_value=AtmosphereModel.TABLES,
+    types=AtmosphereModel,
+    desc='model used to compute atmospheric properties in the mission: tables '
+    '(interpolated 1976 U.S. Standard Atmosphere) or standard (closed-form formulas '
+    'of the 1976 U.S. Standard Atmosphere)',
+)
+
 add_meta_data(
     Mission.Design.CRUISE_ALTITUDE,
     meta_data=_MetaData,
@@ -7289,4 +7344,12 @@ add_meta_data(
 
 
 # here we create a copy of the Aviary-core metadata. The reason for this copy is that if we simply imported the Aviary _MetaData in all the external subsystem extensions, we would be modifying the original and the original _MetaData in the core of Aviary could get altered in undesirable ways. By importing this copy to the API the user modifies a new MetaData designed just for their purposes.
-CoreMetaData = deepcopy(_MetaData)
+# The copy is only made the first time CoreMetaData is used, as most imports of this
+# module only need _MetaData.
+def __getattr__(name):
+    if name == 'CoreMetaData':
+        global CoreMetaData
+        CoreMetaData = deepcopy(_MetaData)
+        return CoreMetaData
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -142,6 +142,7 @@ class Aircraft:
         LIFT_CURVE_SLOPE = 'aircraft:design:lift_curve_slope'
         LIFT_DEPENDENT_DRAG_COEFF_FACTOR = \
             'aircraft:design:lift_dependent_drag_coeff_factor'
+        LIFT_DEPENDENT_DRAG_POLAR = 'aircraft:design:lift_dependent_drag_polar'
         LIFT_POLAR = 'aircraft:design:lift_polar'
 
         MAX_FUSELAGE_PITCH_ANGLE = 'aircraft:design:max_fuselage_pitch_angle'
@@ -173,6 +174,7 @@ class Aircraft:
         ZERO_FUEL_MASS = 'aircraft:design:zero_fuel_mass'
         ZERO_LIFT_DRAG_COEFF_FACTOR = \
             'aircraft:design:zero_lift_drag_coeff_factor'
+        ZERO_LIFT_DRAG_POLAR = 'aircraft:design:zero_lift_drag_polar'
 
     class Electrical:
         HAS_HYBRID_SYSTEM = 'aircraft:electrical:has_hybrid_system'
@@ -190,6 +192,7 @@ class Aircraft:
         CONSTANT_FUEL_CONSUMPTION = 'aircraft:engine:constant_fuel_consumption'
         CONTROLS_MASS = 'aircraft:engine:controls_mass'
 
+        DATA_CACHE_DIR = 'aircraft:engine:data_cache_dir'
         DATA_FILE = 'aircraft:engine:data_file'
         FLIGHT_IDLE_MAX_FRACTION = 'aircraft:engine:flight_idle_max_fraction'
         FLIGHT_IDLE_MIN_FRACTION = 'aircraft:engine:flight_idle_min_fraction'
@@ -630,6 +633,7 @@ class Mission:
         # they cannot change. In a design mission these are either user inputs
         # or calculated outputs, in off-design they are strictly inputs
         # and do not change.
+        ATMOSPHERE_MODEL = 'mission:design:atmosphere_model'
         CRUISE_ALTITUDE = 'mission:design:cruise_altitude'
         CRUISE_RANGE = 'mission:design:cruise_range'
         FUEL_MASS = 'mission:design:fuel_mass'
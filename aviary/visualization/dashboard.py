@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 import pathlib
 import shutil
+import sqlite3
 import importlib.util
 
 import numpy as np
@@ -46,6 +47,10 @@ def _dashboard_setup_parser(parser):
                         dest='driver_recorder', default=None)
     parser.add_argument('--port', dest='port', type=int,
                         default=5000, help="dashboard server port ID (default is 5000)")
+    parser.add_argument('--refresh_interval', dest='refresh_interval', type=float,
+                        default=0., help="seconds between updates of the driver history "
+                        "while the driver recorder file is being written (default is 0, "
+                        "no updates)")
 
     # For future use
     parser.add_argument('-d', '--debug', action='store_true', dest='debug_output',
@@ -64,7 +69,7 @@ def _dashboard_cmd(options, user_args):
         Args to be passed to the user script.
     """
     dashboard(options.script_name, options.problem_recorder,
-              options.driver_recorder, options.port)
+              options.driver_recorder, options.port, options.refresh_interval)
 
 
 def create_report_frame(format, text_filepath):
@@ -185,6 +190,158 @@ def create_aviary_variables_table_data_nested(script_name, recorder_file):
     return table_data_nested
 
 
+class DriverHistory:
+    """
+    Columnar history of the objectives, constraints, and design variables of the
+    driver cases in a case recorder file.
+
+    Driver cases are read straight from the recorder database into preallocated arrays,
+    one column per variable, instead of loading each case with CaseReader.get_case.
+    Each call of update only reads the cases recorded since the last call, so the
+    history of a recorder file that is still being written can be followed during a run.
+
+    Non-scalar variables are represented by their norm.
+
+    Parameters
+    ----------
+    recorder_file_name : str
+        Name of the case recorder file.
+    capacity : int
+        Number of cases the arrays are initially allocated for. The arrays grow as
+        needed.
+
+    Attributes
+    ----------
+    columns : list of str or None
+        Column names, starting with 'iter_count', then the objectives, constraints, and
+        design variables. None until the first driver case is read.
+    num_cases : int
+        Number of driver cases read.
+    """
+
+    def __init__(self, recorder_file_name, capacity=1024):
+        self.recorder_file_name = recorder_file_name
+        self.columns = None
+        self.num_cases = 0
+
+        self._capacity = capacity
+        self._data = None
+        self._sources = None
+        self._last_id = 0
+
+    def _setup_columns(self):
+        """
+        Find the variables of the driver and where their values are recorded.
+        """
+        var_info = om.CaseReader(self.recorder_file_name,
+                                 pre_load=False).problem_metadata['variables']
+
+        objectives = []
+        constraints = []
+        desvars = []
+
+        for key, meta in var_info.items():
+            if not isinstance(meta, dict) or 'source' not in meta:
+                continue
+
+            var_type = meta.get('type')
+
+            if var_type is None:
+                desvars.append((meta['name'], meta))
+            else:
+                name = meta['alias'] or meta['name']
+
+                if var_type == 'obj':
+                    objectives.append((name, meta))
+                else:
+                    constraints.append((name, meta))
+
+        # a variable can be more than one of obj, cons, and desvars. Give priority to
+        # obj, then cons, over desvars
+        self.columns = ['iter_count']
+        self._sources = []
+
+        for name, meta in objectives + constraints + desvars:
+            if name not in self.columns:
+                self.columns.append(name)
+                self._sources.append((meta['source'], meta['indices']))
+
+        self._data = np.empty((self._capacity, len(self.columns)))
+
+    def update(self):
+        """
+        Read the driver cases recorded since the last update.
+
+        Returns
+        -------
+        int
+            Number of new driver cases.
+        """
+        if not os.path.exists(self.recorder_file_name):
+            return 0
+
+        connection = sqlite3.connect(f'file:{self.recorder_file_name}?mode=ro', uri=True)
+
+        try:
+            rows = connection.execute(
+                'SELECT id, outputs FROM driver_iterations WHERE id > ? ORDER BY id',
+                (self._last_id,)).fetchall()
+
+        except sqlite3.OperationalError:
+            # the database is not initialized yet
+            return 0
+
+        finally:
+            connection.close()
+
+        if not rows:
+            return 0
+
+        if self.columns is None:
+            self._setup_columns()
+
+        num_cases = self.num_cases + len(rows)
+
+        if num_cases > len(self._data):
+            data = np.empty((max(num_cases, 2 * len(self._data)), len(self.columns)))
+            data[:self.num_cases] = self._data[:self.num_cases]
+            self._data = data
+
+        data = self._data
+
+        for idx, (case_id, outputs) in enumerate(rows, self.num_cases):
+            outputs = json.loads(outputs)
+            data[idx, 0] = idx
+
+            for col, (source, indices) in enumerate(self._sources, 1):
+                value = np.asarray(outputs[source], dtype=float)
+
+                if indices is not None:
+                    value = value[indices]
+
+                data[idx, col] = value.item() if value.size == 1 else \
+                    np.linalg.norm(value)
+
+        self.num_cases = num_cases
+        self._last_id = rows[-1][0]
+
+        return len(rows)
+
+    def to_dataframe(self):
+        """
+        Return the history as a Pandas data frame.
+
+        Returns
+        -------
+        DataFrame or None
+            One row per driver case, or None if no driver cases were read.
+        """
+        if self.columns is None:
+            return None
+
+        return pd.DataFrame(self._data[:self.num_cases], columns=self.columns)
+
+
 def convert_case_recorder_file_to_df(recorder_file_name):
     """
     Convert a case recorder file into a Pandas data frame.
@@ -193,68 +350,20 @@ def convert_case_recorder_file_to_df(recorder_file_name):
     ----------
     recorder_file_name : str
         Name of the case recorder file.
+
+    Returns
+    -------
+    DataFrame or None
+        Objectives, constraints, and design variables of each driver case, or None if
+        the file does not have driver cases.
     """
-    cr = om.CaseReader(recorder_file_name)
-    driver_cases = cr.list_cases('driver', out_stream=None)
-
-    df = None
-    for i, case in enumerate(driver_cases):
-        driver_case = cr.get_case(case)
-
-        desvars = driver_case.get_design_vars(scaled=False)
-        objectives = driver_case.get_objectives(scaled=False)
-        constraints = driver_case.get_constraints(scaled=False)
-
-        if i == 0:  # Only need to get header of the data frame once
-            # Need to worry about the fact that a variable can be in more than one of
-            #  desvars, cons, and obj. So filter out the dupes
-            initial_desvars_names = list(desvars.keys())
-            initial_constraints_names = list(constraints.keys())
-            objectives_names = list(objectives.keys())
-
-            # Start with obj, then cons, then desvars
-            # Give priority to having a duplicate being in the obj and cons
-            #  over being in the desvars
-            all_var_names = objectives_names.copy()
-            constraints_names = []
-            for name in initial_constraints_names:
-                if name not in all_var_names:
-                    constraints_names.append(name)
-                    all_var_names.append(name)
-            desvars_names = []
-            for name in initial_desvars_names:
-                if name not in all_var_names:
-                    desvars_names.append(name)
-                    all_var_names.append(name)
-            header = ["iter_count"] + all_var_names
-            df = pd.DataFrame(columns=header)
-
-        # Now fill up a row
-        row = [i,]
-        # important to do in this order since that is the order added to the header
-        for varname in objectives_names:
-            value = objectives[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in constraints_names:
-            value = constraints[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in desvars_names:
-            value = desvars[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-        df.loc[i] = row
-
-    return df
-
-
-def dashboard(script_name, problem_recorder, driver_recorder, port):
+    history = DriverHistory(recorder_file_name)
+    history.update()
+
+    return history.to_dataframe()
+
+
+def dashboard(script_name, problem_recorder, driver_recorder, port, refresh_interval=0.):
     """
     Generate the dashboard app display.
 
@@ -266,6 +375,11 @@ def dashboard(script_name, problem_recorder, driver_recorder, port):
         Name of the recorder file containing the Problem cases.
     driver_recorder : str
         Name of the recorder file containing the Driver cases.
+    port : int
+        Dashboard server port ID.
+    refresh_interval : float
+        Seconds between updates of the driver history, to follow a driver recorder file
+        that is still being written. If 0, the driver history is not updated.
     """
     reports_dir = f'reports/{script_name}/'
 
@@ -349,31 +463,47 @@ def dashboard(script_name, problem_recorder, driver_recorder, port):
     if pyopt_solution_pane:
         optimization_tabs_list.append(('PyOpt Solution', pyopt_solution_pane))
 
+    # callbacks run periodically in each dashboard session
+    periodic_callbacks = []
+
     # Desvars, cons, opt interactive plot
     if driver_recorder:
         if os.path.exists(driver_recorder):
-            df = convert_case_recorder_file_to_df(f'{driver_recorder}')
-            if df is not None:
+            history = DriverHistory(f'{driver_recorder}')
+            history.update()
+            if history.num_cases:
                 variables = pn.widgets.CheckBoxGroup(
                     name="Variables",
-                    options=list(df.columns),
+                    options=history.columns,
                     # just so all of them aren't plotted from the beginning. Skip the iter count
-                    value=list(df.columns)[1:2]
+                    value=history.columns[1:2]
                 )
-                ipipeline = df.interactive()
-                ihvplot = ipipeline.hvplot(y=variables, responsive=True, min_height=400,
-                                           color=list(Category10[10]),
-                                           yformatter="%.0f",
-                                           title="Model Optimization using OpenMDAO")
+                # changed when new cases are read, to redraw the plot
+                num_cases = pn.widgets.IntInput(value=history.num_cases, visible=False)
+
+                def plot_history(variables, num_cases):
+                    return history.to_dataframe().hvplot(
+                        y=variables, responsive=True, min_height=400,
+                        color=list(Category10[10]), yformatter="%.0f",
+                        title="Model Optimization using OpenMDAO")
+
+                def update_history():
+                    if history.update():
+                        num_cases.value = history.num_cases
+
+                if refresh_interval > 0.:
+                    periodic_callbacks.append(update_history)
+
                 optimization_plot_pane = pn.Column(
                     pn.Row(
                         pn.Column(
                             variables,
+                            num_cases,
                             pn.VSpacer(height=30),
                             pn.VSpacer(height=30),
                             width=300
                         ),
-                        ihvplot.panel(),
+                        pn.panel(pn.bind(plot_history, variables, num_cases)),
                     )
                 )
                 optimization_tabs_list.append(
@@ -468,7 +598,13 @@ def dashboard(script_name, problem_recorder, driver_recorder, port):
     assets_dir = pathlib.Path(importlib.util.find_spec(
         "aviary").origin).parent.joinpath('visualization/assets/')
     home_dir = '.'
-    server = pn.serve(template, port=port, address='localhost',
+
+    def serve_template():
+        for callback in periodic_callbacks:
+            pn.state.add_periodic_callback(callback, period=int(1000 * refresh_interval))
+        return template
+
+    server = pn.serve(serve_template, port=port, address='localhost',
                       websocket_origin=f'localhost:{port}',
                       show=show,
                       threaded=threaded,
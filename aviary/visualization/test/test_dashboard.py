@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.test_suite.components.sellar_feature import SellarMDA
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.visualization.dashboard import DriverHistory, \
+    convert_case_recorder_file_to_df
+
+
+def sellar_problem(recorder_file_name):
+    prob = om.Problem(SellarMDA())
+    prob.model.add_design_var('x', lower=0., upper=10.)
+    prob.model.add_design_var('z', lower=np.array([-10., 0.]),
+                              upper=np.array([10., 10.]))
+    prob.model.add_objective('obj')
+    prob.model.add_constraint('con1', upper=0.)
+    prob.model.add_constraint('con2', upper=0.)
+
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-8, disp=False)
+    prob.driver.add_recorder(om.SqliteRecorder(recorder_file_name))
+    prob.driver.recording_options['includes'] = []
+    prob.setup()
+
+    return prob
+
+
+@use_tempdirs
+class DriverHistoryTest(unittest.TestCase):
+    def test_history(self):
+        prob = sellar_problem('driver_cases.db')
+        prob.run_driver()
+        prob.cleanup()
+
+        history = DriverHistory('driver_cases.db')
+        num_cases = history.update()
+        self.assertEqual(history.columns,
+                         ['iter_count', 'obj', 'con1', 'con2', 'x', 'z'])
+
+        reader = om.CaseReader('driver_cases.db')
+        cases = reader.list_cases('driver', recurse=False, out_stream=None)
+        self.assertEqual(num_cases, len(cases))
+        self.assertEqual(history.num_cases, len(cases))
+
+        df = history.to_dataframe()
+        self.assertEqual(list(df.columns), history.columns)
+
+        for i, case_name in enumerate(cases):
+            case = reader.get_case(case_name)
+            self.assertEqual(df['iter_count'][i], i)
+            assert_near_equal(df['obj'][i], case.get_val('obj').item(), 1e-12)
+            assert_near_equal(df['con1'][i], case.get_val('con1').item(), 1e-12)
+            assert_near_equal(df['x'][i], case.get_val('x').item(), 1e-12)
+            assert_near_equal(df['z'][i], np.linalg.norm(case.get_val('z')), 1e-12)
+
+        # nothing new to read
+        self.assertEqual(history.update(), 0)
+
+        assert_near_equal(convert_case_recorder_file_to_df('driver_cases.db').values,
+                          df.values, 1e-12)
+
+    def test_update(self):
+        prob = sellar_problem('driver_cases.db')
+
+        # cases recorded after the first update are read by the next one
+        history = DriverHistory('driver_cases.db', capacity=2)
+        self.assertEqual(history.update(), 0)
+        self.assertIsNone(history.to_dataframe())
+
+        prob.driver.options['maxiter'] = 2
+        prob.run_driver()
+        first_cases = history.update()
+        self.assertGreater(first_cases, 0)
+
+        prob.run_driver()
+        prob.cleanup()
+
+        new_cases = history.update()
+        self.assertGreater(new_cases, 0)
+
+        reader = om.CaseReader('driver_cases.db')
+        cases = reader.list_cases('driver', recurse=False, out_stream=None)
+        self.assertEqual(history.num_cases, first_cases + new_cases)
+        self.assertEqual(history.num_cases, len(cases))
+        assert_near_equal(history.to_dataframe()['obj'].values[-1],
+                          prob.get_val('obj').item(), 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()